@@ -0,0 +1,176 @@
+"""
+Benchmark: signal-to-dispatch latency of the alerts engine against a local
+Postgres.
+
+A writer inserts N_SIGNALS signals (one per asset, so none are deduped)
+spread over WRITE_SECONDS. Each engine delivers them to a fake Telegram
+channel that takes SEND_MS per message; latency is the time from the
+insert committing to the send completing.
+
+- legacy: the previous engine, reconstructed inline - a DISTINCT ON query
+  over the last five minutes every LEGACY_INTERVAL seconds, alerts sent
+  one at a time inline
+- notify: AlertsEngine - LISTEN on the insert trigger's channel, watermark
+  tail query, concurrent rate-limited dispatch
+
+Tables live in their own schema (alerts_bench) and the trigger notifies a
+bench-only channel, so a running engine on the same database is not
+disturbed. Connection settings are the engine's (POSTGRES_* env vars).
+
+Usage (from alerts/):
+    PYTHONPATH=src python -m benchmarks.bench_signal_latency
+"""
+import asyncio
+import logging
+import random
+import re
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import psycopg
+from psycopg.rows import dict_row
+
+import alerts.engine as engine_module
+from alerts.engine import AlertsEngine
+
+N_SIGNALS = 200
+WRITE_SECONDS = 60.0
+LEGACY_INTERVAL = 60
+SEND_MS = 100.0
+SCHEMA = "alerts_bench"
+CHANNEL = "alerts_bench_signals"
+BASE_URL = engine_module.DATABASE_URL
+BENCH_URL = f"{BASE_URL}?options=-csearch_path%3D{SCHEMA}"
+
+SETUP_SQL = f"""
+DROP SCHEMA IF EXISTS {SCHEMA} CASCADE;
+CREATE SCHEMA {SCHEMA};
+CREATE TABLE {SCHEMA}.assets (asset_id INT PRIMARY KEY, symbol TEXT NOT NULL);
+CREATE TABLE {SCHEMA}.signals (
+    asset_id INT NOT NULL,
+    ts TIMESTAMPTZ NOT NULL,
+    trend_score DOUBLE PRECISION,
+    pretrend_prob DOUBLE PRECISION,
+    action TEXT,
+    confidence DOUBLE PRECISION,
+    rationale JSONB
+);
+CREATE INDEX ON {SCHEMA}.signals (asset_id, ts DESC);
+CREATE FUNCTION {SCHEMA}.notify_signal_insert() RETURNS trigger AS $$
+BEGIN
+  PERFORM pg_notify('{CHANNEL}', json_build_object('asset_id', NEW.asset_id, 'ts', NEW.ts)::text);
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+CREATE TRIGGER signals_notify AFTER INSERT ON {SCHEMA}.signals
+  FOR EACH ROW EXECUTE FUNCTION {SCHEMA}.notify_signal_insert();
+INSERT INTO {SCHEMA}.assets SELECT i, 'S' || lpad(i::text, 4, '0') FROM generate_series(1, {N_SIGNALS}) i;
+"""
+
+
+class FakeChannel:
+    enabled = True
+
+    def __init__(self):
+        self.sent_at = {}
+
+    async def send_alert(self, *args):
+        await asyncio.sleep(SEND_MS / 1000)
+        self.sent_at[re.search(r"S\d{4}", args[0]).group(0)] = time.time()
+        return True
+
+    async def close(self):
+        pass
+
+
+async def legacy_engine(channel: FakeChannel):
+    """The previous AlertsEngine.start loop."""
+    engine = AlertsEngine()
+    conn = await psycopg.AsyncConnection.connect(BENCH_URL, autocommit=True)
+    sent_alerts = set()
+    try:
+        while True:
+            async with conn.cursor(row_factory=dict_row) as cur:
+                await cur.execute("""
+                    SELECT DISTINCT ON (s.asset_id)
+                        s.asset_id, a.symbol, s.ts, s.trend_score, s.pretrend_prob,
+                        s.action, s.confidence, s.rationale
+                    FROM signals s
+                    JOIN assets a ON s.asset_id = a.asset_id
+                    WHERE s.ts >= NOW() - INTERVAL '5 minutes'
+                    ORDER BY s.asset_id, s.ts DESC
+                """)
+                signals = await cur.fetchall()
+            for signal in signals:
+                key = f"{signal['asset_id']}_{signal['action']}_{signal['ts'].strftime('%Y%m%d%H%M')}"
+                if signal['action'] == 'HOLD' or signal['confidence'] < 0.5 or key in sent_alerts:
+                    continue
+                await channel.send_alert(engine.format_alert_message(signal))
+                sent_alerts.add(key)
+            cutoff = (datetime.utcnow() - timedelta(minutes=30)).strftime('%Y%m%d%H%M')
+            sent_alerts = {key for key in sent_alerts if key.split('_')[-1] >= cutoff}
+            await asyncio.sleep(LEGACY_INTERVAL)
+    finally:
+        await conn.close()
+
+
+async def notify_engine(channel: FakeChannel):
+    engine_module.DATABASE_URL = BENCH_URL
+    engine_module.SIGNALS_CHANNEL = CHANNEL
+    engine = AlertsEngine()
+    engine.telegram = channel
+    engine.email = FakeChannel()
+    await engine.start()
+
+
+async def write_signals(inserted_at: dict):
+    rng = random.Random(48)
+    gaps = [rng.expovariate(N_SIGNALS / WRITE_SECONDS) for _ in range(N_SIGNALS)]
+    async with await psycopg.AsyncConnection.connect(BENCH_URL, autocommit=True) as conn:
+        for asset_id, gap in enumerate(gaps, start=1):
+            await asyncio.sleep(gap)
+            await conn.execute(
+                "INSERT INTO signals VALUES (%s, now(), %s, %s, %s, %s, %s)",
+                (asset_id, 70.0, 0.8, rng.choice(['BUY', 'TRIM', 'EXIT']), 0.9, '{"top_drivers": []}'),
+            )
+            inserted_at[f"S{asset_id:04d}"] = time.time()
+
+
+async def run(name, engine):
+    async with await psycopg.AsyncConnection.connect(BASE_URL, autocommit=True) as conn:
+        await conn.execute(SETUP_SQL)
+
+    channel = FakeChannel()
+    inserted_at = {}
+    task = asyncio.create_task(engine(channel))
+    await asyncio.sleep(1)
+
+    started = time.perf_counter()
+    await write_signals(inserted_at)
+    deadline = time.perf_counter() + LEGACY_INTERVAL + N_SIGNALS * SEND_MS / 1000 + 10
+    while len(channel.sent_at) < N_SIGNALS and time.perf_counter() < deadline:
+        await asyncio.sleep(0.1)
+    wall = time.perf_counter() - started
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    latencies = sorted(channel.sent_at[s] - inserted_at[s] for s in channel.sent_at)
+    p95 = latencies[int(0.95 * (len(latencies) - 1))]
+    print(f"{name:<8}{len(latencies):>6}/{N_SIGNALS}{wall:>9.1f}"
+          f"{statistics.median(latencies) * 1000:>12,.0f}{p95 * 1000:>12,.0f}{latencies[-1] * 1000:>12,.0f}")
+
+
+async def main():
+    logging.disable(logging.CRITICAL)
+    print(f"{N_SIGNALS} signals over {WRITE_SECONDS:.0f}s, send {SEND_MS:.0f} ms, legacy interval {LEGACY_INTERVAL}s")
+    print(f"{'engine':<8}{'sent':>10}{'wall s':>9}{'p50 ms':>12}{'p95 ms':>12}{'max ms':>12}")
+    await run("legacy", legacy_engine)
+    await run("notify", notify_engine)
+    async with await psycopg.AsyncConnection.connect(BASE_URL, autocommit=True) as conn:
+        await conn.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
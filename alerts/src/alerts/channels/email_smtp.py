@@ -1,3 +1,4 @@
+import asyncio
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -36,10 +37,8 @@ class EmailChannel:
             
             msg.attach(MIMEText(message, 'plain'))
             
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_pass)
-                server.send_message(msg)
+            # smtplib blocks; keep it off the event loop so other alerts keep flowing
+            await asyncio.to_thread(self._send, msg)
             
             logger.info(f"Email alert sent: {subject}")
             return True
@@ -47,3 +46,9 @@ class EmailChannel:
         except Exception as e:
             logger.error(f"Failed to send email alert: {e}")
             return False
+    
+    def _send(self, msg):
+        with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30) as server:
+            server.starttls()
+            server.login(self.smtp_user, self.smtp_pass)
+            server.send_message(msg)
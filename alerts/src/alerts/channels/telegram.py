@@ -9,10 +9,21 @@ class TelegramChannel:
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN', '')
         self.chat_id = os.getenv('TELEGRAM_CHAT_ID', '')
         self.enabled = bool(self.bot_token and self.chat_id)
+        self._session = None
         
         if not self.enabled:
             logger.warning("Telegram not configured (missing bot token or chat ID)")
     
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+        return self._session
+    
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
     async def send_alert(self, message: str):
         if not self.enabled:
             logger.debug(f"Telegram disabled, would send: {message}")
@@ -27,14 +38,13 @@ class TelegramChannel:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload) as resp:
-                    if resp.status == 200:
-                        logger.info("Telegram alert sent successfully")
-                        return True
-                    else:
-                        logger.error(f"Telegram API error: {resp.status}")
-                        return False
+            async with self._get_session().post(url, json=payload) as resp:
+                if resp.status == 200:
+                    logger.info("Telegram alert sent successfully")
+                    return True
+                else:
+                    logger.error(f"Telegram API error: {resp.status}")
+                    return False
         except Exception as e:
             logger.error(f"Failed to send Telegram alert: {e}")
             return False
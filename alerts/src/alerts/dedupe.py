@@ -0,0 +1,40 @@
+import time
+from collections import deque
+
+class ExpiringKeySet:
+    """Set of alert keys that expire ttl_seconds after they were added.
+    
+    Keys are added in time order, so expiry pops from the front of a deque
+    instead of rescanning every key.
+    """
+    
+    def __init__(self, ttl_seconds: float, clock=time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._keys = set()
+        self._expiry = deque()
+    
+    def __contains__(self, key):
+        return key in self._keys
+    
+    def __len__(self):
+        return len(self._keys)
+    
+    def add(self, key) -> bool:
+        if key in self._keys:
+            return False
+        
+        self._keys.add(key)
+        self._expiry.append((self.clock() + self.ttl_seconds, key))
+        return True
+    
+    def expire(self) -> int:
+        now = self.clock()
+        removed = 0
+        
+        while self._expiry and self._expiry[0][0] <= now:
+            _, key = self._expiry.popleft()
+            self._keys.discard(key)
+            removed += 1
+        
+        return removed
@@ -0,0 +1,159 @@
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class Alert:
+    key: str
+    symbol: str
+    action: str
+    message: str
+    subject: str
+    signal_ts: datetime
+    queued_at: float = field(default_factory=time.monotonic)
+    attempts: int = 0
+
+class RateLimiter:
+    """Token bucket: rate_per_second sustained, up to burst at once."""
+    
+    def __init__(self, rate_per_second: float, burst: int = 1):
+        self.rate = rate_per_second
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class ChannelDispatcher:
+    """Bounded queue of alerts for one channel, drained by concurrent workers.
+    
+    Failed sends are retried with exponential backoff. Alerts that still
+    fail, or arrive while the channel is disabled, go to the fallback
+    dispatcher if there is one.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        send,
+        enabled: bool = True,
+        workers: int = 4,
+        rate_per_second: float = 0,
+        max_retries: int = 3,
+        backoff_seconds: float = 1.0,
+        queue_size: int = 1000,
+        fallback: "ChannelDispatcher" = None,
+    ):
+        self.name = name
+        self.send = send
+        self.enabled = enabled
+        self.workers = workers
+        self.limiter = RateLimiter(rate_per_second, burst=max(int(rate_per_second), 1))
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.fallback = fallback
+        
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self._tasks = []
+        
+        self.latencies = deque(maxlen=1000)
+        self.stats = {
+            'queued': 0,
+            'sent': 0,
+            'retries': 0,
+            'failed': 0,
+            'fallbacks': 0,
+        }
+    
+    def start(self):
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._worker(), name=f"alerts-{self.name}-{i}")
+                for i in range(self.workers)
+            ]
+    
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+    
+    async def join(self):
+        await self.queue.join()
+        if self.fallback is not None:
+            await self.fallback.join()
+    
+    async def put(self, alert: Alert):
+        if not self.enabled:
+            await self._give_up(alert, reason="disabled")
+            return
+        
+        self.stats['queued'] += 1
+        await self.queue.put(alert)
+    
+    async def _give_up(self, alert: Alert, reason: str):
+        if self.fallback is not None:
+            self.stats['fallbacks'] += 1
+            alert.attempts = 0
+            await self.fallback.put(alert)
+        elif reason == "disabled":
+            logger.debug(f"{self.name} disabled, dropping alert for {alert.symbol}")
+        else:
+            self.stats['failed'] += 1
+            logger.error(f"Giving up on {self.name} alert for {alert.symbol}: {alert.action}")
+    
+    async def _worker(self):
+        while True:
+            alert = await self.queue.get()
+            try:
+                await self._deliver(alert)
+            except Exception as e:
+                logger.error(f"Error dispatching {self.name} alert for {alert.symbol}: {e}")
+            finally:
+                self.queue.task_done()
+    
+    async def _deliver(self, alert: Alert):
+        while True:
+            await self.limiter.acquire()
+            
+            try:
+                sent = await self.send(alert)
+            except Exception as e:
+                logger.error(f"{self.name} send failed for {alert.symbol}: {e}")
+                sent = False
+            
+            if sent:
+                self.stats['sent'] += 1
+                self.latencies.append((datetime.now(timezone.utc) - alert.signal_ts).total_seconds())
+                logger.info(f"Alert sent via {self.name} for {alert.symbol}: {alert.action}")
+                return
+            
+            alert.attempts += 1
+            if alert.attempts > self.max_retries:
+                await self._give_up(alert, reason="failed")
+                return
+            
+            self.stats['retries'] += 1
+            delay = self.backoff_seconds * 2 ** (alert.attempts - 1)
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
@@ -1,30 +1,84 @@
 import asyncio
 import logging
 import psycopg
+from psycopg import sql
 from psycopg.rows import dict_row
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from alerts.channels.telegram import TelegramChannel
 from alerts.channels.email_smtp import EmailChannel
+from alerts.dedupe import ExpiringKeySet
+from alerts.dispatch import Alert, ChannelDispatcher
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 DATABASE_URL = f"postgresql://{os.getenv('POSTGRES_USER', 'ghost')}:{os.getenv('POSTGRES_PASSWORD', 'ghostpass')}@{os.getenv('POSTGRES_HOST', 'localhost')}:{os.getenv('POSTGRES_PORT', '5432')}/{os.getenv('POSTGRES_DB', 'ghostquant')}"
 
+# NOTIFY channel raised by the signals insert trigger (infra/initdb/04_signals_notify.sql).
+# It must match the channel name in that trigger: if they differ, no
+# notification arrives and the engine only picks signals up on the
+# ALERTS_POLL_INTERVAL fallback poll.
+SIGNALS_CHANNEL = os.getenv('ALERTS_SIGNALS_CHANNEL', 'signals_new')
+
 class AlertsEngine:
     def __init__(self):
         self.conn = None
+        self.listen_conn = None
         self.telegram = TelegramChannel()
         self.email = EmailChannel()
-        self.sent_alerts = set()
         self.throttle_minutes = 15
-        self.interval = 60
-        
+        self.sent_alerts = ExpiringKeySet(self.throttle_minutes * 2 * 60)
+        # Fallback poll when no notification arrives
+        self.interval = int(os.getenv('ALERTS_POLL_INTERVAL', '60'))
+        
+        # Signals are read from the watermark minus a grace period, so rows
+        # committed slightly out of ts order are not missed; dedupe drops repeats
+        self.watermark = datetime.now(timezone.utc) - timedelta(minutes=5)
+        self.watermark_grace = timedelta(seconds=int(os.getenv('ALERTS_WATERMARK_GRACE', '30')))
+        
+        self.queue_size = int(os.getenv('ALERTS_QUEUE_SIZE', '1000'))
+        self.workers = int(os.getenv('ALERTS_CHANNEL_WORKERS', '4'))
+        self.max_retries = int(os.getenv('ALERTS_MAX_RETRIES', '3'))
+        self.telegram_rate = float(os.getenv('ALERTS_TELEGRAM_RATE', '25'))
+        self.email_rate = float(os.getenv('ALERTS_EMAIL_RATE', '5'))
+        self.dispatcher = None
+        
+        self._wakeup = asyncio.Event()
+        self._tasks = []
+    
     async def initialize(self):
-        self.conn = await psycopg.AsyncConnection.connect(DATABASE_URL)
+        self.conn = await psycopg.AsyncConnection.connect(DATABASE_URL, autocommit=True)
+        self.listen_conn = await self.connect_listener()
         logger.info("Alerts engine initialized")
-        
+    
+    async def connect_listener(self):
+        conn = await psycopg.AsyncConnection.connect(DATABASE_URL, autocommit=True)
+        await conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(SIGNALS_CHANNEL)))
+        return conn
+    
+    def build_dispatchers(self):
+        email = ChannelDispatcher(
+            'email',
+            lambda alert: self.email.send_alert(alert.subject, alert.message.replace('<b>', '').replace('</b>', '')),
+            enabled=self.email.enabled,
+            workers=self.workers,
+            rate_per_second=self.email_rate,
+            max_retries=self.max_retries,
+            queue_size=self.queue_size,
+        )
+        self.dispatcher = ChannelDispatcher(
+            'telegram',
+            lambda alert: self.telegram.send_alert(alert.message),
+            enabled=self.telegram.enabled,
+            workers=self.workers,
+            rate_per_second=self.telegram_rate,
+            max_retries=self.max_retries,
+            queue_size=self.queue_size,
+            fallback=email,
+        )
+        return self.dispatcher
+    
     async def get_latest_signals(self):
         async with self.conn.cursor(row_factory=dict_row) as cur:
             await cur.execute("""
@@ -39,10 +93,14 @@ class AlertsEngine:
                     s.rationale
                 FROM signals s
                 JOIN assets a ON s.asset_id = a.asset_id
-                WHERE s.ts >= NOW() - INTERVAL '5 minutes'
+                WHERE s.ts > %s
                 ORDER BY s.asset_id, s.ts DESC
-            """)
-            return await cur.fetchall()
+            """, (self.watermark - self.watermark_grace,))
+            signals = await cur.fetchall()
+        
+        if signals:
+            self.watermark = max(self.watermark, max(signal['ts'] for signal in signals))
+        return signals
     
     def should_alert(self, signal):
         if signal['action'] == 'HOLD':
@@ -93,50 +151,99 @@ class AlertsEngine:
     def format_email_subject(self, signal):
         return f"GhostQuant Alert: {signal['symbol']} - {signal['action']}"
     
-    async def send_alert(self, signal):
-        message = self.format_alert_message(signal)
-        
-        telegram_sent = await self.telegram.send_alert(message)
-        
-        if not telegram_sent:
-            subject = self.format_email_subject(signal)
-            email_sent = await self.email.send_alert(subject, message.replace('<b>', '').replace('</b>', ''))
-        
+    async def queue_alert(self, signal):
         alert_key = f"{signal['asset_id']}_{signal['action']}_{signal['ts'].strftime('%Y%m%d%H%M')}"
         self.sent_alerts.add(alert_key)
         
-        logger.info(f"Alert sent for {signal['symbol']}: {signal['action']}")
+        signal_ts = signal['ts']
+        if signal_ts.tzinfo is None:
+            signal_ts = signal_ts.replace(tzinfo=timezone.utc)
+        
+        await self.dispatcher.put(Alert(
+            key=alert_key,
+            symbol=signal['symbol'],
+            action=signal['action'],
+            message=self.format_alert_message(signal),
+            subject=self.format_email_subject(signal),
+            signal_ts=signal_ts,
+        ))
     
     async def cleanup_old_alerts(self):
-        cutoff = datetime.utcnow() - timedelta(minutes=self.throttle_minutes * 2)
-        cutoff_str = cutoff.strftime('%Y%m%d%H%M')
-        
-        self.sent_alerts = {
-            key for key in self.sent_alerts
-            if key.split('_')[-1] >= cutoff_str
-        }
+        self.sent_alerts.expire()
     
     async def process_signals(self):
         signals = await self.get_latest_signals()
         
         for signal in signals:
             if self.should_alert(signal):
-                await self.send_alert(signal)
+                await self.queue_alert(signal)
         
         await self.cleanup_old_alerts()
     
-    async def start(self):
-        await self.initialize()
-        
-        logger.info(f"Starting alerts engine (interval={self.interval}s)")
+    async def listen(self):
+        while True:
+            try:
+                async for _ in self.listen_conn.notifies(timeout=self.interval):
+                    self._wakeup.set()
+                # No notification within the interval: poll anyway
+                self._wakeup.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error listening on {SIGNALS_CHANNEL}: {e}")
+                await asyncio.sleep(1)
+                try:
+                    await self.listen_conn.close()
+                    self.listen_conn = await self.connect_listener()
+                    self._wakeup.set()
+                except Exception as e:
+                    logger.error(f"Error reconnecting listener: {e}")
+    
+    async def run(self):
+        self._wakeup.set()
         
         while True:
+            await self._wakeup.wait()
+            # Notifications that arrive while a batch is processed coalesce into the next one
+            self._wakeup.clear()
+            
             try:
                 await self.process_signals()
             except Exception as e:
                 logger.error(f"Error in alerts cycle: {e}")
-            
-            await asyncio.sleep(self.interval)
+                await asyncio.sleep(1)
+                self._wakeup.set()
+    
+    async def start(self):
+        await self.initialize()
+        
+        if self.dispatcher is None:
+            self.build_dispatchers()
+        self.dispatcher.start()
+        self.dispatcher.fallback.start()
+        
+        logger.info(f"Starting alerts engine (LISTEN {SIGNALS_CHANNEL}, poll interval={self.interval}s)")
+        
+        self._tasks = [asyncio.create_task(self.listen()), asyncio.create_task(self.run())]
+        try:
+            await asyncio.gather(*self._tasks)
+        finally:
+            await self.stop()
+    
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        
+        if self.dispatcher is not None:
+            await self.dispatcher.stop()
+            await self.dispatcher.fallback.stop()
+        await self.telegram.close()
+        
+        for conn in (self.listen_conn, self.conn):
+            if conn is not None and not conn.closed:
+                await conn.close()
 
 async def main():
     engine = AlertsEngine()
@@ -0,0 +1,40 @@
+"""Tests for the expiring alert key set."""
+from alerts.dedupe import ExpiringKeySet
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+def test_add_reports_new_keys_only():
+    keys = ExpiringKeySet(60, clock=FakeClock())
+    
+    assert keys.add("1_BUY_202401010000")
+    assert not keys.add("1_BUY_202401010000")
+    assert "1_BUY_202401010000" in keys
+    assert len(keys) == 1
+
+
+def test_expire_drops_keys_after_ttl():
+    clock = FakeClock()
+    keys = ExpiringKeySet(60, clock=clock)
+    keys.add("a")
+    clock.now += 30
+    keys.add("b")
+    
+    clock.now += 29
+    assert keys.expire() == 0
+    
+    clock.now += 1
+    assert keys.expire() == 1
+    assert "a" not in keys and "b" in keys
+    
+    # An expired key can be alerted on again
+    assert keys.add("a")
+    clock.now += 30
+    assert keys.expire() == 1
+    assert "a" in keys and "b" not in keys
@@ -0,0 +1,136 @@
+"""Tests for channel dispatch: retries, backoff, fallback and rate limiting."""
+import pytest
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from alerts.dispatch import Alert, ChannelDispatcher
+
+
+class FakeChannel:
+    """Records send attempts; the first `failures` attempts per alert fail."""
+    
+    def __init__(self, failures=0, raises=False):
+        self.failures = failures
+        self.raises = raises
+        self.attempts = {}
+        self.calls = []
+        self.delivered = []
+    
+    async def send(self, alert):
+        self.calls.append((alert.key, time.monotonic()))
+        attempt = self.attempts[alert.key] = self.attempts.get(alert.key, 0) + 1
+        if attempt <= self.failures:
+            if self.raises:
+                raise RuntimeError("channel unavailable")
+            return False
+        self.delivered.append(alert.key)
+        return True
+
+
+def make_alert(key="1_BUY_202401010000"):
+    return Alert(
+        key=key,
+        symbol="BTC",
+        action="BUY",
+        message="BTC: BUY",
+        subject="GhostQuant Alert: BTC - BUY",
+        signal_ts=datetime.now(timezone.utc),
+    )
+
+
+async def run(dispatcher, alerts):
+    dispatchers = [dispatcher] + ([dispatcher.fallback] if dispatcher.fallback else [])
+    for d in dispatchers:
+        d.start()
+    try:
+        for alert in alerts:
+            await dispatcher.put(alert)
+        await asyncio.wait_for(dispatcher.join(), timeout=5)
+    finally:
+        for d in dispatchers:
+            await d.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_sends_are_retried():
+    channel = FakeChannel(failures=2, raises=True)
+    dispatcher = ChannelDispatcher('telegram', channel.send, max_retries=3, backoff_seconds=0.001)
+    
+    await run(dispatcher, [make_alert()])
+    
+    assert channel.delivered == [make_alert().key]
+    assert len(channel.calls) == 3
+    assert dispatcher.stats == {'queued': 1, 'sent': 1, 'retries': 2, 'failed': 0, 'fallbacks': 0}
+    assert len(dispatcher.latencies) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_delay_backs_off_exponentially():
+    channel = FakeChannel(failures=10)
+    dispatcher = ChannelDispatcher('telegram', channel.send, max_retries=3, backoff_seconds=0.05)
+    
+    await run(dispatcher, [make_alert()])
+    
+    times = [t for _, t in channel.calls]
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    assert len(gaps) == 3
+    # Each delay is backoff * 2**(attempt - 1), jittered down by at most half
+    for attempt, gap in enumerate(gaps, start=1):
+        base = 0.05 * 2 ** (attempt - 1)
+        assert 0.5 * base - 0.005 <= gap <= base + 0.05
+    assert dispatcher.stats['failed'] == 1
+    assert channel.delivered == []
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_go_to_fallback():
+    telegram = FakeChannel(failures=10)
+    email = FakeChannel()
+    fallback = ChannelDispatcher('email', email.send)
+    dispatcher = ChannelDispatcher('telegram', telegram.send, max_retries=1, backoff_seconds=0.001, fallback=fallback)
+    
+    await run(dispatcher, [make_alert("a"), make_alert("b")])
+    
+    assert len(telegram.calls) == 4
+    assert sorted(email.delivered) == ["a", "b"]
+    assert dispatcher.stats['fallbacks'] == 2
+    assert dispatcher.stats['failed'] == 0
+    assert fallback.stats['sent'] == 2
+
+
+@pytest.mark.asyncio
+async def test_disabled_channel_skips_straight_to_fallback():
+    telegram = FakeChannel()
+    email = FakeChannel()
+    fallback = ChannelDispatcher('email', email.send)
+    dispatcher = ChannelDispatcher('telegram', telegram.send, enabled=False, fallback=fallback)
+    
+    await run(dispatcher, [make_alert()])
+    
+    assert telegram.calls == []
+    assert email.delivered == [make_alert().key]
+    assert dispatcher.stats['queued'] == 0
+    assert dispatcher.stats['fallbacks'] == 1
+    
+    # Without a fallback the alert is dropped, not counted as a failure
+    dropped = ChannelDispatcher('telegram', telegram.send, enabled=False)
+    await run(dropped, [make_alert()])
+    assert telegram.calls == []
+    assert dropped.stats['failed'] == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_spreads_sends():
+    channel = FakeChannel()
+    dispatcher = ChannelDispatcher('telegram', channel.send, workers=4, rate_per_second=10)
+    
+    started = time.monotonic()
+    await run(dispatcher, [make_alert(str(i)) for i in range(15)])
+    elapsed = time.monotonic() - started
+    
+    # A burst of 10, then the remaining 5 at 10 per second
+    assert len(channel.delivered) == 15
+    assert 0.45 <= elapsed < 1.5
+    burst = [t for _, t in channel.calls if t - started < 0.05]
+    assert len(burst) == 10
@@ -0,0 +1,105 @@
+"""Tests for the watermark query and LISTEN setup against a local Postgres.
+
+Tables live in a throwaway schema; the tests are skipped when the
+database from the POSTGRES_* env vars is not reachable.
+"""
+import pytest
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import psycopg
+
+import alerts.engine as engine_module
+from alerts.engine import AlertsEngine
+
+SCHEMA = "alerts_test"
+
+
+@asynccontextmanager
+async def signals_schema():
+    try:
+        conn = await psycopg.AsyncConnection.connect(engine_module.DATABASE_URL, autocommit=True, connect_timeout=3)
+    except psycopg.OperationalError as e:
+        pytest.skip(f"Postgres not available: {e}")
+    
+    await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    await conn.execute(f"CREATE SCHEMA {SCHEMA}")
+    await conn.execute(f"SET search_path TO {SCHEMA}")
+    await conn.execute("CREATE TABLE assets (asset_id INT PRIMARY KEY, symbol TEXT)")
+    await conn.execute("""
+        CREATE TABLE signals (
+            asset_id INT REFERENCES assets(asset_id),
+            ts TIMESTAMPTZ,
+            trend_score FLOAT,
+            pretrend_prob FLOAT,
+            action TEXT,
+            confidence FLOAT,
+            rationale JSONB
+        )
+    """)
+    await conn.execute("INSERT INTO assets VALUES (1, 'BTC'), (2, 'ETH')")
+    try:
+        yield conn
+    finally:
+        await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        await conn.close()
+
+
+async def insert_signal(conn, asset_id, ts, action="BUY"):
+    await conn.execute(
+        "INSERT INTO signals VALUES (%s, %s, 50, 0.7, %s, 0.8, '{}')",
+        (asset_id, ts, action),
+    )
+
+
+@pytest.mark.asyncio
+async def test_watermark_query_tails_new_signals():
+    async with signals_schema() as conn:
+        await check_watermark_query(conn)
+
+
+async def check_watermark_query(conn):
+    engine = AlertsEngine()
+    engine.conn = conn
+    engine.watermark_grace = timedelta(seconds=30)
+    now = datetime.now(timezone.utc)
+    engine.watermark = now - timedelta(minutes=5)
+    
+    await insert_signal(conn, 1, now - timedelta(minutes=10))  # before the watermark
+    await insert_signal(conn, 1, now - timedelta(minutes=2), action="TRIM")
+    await insert_signal(conn, 1, now - timedelta(minutes=1))
+    await insert_signal(conn, 2, now - timedelta(minutes=3))
+    
+    signals = await engine.get_latest_signals()
+    assert {(s['symbol'], s['action'], s['ts']) for s in signals} == {
+        ('BTC', 'BUY', now - timedelta(minutes=1)),
+        ('ETH', 'BUY', now - timedelta(minutes=3)),
+    }
+    assert engine.watermark == now - timedelta(minutes=1)
+    
+    # A row committed late with a ts just behind the watermark is still read
+    await insert_signal(conn, 2, now - timedelta(minutes=1, seconds=10), action="EXIT")
+    signals = await engine.get_latest_signals()
+    assert {(s['symbol'], s['action']) for s in signals} == {('BTC', 'BUY'), ('ETH', 'EXIT')}
+    
+    # Rows older than the grace period are not read again
+    engine.watermark = now
+    assert await engine.get_latest_signals() == []
+    assert engine.watermark == now
+
+
+@pytest.mark.asyncio
+async def test_listener_quotes_channel_name(monkeypatch):
+    channel = "Alerts_Test-Channel"
+    monkeypatch.setattr(engine_module, 'SIGNALS_CHANNEL', channel)
+    engine = AlertsEngine()
+    
+    async with signals_schema() as conn:
+        listener = await engine.connect_listener()
+        try:
+            await conn.execute("SELECT pg_notify(%s, 'ping')", (channel,))
+            notify = await asyncio.wait_for(anext(listener.notifies()), timeout=5)
+            assert (notify.channel, notify.payload) == (channel, 'ping')
+        finally:
+            await listener.close()
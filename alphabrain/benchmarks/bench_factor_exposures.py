@@ -0,0 +1,172 @@
+"""
+Benchmark: AlphaBrainService.compute_all_factor_exposures at 100, 500 and
+2,000 assets.
+
+The previous loader (reconstructed inline as legacy_factor_exposures) ran,
+per asset, one query for 90 days of raw ticks plus three metric queries,
+built a DataFrame per asset and computed its exposures one at a time. The
+batch loader runs one daily-bar query and one latest-row query per metrics
+table for all assets, then computes every exposure over the wide price
+matrix at once.
+
+Both run against an in-memory connection that answers the queries from
+synthetic data (TICKS_PER_DAY ticks per asset per day); the time it spends
+producing rows, i.e. the database's share, is subtracted, so "client ms"
+is the service's own cost. Every query is one round trip, so the table also
+shows the time round trips add at an assumed 1 ms each. The batch result is
+checked against FactorModel.compute_factor_exposures run per asset on the
+same daily bars.
+
+Usage (from alphabrain/):
+    PYTHONPATH=src python -m benchmarks.bench_factor_exposures
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from alphabrain.service import AlphaBrainService
+
+ASSET_COUNTS = (100, 500, 2_000)
+DAYS = 90
+TICKS_PER_DAY = 8
+RTT_MS = 1.0
+
+
+class FakeCursor:
+    def __init__(self, db: "FakeDatabase"):
+        self.db = db
+        self.result = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, sql, params=None):
+        started = time.perf_counter()
+        self.result = self.db.answer(" ".join(sql.split()), params)
+        self.db.queries += 1
+        self.db.rows += len(self.result)
+        self.db.server_seconds += time.perf_counter() - started
+
+    async def fetchall(self):
+        return self.result
+
+    async def fetchone(self):
+        return self.result[0] if self.result else None
+
+
+class FakeDatabase:
+    """Answers the service's queries from synthetic per-asset price paths."""
+
+    def __init__(self, n_assets: int):
+        rng = np.random.default_rng(n_assets)
+        self.n_assets = n_assets
+        now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        steps = DAYS * TICKS_PER_DAY
+        self.tick_ts = [now - timedelta(hours=24 * (steps - i) / TICKS_PER_DAY) for i in range(steps)]
+        log_returns = rng.normal(0, 0.01, size=(n_assets, steps))
+        self.tick_prices = 100 * np.exp(np.cumsum(log_returns, axis=1))
+        self.tick_qty = rng.uniform(1, 10, size=(n_assets, steps))
+        self.funding = rng.normal(0, 0.0005, size=n_assets)
+        self.queries = 0
+        self.rows = 0
+        self.server_seconds = 0.0
+
+    def cursor(self, row_factory=None):
+        return FakeCursor(self)
+
+    def answer(self, sql, params):
+        if sql.startswith("SELECT * FROM assets"):
+            return [{"asset_id": i + 1, "symbol": f"A{i:04d}"} for i in range(self.n_assets)]
+        if "time_bucket" in sql:
+            close = self.tick_prices[:, TICKS_PER_DAY - 1::TICKS_PER_DAY]
+            volume = self.tick_qty.reshape(self.n_assets, DAYS, TICKS_PER_DAY).sum(axis=2)
+            days = [self.tick_ts[d * TICKS_PER_DAY].replace(hour=0) for d in range(DAYS)]
+            return [
+                (a + 1, days[d], float(close[a, d]), float(volume[a, d]))
+                for a in range(self.n_assets) for d in range(DAYS)
+            ]
+        if sql.startswith("SELECT DISTINCT ON (asset_id) asset_id, price"):
+            return [(a + 1, float(self.tick_prices[a, -1])) for a in range(self.n_assets)]
+        if sql.startswith("SELECT DISTINCT ON (asset_id) asset_id, funding_8h"):
+            return [(a + 1, float(self.funding[a]), 1e6) for a in range(self.n_assets)]
+        asset = params[0] - 1
+        if sql.startswith("SELECT ts, price, qty as volume FROM ticks"):
+            return [
+                {"ts": ts, "price": float(p), "volume": float(q)}
+                for ts, p, q in zip(self.tick_ts, self.tick_prices[asset], self.tick_qty[asset])
+            ]
+        if sql.startswith("SELECT price, ts FROM ticks"):
+            return [{"price": float(self.tick_prices[asset, -1]), "ts": self.tick_ts[-1]}]
+        if sql.startswith("SELECT funding_8h, oi FROM derivatives"):
+            return [{"funding_8h": float(self.funding[asset]), "oi": 1e6}]
+        if sql.startswith("SELECT * FROM factors"):
+            return [{"asset_id": params[0], "ts": self.tick_ts[-1]}]
+        raise ValueError(f"unexpected query: {sql[:60]}")
+
+
+async def legacy_factor_exposures(service: AlphaBrainService) -> pd.DataFrame:
+    """The per-asset loop as it was."""
+    factor_data = []
+    for asset in await service.get_assets():
+        price_history = await service.get_asset_price_history(asset['asset_id'])
+        metrics = await service.get_asset_metrics(asset['asset_id'])
+        exposures = await service.factor_model.compute_factor_exposures(metrics, price_history)
+        exposures['symbol'] = asset['symbol']
+        exposures['asset_id'] = asset['asset_id']
+        factor_data.append(exposures)
+    return pd.DataFrame(factor_data).set_index('symbol')
+
+
+async def measure(db: FakeDatabase, coro):
+    queries, rows, server = db.queries, db.rows, db.server_seconds
+    started = time.perf_counter()
+    result = await coro
+    client_ms = (time.perf_counter() - started - (db.server_seconds - server)) * 1000
+    return result, client_ms, db.queries - queries, db.rows - rows
+
+
+async def check_parity(service: AlphaBrainService, batch: pd.DataFrame) -> None:
+    """Batch exposures equal the per-asset computation on the same daily bars."""
+    bars = await service.get_daily_bars()
+    metrics = await service.get_latest_metrics()
+    for asset_id, group in list(bars.groupby('asset_id'))[:50]:
+        history = group.set_index('day')[['close']].rename(columns={'close': 'price'})
+        expected = await service.factor_model.compute_factor_exposures(metrics.loc[asset_id].to_dict(), history)
+        row = batch[batch['asset_id'] == asset_id].iloc[0]
+        for factor, value in expected.items():
+            assert np.isclose(row[factor], value), (asset_id, factor, row[factor], value)
+
+
+def report(name: str, client_ms: float, queries: int, rows: int) -> None:
+    print(f"  {name:<10}{queries:>10,}{rows:>13,}{client_ms:>12,.1f}{client_ms + queries * RTT_MS:>14,.1f}")
+
+
+async def run(n_assets: int) -> None:
+    db = FakeDatabase(n_assets)
+    service = AlphaBrainService()
+    service.conn = db
+
+    print(f"\n{n_assets:,} assets, {DAYS} days x {TICKS_PER_DAY} ticks/day")
+    print(f"  {'':<10}{'queries':>10}{'rows':>13}{'client ms':>12}{'@1ms RTT ms':>14}")
+    _, client_ms, queries, rows = await measure(db, legacy_factor_exposures(service))
+    report("legacy", client_ms, queries, rows)
+    batch, client_ms, queries, rows = await measure(db, service.compute_all_factor_exposures())
+    report("batch", client_ms, queries, rows)
+    await check_parity(service, batch)
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    for n_assets in ASSET_COUNTS:
+        asyncio.run(run(n_assets))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: HarvardAnalytics.rolling_factor_regression at 10,000 and 100,000
+observations, 3 factors, 90-observation window.
+
+The previous implementation (reconstructed inline as legacy_rolling_regression)
+aligned, dropped NaNs and ran np.linalg.lstsq once per window. The rolling
+engine keeps prefix sums of X'X and X'y and solves every window in one
+batched call, falling back to lstsq only for ill-conditioned windows.
+
+The data has ~2% missing portfolio returns, ~1% missing factor values and
+one stretch where a factor is constant (singular windows), so both the
+masking and the fallback are exercised. Results are checked against the
+legacy output. Ten portfolios at 100,000 observations, missing the same
+dates, are also fitted in one call, next to ten single-portfolio calls.
+
+Usage (from alphabrain/):
+    PYTHONPATH=src python -m benchmarks.bench_rolling_regression
+"""
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from alphabrain.analytics.harvard_analytics import HarvardAnalytics
+
+SIZES = (10_000, 100_000)
+WINDOW = 90
+FACTORS = ("mkt", "smb", "mom")
+PORTFOLIOS = 10
+
+
+def legacy_rolling_regression(portfolio_returns: pd.Series, factor_returns: pd.DataFrame, window: int) -> pd.DataFrame:
+    """The previous per-window loop."""
+    results = []
+    for i in range(window, len(portfolio_returns)):
+        aligned = pd.concat([portfolio_returns.iloc[i - window:i], factor_returns.iloc[i - window:i]], axis=1).dropna()
+        if len(aligned) < 10:
+            continue
+        y = aligned.iloc[:, 0]
+        X = aligned.iloc[:, 1:]
+        coeffs, _, _, _ = np.linalg.lstsq(np.column_stack([np.ones(len(X)), X]), y, rcond=None)
+        result = {"date": portfolio_returns.index[i], "alpha": coeffs[0]}
+        for j, factor_name in enumerate(X.columns):
+            result[f"beta_{factor_name}"] = coeffs[j + 1]
+        results.append(result)
+    return pd.DataFrame(results)
+
+
+def make_data(rng: np.random.Generator, n: int, portfolios: int = 1):
+    index = pd.date_range("2000-01-01", periods=n, freq="h")
+    factors = pd.DataFrame(rng.normal(0, 0.02, (n, len(FACTORS))), index=index, columns=list(FACTORS))
+    betas = rng.normal(1, 0.3, (len(FACTORS), portfolios))
+    returns = pd.DataFrame(
+        0.0005 + factors.to_numpy() @ betas + rng.normal(0, 0.01, (n, portfolios)),
+        index=index,
+        columns=[f"p{j}" for j in range(portfolios)],
+    )
+    # Portfolios miss the same dates, so a multi-portfolio call shares X'X
+    returns = returns.mask(np.broadcast_to(rng.random((n, 1)) < 0.02, returns.shape))
+    factors = factors.mask(rng.random(factors.shape) < 0.01)
+    factors.iloc[n // 2:n // 2 + 2 * WINDOW, 1] = 0.001
+    return returns, factors
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    rng = np.random.default_rng(43)
+    analytics = HarvardAnalytics.__new__(HarvardAnalytics)
+
+    print(f"{'observations':<14}{'legacy ms':>12}{'rolling ms':>12}{'speedup':>10}{'windows':>10}{'max |diff|':>12}")
+    for n in SIZES:
+        returns, factors = make_data(rng, n)
+        portfolio = returns["p0"]
+        legacy, legacy_ms = timed(legacy_rolling_regression, portfolio, factors, WINDOW)
+        rolling, rolling_ms = timed(analytics.rolling_factor_regression, portfolio, factors, WINDOW)
+        pd.testing.assert_frame_equal(legacy, rolling, rtol=1e-7, atol=1e-9)
+        diff = np.abs(legacy.drop(columns="date").to_numpy() - rolling.drop(columns="date").to_numpy()).max()
+        print(f"{n:<14,}{legacy_ms:>12,.0f}{rolling_ms:>12,.1f}{legacy_ms / rolling_ms:>9,.0f}x{len(rolling):>10,}{diff:>12.1e}")
+
+    n = SIZES[-1]
+    returns, factors = make_data(rng, n, PORTFOLIOS)
+    _, separate_ms = timed(lambda: [analytics.rolling_factor_regression(returns[c], factors, WINDOW) for c in returns])
+    _, batch_ms = timed(analytics.rolling_factor_regression, returns, factors, WINDOW)
+    print(f"\n{PORTFOLIOS} portfolios x {n:,} observations: "
+          f"{separate_ms:,.0f} ms one at a time, {batch_ms:,.0f} ms in one call")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,8 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
+from alphabrain.analytics.rolling_ols import RollingOLS
+
 logger = logging.getLogger(__name__)
 
 
@@ -392,7 +394,7 @@ class HarvardAnalytics:
         return avg_win / avg_loss
     
     def rolling_factor_regression(self,
-                                  portfolio_returns: pd.Series,
+                                  portfolio_returns,
                                   factor_returns: pd.DataFrame,
                                   window: int = 90) -> pd.DataFrame:
         """
@@ -400,17 +402,71 @@ class HarvardAnalytics:
         
         R_p = alpha + beta_1*F_1 + ... + beta_n*F_n + epsilon
         
+        Each row regresses the `window` observations before a date, skipping
+        rows with missing values and windows with fewer than 10 usable rows.
+        
         Args:
-            portfolio_returns: Portfolio returns
+            portfolio_returns: Portfolio returns (Series), or a DataFrame
+                with one column per portfolio to fit them all in one pass
             factor_returns: DataFrame of factor returns
             window: Rolling window size
         
         Returns:
-            DataFrame with rolling alpha and betas
+            DataFrame with rolling alpha and betas (with a 'portfolio'
+            column when several portfolios are given)
         """
         if len(portfolio_returns) < window:
             return pd.DataFrame()
         
+        if not portfolio_returns.index.equals(factor_returns.index):
+            if isinstance(portfolio_returns, pd.Series):
+                return self._rolling_factor_regression_loop(portfolio_returns, factor_returns, window)
+            
+            frames = []
+            for portfolio in portfolio_returns.columns:
+                frame = self._rolling_factor_regression_loop(portfolio_returns[portfolio], factor_returns, window)
+                if not frame.empty:
+                    frame.insert(0, 'portfolio', portfolio)
+                    frames.append(frame)
+            return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        
+        engine = RollingOLS(window, min_obs=10)
+        ends, coeffs = engine.fit(portfolio_returns.to_numpy(dtype=float), factor_returns.to_numpy(dtype=float))
+        
+        # Windows are dated by the observation after them, so the last
+        # full window has no date
+        ends, coeffs = ends[:-1], coeffs[:-1]
+        names = ['alpha'] + [f'beta_{factor_name}' for factor_name in factor_returns.columns]
+        
+        if isinstance(portfolio_returns, pd.Series):
+            fitted = ~np.isnan(coeffs[:, 0])
+            if not fitted.any():
+                return pd.DataFrame()
+            
+            result = pd.DataFrame(coeffs[fitted], columns=names)
+            result.insert(0, 'date', portfolio_returns.index[ends[fitted]])
+            return result
+        
+        frames = []
+        for j, portfolio in enumerate(portfolio_returns.columns):
+            fitted = ~np.isnan(coeffs[:, j, 0])
+            if not fitted.any():
+                continue
+            frame = pd.DataFrame(coeffs[fitted, j], columns=names)
+            frame.insert(0, 'date', portfolio_returns.index[ends[fitted]])
+            frame.insert(0, 'portfolio', portfolio)
+            frames.append(frame)
+        
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    
+    def _rolling_factor_regression_loop(self,
+                                        portfolio_returns: pd.Series,
+                                        factor_returns: pd.DataFrame,
+                                        window: int) -> pd.DataFrame:
+        """
+        Window-by-window regression, used when the two inputs are not on
+        the same index (each window is then aligned by label).
+        """
         results = []
         
         for i in range(window, len(portfolio_returns)):
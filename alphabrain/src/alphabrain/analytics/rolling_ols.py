@@ -0,0 +1,142 @@
+"""
+Rolling OLS Engine
+
+Sliding-window least squares with an intercept, computed from running
+normal-equation sums instead of one lstsq call per window.
+"""
+import logging
+from typing import Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COND_LIMIT = 1e6
+
+
+class RollingOLS:
+    """
+    Rolling regression y = alpha + X @ beta over every full window of rows.
+    
+    Window sums of X'X and X'y come from running sums, so sliding the
+    window costs O(k^2) per step and all windows are solved in one
+    batched call. Rows where y or any regressor is NaN are left out of
+    every window containing them. Windows with fewer than min_obs usable
+    rows are skipped; windows whose X'X is singular or worse conditioned
+    than cond_limit are re-solved with lstsq on the window's own rows.
+    
+    Several dependent series (columns of y) can be fitted in one pass:
+    series with the same missing-value pattern share X'X and its solve.
+    """
+    
+    def __init__(self, window: int, min_obs: int = 10, cond_limit: float = DEFAULT_COND_LIMIT):
+        """
+        Args:
+            window: Rows per window
+            min_obs: Minimum usable rows for a window to be fitted
+            cond_limit: Largest condition number of the unit-diagonal
+                scaled X'X that is solved directly
+        """
+        self.window = window
+        self.min_obs = min_obs
+        self.cond_limit = cond_limit
+        self.fallbacks = 0
+    
+    def fit(self, y: np.ndarray, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fit every window [end - window, end) for end = window .. n.
+        
+        Args:
+            y: Dependent series, shape (n,) or (n, p)
+            X: Regressors, shape (n, k)
+        
+        Returns:
+            (ends, coeffs): window end positions, and coefficients of shape
+            (len(ends), p, k + 1) with the intercept first (p axis dropped
+            for 1-d y); skipped windows are NaN
+        """
+        y = np.asarray(y, dtype=float)
+        X = np.asarray(X, dtype=float)
+        squeeze = y.ndim == 1
+        if squeeze:
+            y = y[:, None]
+        n, k = X.shape
+        p = y.shape[1]
+        
+        ends = np.arange(self.window, n + 1)
+        coeffs = np.full((len(ends), p, k + 1), np.nan)
+        
+        if len(ends):
+            x_ok = np.isfinite(X).all(axis=1)
+            valid = x_ok[:, None] & np.isfinite(y)
+            Z = np.column_stack([np.ones(n), np.where(x_ok[:, None], X, 0.0)])
+            
+            groups = {}
+            for j in range(p):
+                groups.setdefault(valid[:, j].tobytes(), []).append(j)
+            
+            for cols in groups.values():
+                coeffs[:, cols, :] = self._fit_group(Z, y[:, cols], valid[:, cols[0]], ends)
+        
+        return ends, coeffs[:, 0, :] if squeeze else coeffs
+    
+    def _window_sums(self, values: np.ndarray) -> np.ndarray:
+        """
+        Sum over each full window along axis 0.
+        
+        Running sums restart every `window` rows, so a window starting at
+        offset j of block b is block b's total, minus block b's sum before
+        j, plus block b + 1's sum before j. Rounding error then scales with
+        the window rather than with the whole series, as it would for
+        differences of one global prefix sum.
+        """
+        n, w = len(values), self.window
+        blocks = -(-n // w) + 1
+        padded = np.zeros((blocks * w,) + values.shape[1:])
+        padded[:n] = values
+        
+        running = np.cumsum(padded.reshape((blocks, w) + values.shape[1:]), axis=1)
+        totals = running[:, -1]
+        before = (running - padded.reshape(running.shape)).reshape(padded.shape)
+        
+        starts = np.arange(n - w + 1)
+        return totals[starts // w] - before[starts] + before[starts + w]
+    
+    def _fit_group(self, Z: np.ndarray, Y: np.ndarray, mask: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """Coefficients (windows, series, k + 1) for series sharing one row mask"""
+        Zm = Z * mask[:, None]
+        Ym = np.where(mask[:, None], Y, 0.0)
+        
+        counts = self._window_sums(mask.astype(float))
+        xtx = self._window_sums(np.einsum('ni,nj->nij', Zm, Zm))
+        xty = self._window_sums(np.einsum('ni,np->nip', Zm, Ym))
+        
+        out = np.full((len(ends), Y.shape[1], Z.shape[1]), np.nan)
+        enough = np.flatnonzero(counts >= self.min_obs)
+        if not len(enough):
+            return out
+        
+        # Condition and solve on X'X scaled to a unit diagonal, so the
+        # check does not depend on the units of each regressor
+        with np.errstate(all='ignore'):
+            scale = np.sqrt(np.einsum('wii->wi', xtx[enough]))
+            scaled = xtx[enough] / scale[:, :, None] / scale[:, None, :]
+            direct = np.isfinite(scaled).all(axis=(1, 2))
+            eigenvalues = np.linalg.eigvalsh(np.where(direct[:, None, None], scaled, np.eye(Z.shape[1])))
+            direct &= eigenvalues[:, 0] * self.cond_limit > eigenvalues[:, -1]
+        
+        if direct.any():
+            rhs = xty[enough[direct]] / scale[direct][:, :, None]
+            solution = np.linalg.solve(scaled[direct], rhs) / scale[direct][:, :, None]
+            out[enough[direct]] = solution.transpose(0, 2, 1)
+        
+        for w in enough[~direct]:
+            self.fallbacks += 1
+            rows = slice(ends[w] - self.window, ends[w])
+            rows_ok = mask[rows]
+            try:
+                solution, _, _, _ = np.linalg.lstsq(Z[rows][rows_ok], Y[rows][rows_ok], rcond=None)
+                out[w] = solution.T
+            except np.linalg.LinAlgError as e:
+                logger.warning(f"Regression failed: {e}")
+        
+        return out
@@ -6,13 +6,15 @@ Exposes AlphaBrain functionality via REST API.
 import logging
 from datetime import datetime
 from typing import Dict, Optional
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from functools import wraps
 import uvicorn
 
+from alphabrain.config import SNAPSHOT_REFRESH_SECONDS
 from alphabrain.service import AlphaBrainService
+from alphabrain.snapshot import AlphaBrainSnapshot, SnapshotPublisher
 
 logging.basicConfig(
     level=logging.INFO,
@@ -33,15 +35,17 @@ app.add_middleware(
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 service: Optional[AlphaBrainService] = None
-_cache = {}
+snapshots: Optional[SnapshotPublisher] = None
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize service on startup"""
-    global service
+    global service, snapshots
     service = AlphaBrainService()
     await service.connect_db()
+    snapshots = SnapshotPublisher(service, interval_seconds=SNAPSHOT_REFRESH_SECONDS)
+    snapshots.start()
     logger.info("AlphaBrain API started")
 
 
@@ -49,11 +53,25 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     global service
+    if snapshots:
+        await snapshots.stop()
     if service:
         await service.close_db()
     logger.info("AlphaBrain API shutdown")
 
 
+def _snapshot_response(request: Request, response: Response, snapshot: AlphaBrainSnapshot, view: str):
+    """Body of one snapshot view, or 304 when the client already has this content"""
+    etag = snapshot.etag(view)
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    response.headers["ETag"] = etag
+    response.headers["X-Snapshot-Version"] = str(snapshot.version)
+    return snapshot.view(view)
+
+
 @app.get("/health")
 async def health():
     """Health check endpoint"""
@@ -61,7 +79,7 @@ async def health():
 
 
 @app.get("/alphabrain/summary")
-async def get_summary():
+async def get_summary(request: Request, response: Response):
     """
     Get comprehensive AlphaBrain summary.
     
@@ -72,25 +90,21 @@ async def get_summary():
         - Playbook recommendations
         - Narrative summary
     
-    Cached for 60s for performance.
+    Served from the shared snapshot, refreshed in the background every
+    ALPHABRAIN_SNAPSHOT_REFRESH_SECONDS. The snapshot-backed endpoints
+    send an ETag derived from their body and answer a matching
+    If-None-Match with 304.
     """
     try:
-        cache_key = "alphabrain:summary"
-        if cache_key in _cache:
-            cached_data, cached_time = _cache[cache_key]
-            if (datetime.now() - cached_time).total_seconds() < 60:
-                return cached_data
-        
-        summary = await service.get_summary()
-        _cache[cache_key] = (summary, datetime.now())
-        return summary
+        snapshot = await snapshots.get()
+        return _snapshot_response(request, response, snapshot, 'summary')
     except Exception as e:
         logger.error(f"Error getting summary: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/alphabrain/regime")
-async def get_regime():
+async def get_regime(request: Request, response: Response):
     """
     Get current macro regime analysis.
     
@@ -102,15 +116,15 @@ async def get_regime():
         - Interpretation
     """
     try:
-        regime_data = await service.macro_detector.update_regime()
-        return regime_data
+        snapshot = await snapshots.get()
+        return _snapshot_response(request, response, snapshot, 'regime')
     except Exception as e:
         logger.error(f"Error getting regime: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/alphabrain/portfolio")
-async def get_portfolio():
+async def get_portfolio(request: Request, response: Response):
     """
     Get portfolio recommendation.
     
@@ -121,21 +135,15 @@ async def get_portfolio():
         - Top picks with rationale
     """
     try:
-        recommendation = await service.generate_portfolio_recommendation()
-        
-        return {
-            'weights': recommendation.get('portfolio_weights', {}),
-            'metrics': recommendation.get('portfolio_metrics', {}),
-            'top_picks': recommendation.get('top_picks', []),
-            'timestamp': recommendation.get('timestamp')
-        }
+        snapshot = await snapshots.get()
+        return _snapshot_response(request, response, snapshot, 'portfolio')
     except Exception as e:
         logger.error(f"Error getting portfolio: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/alphabrain/suggestions")
-async def get_suggestions():
+async def get_suggestions(request: Request, response: Response):
     """
     Get actionable investment suggestions.
     
@@ -146,47 +154,8 @@ async def get_suggestions():
         - Regime-based adjustments
     """
     try:
-        recommendation = await service.generate_portfolio_recommendation()
-        
-        regime = recommendation.get('macro_regime', {})
-        weights = recommendation.get('portfolio_weights', {})
-        top_picks = recommendation.get('top_picks', [])
-        playbook_rec = recommendation.get('playbook_recommendations', {})
-        
-        suggestions = {
-            'timestamp': recommendation.get('timestamp'),
-            'regime_context': {
-                'regime': regime.get('regime'),
-                'confidence': regime.get('confidence'),
-                'interpretation': regime.get('interpretation')
-            },
-            'recommended_strategy': playbook_rec.get('primary_strategy'),
-            'top_picks': top_picks,
-            'actions': []
-        }
-        
-        for pick in top_picks[:3]:
-            action = {
-                'symbol': pick['symbol'],
-                'action': 'BUY' if pick['weight'] > 0.1 else 'ACCUMULATE',
-                'target_weight': pick['weight'],
-                'rationale': pick['rationale'],
-                'confidence': 'HIGH' if pick['weight'] > 0.15 else 'MEDIUM'
-            }
-            suggestions['actions'].append(action)
-        
-        if regime.get('regime') == 'risk_off':
-            suggestions['warnings'] = [
-                "Risk-off regime detected. Consider reducing exposure.",
-                "Increase cash allocation and focus on quality assets."
-            ]
-        elif regime.get('regime') == 'crisis':
-            suggestions['warnings'] = [
-                "Crisis mode. Minimize exposure and preserve capital.",
-                "Wait for regime stabilization before re-entering."
-            ]
-        
-        return suggestions
+        snapshot = await snapshots.get()
+        return _snapshot_response(request, response, snapshot, 'suggestions')
         
     except Exception as e:
         logger.error(f"Error getting suggestions: {e}")
@@ -194,7 +163,7 @@ async def get_suggestions():
 
 
 @app.get("/alphabrain/playbooks")
-async def get_playbooks():
+async def get_playbooks(request: Request, response: Response):
     """
     Get institutional playbook analysis.
     
@@ -204,20 +173,15 @@ async def get_playbooks():
         - Recommended strategy based on regime
     """
     try:
-        recommendation = await service.generate_portfolio_recommendation()
-        
-        return {
-            'playbook_results': recommendation.get('playbook_results', {}),
-            'recommendations': recommendation.get('playbook_recommendations', {}),
-            'timestamp': recommendation.get('timestamp')
-        }
+        snapshot = await snapshots.get()
+        return _snapshot_response(request, response, snapshot, 'playbooks')
     except Exception as e:
         logger.error(f"Error getting playbooks: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/alphabrain/factors")
-async def get_factors():
+async def get_factors(request: Request, response: Response):
     """
     Get factor model analysis.
     
@@ -227,18 +191,8 @@ async def get_factors():
         - Factor weights
     """
     try:
-        factor_exposures = await service.compute_all_factor_exposures()
-        
-        if factor_exposures.empty:
-            return {'factors': {}, 'smart_beta_scores': {}}
-        
-        smart_beta_scores = service.factor_model.compute_smart_beta_scores(factor_exposures)
-        
-        return {
-            'factors': factor_exposures.to_dict('index'),
-            'smart_beta_scores': smart_beta_scores.to_dict(),
-            'model_summary': service.factor_model.get_model_summary()
-        }
+        snapshot = await snapshots.get()
+        return _snapshot_response(request, response, snapshot, 'factors')
     except Exception as e:
         logger.error(f"Error getting factors: {e}")
         raise HTTPException(status_code=500, detail=str(e))
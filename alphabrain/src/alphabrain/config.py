@@ -18,6 +18,8 @@ USE_MOCK_MACRO_DATA = os.getenv('USE_MOCK_MACRO_DATA', 'true').lower() == 'true'
 FACTOR_LOOKBACK_DAYS = int(os.getenv('FACTOR_LOOKBACK_DAYS', '90'))
 FACTOR_REBALANCE_HOURS = int(os.getenv('FACTOR_REBALANCE_HOURS', '24'))
 
+SNAPSHOT_REFRESH_SECONDS = float(os.getenv('ALPHABRAIN_SNAPSHOT_REFRESH_SECONDS', '60'))
+
 VOLATILITY_TARGET = float(os.getenv('VOLATILITY_TARGET', '0.15'))  # 15% annual vol target
 KELLY_FRACTION = float(os.getenv('KELLY_FRACTION', '0.25'))  # Conservative Kelly
 MAX_POSITION_SIZE = float(os.getenv('MAX_POSITION_SIZE', '0.20'))  # 20% max per asset
@@ -142,45 +142,114 @@ class AlphaBrainService:
             
             return metrics
     
-    async def compute_all_factor_exposures(self) -> pd.DataFrame:
-        """Compute factor exposures for all assets"""
-        assets = await self.get_assets()
+    async def get_daily_bars(self, days: Optional[int] = None) -> pd.DataFrame:
+        """
+        Get daily bars for all assets.
         
-        factor_data = []
+        Ticks are aggregated into one close/volume bar per asset and day in
+        the database, in a single query for every asset.
         
-        for asset in assets:
-            asset_id = asset['asset_id']
-            symbol = asset['symbol']
-            
-            price_history = await self.get_asset_price_history(asset_id)
+        Args:
+            days: Days back (default: enough for the factor lookback and the
+                6-month momentum)
+        
+        Returns:
+            DataFrame with columns ['asset_id', 'day', 'close', 'volume'],
+            ordered by asset and day
+        """
+        days = days or self.factor_model.history_days
+        async with self.conn.cursor() as cur:
+            await cur.execute("""
+                SELECT asset_id,
+                       time_bucket('1 day', ts) AS day,
+                       last(price, ts) AS close,
+                       sum(qty) AS volume
+                FROM ticks
+                WHERE ts >= NOW() - %s * INTERVAL '1 day'
+                GROUP BY asset_id, day
+                ORDER BY asset_id, day
+            """, (days,))
             
-            metrics = await self.get_asset_metrics(asset_id)
+            rows = await cur.fetchall()
+        
+        return pd.DataFrame(rows, columns=['asset_id', 'day', 'close', 'volume'])
+    
+    async def get_latest_metrics(self) -> pd.DataFrame:
+        """
+        Get current metrics for all assets, one query per source table.
+        
+        Same fields as get_asset_metrics(), one row per asset id; assets
+        without ticks have no row.
+        """
+        async with self.conn.cursor() as cur:
+            await cur.execute("""
+                SELECT DISTINCT ON (asset_id) asset_id, price
+                FROM ticks
+                ORDER BY asset_id, ts DESC
+            """)
             
-            exposures = await self.factor_model.compute_factor_exposures(
-                metrics, price_history
-            )
+            price_rows = await cur.fetchall()
             
-            exposures['symbol'] = symbol
-            exposures['asset_id'] = asset_id
+            await cur.execute("""
+                SELECT DISTINCT ON (asset_id) asset_id, funding_8h, oi
+                FROM derivatives
+                ORDER BY asset_id, ts DESC
+            """)
             
-            factor_data.append(exposures)
+            deriv_rows = await cur.fetchall()
+        
+        prices = pd.DataFrame(price_rows, columns=['asset_id', 'current_price']).set_index('asset_id')
+        derivs = pd.DataFrame(deriv_rows, columns=['asset_id', 'funding_rate', 'oi']).set_index('asset_id')
+        
+        metrics = prices.join(derivs, how='left')
+        metrics['funding_rate'] = metrics['funding_rate'].astype(float).fillna(0)
+        metrics['oi'] = metrics['oi'].astype(float).fillna(0)
+        metrics['staking_yield'] = 0.0  # Placeholder
+        metrics['market_cap'] = 1e9  # Placeholder
+        metrics['volume_24h'] = 1e8  # Placeholder
+        metrics['spread_bps'] = 10  # Placeholder
+        metrics['ma_200'] = metrics['current_price'] * 0.95  # Approximate
+        
+        return metrics
+    
+    async def compute_all_factor_exposures(self) -> pd.DataFrame:
+        """
+        Compute factor exposures for all assets.
         
-        if not factor_data:
+        Daily bars and latest metrics are loaded for every asset at once,
+        and the exposures computed over the wide price matrix in one pass.
+        """
+        assets = await self.get_assets()
+        
+        if not assets:
             return pd.DataFrame()
         
-        df = pd.DataFrame(factor_data)
-        df.set_index('symbol', inplace=True)
+        bars = await self.get_daily_bars()
+        metrics = await self.get_latest_metrics()
+        
+        asset_ids = [asset['asset_id'] for asset in assets]
+        prices = bars.pivot(index='day', columns='asset_id', values='close')
+        
+        df = self.factor_model.compute_factor_exposures_batch(metrics.reindex(asset_ids), prices)
+        df['asset_id'] = asset_ids
+        df.index = pd.Index([asset['symbol'] for asset in assets], name='symbol')
         
         return df
     
-    async def generate_portfolio_recommendation(self) -> Dict:
-        """Generate complete portfolio recommendation"""
+    async def generate_portfolio_recommendation(self, factor_exposures: Optional[pd.DataFrame] = None) -> Dict:
+        """
+        Generate complete portfolio recommendation
+        
+        Args:
+            factor_exposures: Exposures already computed for this run, if any
+        """
         logger.info("Generating portfolio recommendation...")
         
         regime_data = await self.macro_detector.update_regime()
         logger.info(f"Macro regime: {regime_data['regime']} (confidence: {regime_data['confidence']:.2f})")
         
-        factor_exposures = await self.compute_all_factor_exposures()
+        if factor_exposures is None:
+            factor_exposures = await self.compute_all_factor_exposures()
         
         if factor_exposures.empty:
             logger.warning("No factor exposures computed")
@@ -265,6 +334,10 @@ class AlphaBrainService:
         """Get AlphaBrain summary"""
         recommendation = await self.generate_portfolio_recommendation()
         
+        return self.summarize(recommendation)
+    
+    def summarize(self, recommendation: Dict) -> Dict:
+        """Build the AlphaBrain summary from a portfolio recommendation"""
         return {
             'service': 'AlphaBrain',
             'version': '0.1.0',
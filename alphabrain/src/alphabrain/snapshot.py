@@ -0,0 +1,231 @@
+"""
+AlphaBrain Snapshots
+
+Runs the AlphaBrain pipeline once per refresh and publishes the result as an
+immutable, versioned snapshot that every API endpoint reads:
+- Background refresh on a fixed schedule
+- Single-flight: concurrent misses share one pipeline run
+- Per-view ETags derived from the view content, for conditional requests
+"""
+import json
+import time
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AlphaBrainSnapshot:
+    """
+    One published run of the AlphaBrain pipeline.
+    
+    Each endpoint's response body is built once, when the snapshot is
+    created, and is not modified afterwards. A view's ETag is a digest of
+    its body, so it only changes when that body does (and stays the same
+    across restarts, unlike the version).
+    """
+    version: int
+    created_at: str
+    built_monotonic: float
+    build_seconds: float
+    views: Mapping[str, Dict[str, Any]] = field(default_factory=dict)
+    etags: Mapping[str, str] = field(default_factory=dict)
+    
+    def view(self, name: str) -> Dict[str, Any]:
+        """Response body for one endpoint"""
+        return self.views.get(name, {})
+    
+    def etag(self, name: str) -> str:
+        """ETag of one endpoint's response body"""
+        return self.etags.get(name) or content_etag({})
+    
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.built_monotonic
+
+
+def content_etag(body: Any) -> str:
+    """Strong ETag from a digest of the JSON-encoded body"""
+    encoded = json.dumps(body, sort_keys=True, default=str).encode('utf-8')
+    return f'"{hashlib.sha1(encoded).hexdigest()[:20]}"'
+
+
+def build_views(service, recommendation: Dict, factor_exposures, regime: Dict) -> Dict[str, Dict[str, Any]]:
+    """
+    Response bodies for every snapshot-backed endpoint from one pipeline run.
+    """
+    weights = recommendation.get('portfolio_weights', {})
+    top_picks = recommendation.get('top_picks', [])
+    playbook_rec = recommendation.get('playbook_recommendations', {})
+    
+    suggestions = {
+        'timestamp': recommendation.get('timestamp'),
+        'regime_context': {
+            'regime': regime.get('regime'),
+            'confidence': regime.get('confidence'),
+            'interpretation': regime.get('interpretation')
+        },
+        'recommended_strategy': playbook_rec.get('primary_strategy'),
+        'top_picks': top_picks,
+        'actions': []
+    }
+    
+    for pick in top_picks[:3]:
+        action = {
+            'symbol': pick['symbol'],
+            'action': 'BUY' if pick['weight'] > 0.1 else 'ACCUMULATE',
+            'target_weight': pick['weight'],
+            'rationale': pick['rationale'],
+            'confidence': 'HIGH' if pick['weight'] > 0.15 else 'MEDIUM'
+        }
+        suggestions['actions'].append(action)
+    
+    if regime.get('regime') == 'risk_off':
+        suggestions['warnings'] = [
+            "Risk-off regime detected. Consider reducing exposure.",
+            "Increase cash allocation and focus on quality assets."
+        ]
+    elif regime.get('regime') == 'crisis':
+        suggestions['warnings'] = [
+            "Crisis mode. Minimize exposure and preserve capital.",
+            "Wait for regime stabilization before re-entering."
+        ]
+    
+    if factor_exposures is None or factor_exposures.empty:
+        factors = {'factors': {}, 'smart_beta_scores': {}}
+    else:
+        factors = {
+            'factors': factor_exposures.to_dict('index'),
+            'smart_beta_scores': recommendation.get('smart_beta_scores', {}),
+            'model_summary': service.factor_model.get_model_summary()
+        }
+    
+    return {
+        'summary': service.summarize(recommendation),
+        'regime': regime,
+        'portfolio': {
+            'weights': weights,
+            'metrics': recommendation.get('portfolio_metrics', {}),
+            'top_picks': top_picks,
+            'timestamp': recommendation.get('timestamp')
+        },
+        'suggestions': suggestions,
+        'playbooks': {
+            'playbook_results': recommendation.get('playbook_results', {}),
+            'recommendations': playbook_rec,
+            'timestamp': recommendation.get('timestamp')
+        },
+        'factors': factors
+    }
+
+
+class SnapshotPublisher:
+    """
+    Holds the current AlphaBrainSnapshot and refreshes it.
+    
+    Readers never run the pipeline themselves unless there is no snapshot
+    yet; concurrent cold-start readers wait on the same run. A snapshot
+    older than max_age_seconds (e.g. when the background loop is not
+    running or keeps failing) is still served while a single refresh runs
+    behind it.
+    """
+    
+    def __init__(self, service, interval_seconds: float = 60.0, max_age_seconds: Optional[float] = None):
+        self.service = service
+        self.interval_seconds = interval_seconds
+        self.max_age_seconds = max_age_seconds or 2 * interval_seconds
+        self._snapshot: Optional[AlphaBrainSnapshot] = None
+        self._version = 0
+        self._inflight: Optional[asyncio.Future] = None
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {'refreshes': 0, 'failures': 0}
+    
+    @property
+    def snapshot(self) -> Optional[AlphaBrainSnapshot]:
+        return self._snapshot
+    
+    async def get(self) -> AlphaBrainSnapshot:
+        """Current snapshot, building the first one if there is none"""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            if snapshot.age_seconds() > self.max_age_seconds:
+                self._refresh_single_flight()
+            return snapshot
+        
+        return await asyncio.shield(self._refresh_single_flight())
+    
+    def _refresh_single_flight(self) -> asyncio.Future:
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._refresh())
+            self._inflight.add_done_callback(self._clear_inflight)
+        return self._inflight
+    
+    def _clear_inflight(self, future: asyncio.Future) -> None:
+        self._inflight = None
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Snapshot refresh failed: {future.exception()}")
+    
+    async def refresh(self) -> AlphaBrainSnapshot:
+        """Run the pipeline now (joining a run already in flight)"""
+        return await asyncio.shield(self._refresh_single_flight())
+    
+    async def _refresh(self) -> AlphaBrainSnapshot:
+        started = time.monotonic()
+        try:
+            self.stats['refreshes'] += 1
+            factor_exposures = await self.service.compute_all_factor_exposures()
+            recommendation = await self.service.generate_portfolio_recommendation(factor_exposures)
+            # An empty recommendation (no exposures) carries no regime
+            regime = recommendation.get('macro_regime') or await self.service.macro_detector.update_regime()
+            views = build_views(self.service, recommendation, factor_exposures, regime)
+        except Exception:
+            self.stats['failures'] += 1
+            raise
+        
+        self._version += 1
+        snapshot = AlphaBrainSnapshot(
+            version=self._version,
+            created_at=datetime.now().isoformat(),
+            built_monotonic=time.monotonic(),
+            build_seconds=time.monotonic() - started,
+            views=MappingProxyType(views),
+            etags=MappingProxyType({name: content_etag(body) for name, body in views.items()})
+        )
+        self._snapshot = snapshot
+        
+        logger.info(f"AlphaBrain snapshot v{snapshot.version} published in {snapshot.build_seconds:.2f}s")
+        return snapshot
+    
+    async def run(self) -> None:
+        """Refresh on schedule until cancelled"""
+        logger.info(f"Starting snapshot refresh every {self.interval_seconds}s")
+        
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in snapshot refresh: {e}")
+            
+            await asyncio.sleep(self.interval_seconds)
+    
+    def start(self) -> None:
+        """Start the background refresh loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self.run())
+    
+    async def stop(self) -> None:
+        """Stop the background refresh loop"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
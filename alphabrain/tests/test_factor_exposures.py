@@ -0,0 +1,78 @@
+"""Tests for the batch factor-exposure loader."""
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from alphabrain.service import AlphaBrainService
+
+HISTORY_DAYS = 200
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.result = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, sql, params=None):
+        self.result = self.db.answer(" ".join(sql.split()), params)
+
+    async def fetchall(self):
+        return self.result
+
+    async def fetchone(self):
+        return self.result[0] if self.result else None
+
+
+class FakeDatabase:
+    """Daily bars for two assets, filtered by the query's days-back parameter."""
+
+    def __init__(self):
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.days = [today - timedelta(days=HISTORY_DAYS - 1 - d) for d in range(HISTORY_DAYS)]
+        growth = np.linspace(0, 1, HISTORY_DAYS)
+        self.closes = {1: 100 * np.exp(growth), 2: 50 * np.exp(-growth)}
+        self.days_requested = None
+
+    def cursor(self, row_factory=None):
+        return FakeCursor(self)
+
+    def answer(self, sql, params):
+        if sql.startswith("SELECT * FROM assets"):
+            return [{"asset_id": 1, "symbol": "UP"}, {"asset_id": 2, "symbol": "DOWN"}]
+        if "time_bucket" in sql:
+            self.days_requested = params[0]
+            since = datetime.now(timezone.utc) - timedelta(days=params[0])
+            return [
+                (asset_id, day, float(close), 1.0)
+                for asset_id, closes in self.closes.items()
+                for day, close in zip(self.days, closes)
+                if day >= since.replace(hour=0, minute=0, second=0, microsecond=0)
+            ]
+        if "asset_id, price" in sql:
+            return [(asset_id, float(closes[-1])) for asset_id, closes in self.closes.items()]
+        if "funding_8h" in sql:
+            return []
+        raise AssertionError(f"unexpected query: {sql}")
+
+
+@pytest.mark.asyncio
+async def test_six_month_momentum_uses_enough_history():
+    """With 200 days of bars, momentum_6m is computed rather than left at 0."""
+    service = AlphaBrainService()
+    service.conn = FakeDatabase()
+
+    exposures = await service.compute_all_factor_exposures()
+
+    assert service.conn.days_requested >= 180
+    up, down = exposures.loc["UP"], exposures.loc["DOWN"]
+    closes = service.conn.closes[1]
+    assert up["momentum_6m"] == pytest.approx(closes[-1] / closes[-180] - 1)
+    assert up["momentum_6m"] > up["momentum_3m"] > up["momentum_1m"] > 0
+    assert down["momentum_6m"] < 0
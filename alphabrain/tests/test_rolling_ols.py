@@ -0,0 +1,150 @@
+"""Tests for the running-sum rolling regression against the per-window loop."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from alphabrain.analytics.harvard_analytics import HarvardAnalytics
+from alphabrain.analytics.rolling_ols import RollingOLS
+
+TOLERANCE = 1e-10
+WINDOW = 30
+
+
+def make_returns(n=200, factors=3, seed=7):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-01-01", periods=n, freq="D")
+    factor_returns = pd.DataFrame(
+        rng.normal(0, 0.02, (n, factors)),
+        index=index,
+        columns=[f"f{i}" for i in range(factors)],
+    )
+    betas = rng.normal(1, 0.5, factors)
+    portfolio = pd.Series(
+        0.001 + factor_returns.to_numpy() @ betas + rng.normal(0, 0.01, n),
+        index=index,
+        name="portfolio",
+    )
+    return portfolio, factor_returns
+
+
+def r_squared(portfolio, factor_returns, result, window):
+    """R^2 of each result row, refitted on the same window's usable rows"""
+    positions = portfolio.index.get_indexer(result["date"])
+    coeffs = result.drop(columns="date").to_numpy()
+    values = []
+    for position, row in zip(positions, coeffs):
+        y = portfolio.iloc[position - window:position].to_numpy()
+        X = factor_returns.iloc[position - window:position].to_numpy()
+        ok = np.isfinite(y) & np.isfinite(X).all(axis=1)
+        residuals = y[ok] - row[0] - X[ok] @ row[1:]
+        values.append(1 - residuals @ residuals / ((y[ok] - y[ok].mean()) ** 2).sum())
+    return np.array(values)
+
+
+def assert_matches_loop(analytics, portfolio, factor_returns, window=WINDOW):
+    fast = analytics.rolling_factor_regression(portfolio, factor_returns, window)
+    slow = analytics._rolling_factor_regression_loop(portfolio, factor_returns, window)
+
+    assert list(fast.columns) == list(slow.columns)
+    assert list(fast["date"]) == list(slow["date"])
+    np.testing.assert_allclose(
+        fast.drop(columns="date").to_numpy(),
+        slow.drop(columns="date").to_numpy(),
+        rtol=0,
+        atol=TOLERANCE,
+    )
+    np.testing.assert_allclose(
+        r_squared(portfolio, factor_returns, fast, window),
+        r_squared(portfolio, factor_returns, slow, window),
+        rtol=0,
+        atol=TOLERANCE,
+    )
+    return fast
+
+
+@pytest.fixture
+def analytics():
+    return HarvardAnalytics()
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_matches_loop_on_random_data(analytics, seed):
+    portfolio, factor_returns = make_returns(seed=seed)
+
+    result = assert_matches_loop(analytics, portfolio, factor_returns)
+
+    assert len(result) == len(portfolio) - WINDOW
+    assert list(result.columns) == ["date", "alpha", "beta_f0", "beta_f1", "beta_f2"]
+
+
+def test_nan_rows_are_dropped_from_their_windows(analytics):
+    portfolio, factor_returns = make_returns()
+    portfolio.iloc[[5, 40, 41, 90]] = np.nan
+    factor_returns.iloc[[12, 41, 150], 1] = np.nan
+    # A long gap leaves some windows with fewer than 10 usable rows
+    portfolio.iloc[100:125] = np.nan
+
+    result = assert_matches_loop(analytics, portfolio, factor_returns)
+
+    assert 0 < len(result) < len(portfolio) - WINDOW
+    assert not result.drop(columns="date").isna().any().any()
+
+
+def test_singular_windows_take_lstsq_fallback(analytics):
+    portfolio, factor_returns = make_returns()
+    # One factor is flat (all zero) for a stretch longer than a window
+    factor_returns.iloc[60:110, 0] = 0.0
+
+    assert_matches_loop(analytics, portfolio, factor_returns)
+
+    engine = RollingOLS(WINDOW)
+    engine.fit(portfolio.to_numpy(), factor_returns.to_numpy())
+    assert engine.fallbacks > 0
+
+
+def test_collinear_factors_take_lstsq_fallback(analytics):
+    portfolio, factor_returns = make_returns()
+    factor_returns["f2"] = 2 * factor_returns["f0"] - factor_returns["f1"]
+
+    assert_matches_loop(analytics, portfolio, factor_returns)
+
+    engine = RollingOLS(WINDOW)
+    ends, _ = engine.fit(portfolio.to_numpy(), factor_returns.to_numpy())
+    assert engine.fallbacks == len(ends)
+
+
+def test_window_longer_than_series(analytics):
+    portfolio, factor_returns = make_returns(n=20)
+
+    assert analytics.rolling_factor_regression(portfolio, factor_returns, window=50).empty
+
+    ends, coeffs = RollingOLS(50).fit(portfolio.to_numpy(), factor_returns.to_numpy())
+    assert len(ends) == 0
+    assert coeffs.shape == (0, 4)
+
+
+def test_multi_portfolio_frame_matches_each_series(analytics):
+    portfolio, factor_returns = make_returns()
+    rng = np.random.default_rng(11)
+    portfolios = pd.DataFrame({
+        "a": portfolio,
+        "b": portfolio * 0.5 + rng.normal(0, 0.01, len(portfolio)),
+        "c": portfolio.copy(),
+    })
+    # Different missing-value patterns put the columns in separate solve groups
+    portfolios.iloc[[10, 11, 70], 2] = np.nan
+    portfolios.iloc[130:170, 1] = np.nan
+
+    result = analytics.rolling_factor_regression(portfolios, factor_returns, WINDOW)
+
+    assert list(result.columns[:2]) == ["portfolio", "date"]
+    for name in portfolios.columns:
+        fast = result[result["portfolio"] == name].drop(columns="portfolio").reset_index(drop=True)
+        slow = analytics._rolling_factor_regression_loop(portfolios[name], factor_returns, WINDOW)
+        assert list(fast["date"]) == list(slow["date"])
+        np.testing.assert_allclose(
+            fast.drop(columns="date").to_numpy(),
+            slow.drop(columns="date").to_numpy(),
+            rtol=0,
+            atol=TOLERANCE,
+        )
@@ -0,0 +1,48 @@
+"""Tests for content-derived snapshot ETags."""
+import pytest
+
+from alphabrain.snapshot import SnapshotPublisher
+
+
+class FakeService:
+    """Pipeline stand-in with a fixed timestamp, so output depends only on the inputs."""
+
+    def __init__(self):
+        self.regime = {'regime': 'risk_on', 'confidence': 0.8, 'interpretation': 'Risk-on'}
+        self.weights = {'BTC': 0.6, 'ETH': 0.4}
+
+    async def compute_all_factor_exposures(self):
+        return None
+
+    async def generate_portfolio_recommendation(self, factor_exposures):
+        return {
+            'timestamp': '2024-01-01T00:00:00',
+            'macro_regime': dict(self.regime),
+            'portfolio_weights': dict(self.weights),
+        }
+
+    def summarize(self, recommendation):
+        return {'regime': recommendation['macro_regime']['regime']}
+
+
+@pytest.mark.asyncio
+async def test_etags_follow_view_content_not_version():
+    service = FakeService()
+    publisher = SnapshotPublisher(service)
+
+    first = await publisher.refresh()
+    second = await publisher.refresh()
+    assert (first.version, second.version) == (1, 2)
+    assert dict(second.etags) == dict(first.etags)
+    assert set(first.etags) == set(first.views)
+
+    service.weights = {'BTC': 0.5, 'ETH': 0.5}
+    third = await publisher.refresh()
+    assert third.etag('portfolio') != first.etag('portfolio')
+    assert third.etag('regime') == first.etag('regime')
+    assert third.etag('summary') == first.etag('summary')
+
+    # A restarted publisher starts again at version 1 but gives the same ETags
+    restarted = await SnapshotPublisher(service).refresh()
+    assert restarted.version == 1
+    assert dict(restarted.etags) == dict(third.etags)
@@ -427,7 +427,7 @@ async def get_clusters():
     try:
         print("[RadarAPI] Received clusters request")
         
-        clusters = radar_engine.clusters
+        clusters = list(radar_engine.clusters.values())
         
         high_risk_count = sum(1 for c in clusters if c.get('score', 0) >= 0.70)
         
@@ -1,6 +1,6 @@
 """
 Ultra-Fusion AI Supervisor™ - FastAPI Router
-6 endpoints for meta-intelligence supervision
+8 endpoints for meta-intelligence supervision
 """
 
 import logging
@@ -138,7 +138,7 @@ async def analyze_complete(request: AnalyzeRequest) -> AnalyzeResponse:
             events=request.events or []
         )
         
-        result = supervisor.generate_final_supervisor_output(supervisor_input)
+        result = await supervisor.generate_final_supervisor_output_async(supervisor_input)
         
         return AnalyzeResponse(
             success=True,
@@ -184,7 +184,7 @@ async def analyze_entity(request: EntityRequest) -> EntityResponse:
             events=request.events or []
         )
         
-        result = supervisor.generate_final_supervisor_output(supervisor_input)
+        result = await supervisor.generate_final_supervisor_output_async(supervisor_input)
         
         return EntityResponse(
             success=True,
@@ -231,7 +231,7 @@ async def analyze_token(request: TokenRequest) -> TokenResponse:
             events=request.events or []
         )
         
-        result = supervisor.generate_final_supervisor_output(supervisor_input)
+        result = await supervisor.generate_final_supervisor_output_async(supervisor_input)
         
         return TokenResponse(
             success=True,
@@ -275,7 +275,7 @@ async def analyze_chain(request: ChainRequest) -> ChainResponse:
             events=request.events or []
         )
         
-        result = supervisor.generate_final_supervisor_output(supervisor_input)
+        result = await supervisor.generate_final_supervisor_output_async(supervisor_input)
         
         return ChainResponse(
             success=True,
@@ -325,7 +325,7 @@ async def analyze_image(request: ImageRequest) -> ImageResponse:
             image_metadata=request.image_metadata
         )
         
-        result = supervisor.generate_final_supervisor_output(supervisor_input)
+        result = await supervisor.generate_final_supervisor_output_async(supervisor_input)
         
         return ImageResponse(
             success=True,
@@ -374,6 +374,33 @@ async def health_check() -> HealthResponse:
         )
 
 
+@router.get("/ultrafusion/metrics")
+async def get_engine_metrics() -> Dict[str, Any]:
+    """
+    Engine fan-out metrics
+    
+    GET /ultrafusion/metrics
+    
+    Returns:
+    - Per-engine latency histograms (p50/p99, buckets)
+    - Per-engine timeout and failure counts
+    - Gather latency histogram
+    - Memo cache statistics
+    """
+    try:
+        return {
+            **supervisor.get_engine_metrics(),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except Exception as e:
+        logger.error(f"[UltraFusionAPI] Error getting metrics: {e}")
+        return {
+            "error": str(e),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+
 @router.get("/ultrafusion/info")
 async def get_api_info() -> Dict[str, Any]:
     """
@@ -423,6 +450,11 @@ async def get_api_info() -> Dict[str, Any]:
                     "method": "GET",
                     "description": "Health check endpoint"
                 },
+                {
+                    "path": "/ultrafusion/metrics",
+                    "method": "GET",
+                    "description": "Engine latency histograms and timeouts"
+                },
                 {
                     "path": "/ultrafusion/info",
                     "method": "GET",
@@ -6,6 +6,7 @@ Pure Python, zero external dependencies
 
 import logging
 from typing import Dict, Any, List, Optional, Tuple
+from .ultrafusion_fanout import EngineCall, EngineFanout, FanoutResult
 from .ultrafusion_schema import (
     SupervisorInput,
     SupervisorSignals,
@@ -58,9 +59,28 @@ class UltraFusionSupervisor:
         'blindspot_penalty_max': 0.15
     }
     
-    def __init__(self, weights: Optional[Dict[str, float]] = None):
-        """Initialize Ultra-Fusion Supervisor"""
+    ENGINE_KEYS = [
+        'predictor', 'dna', 'history', 'correlation', 'fusion',
+        'radar', 'cluster', 'actor', 'oracle', 'ghostwriter'
+    ]
+    
+    def __init__(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        fanout: Optional[EngineFanout] = None,
+        engine_deadlines: Optional[Dict[str, float]] = None
+    ):
+        """
+        Initialize Ultra-Fusion Supervisor
+        
+        Args:
+            weights: Fusion weights (defaults to DEFAULT_WEIGHTS)
+            fanout: Engine fan-out executor (concurrency, deadlines, memo)
+            engine_deadlines: Per-engine deadline overrides in seconds
+        """
         self.weights = weights or self.DEFAULT_WEIGHTS.copy()
+        self.fanout = fanout or EngineFanout()
+        self.engine_deadlines = engine_deadlines or {}
         logger.info("[UltraFusion] Supervisor initialized")
     
     @staticmethod
@@ -108,6 +128,11 @@ class UltraFusionSupervisor:
         - Oracle Eye (visual fraud - if image provided)
         - GhostWriter (narrative summaries)
         
+        Independent engines run concurrently, each under its own deadline.
+        Engines that time out or fail are listed in bundle['timed_out'] /
+        bundle['failed'] and contribute an empty section, so the bundle is
+        still usable as a partial result.
+        
         Args:
             entity: Entity address
             token: Token symbol
@@ -121,77 +146,42 @@ class UltraFusionSupervisor:
         try:
             logger.info(f"[UltraFusion] Gathering intelligence for entity={entity}, token={token}, chain={chain}")
             
-            bundle = {
+            plan = self._build_gather_plan(entity, token, chain, image_metadata)
+            return self._assemble_bundle(
+                entity, token, chain, image_metadata, events, plan, self.fanout.run(plan)
+            )
+            
+        except Exception as e:
+            logger.error(f"[UltraFusion] Error gathering intelligence: {e}")
+            return {
                 'entity': entity,
                 'token': token,
                 'chain': chain,
-                'image_metadata': image_metadata or {},
-                'events': events or [],
                 'sources': [],
-                'predictor': {},
-                'dna': {},
-                'history': {},
-                'correlation': {},
-                'fusion': {},
-                'radar': {},
-                'cluster': {},
-                'actor': {},
-                'oracle': {},
-                'ghostwriter': {}
+                'error': str(e)
             }
+    
+    async def gather_all_intelligence_async(
+        self,
+        entity: str = "",
+        token: str = "",
+        chain: str = "",
+        image_metadata: Optional[Dict[str, Any]] = None,
+        events: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of gather_all_intelligence for use inside the event loop
+        
+        Coroutine engines run as asyncio tasks and sync engines on the
+        fan-out thread pool, so the caller's loop is never blocked.
+        """
+        try:
+            logger.info(f"[UltraFusion] Gathering intelligence for entity={entity}, token={token}, chain={chain}")
             
-            if entity or token:
-                bundle['predictor'] = self._gather_predictor(entity, token, chain)
-                if bundle['predictor']:
-                    bundle['sources'].append('predictor')
-            
-            if entity:
-                bundle['dna'] = self._gather_dna(entity)
-                if bundle['dna']:
-                    bundle['sources'].append('dna')
-            
-            if entity:
-                bundle['history'] = self._gather_history(entity)
-                if bundle['history']:
-                    bundle['sources'].append('history')
-            
-            if entity:
-                bundle['correlation'] = self._gather_correlation(entity)
-                if bundle['correlation']:
-                    bundle['sources'].append('correlation')
-            
-            if entity or token:
-                bundle['fusion'] = self._gather_fusion(entity, token, chain)
-                if bundle['fusion']:
-                    bundle['sources'].append('fusion')
-            
-            if entity or token or chain:
-                bundle['radar'] = self._gather_radar(entity, token, chain)
-                if bundle['radar']:
-                    bundle['sources'].append('radar')
-            
-            if entity:
-                bundle['cluster'] = self._gather_cluster(entity)
-                if bundle['cluster']:
-                    bundle['sources'].append('cluster')
-            
-            if entity:
-                bundle['actor'] = self._gather_actor(entity)
-                if bundle['actor']:
-                    bundle['sources'].append('actor')
-            
-            if image_metadata:
-                bundle['oracle'] = self._gather_oracle(image_metadata)
-                if bundle['oracle']:
-                    bundle['sources'].append('oracle')
-            
-            if entity or token:
-                bundle['ghostwriter'] = self._gather_ghostwriter(entity, token, chain)
-                if bundle['ghostwriter']:
-                    bundle['sources'].append('ghostwriter')
-            
-            logger.info(f"[UltraFusion] Gathered intelligence from {len(bundle['sources'])} sources")
-            return bundle
+            plan = self._build_gather_plan(entity, token, chain, image_metadata)
+            return self._assemble_bundle(
+                entity, token, chain, image_metadata, events, plan, await self.fanout.run_async(plan)
+            )
             
         except Exception as e:
             logger.error(f"[UltraFusion] Error gathering intelligence: {e}")
@@ -203,6 +193,85 @@ class UltraFusionSupervisor:
                 'error': str(e)
             }
     
+    def _build_gather_plan(
+        self,
+        entity: str,
+        token: str,
+        chain: str,
+        image_metadata: Optional[Dict[str, Any]]
+    ) -> List[EngineCall]:
+        """Select the engines that apply to this request, in source order"""
+        plan = []
+        
+        def add(name: str, fn, *args, memoize: bool = True) -> None:
+            plan.append(EngineCall(
+                name=name,
+                fn=fn,
+                args=args,
+                deadline_seconds=self.engine_deadlines.get(name),
+                memoize=memoize
+            ))
+        
+        if entity or token:
+            add('predictor', self._gather_predictor, entity, token, chain)
+        if entity:
+            add('dna', self._gather_dna, entity)
+            add('history', self._gather_history, entity)
+            add('correlation', self._gather_correlation, entity)
+        if entity or token:
+            add('fusion', self._gather_fusion, entity, token, chain)
+        if entity or token or chain:
+            add('radar', self._gather_radar, entity, token, chain)
+        if entity:
+            add('cluster', self._gather_cluster, entity)
+            add('actor', self._gather_actor, entity)
+        if image_metadata:
+            add('oracle', self._gather_oracle, image_metadata, memoize=False)
+        if entity or token:
+            add('ghostwriter', self._gather_ghostwriter, entity, token, chain)
+        
+        return plan
+    
+    def _assemble_bundle(
+        self,
+        entity: str,
+        token: str,
+        chain: str,
+        image_metadata: Optional[Dict[str, Any]],
+        events: Optional[List[Dict[str, Any]]],
+        plan: List[EngineCall],
+        outcome: FanoutResult
+    ) -> Dict[str, Any]:
+        """Build the intelligence bundle from a fan-out outcome"""
+        bundle = {
+            'entity': entity,
+            'token': token,
+            'chain': chain,
+            'image_metadata': image_metadata or {},
+            'events': events or [],
+            'sources': [],
+            'timed_out': list(outcome.timed_out),
+            'failed': dict(outcome.failed),
+            'cached': list(outcome.cached),
+            'engine_latency_ms': dict(outcome.latency_ms),
+            'gather_ms': outcome.total_ms,
+            'partial': outcome.partial
+        }
+        for key in self.ENGINE_KEYS:
+            bundle[key] = {}
+        
+        for call in plan:
+            data = outcome.results.get(call.name)
+            if data:
+                bundle[call.name] = data
+                bundle['sources'].append(call.name)
+        
+        logger.info(
+            f"[UltraFusion] Gathered intelligence from {len(bundle['sources'])} sources "
+            f"in {outcome.total_ms:.1f}ms (timed_out={outcome.timed_out}, cached={len(outcome.cached)})"
+        )
+        return bundle
+    
     def compute_meta_signals(self, bundle: Dict[str, Any]) -> SupervisorSignals:
         """
         Extract high-level meta-signals from intelligence bundle
@@ -644,6 +713,46 @@ class UltraFusionSupervisor:
                 events=supervisor_input.events
             )
             
+            return self._build_supervisor_output(supervisor_input, bundle)
+            
+        except Exception as e:
+            logger.error(f"[UltraFusion] Error generating final output: {e}")
+            return self._error_output(e)
+    
+    async def generate_final_supervisor_output_async(
+        self,
+        supervisor_input: SupervisorInput
+    ) -> Dict[str, Any]:
+        """
+        Async variant of generate_final_supervisor_output
+        
+        Gathers with gather_all_intelligence_async so API handlers do not
+        block the event loop while engines run.
+        """
+        try:
+            logger.info("[UltraFusion] Generating final supervisor output")
+            
+            bundle = await self.gather_all_intelligence_async(
+                entity=supervisor_input.entity,
+                token=supervisor_input.token,
+                chain=supervisor_input.chain,
+                image_metadata=supervisor_input.image_metadata,
+                events=supervisor_input.events
+            )
+            
+            return self._build_supervisor_output(supervisor_input, bundle)
+            
+        except Exception as e:
+            logger.error(f"[UltraFusion] Error generating final output: {e}")
+            return self._error_output(e)
+    
+    def _build_supervisor_output(
+        self,
+        supervisor_input: SupervisorInput,
+        bundle: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Derive decision, narrative and summary from a gathered bundle"""
+        try:
             signals = self.compute_meta_signals(bundle)
             
             fusion = self.normalize_and_fuse(bundle, signals)
@@ -695,7 +804,12 @@ class UltraFusionSupervisor:
                     'sources': bundle.get('sources', []),
                     'entity': bundle.get('entity', ''),
                     'token': bundle.get('token', ''),
-                    'chain': bundle.get('chain', '')
+                    'chain': bundle.get('chain', ''),
+                    'partial': bundle.get('partial', False),
+                    'timed_out': bundle.get('timed_out', []),
+                    'failed': bundle.get('failed', {}),
+                    'cached': bundle.get('cached', []),
+                    'gather_ms': bundle.get('gather_ms', 0.0)
                 }
             }
             
@@ -704,12 +818,16 @@ class UltraFusionSupervisor:
             
         except Exception as e:
             logger.error(f"[UltraFusion] Error generating final output: {e}")
-            return {
-                'decision': SupervisorDecision(classification="ERROR").to_dict(),
-                'narrative': SupervisorNarrative(full_narrative="Error generating output").to_dict(),
-                'summary': SupervisorSummary(classification="ERROR").to_dict(),
-                'error': str(e)
-            }
+            return self._error_output(e)
+    
+    def _error_output(self, error: Exception) -> Dict[str, Any]:
+        """Fallback supervisor output when analysis fails"""
+        return {
+            'decision': SupervisorDecision(classification="ERROR").to_dict(),
+            'narrative': SupervisorNarrative(full_narrative="Error generating output").to_dict(),
+            'summary': SupervisorSummary(classification="ERROR").to_dict(),
+            'error': str(error)
+        }
     
     def get_health(self) -> Dict[str, Any]:
         """
@@ -724,6 +842,7 @@ class UltraFusionSupervisor:
                 'engine': 'Ultra-Fusion AI Supervisor™',
                 'version': '1.0.0',
                 'weights': self.weights,
+                'engine_deadline_ms': self.fanout.default_deadline_seconds * 1000,
                 'timestamp': 'operational'
             }
         except Exception as e:
@@ -734,6 +853,15 @@ class UltraFusionSupervisor:
                 'error': str(e)
             }
     
+    def get_engine_metrics(self) -> Dict[str, Any]:
+        """
+        Get per-engine latency histograms, timeouts and memo statistics
+        
+        Returns:
+            Metrics dictionary from the engine fan-out
+        """
+        return self.fanout.get_metrics()
+    
     
     def _gather_predictor(self, entity: str, token: str, chain: str) -> Dict[str, Any]:
         """Simulate gathering from Predictor"""
@@ -0,0 +1,320 @@
+"""
+Ultra-Fusion Engine Fan-Out
+Runs independent intelligence engines concurrently with per-engine deadlines,
+short-TTL memoization and per-engine latency histograms.
+Pure Python, zero external dependencies
+"""
+
+import asyncio
+import bisect
+import inspect
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+@dataclass
+class EngineCall:
+    """One engine invocation in a fan-out plan."""
+    name: str
+    fn: Callable[..., Any]
+    args: Tuple[Any, ...] = ()
+    deadline_seconds: Optional[float] = None
+    memoize: bool = True
+
+
+@dataclass
+class FanoutResult:
+    """Outcome of a fan-out: results for completed engines plus what did not finish."""
+    results: Dict[str, Any] = field(default_factory=dict)
+    timed_out: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    cached: List[str] = field(default_factory=list)
+    latency_ms: Dict[str, float] = field(default_factory=dict)
+    total_ms: float = 0.0
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.timed_out or self.failed)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram with a bounded window of recent samples
+    for p50/p99.
+    """
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = LATENCY_BUCKETS_MS, window: int = 1024):
+        self.buckets_ms = buckets_ms
+        self.counts = [0] * (len(buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, value_ms: float) -> None:
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets_ms, value_ms)] += 1
+            self.count += 1
+            self.total_ms += value_ms
+            self._recent.append(value_ms)
+
+    def percentile(self, q: float) -> float:
+        with self._lock:
+            samples = sorted(self._recent)
+        if not samples:
+            return 0.0
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"le_{b}" for b in self.buckets_ms] + ["le_inf"]
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'p50_ms': round(self.percentile(0.50), 3),
+            'p99_ms': round(self.percentile(0.99), 3),
+            'buckets': dict(zip(labels, self.counts)),
+        }
+
+
+class TTLMemo:
+    """Small thread-safe memo of engine outputs keyed by (engine, args), expiring after ttl."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        if self.ttl_seconds <= 0:
+            return False, None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return False, None
+            return True, value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                now = time.monotonic()
+                self._entries = {k: v for k, v in self._entries.items() if v[0] >= now}
+                if len(self._entries) >= self.max_entries:
+                    # Still full of live entries: drop the oldest insertion
+                    self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class EngineFanout:
+    """
+    Concurrent executor for intelligence engine calls.
+
+    Sync engines run on a shared thread pool; coroutine engines run as
+    asyncio tasks (run_async). Each call has its own deadline measured from
+    the start of the fan-out; engines that miss it are reported in
+    ``timed_out`` and the fan-out returns with whatever finished. A late
+    result still lands in the memo so the next request for the same entity
+    is served from cache.
+    """
+
+    def __init__(
+        self,
+        default_deadline_seconds: Optional[float] = None,
+        memo_ttl_seconds: Optional[float] = None,
+        max_workers: Optional[int] = None
+    ):
+        self.default_deadline_seconds = default_deadline_seconds or float(
+            os.getenv("ULTRAFUSION_ENGINE_DEADLINE_MS", 2000)
+        ) / 1000
+        if memo_ttl_seconds is None:
+            memo_ttl_seconds = float(os.getenv("ULTRAFUSION_MEMO_TTL_SECONDS", 30))
+        self.memo = TTLMemo(memo_ttl_seconds)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or int(os.getenv("ULTRAFUSION_MAX_WORKERS", 16)),
+            thread_name_prefix="ultrafusion-engine"
+        )
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._timeouts: Dict[str, int] = {}
+        self._failures: Dict[str, int] = {}
+        self._cache_hits = 0
+        self._lock = threading.Lock()
+
+    def _histogram(self, name: str) -> LatencyHistogram:
+        with self._lock:
+            hist = self._histograms.get(name)
+            if hist is None:
+                hist = self._histograms[name] = LatencyHistogram()
+            return hist
+
+    def _count(self, counter: Dict[str, int], name: str) -> None:
+        with self._lock:
+            counter[name] = counter.get(name, 0) + 1
+
+    def _memo_key(self, call: EngineCall) -> Optional[Hashable]:
+        if not call.memoize:
+            return None
+        key = (call.name, call.args)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _lookup(self, call: EngineCall, result: FanoutResult) -> Tuple[Optional[Hashable], bool]:
+        key = self._memo_key(call)
+        if key is not None:
+            hit, value = self.memo.get(key)
+            if hit:
+                result.results[call.name] = value
+                result.cached.append(call.name)
+                result.latency_ms[call.name] = 0.0
+                with self._lock:
+                    self._cache_hits += 1
+                return key, True
+        return key, False
+
+    def _timed(self, call: EngineCall, key: Optional[Hashable]) -> Any:
+        start = time.perf_counter()
+        try:
+            value = call.fn(*call.args)
+        finally:
+            self._histogram(call.name).observe((time.perf_counter() - start) * 1000)
+        if key is not None:
+            self.memo.put(key, value)
+        return value
+
+    async def _timed_async(self, call: EngineCall, key: Optional[Hashable]) -> Any:
+        start = time.perf_counter()
+        try:
+            value = await call.fn(*call.args)
+        finally:
+            self._histogram(call.name).observe((time.perf_counter() - start) * 1000)
+        if key is not None:
+            self.memo.put(key, value)
+        return value
+
+    def _deadline(self, call: EngineCall) -> float:
+        return call.deadline_seconds if call.deadline_seconds is not None else self.default_deadline_seconds
+
+    def _record_failure(self, name: str, error: BaseException, result: FanoutResult) -> None:
+        logger.warning(f"[UltraFusion] Engine {name} failed: {error}")
+        result.failed[name] = str(error)
+        self._count(self._failures, name)
+
+    def _record_timeout(self, name: str, result: FanoutResult) -> None:
+        logger.warning(f"[UltraFusion] Engine {name} missed its deadline")
+        result.timed_out.append(name)
+        self._count(self._timeouts, name)
+
+    def run(self, calls: List[EngineCall]) -> FanoutResult:
+        """Run sync engine calls concurrently on the thread pool."""
+        result = FanoutResult()
+        start = time.perf_counter()
+        pending = {}
+        for call in calls:
+            key, hit = self._lookup(call, result)
+            if not hit:
+                pending[self._executor.submit(self._timed, call, key)] = (call, start + self._deadline(call))
+
+        while pending:
+            now = time.perf_counter()
+            for future, (call, deadline) in list(pending.items()):
+                if not future.done() and deadline <= now:
+                    del pending[future]
+                    self._record_timeout(call.name, result)
+            if not pending:
+                break
+            next_deadline = min(deadline for _, deadline in pending.values())
+            done, _ = wait(list(pending), timeout=max(0.0, next_deadline - now), return_when=FIRST_COMPLETED)
+            for future in done:
+                call, _ = pending.pop(future)
+                error = future.exception()
+                if error is not None:
+                    self._record_failure(call.name, error, result)
+                else:
+                    result.results[call.name] = future.result()
+                    result.latency_ms[call.name] = round((time.perf_counter() - start) * 1000, 3)
+
+        result.total_ms = round((time.perf_counter() - start) * 1000, 3)
+        self._histogram("gather").observe(result.total_ms)
+        return result
+
+    async def run_async(self, calls: List[EngineCall]) -> FanoutResult:
+        """Run engine calls concurrently: coroutines as tasks, sync engines on the thread pool."""
+        result = FanoutResult()
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+
+        async def run_one(call: EngineCall, key: Optional[Hashable]) -> None:
+            if inspect.iscoroutinefunction(call.fn):
+                awaitable = self._timed_async(call, key)
+            else:
+                awaitable = loop.run_in_executor(self._executor, self._timed, call, key)
+            try:
+                value = await asyncio.wait_for(awaitable, timeout=self._deadline(call))
+            except asyncio.TimeoutError:
+                self._record_timeout(call.name, result)
+            except Exception as e:
+                self._record_failure(call.name, e, result)
+            else:
+                result.results[call.name] = value
+                result.latency_ms[call.name] = round((time.perf_counter() - start) * 1000, 3)
+
+        tasks = []
+        for call in calls:
+            key, hit = self._lookup(call, result)
+            if not hit:
+                tasks.append(run_one(call, key))
+        if tasks:
+            await asyncio.gather(*tasks)
+
+        result.total_ms = round((time.perf_counter() - start) * 1000, 3)
+        self._histogram("gather").observe(result.total_ms)
+        return result
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-engine latency histograms, timeout/failure counts and memo stats."""
+        with self._lock:
+            histograms = dict(self._histograms)
+            timeouts = dict(self._timeouts)
+            failures = dict(self._failures)
+            cache_hits = self._cache_hits
+        return {
+            'engines': {
+                name: {**hist.to_dict(), 'timeouts': timeouts.get(name, 0), 'failures': failures.get(name, 0)}
+                for name, hist in histograms.items() if name != "gather"
+            },
+            'gather': histograms["gather"].to_dict() if "gather" in histograms else LatencyHistogram().to_dict(),
+            'memo': {
+                'entries': len(self.memo),
+                'ttl_seconds': self.memo.ttl_seconds,
+                'hits': cache_hits,
+            },
+            'default_deadline_ms': self.default_deadline_seconds * 1000,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
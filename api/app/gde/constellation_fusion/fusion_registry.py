@@ -153,13 +153,13 @@ class ConstellationFusionRegistry:
         try:
             result = constellation_fusion_service.process_event(event)
             
-            # Call any registered handlers
-            if event_type in self._event_handlers:
-                for handler in self._event_handlers[event_type]:
-                    try:
-                        handler(event)
-                    except Exception as e:
-                        logger.error(f"Event handler error for {event_type}: {e}")
+            # Call any registered handlers ("*" handlers receive every event)
+            handlers = self._event_handlers.get(event_type, []) + self._event_handlers.get("*", [])
+            for handler in handlers:
+                try:
+                    handler(event)
+                except Exception as e:
+                    logger.error(f"Event handler error for {event_type}: {e}")
             
             logger.debug(f"Processed event: {event_type} from {source_engine}")
             return result
@@ -88,6 +88,23 @@ async def get_constellation_graph():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/graph/changes")
+async def get_constellation_changes(
+    since: int = Query(default=0, ge=0, description="Graph version the client already holds"),
+):
+    """
+    Get the constellation changes since a known graph version.
+    
+    Returns added, updated and removed nodes, edges and clusters. Falls back
+    to a full snapshot (``full: true``) when ``since`` is older than the
+    retained change log.
+    """
+    try:
+        return constellation_fusion_service.get_changes_since(since)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/metrics", response_model=MetricsResponse)
 async def get_constellation_metrics():
     """
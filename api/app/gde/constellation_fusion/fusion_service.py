@@ -4,11 +4,12 @@ Constellation Fusion Pipeline - Service Layer
 Core business logic for managing the constellation graph.
 """
 
+import heapq
 import math
 import random
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
-from collections import defaultdict
+from collections import defaultdict, deque
 
 from .fusion_models import (
     ConstellationNode,
@@ -22,13 +23,30 @@ from .fusion_models import (
 )
 
 
+HIGH_RISK_THRESHOLD = 0.7
+
+# Change-log entity kinds and operations
+KIND_NODE = "nodes"
+KIND_EDGE = "edges"
+KIND_CLUSTER = "clusters"
+OP_ADDED = "added"
+OP_UPDATED = "updated"
+OP_REMOVED = "removed"
+
+
 class ConstellationFusionService:
     """
     Service class for managing the Global Threat Constellation.
     Handles nodes, edges, clusters, and risk computation.
+    
+    Every mutation bumps a monotonically increasing graph version and is
+    recorded in a bounded change log, so clients can ask for the changes
+    since a version they already hold instead of the whole graph. Global
+    risk inputs (risk sums, hydra/whale counts, high-risk set) are kept as
+    running aggregates and never require a walk over all nodes.
     """
     
-    def __init__(self):
+    def __init__(self, max_change_log: int = 50000):
         # In-memory storage
         self._nodes: Dict[str, ConstellationNode] = {}
         self._edges: Dict[str, ConstellationEdge] = {}
@@ -36,10 +54,39 @@ class ConstellationFusionService:
         self._events: List[FusionEvent] = []
         self._metrics = ConstellationMetrics()
         
+        # Versioning and change log: (version, kind, key, op)
+        self._version = 0
+        self._change_log: deque = deque(maxlen=max_change_log)
+        
+        # Incrementally maintained risk aggregates
+        self._node_risk_sum = 0.0
+        self._cluster_risk_sum = 0.0
+        self._category_counts: Dict[NodeCategory, int] = defaultdict(int)
+        self._high_risk_ids: set = set()
+        
         # Spatial layout parameters
         self._layout_radius = 100.0
         self._cluster_spacing = 50.0
     
+    @property
+    def version(self) -> int:
+        """Current graph version."""
+        return self._version
+    
+    def _record_change(self, kind: str, key: str, op: str) -> None:
+        """Bump the graph version and append to the change log."""
+        self._version += 1
+        self._change_log.append((self._version, kind, key, op))
+    
+    def _set_node_risk(self, node: ConstellationNode, risk_score: float) -> None:
+        """Update a node's risk score while keeping the running aggregates in sync."""
+        self._node_risk_sum += risk_score - node.risk_score
+        node.risk_score = risk_score
+        if risk_score >= HIGH_RISK_THRESHOLD:
+            self._high_risk_ids.add(node.id)
+        else:
+            self._high_risk_ids.discard(node.id)
+    
     def add_node(
         self,
         entity_address: str,
@@ -56,7 +103,7 @@ class ConstellationFusionService:
         if entity_id in self._nodes:
             # Update existing node
             node = self._nodes[entity_id]
-            node.risk_score = max(node.risk_score, risk_score)
+            self._set_node_risk(node, max(node.risk_score, risk_score))
             node.last_updated = datetime.utcnow()
             if metadata:
                 node.metadata.update(metadata)
@@ -65,6 +112,7 @@ class ConstellationFusionService:
                     if tag not in node.tags:
                         node.tags.append(tag)
             node._compute_color()
+            self._record_change(KIND_NODE, entity_id, OP_UPDATED)
         else:
             # Create new node with random position
             x, y, z = self._compute_node_position(entity_id)
@@ -79,6 +127,11 @@ class ConstellationFusionService:
                 tags=tags or [],
             )
             self._nodes[entity_id] = node
+            self._node_risk_sum += node.risk_score
+            self._category_counts[node.category] += 1
+            if node.risk_score >= HIGH_RISK_THRESHOLD:
+                self._high_risk_ids.add(entity_id)
+            self._record_change(KIND_NODE, entity_id, OP_ADDED)
         
         # Update metrics
         self._update_metrics()
@@ -115,6 +168,7 @@ class ConstellationFusionService:
             edge.confidence = max(edge.confidence, confidence)
             if metadata:
                 edge.metadata.update(metadata)
+            op = OP_UPDATED
         else:
             # Create new edge
             edge = ConstellationEdge(
@@ -126,11 +180,13 @@ class ConstellationFusionService:
                 metadata=metadata or {},
             )
             self._edges[edge_key] = edge
+            op = OP_ADDED
         
         # Compute correlation based on node risk scores
         source_node = self._nodes[source_id]
         target_node = self._nodes[target_id]
         edge.correlation = (source_node.risk_score + target_node.risk_score) / 2
+        self._record_change(KIND_EDGE, edge_key, op)
         
         # Update metrics
         self._update_metrics()
@@ -158,6 +214,7 @@ class ConstellationFusionService:
                 for node_id in node_ids:
                     if node_id.lower() not in cluster.node_ids:
                         cluster.node_ids.append(node_id.lower())
+            op = OP_UPDATED
         else:
             # Create new cluster
             cx, cy, cz = self._compute_cluster_position(cluster_id)
@@ -170,6 +227,7 @@ class ConstellationFusionService:
                 center_z=cz,
             )
             self._clusters[cluster_id] = cluster
+            op = OP_ADDED
         
         # Compute risk score from risk level
         risk_scores = {
@@ -180,34 +238,74 @@ class ConstellationFusionService:
             RiskLevel.HIGH: 0.8,
             RiskLevel.CRITICAL: 0.95,
         }
-        cluster.risk_score = risk_scores.get(risk_level, 0.5)
+        new_risk = risk_scores.get(risk_level, 0.5)
+        self._cluster_risk_sum += new_risk - (cluster.risk_score if op == OP_UPDATED else 0.0)
+        cluster.risk_score = new_risk
+        self._record_change(KIND_CLUSTER, cluster_id, op)
         
         # Update metrics
         self._update_metrics()
         
         return cluster
     
+    def remove_edge(self, edge_key: str) -> bool:
+        """
+        Remove an edge by its key (source_target_relation).
+        """
+        if self._edges.pop(edge_key, None) is None:
+            return False
+        self._record_change(KIND_EDGE, edge_key, OP_REMOVED)
+        self._update_metrics()
+        return True
+    
+    def remove_node(self, entity_address: str) -> bool:
+        """
+        Remove a node along with its incident edges and cluster memberships.
+        """
+        entity_id = entity_address.lower()
+        node = self._nodes.pop(entity_id, None)
+        if node is None:
+            return False
+        
+        self._node_risk_sum -= node.risk_score
+        self._category_counts[node.category] -= 1
+        self._high_risk_ids.discard(entity_id)
+        
+        for edge_key in [k for k, e in self._edges.items() if entity_id in (e.source_id, e.target_id)]:
+            del self._edges[edge_key]
+            self._record_change(KIND_EDGE, edge_key, OP_REMOVED)
+        
+        for cluster in self._clusters.values():
+            if entity_id in cluster.node_ids:
+                cluster.node_ids.remove(entity_id)
+                self._record_change(KIND_CLUSTER, cluster.cluster_id, OP_UPDATED)
+        
+        self._record_change(KIND_NODE, entity_id, OP_REMOVED)
+        self._update_metrics()
+        return True
+    
     def recompute_global_risk(self) -> float:
         """
         Recompute the global risk score based on all nodes and clusters.
+        
+        O(1): reads the running node/cluster risk sums and category counts.
         """
         if not self._nodes:
             self._metrics.global_risk_score = 0.0
             return 0.0
         
         # Weighted average of node risks
-        total_risk = sum(node.risk_score for node in self._nodes.values())
-        avg_node_risk = total_risk / len(self._nodes)
+        avg_node_risk = self._node_risk_sum / len(self._nodes)
         
         # Factor in cluster risks
         if self._clusters:
-            cluster_risk = sum(c.risk_score for c in self._clusters.values()) / len(self._clusters)
+            cluster_risk = self._cluster_risk_sum / len(self._clusters)
             global_risk = (avg_node_risk * 0.6) + (cluster_risk * 0.4)
         else:
             global_risk = avg_node_risk
         
         # Factor in hydra heads (high-risk coordinated nodes)
-        hydra_count = sum(1 for n in self._nodes.values() if n.category == NodeCategory.HYDRA_HEAD)
+        hydra_count = self._category_counts[NodeCategory.HYDRA_HEAD]
         if hydra_count > 0:
             hydra_factor = min(hydra_count * 0.05, 0.3)
             global_risk = min(global_risk + hydra_factor, 1.0)
@@ -254,6 +352,7 @@ class ConstellationFusionService:
             "success": True,
             "source": source,
             "map": {
+                "version": self._version,
                 "nodes": nodes,
                 "edges": edges,
                 "global_risk_score": self._metrics.global_risk_score if self._nodes else 0.45,
@@ -266,6 +365,65 @@ class ConstellationFusionService:
             "timestamp": datetime.utcnow().isoformat(),
         }
     
+    def get_changes_since(self, since_version: int) -> Dict:
+        """
+        Return the graph delta between ``since_version`` and the current version.
+        
+        Entities touched several times are collapsed to their final state.
+        If ``since_version`` is older than the retained change log (or in the
+        future), a full snapshot is returned with ``full`` set to True.
+        """
+        oldest_available = self._change_log[0][0] - 1 if self._change_log else self._version
+        if since_version < oldest_available or since_version > self._version:
+            snapshot = self.serialize_constellation()
+            snapshot["full"] = True
+            snapshot["from_version"] = since_version
+            snapshot["version"] = self._version
+            return snapshot
+        
+        # Binary search for the first entry newer than since_version
+        lo, hi = 0, len(self._change_log)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._change_log[mid][0] <= since_version:
+                lo = mid + 1
+            else:
+                hi = mid
+        
+        first_op: Dict[Tuple[str, str], str] = {}
+        last_op: Dict[Tuple[str, str], str] = {}
+        for i in range(lo, len(self._change_log)):
+            _, kind, key, op = self._change_log[i]
+            first_op.setdefault((kind, key), op)
+            last_op[(kind, key)] = op
+        
+        stores = {KIND_NODE: self._nodes, KIND_EDGE: self._edges, KIND_CLUSTER: self._clusters}
+        changes = {
+            kind: {OP_ADDED: [], OP_UPDATED: [], OP_REMOVED: []}
+            for kind in stores
+        }
+        for (kind, key), op in last_op.items():
+            created = first_op[(kind, key)] == OP_ADDED
+            if op == OP_REMOVED:
+                if not created:
+                    changes[kind][OP_REMOVED].append(key)
+                continue
+            entity = stores[kind].get(key)
+            if entity is None:
+                continue
+            changes[kind][OP_ADDED if created else OP_UPDATED].append(entity.to_dict())
+        
+        self.recompute_global_risk()
+        return {
+            "success": True,
+            "full": False,
+            "from_version": since_version,
+            "version": self._version,
+            "changes": changes,
+            "global_risk_score": self._metrics.global_risk_score,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+    
     def _generate_synthetic_nodes(self) -> list:
         """Generate minimum viable synthetic nodes for 3D visualization."""
         import hashlib
@@ -423,9 +581,7 @@ class ConstellationFusionService:
         all_nodes = [origin] + participants if origin else participants
         self.increment_cluster(cluster_id, risk_level, all_nodes)
         
-        self._metrics.hydra_heads_detected = sum(
-            1 for n in self._nodes.values() if n.category == NodeCategory.HYDRA_HEAD
-        )
+        self._metrics.hydra_heads_detected = self._category_counts[NodeCategory.HYDRA_HEAD]
         
         return True
     
@@ -489,9 +645,7 @@ class ConstellationFusionService:
                 metadata={"amount_usd": amount_usd, "chain": chain, "direction": "outflow"},
             )
         
-        self._metrics.whale_nodes = sum(
-            1 for n in self._nodes.values() if n.category == NodeCategory.WHALE
-        )
+        self._metrics.whale_nodes = self._category_counts[NodeCategory.WHALE]
         
         return True
     
@@ -617,19 +771,13 @@ class ConstellationFusionService:
         self._metrics.total_nodes = len(self._nodes)
         self._metrics.total_edges = len(self._edges)
         self._metrics.total_clusters = len(self._clusters)
-        self._metrics.hydra_heads_detected = sum(
-            1 for n in self._nodes.values() if n.category == NodeCategory.HYDRA_HEAD
-        )
-        self._metrics.whale_nodes = sum(
-            1 for n in self._nodes.values() if n.category == NodeCategory.WHALE
-        )
+        self._metrics.hydra_heads_detected = self._category_counts[NodeCategory.HYDRA_HEAD]
+        self._metrics.whale_nodes = self._category_counts[NodeCategory.WHALE]
         
         # Get high risk entities
-        high_risk = [
-            n.id for n in self._nodes.values()
-            if n.risk_score >= 0.7
-        ]
-        self._metrics.high_risk_entities = sorted(high_risk, key=lambda x: self._nodes[x].risk_score, reverse=True)[:10]
+        self._metrics.high_risk_entities = heapq.nlargest(
+            10, self._high_risk_ids, key=lambda x: self._nodes[x].risk_score
+        )
         
         self.recompute_global_risk()
 
@@ -15,6 +15,8 @@ from enum import Enum
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 
+from app.services.broadcast_hub import BroadcastHub
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,6 +29,7 @@ class StreamEventType(str, Enum):
     RISK_UPDATE = "risk_update"
     LABEL_UPDATE = "label_update"
     TIMELINE_EVENT = "timeline_event"
+    GRAPH_DELTA = "graph_delta"
     HEARTBEAT = "heartbeat"
     CONNECTION = "connection"
     ERROR = "error"
@@ -52,12 +55,18 @@ class StreamEvent:
 
 
 class ConnectionManager:
-    """Manages WebSocket connections for constellation streaming."""
+    """
+    Manages WebSocket connections for constellation streaming.
+    
+    Outbound frames go through a BroadcastHub: each event is encoded once
+    and every client drains its own bounded queue on a dedicated writer task.
+    """
     
     def __init__(self):
         self.active_connections: Set[WebSocket] = set()
         self.subscriptions: Dict[WebSocket, Set[str]] = {}
         self.connection_metadata: Dict[WebSocket, Dict[str, Any]] = {}
+        self.hub = BroadcastHub(on_disconnect=self.disconnect)
         self._lock = asyncio.Lock()
         self._event_queue: asyncio.Queue = asyncio.Queue()
         self._broadcast_task: Optional[asyncio.Task] = None
@@ -75,6 +84,7 @@ class ConnectionManager:
                 "connected_at": datetime.utcnow().isoformat(),
                 "events_received": 0,
             }
+            self.hub.register(websocket, client_id=self.connection_metadata[websocket]["client_id"])
         
         # Send connection confirmation
         await self._send_to_client(websocket, StreamEvent(
@@ -91,8 +101,11 @@ class ConnectionManager:
     
     def disconnect(self, websocket: WebSocket) -> None:
         """Remove a WebSocket connection."""
+        if websocket not in self.active_connections:
+            return
         self.active_connections.discard(websocket)
         self.subscriptions.pop(websocket, None)
+        self.hub.unregister(websocket)
         metadata = self.connection_metadata.pop(websocket, {})
         logger.info(f"Client disconnected: {metadata.get('client_id', 'unknown')}")
     
@@ -113,40 +126,41 @@ class ConnectionManager:
         await self._event_queue.put(event)
     
     async def _send_to_client(self, websocket: WebSocket, event: StreamEvent) -> bool:
-        """Send an event to a specific client."""
-        try:
-            await websocket.send_json(event.to_dict())
-            if websocket in self.connection_metadata:
-                self.connection_metadata[websocket]["events_received"] += 1
-            return True
-        except Exception as e:
-            logger.warning(f"Failed to send to client: {e}")
+        """Queue an event for a specific client."""
+        return await self.send_personal_message(event.to_dict(), websocket)
+    
+    async def send_personal_message(self, message: Dict[str, Any], websocket: WebSocket) -> bool:
+        """Queue a message on a client's send queue, preserving frame order."""
+        if not self.hub.send(websocket, message):
+            logger.warning("Failed to send to client: not connected")
             return False
+        if websocket in self.connection_metadata:
+            self.connection_metadata[websocket]["events_received"] += 1
+        return True
     
     async def _broadcast_worker(self) -> None:
         """Worker that processes the broadcast queue."""
         while self._running:
             try:
                 event = await asyncio.wait_for(self._event_queue.get(), timeout=1.0)
+                event_type_str = event.event_type.value if isinstance(event.event_type, StreamEventType) else event.event_type
                 
-                # Get list of connections to broadcast to
+                # Get list of subscribed connections to broadcast to
                 async with self._lock:
-                    connections = list(self.active_connections)
+                    targets = [
+                        websocket for websocket, subs in self.subscriptions.items()
+                        if "all" in subs or event_type_str in subs or event.source_engine in subs
+                    ]
                 
-                # Broadcast to all subscribed clients
-                disconnected = []
-                for websocket in connections:
-                    subs = self.subscriptions.get(websocket, set())
-                    event_type_str = event.event_type.value if isinstance(event.event_type, StreamEventType) else event.event_type
-                    
-                    if "all" in subs or event_type_str in subs or event.source_engine in subs:
-                        success = await self._send_to_client(websocket, event)
-                        if not success:
-                            disconnected.append(websocket)
+                if not targets:
+                    continue
                 
-                # Clean up disconnected clients
-                for ws in disconnected:
-                    self.disconnect(ws)
+                # Encode once, enqueue per client; slow clients never block this loop
+                self.hub.publish(event.to_dict(), targets)
+                for websocket in targets:
+                    metadata = self.connection_metadata.get(websocket)
+                    if metadata is not None:
+                        metadata["events_received"] += 1
                     
             except asyncio.TimeoutError:
                 continue
@@ -188,6 +202,7 @@ class ConnectionManager:
             self._broadcast_task.cancel()
         if self._heartbeat_task:
             self._heartbeat_task.cancel()
+        await self.hub.close_all()
         logger.info("Stream server workers stopped")
     
     def get_stats(self) -> Dict[str, Any]:
@@ -197,7 +212,12 @@ class ConnectionManager:
             "total_subscriptions": sum(len(s) for s in self.subscriptions.values()),
             "queue_size": self._event_queue.qsize(),
             "running": self._running,
+            "fanout": self.hub.get_stats(),
         }
+    
+    def get_client_metrics(self) -> List[Dict[str, Any]]:
+        """Per-client send-queue depth, lag and drop counters."""
+        return self.hub.get_client_metrics()
 
 
 # Global connection manager instance
@@ -209,13 +229,16 @@ class ConstellationStreamServer:
     WebSocket streaming server for Constellation Fusion events.
     
     Subscribes to the fusion_registry event bus WITHOUT altering it,
-    and broadcasts events to connected WebSocket clients.
+    and broadcasts events to connected WebSocket clients. Graph changes
+    are pushed as versioned deltas rather than full constellation graphs.
     """
     
     def __init__(self):
         self.manager = stream_manager
         self._event_handlers: Dict[str, List[Callable]] = {}
         self._fusion_listener_active = False
+        self._delta_version = 0
+        self._delta_lock = asyncio.Lock()
         
     def register_event_handler(self, event_type: str, handler: Callable) -> None:
         """Register a handler for a specific event type."""
@@ -245,6 +268,33 @@ class ConstellationStreamServer:
             except Exception as e:
                 logger.error(f"Event handler error: {e}")
     
+    async def push_graph_delta(self) -> None:
+        """
+        Broadcast the constellation changes since the last pushed version.
+        
+        Bursts of fusion events collapse into a single delta because each push
+        covers everything that changed since the previous one.
+        """
+        from app.gde.constellation_fusion.fusion_service import constellation_fusion_service
+        
+        async with self._delta_lock:
+            if constellation_fusion_service.version == self._delta_version:
+                return
+            delta = constellation_fusion_service.get_changes_since(self._delta_version)
+            self._delta_version = delta["version"]
+        
+        await self.emit_stream_event(
+            event_type=StreamEventType.GRAPH_DELTA,
+            payload=delta,
+            source_engine="constellation_fusion",
+        )
+    
+    def get_graph_sync(self, since_version: int) -> Dict[str, Any]:
+        """Changes since a client's version (full snapshot if too old)."""
+        from app.gde.constellation_fusion.fusion_service import constellation_fusion_service
+        
+        return constellation_fusion_service.get_changes_since(since_version)
+    
     async def start_fusion_listener(self) -> None:
         """
         Start listening to the fusion_registry event bus.
@@ -258,6 +308,10 @@ class ConstellationStreamServer:
         try:
             # Import fusion registry to subscribe to events
             from app.gde.constellation_fusion.fusion_registry import fusion_registry
+            from app.gde.constellation_fusion.fusion_service import constellation_fusion_service
+            
+            # Deltas start from the graph as it exists when streaming begins
+            self._delta_version = constellation_fusion_service.version
             
             # Register a callback that forwards events to WebSocket clients
             async def forward_to_websocket(event_type: str, payload: Dict[str, Any], source_engine: str):
@@ -269,6 +323,7 @@ class ConstellationStreamServer:
                     },
                     source_engine=source_engine,
                 )
+                await self.push_graph_delta()
             
             # Add event handler to registry (this is additive, not modifying)
             fusion_registry.add_event_handler("*", lambda e: asyncio.create_task(
@@ -320,6 +375,7 @@ async def websocket_constellation_stream(websocket: WebSocket):
     - {"action": "subscribe", "event_types": ["fusion_event", "risk_update"]}
     - {"action": "unsubscribe", "event_types": ["fusion_event"]}
     - {"action": "ping"}
+    - {"action": "sync", "since_version": 42}  (graph delta, or full snapshot if too old)
     """
     await stream_manager.connect(websocket)
     
@@ -331,34 +387,42 @@ async def websocket_constellation_stream(websocket: WebSocket):
             if action == "subscribe":
                 event_types = data.get("event_types", [])
                 await stream_manager.subscribe(websocket, event_types)
-                await websocket.send_json({
+                await stream_manager.send_personal_message({
                     "type": "subscribed",
                     "event_types": event_types,
                     "timestamp": datetime.utcnow().isoformat(),
-                })
+                }, websocket)
             
             elif action == "unsubscribe":
                 event_types = data.get("event_types", [])
                 await stream_manager.unsubscribe(websocket, event_types)
-                await websocket.send_json({
+                await stream_manager.send_personal_message({
                     "type": "unsubscribed",
                     "event_types": event_types,
                     "timestamp": datetime.utcnow().isoformat(),
-                })
+                }, websocket)
+            
+            elif action == "sync":
+                since_version = int(data.get("since_version", 0))
+                await stream_manager.send_personal_message(StreamEvent(
+                    event_type=StreamEventType.GRAPH_DELTA,
+                    payload=constellation_stream_server.get_graph_sync(since_version),
+                    source_engine="constellation_fusion",
+                ).to_dict(), websocket)
             
             elif action == "ping":
-                await websocket.send_json({
+                await stream_manager.send_personal_message({
                     "type": "pong",
                     "timestamp": datetime.utcnow().isoformat(),
-                })
+                }, websocket)
             
             elif action == "stats":
                 stats = stream_manager.get_stats()
-                await websocket.send_json({
+                await stream_manager.send_personal_message({
                     "type": "stats",
                     "data": stats,
                     "timestamp": datetime.utcnow().isoformat(),
-                })
+                }, websocket)
     
     except WebSocketDisconnect:
         stream_manager.disconnect(websocket)
@@ -377,6 +441,16 @@ async def get_stream_stats():
     }
 
 
+@router.get("/stream/clients")
+async def get_stream_clients():
+    """Get per-client send-queue lag metrics."""
+    return {
+        "success": True,
+        "clients": stream_manager.get_client_metrics(),
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+
 @router.post("/stream/broadcast")
 async def broadcast_event(event_type: str, payload: Dict[str, Any], source_engine: str = "api"):
     """
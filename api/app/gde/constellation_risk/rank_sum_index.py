@@ -0,0 +1,112 @@
+"""
+Constellation Risk - Rank-Sum Index
+
+Order-statistics structure over node risk scores. Keeps the rank-weighted
+sum behind the risk concentration (Gini) figure current under inserts and
+removals, so the figure can be read without sorting all scores.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List
+
+
+class RankSumIndex:
+    """
+    Multiset of scores with O(log n) insert/remove and O(1) Gini reads.
+
+    Maintains ``rank_sum = sum((i + 1) * x_i)`` over the scores sorted
+    ascending. Inserting x moves it to rank ``count(<= x) + 1`` and shifts
+    every larger score up one rank, so the sum changes by
+    ``x * (count(<= x) + 1) + sum(> x)``; removal is the inverse. Those
+    counts and sums come from Fenwick trees over a fixed 2^16-slot grid on
+    [0, 1] plus a small sorted list per slot, which keeps them exact for any
+    score (out-of-range scores go to the edge slots).
+    """
+
+    SLOTS = 1 << 16
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.rank_sum = 0.0
+        self._nonzero = 0
+        self._tree_count: List[int] = [0] * (self.SLOTS + 1)
+        self._tree_sum: List[float] = [0.0] * (self.SLOTS + 1)
+        self._slots: Dict[int, List[float]] = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _slot(self, score: float) -> int:
+        return min(self.SLOTS - 1, max(0, int(score * self.SLOTS)))
+
+    def _prefix(self, slot: int):
+        """Count and sum of scores in slots before ``slot``."""
+        count, total = 0, 0.0
+        i = slot
+        tree_count, tree_sum = self._tree_count, self._tree_sum
+        while i > 0:
+            count += tree_count[i]
+            total += tree_sum[i]
+            i -= i & -i
+        return count, total
+
+    def _update(self, slot: int, count: int, score: float) -> None:
+        i = slot + 1
+        tree_count, tree_sum = self._tree_count, self._tree_sum
+        while i <= self.SLOTS:
+            tree_count[i] += count
+            tree_sum[i] += score
+            i += i & -i
+
+    def _at_or_below(self, slot: int, members: List[float], score: float):
+        """Count of scores <= ``score`` and sum of scores > ``score``."""
+        below_count, below_sum = self._prefix(slot)
+        position = bisect_right(members, score)
+        at_or_below = below_count + position
+        above_sum = self.total - below_sum - sum(members[:position])
+        return at_or_below, above_sum
+
+    def add(self, score: float) -> None:
+        """Insert a score."""
+        slot = self._slot(score)
+        members = self._slots.setdefault(slot, [])
+        at_or_below, above_sum = self._at_or_below(slot, members, score)
+
+        self.rank_sum += score * (at_or_below + 1) + above_sum
+        insort(members, score)
+        self._update(slot, 1, score)
+        self.count += 1
+        self.total += score
+        if score:
+            self._nonzero += 1
+
+    def remove(self, score: float) -> None:
+        """Remove one occurrence of a score previously added."""
+        slot = self._slot(score)
+        members = self._slots[slot]
+        at_or_below, above_sum = self._at_or_below(slot, members, score)
+
+        self.rank_sum -= score * at_or_below + above_sum
+        del members[bisect_left(members, score)]
+        if not members:
+            del self._slots[slot]
+        self._update(slot, -1, -score)
+        self.count -= 1
+        self.total -= score
+        if score:
+            self._nonzero -= 1
+        if not self._nonzero:
+            # Only zeros left: drop accumulated rounding residue
+            self.total = 0.0
+            self.rank_sum = 0.0
+
+    def gini(self) -> float:
+        """Gini coefficient of the scores, clamped to [0, 1] (0 for fewer than two)."""
+        n = self.count
+        if n <= 1:
+            return 0.0
+        if not (self._nonzero and self.total > 0):
+            return 0.0
+        concentration = (2 * self.rank_sum) / (n * self.total) - (n + 1) / n
+        return max(0.0, min(1.0, concentration))
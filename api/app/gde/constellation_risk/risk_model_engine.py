@@ -15,6 +15,8 @@ from enum import Enum
 from collections import defaultdict
 from fastapi import APIRouter
 
+from .rank_sum_index import RankSumIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -135,6 +137,51 @@ class SystemicRiskProfile:
         }
 
 
+HIGH_RISK_CATEGORIES = (RiskCategory.HIGH, RiskCategory.CRITICAL)
+
+
+@dataclass
+class ClusterRiskAccumulator:
+    """Running aggregates over the risk profiles of a cluster's members."""
+    members: Dict[str, int] = field(default_factory=dict)  # node_id -> times listed
+    node_count: int = 0
+    cohesion: float = 0.5
+    profiled_count: int = 0
+    risk_sum: float = 0.0
+    weighted_sum: float = 0.0
+    weight_total: float = 0.0
+    high_risk_count: int = 0
+    distribution: Dict[str, int] = field(default_factory=dict)
+    factor_totals: Dict[str, float] = field(
+        default_factory=lambda: {factor.value: 0.0 for factor in RiskFactor}
+    )
+    
+    def add(self, profile: NodeRiskProfile, times: int = 1) -> None:
+        self._apply(profile, times)
+    
+    def remove(self, profile: NodeRiskProfile, times: int = 1) -> None:
+        self._apply(profile, -times)
+        if not self.profiled_count:
+            # Drop accumulated rounding residue once the cluster is empty
+            self.risk_sum = self.weighted_sum = self.weight_total = 0.0
+            self.factor_totals = {factor: 0.0 for factor in self.factor_totals}
+    
+    def _apply(self, profile: NodeRiskProfile, times: int) -> None:
+        risk = profile.adjusted_risk_score
+        self.profiled_count += times
+        self.risk_sum += risk * times
+        self.weighted_sum += risk * (1.0 + risk) * times
+        self.weight_total += (1.0 + risk) * times
+        if profile.risk_category in HIGH_RISK_CATEGORIES:
+            self.high_risk_count += times
+        category = profile.risk_category.value
+        self.distribution[category] = self.distribution.get(category, 0) + times
+        if not self.distribution[category]:
+            del self.distribution[category]
+        for factor, score in profile.risk_factors.items():
+            self.factor_totals[factor] = self.factor_totals.get(factor, 0.0) + score * times
+
+
 class ConstellationRiskModelEngine:
     """
     AI-powered risk model engine for the Constellation.
@@ -144,6 +191,13 @@ class ConstellationRiskModelEngine:
     - Cluster-level aggregate risk
     - System-wide systemic risk assessment
     - Risk trends and forecasts
+    
+    System-wide and cluster aggregates (weighted risk sums, category
+    counts, per-factor totals and the rank-weighted sum behind the
+    concentration figure) are maintained incrementally as node profiles
+    arrive through compute_node_risk, so reading systemic or cluster risk
+    does not walk the node profiles. Update node_risks only through
+    compute_node_risk so the aggregates stay in sync.
     """
     
     # Risk factor weights (can be tuned)
@@ -177,6 +231,16 @@ class ConstellationRiskModelEngine:
         self.risk_history: List[Dict[str, Any]] = []
         self._stream_server = None
         
+        # Incrementally maintained aggregates over node_risks / cluster_risks
+        self._risk_index = RankSumIndex()
+        self._weighted_sum = 0.0
+        self._weight_total = 0.0
+        self._high_risk_nodes = 0
+        self._factor_totals: Dict[str, float] = {factor.value: 0.0 for factor in RiskFactor}
+        self._critical_clusters = 0
+        self._cluster_accumulators: Dict[str, ClusterRiskAccumulator] = {}
+        self._node_clusters: Dict[str, Dict[str, int]] = defaultdict(dict)  # node -> cluster -> times
+        
     def _categorize_risk(self, score: float) -> RiskCategory:
         """Categorize a risk score into a risk category."""
         for category, threshold in sorted(
@@ -347,80 +411,116 @@ class ConstellationRiskModelEngine:
         )
         
         # Store profile
+        previous = self.node_risks.get(node_id)
         self.node_risks[node_id] = profile
+        self._update_aggregates(previous, profile)
         
         return profile
     
+    def _update_aggregates(self, previous: Optional[NodeRiskProfile], profile: NodeRiskProfile) -> None:
+        """Swap a node's contribution to the system and cluster aggregates."""
+        for contribution, sign in ((previous, -1), (profile, 1)):
+            if contribution is None:
+                continue
+            risk = contribution.adjusted_risk_score
+            if sign > 0:
+                self._risk_index.add(risk)
+            else:
+                self._risk_index.remove(risk)
+            self._weighted_sum += sign * risk * (1.0 + risk * 2)
+            self._weight_total += sign * (1.0 + risk * 2)
+            if contribution.risk_category in HIGH_RISK_CATEGORIES:
+                self._high_risk_nodes += sign
+            for factor, score in contribution.risk_factors.items():
+                self._factor_totals[factor] = self._factor_totals.get(factor, 0.0) + sign * score
+        
+        for cluster_id, times in self._node_clusters.get(profile.node_id, {}).items():
+            accumulator = self._cluster_accumulators[cluster_id]
+            if previous is not None:
+                accumulator.remove(previous, times)
+            accumulator.add(profile, times)
+            self._store_cluster_profile(cluster_id, accumulator)
+    
     def compute_cluster_risk(
         self,
         cluster_id: str,
-        node_ids: List[str],
+        node_ids: Optional[List[str]] = None,
         cluster_metadata: Dict[str, Any] = None,
     ) -> ClusterRiskProfile:
         """
         Compute aggregate risk for a cluster of nodes.
         
+        The cluster's membership is registered, and its profile is kept
+        current as member node risks are recomputed afterwards.
+        
         Args:
             cluster_id: Unique identifier for the cluster
-            node_ids: List of node IDs in the cluster
+            node_ids: List of node IDs in the cluster (None re-reads the
+                registered membership in O(1))
             cluster_metadata: Additional cluster attributes
         
         Returns:
             ClusterRiskProfile with computed risk scores
         """
-        cluster_metadata = cluster_metadata or {}
+        accumulator = self._cluster_accumulators.get(cluster_id)
+        if node_ids is None and accumulator is not None:
+            if cluster_metadata is not None:
+                accumulator.cohesion = cluster_metadata.get("cohesion_score", 0.5)
+        else:
+            accumulator = self._register_cluster(cluster_id, node_ids or [])
+            accumulator.cohesion = (cluster_metadata or {}).get("cohesion_score", 0.5)
         
-        # Get risk profiles for all nodes in cluster
-        node_profiles = [
-            self.node_risks.get(nid)
-            for nid in node_ids
-            if nid in self.node_risks
-        ]
+        if not accumulator.profiled_count:
+            return ClusterRiskProfile(cluster_id=cluster_id)
         
-        if not node_profiles:
+        return self._store_cluster_profile(cluster_id, accumulator)
+    
+    def _register_cluster(self, cluster_id: str, node_ids: List[str]) -> ClusterRiskAccumulator:
+        """(Re)build a cluster's accumulator from its member list."""
+        previous = self._cluster_accumulators.get(cluster_id)
+        if previous is not None:
+            for node_id in previous.members:
+                clusters = self._node_clusters.get(node_id)
+                if clusters is not None:
+                    clusters.pop(cluster_id, None)
+                    if not clusters:
+                        del self._node_clusters[node_id]
+        
+        accumulator = ClusterRiskAccumulator(node_count=len(node_ids))
+        for node_id in node_ids:
+            accumulator.members[node_id] = accumulator.members.get(node_id, 0) + 1
+        for node_id, times in accumulator.members.items():
+            self._node_clusters[node_id][cluster_id] = times
+            profile = self.node_risks.get(node_id)
+            if profile is not None:
+                accumulator.add(profile, times)
+        
+        self._cluster_accumulators[cluster_id] = accumulator
+        return accumulator
+    
+    def _store_cluster_profile(self, cluster_id: str, accumulator: ClusterRiskAccumulator) -> ClusterRiskProfile:
+        """Build a cluster's profile from its accumulator and store it."""
+        if not accumulator.profiled_count:
             return ClusterRiskProfile(cluster_id=cluster_id)
         
         # Compute aggregate risk
-        risk_scores = [p.adjusted_risk_score for p in node_profiles]
-        aggregate_risk = sum(risk_scores) / len(risk_scores)
-        
-        # Compute weighted risk (higher weight for high-risk nodes)
-        weights = [1.0 + p.adjusted_risk_score for p in node_profiles]
-        weighted_risk = sum(
-            p.adjusted_risk_score * w
-            for p, w in zip(node_profiles, weights)
-        ) / sum(weights)
-        
-        # Count high-risk nodes
-        high_risk_count = sum(
-            1 for p in node_profiles
-            if p.risk_category in [RiskCategory.HIGH, RiskCategory.CRITICAL]
-        )
-        
-        # Risk distribution
-        distribution = defaultdict(int)
-        for p in node_profiles:
-            distribution[p.risk_category.value] += 1
+        aggregate_risk = accumulator.risk_sum / accumulator.profiled_count
         
-        # Dominant risk factors
-        factor_totals = defaultdict(float)
-        for p in node_profiles:
-            for factor, score in p.risk_factors.items():
-                factor_totals[factor] += score
+        # Weighted risk (weight 1 + risk, higher for high-risk nodes)
+        weighted_risk = accumulator.weighted_sum / accumulator.weight_total
         
+        # Dominant risk factors (totals rounded so running-sum noise can't reorder ties)
         dominant_factors = sorted(
-            factor_totals.items(),
-            key=lambda x: x[1],
+            accumulator.factor_totals.items(),
+            key=lambda x: round(x[1], 9),
             reverse=True
         )[:3]
         
-        # Cohesion score (how tightly connected the cluster is)
-        cohesion = cluster_metadata.get("cohesion_score", 0.5)
-        
         # Threat potential (combination of size, risk, and cohesion)
+        cohesion = accumulator.cohesion
         threat_potential = min(1.0, (
             weighted_risk * 0.4 +
-            (len(node_ids) / 100) * 0.3 +
+            (accumulator.node_count / 100) * 0.3 +
             cohesion * 0.3
         ))
         
@@ -429,14 +529,19 @@ class ConstellationRiskModelEngine:
             aggregate_risk_score=aggregate_risk,
             weighted_risk_score=weighted_risk,
             risk_category=self._categorize_risk(weighted_risk),
-            node_count=len(node_ids),
-            high_risk_node_count=high_risk_count,
-            risk_distribution=dict(distribution),
+            node_count=accumulator.node_count,
+            high_risk_node_count=accumulator.high_risk_count,
+            risk_distribution=dict(accumulator.distribution),
             dominant_risk_factors=[f[0] for f in dominant_factors],
             cohesion_score=cohesion,
             threat_potential=threat_potential,
         )
         
+        previous = self.cluster_risks.get(cluster_id)
+        if previous is not None and previous.risk_category in HIGH_RISK_CATEGORIES:
+            self._critical_clusters -= 1
+        if profile.risk_category in HIGH_RISK_CATEGORIES:
+            self._critical_clusters += 1
         self.cluster_risks[cluster_id] = profile
         
         return profile
@@ -448,50 +553,28 @@ class ConstellationRiskModelEngine:
         Returns:
             SystemicRiskProfile with global risk metrics
         """
-        # Get all node and cluster profiles
-        node_profiles = list(self.node_risks.values())
-        cluster_profiles = list(self.cluster_risks.values())
+        node_count = len(self.node_risks)
+        cluster_count = len(self.cluster_risks)
         
-        if not node_profiles:
+        if not node_count:
             self.systemic_risk = SystemicRiskProfile()
             return self.systemic_risk
         
-        # Global risk score (weighted average with emphasis on high-risk nodes)
-        total_weight = 0.0
-        weighted_sum = 0.0
-        for p in node_profiles:
-            weight = 1.0 + p.adjusted_risk_score * 2  # Higher weight for risky nodes
-            weighted_sum += p.adjusted_risk_score * weight
-            total_weight += weight
-        
-        global_risk = weighted_sum / total_weight if total_weight > 0 else 0.0
+        # Global risk score (weighted average, weight 1 + 2 * risk for risky nodes)
+        global_risk = self._weighted_sum / self._weight_total if self._weight_total > 0 else 0.0
         
         # Count high-risk entities
-        high_risk_nodes = sum(
-            1 for p in node_profiles
-            if p.risk_category in [RiskCategory.HIGH, RiskCategory.CRITICAL]
-        )
-        
-        critical_clusters = sum(
-            1 for c in cluster_profiles
-            if c.risk_category in [RiskCategory.HIGH, RiskCategory.CRITICAL]
-        )
+        high_risk_nodes = self._high_risk_nodes
+        critical_clusters = self._critical_clusters
         
         # Risk concentration (Gini-like coefficient)
-        if len(node_profiles) > 1:
-            sorted_risks = sorted(p.adjusted_risk_score for p in node_profiles)
-            n = len(sorted_risks)
-            cumsum = sum((i + 1) * r for i, r in enumerate(sorted_risks))
-            concentration = (2 * cumsum) / (n * sum(sorted_risks)) - (n + 1) / n if sum(sorted_risks) > 0 else 0
-            concentration = max(0.0, min(1.0, concentration))
-        else:
-            concentration = 0.0
+        concentration = self._risk_index.gini()
         
         # Systemic threat level
         systemic_threat = min(1.0, (
             global_risk * 0.3 +
-            (high_risk_nodes / max(1, len(node_profiles))) * 0.3 +
-            (critical_clusters / max(1, len(cluster_profiles))) * 0.2 if cluster_profiles else 0 +
+            (high_risk_nodes / max(1, node_count)) * 0.3 +
+            (critical_clusters / max(1, cluster_count)) * 0.2 if cluster_count else 0 +
             concentration * 0.2
         ))
         
@@ -509,14 +592,9 @@ class ConstellationRiskModelEngine:
                 risk_momentum = risk_velocity - prev_velocity
         
         # Top risk factors across all nodes
-        factor_totals = defaultdict(float)
-        for p in node_profiles:
-            for factor, score in p.risk_factors.items():
-                factor_totals[factor] += score
-        
         top_factors = sorted(
-            factor_totals.items(),
-            key=lambda x: x[1],
+            self._factor_totals.items(),
+            key=lambda x: round(x[1], 9),
             reverse=True
         )[:5]
         
@@ -530,8 +608,8 @@ class ConstellationRiskModelEngine:
         self.systemic_risk = SystemicRiskProfile(
             global_risk_score=global_risk,
             risk_category=self._categorize_risk(global_risk),
-            total_nodes=len(node_profiles),
-            total_clusters=len(cluster_profiles),
+            total_nodes=node_count,
+            total_clusters=cluster_count,
             high_risk_nodes=high_risk_nodes,
             critical_clusters=critical_clusters,
             risk_concentration=concentration,
@@ -6,16 +6,32 @@ threat narrative for the 60-120 minute rolling window.
 """
 
 import asyncio
+import heapq
 import logging
+import os
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Callable
+from typing import Deque, Dict, Any, Iterable, Iterator, List, Optional, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from collections import deque
+from operator import itemgetter
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from app.services.broadcast_hub import BroadcastHub
+from .top_counter import TopCounter
+
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _timestamp_epoch(timestamp: str) -> float:
+    """Epoch seconds of an ISO timestamp; naive values are taken as UTC."""
+    parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        return (parsed - _EPOCH).total_seconds()
+    return parsed.timestamp()
+
 
 class ThreatSeverity(str, Enum):
     """Severity levels for threat events."""
@@ -118,12 +134,26 @@ class ConstellationTimelineEngine:
     - Real-time event recording
     - Automatic narrative generation
     - WebSocket streaming for live updates
+    
+    Events live in a fixed-capacity ring addressed by a monotonically
+    increasing sequence number (slot = seq % capacity) with their epoch
+    timestamps alongside, kept in time order. Per-severity, per-event-type,
+    per-entity and per-cluster indexes hold the retained sequence numbers in
+    arrival order; their lengths are the distributions reported by
+    get_stats(), and rolling counters track the top entities and clusters. Filtered queries walk the most
+    selective index from the newest end and stop at the window cutoff, so
+    they cost time proportional to the result rather than the store.
+    
+    Configuration (environment):
+    - TIMELINE_MAX_EVENTS: events retained (default MAX_EVENTS)
+    - TIMELINE_RETENTION_MINUTES: age after which events are dropped (default 24h)
     """
     
     # Default window sizes
     DEFAULT_WINDOW_MINUTES = 60
     MAX_WINDOW_MINUTES = 120
     MAX_EVENTS = 10000
+    RETENTION_MINUTES = 24 * 60
     
     # Narrative templates
     NARRATIVE_TEMPLATES = {
@@ -141,13 +171,42 @@ class ConstellationTimelineEngine:
         TimelineEventType.SYSTEM_ALERT: "System alert: {message}.",
     }
     
-    def __init__(self, window_minutes: int = DEFAULT_WINDOW_MINUTES):
+    def __init__(
+        self,
+        window_minutes: int = DEFAULT_WINDOW_MINUTES,
+        max_events: Optional[int] = None,
+        retention_minutes: Optional[int] = None,
+    ):
         self.window_minutes = min(window_minutes, self.MAX_WINDOW_MINUTES)
-        self.events: deque = deque(maxlen=self.MAX_EVENTS)
+        self.capacity = max(1, max_events or int(os.getenv("TIMELINE_MAX_EVENTS", self.MAX_EVENTS)))
+        self.retention_minutes = retention_minutes or int(
+            os.getenv("TIMELINE_RETENTION_MINUTES", self.RETENTION_MINUTES)
+        )
         self._event_counter = 0
-        self._stream_clients: List[WebSocket] = []
+        self.hub = BroadcastHub(on_disconnect=self.disconnect_client)
         self._lock = asyncio.Lock()
-        
+        self._reset()
+    
+    def _reset(self) -> None:
+        self._ring: List[Optional[TimelineEvent]] = [None] * self.capacity
+        self._epochs: List[float] = [0.0] * self.capacity
+        self._start = 0  # seq of the oldest retained event
+        self._next = 0   # seq the next stored event receives
+        self._by_severity: Dict[str, Deque[int]] = {}
+        self._by_event_type: Dict[str, Deque[int]] = {}
+        self._by_entity: Dict[str, Deque[int]] = {}
+        self._by_cluster: Dict[str, Deque[int]] = {}
+        self._top_entities = TopCounter()
+        self._top_clusters = TopCounter()
+    
+    @property
+    def events(self) -> List[TimelineEvent]:
+        """Retained events, oldest first."""
+        return [self._ring[seq % self.capacity] for seq in range(self._start, self._next)]
+    
+    def __len__(self) -> int:
+        return self._next - self._start
+    
     def _generate_event_id(self) -> str:
         """Generate a unique event ID."""
         self._event_counter += 1
@@ -265,13 +324,14 @@ class ConstellationTimelineEngine:
             risk_impact = risk_map.get(severity, 0.0)
         
         # Create event
+        now = datetime.utcnow()
         event = TimelineEvent(
             event_id=self._generate_event_id(),
             event_type=event_type,
             severity=severity,
             title=title,
             description=description,
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=now.isoformat(),
             entities_involved=entities_involved,
             clusters_involved=clusters_involved,
             risk_impact=risk_impact,
@@ -281,7 +341,7 @@ class ConstellationTimelineEngine:
         
         # Add to timeline
         async with self._lock:
-            self.events.append(event)
+            self.store_event(event, epoch=(now - _EPOCH).total_seconds())
         
         # Broadcast to WebSocket clients
         await self._broadcast_event(event)
@@ -291,27 +351,78 @@ class ConstellationTimelineEngine:
         
         return event
     
+    def store_event(self, event: TimelineEvent, epoch: Optional[float] = None) -> None:
+        """
+        Insert a built event into the store and its indexes.
+        
+        Args:
+            event: Event to store
+            epoch: Epoch seconds of the event (parsed from its timestamp if omitted)
+        """
+        if epoch is None:
+            epoch = _timestamp_epoch(event.timestamp)
+        capacity = self.capacity
+        seq = self._next
+        if seq > self._start:
+            # Keep the store time-ordered so window cutoffs can stop early
+            epoch = max(epoch, self._epochs[(seq - 1) % capacity])
+        
+        cutoff = epoch - self.retention_minutes * 60
+        while self._start < seq and self._epochs[self._start % capacity] < cutoff:
+            self._evict_oldest()
+        if seq - self._start >= capacity:
+            self._evict_oldest()
+        
+        slot = seq % capacity
+        self._ring[slot] = event
+        self._epochs[slot] = epoch
+        self._next = seq + 1
+        
+        self._by_severity.setdefault(event.severity.value, deque()).append(seq)
+        self._by_event_type.setdefault(event.event_type.value, deque()).append(seq)
+        for index, top, keys in self._involved(event):
+            for key in keys:
+                index.setdefault(key, deque()).append(seq)
+                top.add(key)
+    
+    def _evict_oldest(self) -> None:
+        seq = self._start
+        slot = seq % self.capacity
+        event = self._ring[slot]
+        self._ring[slot] = None
+        self._start = seq + 1
+        
+        for index, key in ((self._by_severity, event.severity.value), (self._by_event_type, event.event_type.value)):
+            self._drop_oldest(index, key)
+        for index, top, keys in self._involved(event):
+            for key in keys:
+                self._drop_oldest(index, key)
+                top.remove(key)
+    
+    @staticmethod
+    def _drop_oldest(index: Dict[str, Deque[int]], key: str) -> None:
+        seqs = index[key]
+        seqs.popleft()
+        if not seqs:
+            del index[key]
+    
+    def _involved(self, event: TimelineEvent):
+        """(index, counter, distinct keys) for the entities and clusters of an event."""
+        return (
+            (self._by_entity, self._top_entities, dict.fromkeys(event.entities_involved)),
+            (self._by_cluster, self._top_clusters, dict.fromkeys(event.clusters_involved)),
+        )
+    
     async def _broadcast_event(self, event: TimelineEvent) -> None:
         """Broadcast event to all connected WebSocket clients."""
-        if not self._stream_clients:
+        if not self.hub.channels:
             return
         
-        message = {
+        self.hub.publish({
             "type": "timeline_event",
             "event": event.to_dict(),
             "timestamp": datetime.utcnow().isoformat(),
-        }
-        
-        disconnected = []
-        for client in self._stream_clients:
-            try:
-                await client.send_json(message)
-            except Exception:
-                disconnected.append(client)
-        
-        # Remove disconnected clients
-        for client in disconnected:
-            self._stream_clients.remove(client)
+        })
     
     async def _emit_to_stream_server(self, event: TimelineEvent) -> None:
         """Emit event to the main constellation stream server."""
@@ -337,6 +448,8 @@ class ConstellationTimelineEngine:
         severity_filter: Optional[List[ThreatSeverity]] = None,
         event_type_filter: Optional[List[TimelineEventType]] = None,
         limit: int = 100,
+        entity_id: Optional[str] = None,
+        cluster_id: Optional[str] = None,
     ) -> List[TimelineEvent]:
         """
         Get events from the timeline.
@@ -346,20 +459,23 @@ class ConstellationTimelineEngine:
             severity_filter: Filter by severity levels
             event_type_filter: Filter by event types
             limit: Maximum number of events to return
+            entity_id: Only events involving this entity
+            cluster_id: Only events involving this cluster
         
         Returns:
-            List of TimelineEvent objects
+            List of TimelineEvent objects, most recent first
         """
         window = window_minutes or self.window_minutes
-        cutoff = datetime.utcnow() - timedelta(minutes=window)
-        cutoff_str = cutoff.isoformat()
+        cutoff = (datetime.utcnow() - _EPOCH).total_seconds() - window * 60
         
-        # Filter events
         filtered = []
-        for event in reversed(self.events):  # Most recent first
-            # Time filter
-            if event.timestamp < cutoff_str:
-                continue
+        capacity = self.capacity
+        for seq in self._candidate_seqs(severity_filter, event_type_filter, entity_id, cluster_id):
+            slot = seq % capacity
+            # Time filter: the store is time-ordered, so nothing older follows
+            if self._epochs[slot] < cutoff:
+                break
+            event = self._ring[slot]
             
             # Severity filter
             if severity_filter and event.severity not in severity_filter:
@@ -369,6 +485,11 @@ class ConstellationTimelineEngine:
             if event_type_filter and event.event_type not in event_type_filter:
                 continue
             
+            if entity_id is not None and entity_id not in event.entities_involved:
+                continue
+            if cluster_id is not None and cluster_id not in event.clusters_involved:
+                continue
+            
             filtered.append(event)
             
             if len(filtered) >= limit:
@@ -376,6 +497,40 @@ class ConstellationTimelineEngine:
         
         return filtered
     
+    def _candidate_seqs(
+        self,
+        severity_filter: Optional[Iterable[ThreatSeverity]],
+        event_type_filter: Optional[Iterable[TimelineEventType]],
+        entity_id: Optional[str],
+        cluster_id: Optional[str],
+    ) -> Iterator[int]:
+        """
+        Sequence numbers, newest first, from the most selective applicable index.
+        
+        Index keys are enum values; str enums hash and compare equal to them.
+        """
+        candidates = []
+        if severity_filter:
+            candidates.append(self._lookup(self._by_severity, severity_filter))
+        if event_type_filter:
+            candidates.append(self._lookup(self._by_event_type, event_type_filter))
+        if entity_id is not None:
+            candidates.append(self._lookup(self._by_entity, (entity_id,)))
+        if cluster_id is not None:
+            candidates.append(self._lookup(self._by_cluster, (cluster_id,)))
+        
+        if not candidates:
+            return iter(range(self._next - 1, self._start - 1, -1))
+        
+        seqs = min(candidates, key=lambda lists: sum(len(s) for s in lists))
+        if len(seqs) == 1:
+            return reversed(seqs[0])
+        return heapq.merge(*(reversed(s) for s in seqs), reverse=True)
+    
+    @staticmethod
+    def _lookup(index: Dict[str, Deque[int]], keys: Iterable[str]) -> List[Deque[int]]:
+        return [index[key] for key in dict.fromkeys(keys) if key in index]
+    
     def build_narrative(
         self,
         window_minutes: Optional[int] = None,
@@ -408,27 +563,33 @@ class ConstellationTimelineEngine:
                 events=[],
             )
         
-        # Count by severity
-        critical_count = sum(1 for e in events if e.severity == ThreatSeverity.CRITICAL)
-        high_count = sum(1 for e in events if e.severity == ThreatSeverity.HIGH)
-        
-        # Find dominant threat type
+        # Severity, type, entity and cluster counts in one pass
+        critical_count = 0
+        high_count = 0
         type_counts = {}
-        for e in events:
-            type_counts[e.event_type.value] = type_counts.get(e.event_type.value, 0) + 1
-        dominant_type = max(type_counts.items(), key=lambda x: x[1])[0] if type_counts else "none"
-        
-        # Collect key entities and clusters
         entity_counts = {}
         cluster_counts = {}
+        important_events = []
         for e in events:
+            if e.severity == ThreatSeverity.CRITICAL or e.severity == ThreatSeverity.HIGH:
+                if e.severity == ThreatSeverity.CRITICAL:
+                    critical_count += 1
+                else:
+                    high_count += 1
+                if len(important_events) < 5:
+                    important_events.append(e)
+            type_counts[e.event_type.value] = type_counts.get(e.event_type.value, 0) + 1
             for entity in e.entities_involved:
                 entity_counts[entity] = entity_counts.get(entity, 0) + 1
             for cluster in e.clusters_involved:
                 cluster_counts[cluster] = cluster_counts.get(cluster, 0) + 1
         
-        key_entities = sorted(entity_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-        key_clusters = sorted(cluster_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+        # Find dominant threat type
+        dominant_type = max(type_counts.items(), key=lambda x: x[1])[0] if type_counts else "none"
+        
+        # Collect key entities and clusters
+        key_entities = heapq.nlargest(5, entity_counts.items(), key=itemgetter(1))
+        key_clusters = heapq.nlargest(3, cluster_counts.items(), key=itemgetter(1))
         
         # Determine risk trend
         if len(events) >= 2:
@@ -469,7 +630,6 @@ class ConstellationTimelineEngine:
             narrative_parts.append(f"Active clusters: {cluster_list}.")
         
         # Add recent critical/high events to narrative
-        important_events = [e for e in events if e.severity in [ThreatSeverity.CRITICAL, ThreatSeverity.HIGH]][:5]
         if important_events:
             narrative_parts.append("Recent important events:")
             for e in important_events:
@@ -495,10 +655,10 @@ class ConstellationTimelineEngine:
     async def connect_client(self, websocket: WebSocket) -> None:
         """Connect a WebSocket client for timeline streaming."""
         await websocket.accept()
-        self._stream_clients.append(websocket)
+        self.hub.register(websocket)
         
         # Send connection confirmation
-        await websocket.send_json({
+        self.hub.send(websocket, {
             "type": "connected",
             "message": "Connected to threat timeline stream",
             "timestamp": datetime.utcnow().isoformat(),
@@ -506,35 +666,35 @@ class ConstellationTimelineEngine:
         
         # Send recent events
         recent_events = self.get_events(limit=20)
-        await websocket.send_json({
+        self.hub.send(websocket, {
             "type": "initial_events",
             "events": [e.to_dict() for e in recent_events],
             "timestamp": datetime.utcnow().isoformat(),
         })
     
+    def send_to_client(self, websocket: WebSocket, message: Dict[str, Any]) -> bool:
+        """Queue a message for one client behind any pending broadcasts."""
+        return self.hub.send(websocket, message)
+    
     def disconnect_client(self, websocket: WebSocket) -> None:
         """Disconnect a WebSocket client."""
-        if websocket in self._stream_clients:
-            self._stream_clients.remove(websocket)
+        self.hub.unregister(websocket)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get timeline statistics."""
-        events = list(self.events)
-        
-        severity_counts = {}
-        type_counts = {}
-        for e in events:
-            severity_counts[e.severity.value] = severity_counts.get(e.severity.value, 0) + 1
-            type_counts[e.event_type.value] = type_counts.get(e.event_type.value, 0) + 1
-        
+        total = len(self)
         return {
-            "total_events": len(events),
+            "total_events": total,
             "window_minutes": self.window_minutes,
-            "connected_clients": len(self._stream_clients),
-            "severity_distribution": severity_counts,
-            "event_type_distribution": type_counts,
-            "oldest_event": events[0].timestamp if events else None,
-            "newest_event": events[-1].timestamp if events else None,
+            "connected_clients": len(self.hub.channels),
+            "severity_distribution": {key: len(seqs) for key, seqs in self._by_severity.items()},
+            "event_type_distribution": {key: len(seqs) for key, seqs in self._by_event_type.items()},
+            "top_entities": self._top_entities.top(5),
+            "top_clusters": self._top_clusters.top(3),
+            "capacity": self.capacity,
+            "retention_minutes": self.retention_minutes,
+            "oldest_event": self._ring[self._start % self.capacity].timestamp if total else None,
+            "newest_event": self._ring[(self._next - 1) % self.capacity].timestamp if total else None,
         }
 
 
@@ -555,6 +715,8 @@ async def get_timeline(
     limit: int = 100,
     severity: Optional[str] = None,
     event_type: Optional[str] = None,
+    entity: Optional[str] = None,
+    cluster: Optional[str] = None,
 ):
     """
     Get threat timeline events.
@@ -564,6 +726,8 @@ async def get_timeline(
         limit: Maximum number of events to return
         severity: Filter by severity (critical, high, medium, low, info)
         event_type: Filter by event type
+        entity: Filter by involved entity ID
+        cluster: Filter by involved cluster ID
     
     Returns:
         List of timeline events with narrative
@@ -588,6 +752,8 @@ async def get_timeline(
         severity_filter=severity_filter,
         event_type_filter=event_type_filter,
         limit=limit,
+        entity_id=entity,
+        cluster_id=cluster,
     )
     
     narrative = timeline_engine.build_narrative(window_minutes=min(window_minutes, 120))
@@ -685,20 +851,20 @@ async def websocket_timeline_stream(websocket: WebSocket):
             if action == "get_narrative":
                 window = data.get("window_minutes", 60)
                 narrative = timeline_engine.build_narrative(window_minutes=window)
-                await websocket.send_json({
+                timeline_engine.send_to_client(websocket, {
                     "type": "narrative",
                     "narrative": narrative.to_dict(),
                     "timestamp": datetime.utcnow().isoformat(),
                 })
             
             elif action == "ping":
-                await websocket.send_json({
+                timeline_engine.send_to_client(websocket, {
                     "type": "pong",
                     "timestamp": datetime.utcnow().isoformat(),
                 })
             
             elif action == "get_stats":
-                await websocket.send_json({
+                timeline_engine.send_to_client(websocket, {
                     "type": "stats",
                     "stats": timeline_engine.get_stats(),
                     "timestamp": datetime.utcnow().isoformat(),
@@ -0,0 +1,66 @@
+"""
+Constellation Timeline - Top Counter
+
+Rolling counts keyed by entity or cluster with unit increments and
+decrements, answering "top n by count" without scanning every key.
+"""
+
+from typing import Dict, Hashable, List, Tuple
+
+
+class TopCounter:
+    """
+    Counter with O(1) add/remove and top-n reads that skip the tail.
+
+    Keys are grouped into buckets by their current count and the highest
+    non-empty count is tracked. Counts only move by one, so a key always
+    lands in a neighbouring bucket and the maximum can only drop by one when
+    its bucket empties. top(n) walks buckets down from the maximum; ties
+    keep the order in which keys reached that count.
+    """
+
+    def __init__(self):
+        self.counts: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, Dict[Hashable, None]] = {}
+        self._max = 0
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def _move(self, key: Hashable, old: int, new: int) -> None:
+        if old:
+            bucket = self._buckets[old]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[old]
+        if new:
+            self._buckets.setdefault(new, {})[key] = None
+            self.counts[key] = new
+        else:
+            del self.counts[key]
+
+    def add(self, key: Hashable) -> None:
+        """Increment the count of a key."""
+        old = self.counts.get(key, 0)
+        self._move(key, old, old + 1)
+        if old + 1 > self._max:
+            self._max = old + 1
+
+    def remove(self, key: Hashable) -> None:
+        """Decrement the count of a key previously added."""
+        old = self.counts[key]
+        self._move(key, old, old - 1)
+        if old == self._max and old not in self._buckets:
+            self._max = old - 1
+
+    def top(self, n: int) -> List[Tuple[Hashable, int]]:
+        """Up to n (key, count) pairs, highest count first."""
+        result: List[Tuple[Hashable, int]] = []
+        count = self._max
+        while count > 0 and len(result) < n:
+            for key in self._buckets.get(count, ()):
+                result.append((key, count))
+                if len(result) >= n:
+                    break
+            count -= 1
+        return result
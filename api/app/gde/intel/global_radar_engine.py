@@ -3,27 +3,93 @@ Global Manipulation Radar Heatmap (GMRH) - Real-time manipulation risk visualiza
 """
 
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
+import heapq
+import os
 import time
 
+BUCKET_SECONDS = 60
+ROLLUP_BUCKETS = 60  # Minute buckets per hourly rollup
+DIMENSIONS = ('chains', 'entities', 'tokens', 'networks')
+
+
+class RadarBucket:
+    """
+    Running risk aggregates for the events of one minute.
+    Each dimension maps key -> [risk sum, event count]; clusters also track member entities.
+    """
+    
+    __slots__ = ('event_count', 'chains', 'entities', 'tokens', 'networks', 'clusters')
+    
+    def __init__(self):
+        self.event_count = 0
+        self.chains: Dict[str, List[float]] = {}
+        self.entities: Dict[str, List[float]] = {}
+        self.tokens: Dict[str, List[float]] = {}
+        self.networks: Dict[str, List[float]] = {}
+        self.clusters: Dict[Any, Dict[str, Any]] = {}
+    
+    def add(self, keys: Dict[str, str], cluster_id: Any, event_risk: float):
+        """Fold one event into the bucket."""
+        self.event_count += 1
+        for dimension in DIMENSIONS:
+            totals = getattr(self, dimension)
+            key = keys[dimension]
+            acc = totals.get(key)
+            if acc is None:
+                totals[key] = [event_risk, 1]
+            else:
+                acc[0] += event_risk
+                acc[1] += 1
+        if cluster_id:
+            cluster = self.clusters.get(cluster_id)
+            if cluster is None:
+                cluster = self.clusters[cluster_id] = {'sum': 0.0, 'count': 0, 'entities': {}}
+            cluster['sum'] += event_risk
+            cluster['count'] += 1
+            cluster['entities'][keys['entities']] = None
+
 
 class GlobalRadarEngine:
     """
     Global Manipulation Radar Engine.
     Provides real-time heatmap visualization of manipulation risk across chains, entities, tokens, and networks.
+    
+    Events are not stored; each one is folded into the per-minute bucket of
+    its timestamp and into an hourly rollup. A heatmap merges the minute
+    buckets up to the first whole hour after the cutoff and the hourly
+    rollups from there on (at most 59 + timeframe/1h bucket aggregates), so
+    its cost does not grow with event volume. Timeframes are resolved to
+    whole minutes (the bucket containing the cutoff is included). Buckets
+    older than the retention window (or a purge cutoff) are dropped as a
+    whole; an hour that is only partly dropped is served from its
+    remaining minute buckets.
     """
     
-    def __init__(self):
-        """Initialize the Global Radar Engine."""
+    def __init__(self, retention_hours: Optional[float] = None):
+        """
+        Initialize the Global Radar Engine.
+        
+        Args:
+            retention_hours: How long minute buckets are kept (default: 7 days)
+        """
         try:
             print("[GlobalRadar] Initializing Global Manipulation Radar Engine")
             
-            self.events = []  # List of all ingested events
+            self.retention_seconds = 3600 * (
+                retention_hours or float(os.getenv("GLOBAL_RADAR_RETENTION_HOURS", 24 * 7))
+            )
+            self.buckets: Dict[int, RadarBucket] = {}  # Minute -> aggregates
+            self.hour_buckets: Dict[int, RadarBucket] = {}  # Hour -> aggregates
+            self._bucket_heap: List[int] = []  # Minutes, oldest first, for expiry
+            self._hour_heap: List[int] = []
+            self._expired_minute = 0  # Minute buckets before this one have been dropped
             self.chain_scores = {}  # Chain -> risk score
             self.entity_scores = {}  # Entity -> risk score
             self.token_scores = {}  # Token -> risk score
             self.network_scores = {}  # Network -> risk score
-            self.clusters = []  # List of detected clusters
+            self.clusters = {}  # Cluster ID -> detected cluster
+            self._cluster_members = {}  # Cluster ID -> set of member entities
             
             self.last_update = datetime.now(timezone.utc)
             self.total_events_ingested = 0
@@ -39,12 +105,18 @@ class GlobalRadarEngine:
             
         except Exception as e:
             print(f"[GlobalRadar] Error in __init__: {e}")
-            self.events = []
+            self.retention_seconds = 3600 * 24 * 7
+            self.buckets = {}
+            self.hour_buckets = {}
+            self._bucket_heap = []
+            self._hour_heap = []
+            self._expired_minute = 0
             self.chain_scores = {}
             self.entity_scores = {}
             self.token_scores = {}
             self.network_scores = {}
-            self.clusters = []
+            self.clusters = {}
+            self._cluster_members = {}
             self.last_update = datetime.now(timezone.utc)
             self.total_events_ingested = 0
             self.thresholds = {
@@ -79,28 +151,26 @@ class GlobalRadarEngine:
             if 'timestamp' not in event:
                 event['timestamp'] = datetime.now(timezone.utc).isoformat()
             
-            self.events.append(event)
             self.total_events_ingested += 1
             self.last_update = datetime.now(timezone.utc)
             
-            chain = event.get('chain', 'unknown')
-            entity = event.get('entity', event.get('address', 'unknown'))
-            token = event.get('token', event.get('symbol', 'unknown'))
-            network = event.get('network', self._infer_network(chain))
-            
-            manipulation_risk = self._safe_float(event.get('manipulation_risk', 0.3))
-            volatility = self._safe_float(event.get('volatility', 0.3))
-            ring_probability = self._safe_float(event.get('ring_probability', 0.2))
-            chain_pressure = self._safe_float(event.get('chain_pressure', 0.3))
-            anomaly_score = self._safe_float(event.get('anomaly_score', 0.2))
-            
-            event_risk = (
-                manipulation_risk * 0.35 +
-                volatility * 0.25 +
-                ring_probability * 0.20 +
-                chain_pressure * 0.10 +
-                anomaly_score * 0.10
-            )
+            keys = self._event_keys(event)
+            chain = keys['chains']
+            entity = keys['entities']
+            token = keys['tokens']
+            network = keys['networks']
+            event_risk = self._event_risk(event)
+            
+            now = time.time()
+            self._expire_buckets(now - self.retention_seconds)
+            event_time = self._timestamp_epoch(event.get('timestamp'), now)
+            minute = int(event_time // BUCKET_SECONDS)
+            if event_time >= now - self.retention_seconds and minute >= self._expired_minute:
+                for buckets, heap, key in (
+                    (self.buckets, self._bucket_heap, minute),
+                    (self.hour_buckets, self._hour_heap, minute // ROLLUP_BUCKETS)
+                ):
+                    self._bucket_for(buckets, heap, key).add(keys, event.get('cluster_id'), event_risk)
             
             if chain in self.chain_scores:
                 self.chain_scores[chain] = (
@@ -168,61 +238,53 @@ class GlobalRadarEngine:
             print(f"[GlobalRadar] Computing heatmap for timeframe: {timeframe}")
             
             hours = self._parse_timeframe(timeframe)
-            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-            
-            recent_events = [
-                e for e in self.events
-                if self._parse_timestamp(e.get('timestamp')) >= cutoff_time
+            now = time.time()
+            self._expire_buckets(now - self.retention_seconds)
+            cutoff_minute = int((now - hours * 3600) // BUCKET_SECONDS)
+            first_hour = -(-max(cutoff_minute, self._expired_minute) // ROLLUP_BUCKETS)
+            
+            recent_buckets = [
+                self.buckets[minute]
+                for minute in range(cutoff_minute, first_hour * ROLLUP_BUCKETS)
+                if minute in self.buckets
             ]
+            recent_buckets.extend(
+                bucket for hour, bucket in self.hour_buckets.items()
+                if hour >= first_hour
+            )
+            event_count = sum(bucket.event_count for bucket in recent_buckets)
             
-            print(f"[GlobalRadar] Found {len(recent_events)} events in timeframe")
+            print(f"[GlobalRadar] Found {event_count} events in {len(recent_buckets)} buckets in timeframe")
             
-            temp_chain_scores = {}
-            temp_entity_scores = {}
-            temp_token_scores = {}
-            temp_network_scores = {}
+            merged = {dimension: {} for dimension in DIMENSIONS}
             temp_clusters = {}
             
-            for event in recent_events:
-                chain = event.get('chain', 'unknown')
-                entity = event.get('entity', event.get('address', 'unknown'))
-                token = event.get('token', event.get('symbol', 'unknown'))
-                network = event.get('network', self._infer_network(chain))
+            for bucket in recent_buckets:
+                for dimension in DIMENSIONS:
+                    totals = merged[dimension]
+                    for key, (risk_sum, count) in getattr(bucket, dimension).items():
+                        acc = totals.get(key)
+                        if acc is None:
+                            totals[key] = [risk_sum, count]
+                        else:
+                            acc[0] += risk_sum
+                            acc[1] += count
                 
-                manipulation_risk = self._safe_float(event.get('manipulation_risk', 0.3))
-                volatility = self._safe_float(event.get('volatility', 0.3))
-                ring_probability = self._safe_float(event.get('ring_probability', 0.2))
-                chain_pressure = self._safe_float(event.get('chain_pressure', 0.3))
-                anomaly_score = self._safe_float(event.get('anomaly_score', 0.2))
-                
-                event_risk = (
-                    manipulation_risk * 0.35 +
-                    volatility * 0.25 +
-                    ring_probability * 0.20 +
-                    chain_pressure * 0.10 +
-                    anomaly_score * 0.10
-                )
-                
-                temp_chain_scores[chain] = temp_chain_scores.get(chain, []) + [event_risk]
-                temp_entity_scores[entity] = temp_entity_scores.get(entity, []) + [event_risk]
-                temp_token_scores[token] = temp_token_scores.get(token, []) + [event_risk]
-                temp_network_scores[network] = temp_network_scores.get(network, []) + [event_risk]
-                
-                cluster_id = event.get('cluster_id')
-                if cluster_id:
+                for cluster_id, data in bucket.clusters.items():
                     if cluster_id not in temp_clusters:
-                        temp_clusters[cluster_id] = {'entities': set(), 'scores': []}
-                    temp_clusters[cluster_id]['entities'].add(entity)
-                    temp_clusters[cluster_id]['scores'].append(event_risk)
-            
-            chains = {k: self._normalize(sum(v) / len(v)) for k, v in temp_chain_scores.items()}
-            entities = {k: self._normalize(sum(v) / len(v)) for k, v in temp_entity_scores.items()}
-            tokens = {k: self._normalize(sum(v) / len(v)) for k, v in temp_token_scores.items()}
-            networks = {k: self._normalize(sum(v) / len(v)) for k, v in temp_network_scores.items()}
+                        temp_clusters[cluster_id] = {'entities': {}, 'sum': 0.0, 'count': 0}
+                    temp_clusters[cluster_id]['entities'].update(data['entities'])
+                    temp_clusters[cluster_id]['sum'] += data['sum']
+                    temp_clusters[cluster_id]['count'] += data['count']
+            
+            chains, entities, tokens, networks = (
+                {k: self._normalize(v[0] / v[1]) for k, v in merged[dimension].items()}
+                for dimension in DIMENSIONS
+            )
             
             clusters = []
             for cluster_id, data in temp_clusters.items():
-                avg_score = sum(data['scores']) / len(data['scores']) if data['scores'] else 0.0
+                avg_score = data['sum'] / data['count'] if data['count'] else 0.0
                 clusters.append({
                     'cluster_id': cluster_id,
                     'score': self._normalize(avg_score),
@@ -237,7 +299,7 @@ class GlobalRadarEngine:
                 'success': True,
                 'timeframe': timeframe,
                 'timeframe_hours': hours,
-                'event_count': len(recent_events),
+                'event_count': event_count,
                 'chains': chains,
                 'entities': entities,
                 'tokens': tokens,
@@ -338,7 +400,7 @@ class GlobalRadarEngine:
                     'score': c['score'],
                     'risk_level': c['risk_level']
                 }
-                for c in sorted(self.clusters, key=lambda x: x['score'], reverse=True)[:10]
+                for c in sorted(self.clusters.values(), key=lambda x: x['score'], reverse=True)[:10]
             ]
             
             manipulation_spikes = [
@@ -377,7 +439,7 @@ class GlobalRadarEngine:
     
     def purge_old_events(self, max_age_secs: int = 86400) -> Dict[str, Any]:
         """
-        Purge events older than max_age_secs.
+        Purge events older than max_age_secs by dropping their minute buckets.
         
         Args:
             max_age_secs: Maximum age in seconds (default: 24 hours)
@@ -388,15 +450,8 @@ class GlobalRadarEngine:
         try:
             print(f"[GlobalRadar] Purging events older than {max_age_secs} seconds")
             
-            cutoff_time = datetime.now(timezone.utc) - timedelta(seconds=max_age_secs)
-            
-            old_count = len(self.events)
-            self.events = [
-                e for e in self.events
-                if self._parse_timestamp(e.get('timestamp')) >= cutoff_time
-            ]
-            new_count = len(self.events)
-            purged_count = old_count - new_count
+            purged_count = self._expire_buckets(time.time() - max_age_secs)
+            new_count = sum(bucket.event_count for bucket in self.buckets.values())
             
             print(f"[GlobalRadar] Purged {purged_count} events")
             
@@ -414,6 +469,54 @@ class GlobalRadarEngine:
             }
     
     
+    def _event_keys(self, event: Dict[str, Any]) -> Dict[str, str]:
+        """Chain, entity, token and network an event is aggregated under."""
+        chain = event.get('chain', 'unknown')
+        return {
+            'chains': chain,
+            'entities': event.get('entity', event.get('address', 'unknown')),
+            'tokens': event.get('token', event.get('symbol', 'unknown')),
+            'networks': event.get('network', self._infer_network(chain))
+        }
+    
+    def _event_risk(self, event: Dict[str, Any]) -> float:
+        """Weighted risk score of a single event."""
+        manipulation_risk = self._safe_float(event.get('manipulation_risk', 0.3))
+        volatility = self._safe_float(event.get('volatility', 0.3))
+        ring_probability = self._safe_float(event.get('ring_probability', 0.2))
+        chain_pressure = self._safe_float(event.get('chain_pressure', 0.3))
+        anomaly_score = self._safe_float(event.get('anomaly_score', 0.2))
+        
+        return (
+            manipulation_risk * 0.35 +
+            volatility * 0.25 +
+            ring_probability * 0.20 +
+            chain_pressure * 0.10 +
+            anomaly_score * 0.10
+        )
+    
+    def _bucket_for(self, buckets: Dict[int, RadarBucket], heap: List[int], key: int) -> RadarBucket:
+        """Bucket ``key`` of a bucket map, created on first use."""
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = RadarBucket()
+            heapq.heappush(heap, key)
+        return bucket
+    
+    def _expire_buckets(self, cutoff_epoch: float) -> int:
+        """Drop buckets that end before ``cutoff_epoch``; returns the number of events dropped."""
+        cutoff_minute = max(int(cutoff_epoch // BUCKET_SECONDS), self._expired_minute)
+        self._expired_minute = cutoff_minute
+        dropped = 0
+        while self._bucket_heap and self._bucket_heap[0] < cutoff_minute:
+            dropped += self.buckets.pop(heapq.heappop(self._bucket_heap)).event_count
+        # Hourly rollups go as soon as any minute they cover has been dropped;
+        # heatmaps read a partly dropped hour from its minute buckets
+        cutoff_hour = -(-cutoff_minute // ROLLUP_BUCKETS)
+        while self._hour_heap and self._hour_heap[0] < cutoff_hour:
+            del self.hour_buckets[heapq.heappop(self._hour_heap)]
+        return dropped
+    
     def _infer_network(self, chain: str) -> str:
         """Infer network type from chain name."""
         try:
@@ -437,22 +540,25 @@ class GlobalRadarEngine:
     def _update_cluster(self, cluster_id: Any, entity: str, score: float):
         """Update cluster information."""
         try:
-            for cluster in self.clusters:
-                if cluster['cluster_id'] == cluster_id:
-                    if entity not in cluster['entities']:
-                        cluster['entities'].append(entity)
-                    cluster['score'] = (cluster['score'] * 0.7 + score * 0.3)
-                    cluster['size'] = len(cluster['entities'])
-                    cluster['risk_level'] = self.compute_risk_level(cluster['score'])
-                    return
-            
-            self.clusters.append({
+            cluster = self.clusters.get(cluster_id)
+            if cluster is not None:
+                members = self._cluster_members[cluster_id]
+                if entity not in members:
+                    members.add(entity)
+                    cluster['entities'].append(entity)
+                cluster['score'] = (cluster['score'] * 0.7 + score * 0.3)
+                cluster['size'] = len(cluster['entities'])
+                cluster['risk_level'] = self.compute_risk_level(cluster['score'])
+                return
+            
+            self.clusters[cluster_id] = {
                 'cluster_id': cluster_id,
                 'entities': [entity],
                 'score': score,
                 'size': 1,
                 'risk_level': self.compute_risk_level(score)
-            })
+            }
+            self._cluster_members[cluster_id] = {entity}
             
         except Exception as e:
             print(f"[GlobalRadar] Error updating cluster: {e}")
@@ -487,6 +593,18 @@ class GlobalRadarEngine:
         except Exception:
             return datetime.now(timezone.utc)
     
+    def _timestamp_epoch(self, timestamp: Any, default: float) -> float:
+        """Event timestamp as epoch seconds; naive datetimes are taken as UTC."""
+        if timestamp is None:
+            return default
+        try:
+            parsed = self._parse_timestamp(timestamp)
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.timestamp()
+        except Exception:
+            return default
+    
     def _normalize(self, value: float) -> float:
         """Normalize value to 0-1 range."""
         return max(0.0, min(1.0, value))
@@ -1,12 +1,14 @@
 """
 Oracle Eye™ - FastAPI Router
-6 endpoints for visual deception detection
+7 endpoints for visual deception detection
 """
 
+import asyncio
 import logging
+import time
 from fastapi import APIRouter
 from pydantic import BaseModel
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from .oracle_eye_engine import OracleEyeEngine
@@ -31,6 +33,22 @@ class AnalyzeResponse(BaseModel):
     timestamp: str
 
 
+class BatchRequest(BaseModel):
+    """Request model for batch visual analysis"""
+    records: List[Dict[str, Any]]
+
+
+class BatchResponse(BaseModel):
+    """Response model for batch visual analysis"""
+    success: bool
+    results: List[Dict[str, Any]] = []
+    count: int = 0
+    fraud_detected: int = 0
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None
+    timestamp: str
+
+
 class ClassifyRequest(BaseModel):
     """Request model for classification"""
     metadata: Dict[str, Any]
@@ -128,6 +146,51 @@ async def analyze_image(request: AnalyzeRequest) -> AnalyzeResponse:
         )
 
 
+@router.post("/oracle/batch")
+async def analyze_batch(request: BatchRequest) -> BatchResponse:
+    """
+    Complete visual intelligence analysis for many images at once
+    
+    POST /oracle/batch
+    
+    Request body:
+    {
+        "records": [
+            {"filename": "chart.png", "suspected_content": "chart", "tags": ["chart"]},
+            {"filename": "balance_edited.png", "suspected_content": "wallet", "source": "telegram"}
+        ]
+    }
+    
+    Returns:
+    - One analysis per record, in request order (same shape as /oracle/analyze)
+    - Number of records with fraud detected
+    - Elapsed time
+    """
+    try:
+        logger.info(f"[OracleAPI] Analyzing batch of {len(request.records)} images")
+        
+        start = time.perf_counter()
+        outputs = await asyncio.to_thread(oracle_engine.analyze_batch, request.records)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        
+        return BatchResponse(
+            success=True,
+            results=[output.to_dict() for output in outputs],
+            count=len(outputs),
+            fraud_detected=sum(1 for output in outputs if output.fraud_detected),
+            elapsed_ms=round(elapsed_ms, 2),
+            timestamp=datetime.utcnow().isoformat()
+        )
+        
+    except Exception as e:
+        logger.error(f"[OracleAPI] Error analyzing batch: {e}")
+        return BatchResponse(
+            success=False,
+            error=str(e),
+            timestamp=datetime.utcnow().isoformat()
+        )
+
+
 @router.post("/oracle/classify")
 async def classify_image(request: ClassifyRequest) -> ClassifyResponse:
     """
@@ -312,6 +375,11 @@ async def get_api_info() -> Dict[str, Any]:
                     "method": "POST",
                     "description": "Complete visual intelligence analysis"
                 },
+                {
+                    "path": "/oracle/batch",
+                    "method": "POST",
+                    "description": "Batch visual intelligence analysis"
+                },
                 {
                     "path": "/oracle/classify",
                     "method": "POST",
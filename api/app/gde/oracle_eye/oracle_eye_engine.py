@@ -5,10 +5,15 @@ Pure Python, zero external dependencies
 """
 
 import logging
+import multiprocessing
+import os
 import re
-from typing import Dict, Any, List
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional
 from .oracle_schema import (
     OracleInput,
+    OracleFeatures,
     OracleVisualSignals,
     OracleDeceptionScores,
     OracleNarrative,
@@ -17,6 +22,16 @@ from .oracle_schema import (
 
 logger = logging.getLogger(__name__)
 
+_worker_engine = None
+
+
+def _analyze_chunk(records: List[Dict[str, Any]]) -> List[OracleOutput]:
+    """Worker-process entry point for OracleEyeEngine.analyze_batch"""
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = OracleEyeEngine()
+    return [_worker_engine._analyze_record(metadata) for metadata in records]
+
 
 class OracleEyeEngine:
     """
@@ -56,8 +71,18 @@ class OracleEyeEngine:
         'ledger', 'trezor', 'uniswap', 'pancakeswap'
     ]
     
-    def __init__(self):
-        """Initialize Oracle Eye Engine"""
+    BATCH_CHUNK_SIZE = 256
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize Oracle Eye Engine
+        
+        Args:
+            max_workers: Worker processes for analyze_batch (default: CPU count)
+        """
+        self.max_workers = max_workers or int(os.getenv("ORACLE_EYE_BATCH_WORKERS", os.cpu_count() or 1))
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
         logger.info("[OracleEye] Engine initialized")
     
     @staticmethod
@@ -102,16 +127,130 @@ class OracleEyeEngine:
         Returns:
             OracleOutput with complete analysis
         """
-        try:
-            logger.info("[OracleEye] Starting visual analysis")
-            
-            classification = self.classify_image_type(metadata)
+        logger.info("[OracleEye] Starting visual analysis")
+        
+        output = self._analyze_record(metadata)
+        
+        logger.info(f"[OracleEye] Analysis complete: {output.id} ({output.classification})")
+        return output
+    
+    def analyze_batch(self, records: List[Dict[str, Any]]) -> List[OracleOutput]:
+        """
+        Visual intelligence analysis for many metadata records
+        
+        Each record is normalized once into OracleFeatures and every stage
+        is computed from it. Large batches are split into chunks and
+        analyzed on a process pool; small ones run inline.
+        
+        Args:
+            records: List of image metadata dictionaries
             
-            signals = self.simulate_visual_signals(metadata)
+        Returns:
+            List of OracleOutput, in input order
+        """
+        logger.info(f"[OracleEye] Starting batch visual analysis of {len(records)} records")
+        
+        chunk_size = self.BATCH_CHUNK_SIZE
+        if self.max_workers <= 1 or len(records) <= chunk_size:
+            return [self._analyze_record(metadata) for metadata in records]
+        
+        pool = self.start()
+        chunks = [records[i:i + chunk_size] for i in range(0, len(records), chunk_size)]
+        
+        outputs = []
+        for chunk_outputs in pool.map(_analyze_chunk, chunks):
+            outputs.extend(chunk_outputs)
+        return outputs
+    
+    def start(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Create the batch worker pool (called at app startup; analyze_batch
+        creates it on first use otherwise)
+        
+        Workers are spawned rather than forked: forking the multithreaded
+        event-loop process can copy held locks into the children.
+        
+        Returns:
+            The pool, or None when batches run inline (one worker)
+        """
+        if self.max_workers <= 1:
+            return None
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the batch worker pool, if started, cancelling queued chunks"""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+    
+    def extract_features(self, metadata: Dict[str, Any]) -> OracleFeatures:
+        """
+        Normalize metadata once for all scoring stages
+        
+        Args:
+            metadata: Image metadata dictionary
             
-            fraud_detected, fraud_types = self.detect_visual_fraud(metadata)
+        Returns:
+            OracleFeatures with lowercased fields and keyword hit counts
+            (tags is None when the metadata tags are not iterable)
+        """
+        filename = self.safe_str(metadata.get('filename', ''))
+        description = self.safe_str(metadata.get('description', ''))
+        
+        try:
+            tags = [self.safe_str(t) for t in metadata.get('tags', [])]
+        except TypeError:
+            tags = None  # Stages that need tags fail and fall back individually
+        
+        return OracleFeatures(
+            filename=filename,
+            description=description,
+            suspected_content=self.safe_str(metadata.get('suspected_content', '')),
+            tags=tags,
+            source=self.safe_str(metadata.get('source', '')),
+            extension=self.safe_str(metadata.get('extension', '')),
+            hash_value=self.safe_str(metadata.get('hash', '')),
+            size_kb=self.safe_value(metadata.get('size_kb', 0)),
+            raw_size_kb=metadata.get('size_kb', 0),
+            created_timestamp=metadata.get('created_timestamp', 0),
+            modified_timestamp=metadata.get('modified_timestamp', 0),
+            suspicious_pattern_hits=sum(1 for p in self.SUSPICIOUS_PATTERNS if p in filename),
+            phishing_keyword_hits=sum(1 for kw in self.PHISHING_KEYWORDS if kw in description),
+            exchange_mimic_hits=sum(1 for ex in self.EXCHANGE_MIMICS if ex in description)
+        )
+    
+    def _analyze_record(self, metadata: Dict[str, Any]) -> OracleOutput:
+        """Analyze one record from a single OracleFeatures pass"""
+        try:
+            features = self.extract_features(metadata)
+            
+            try:
+                classification = self._classify_features(features)
+            except Exception as e:
+                logger.error(f"[OracleEye] Error classifying image: {e}")
+                classification = 'other'
+            
+            try:
+                signals = self._compute_signals(features)
+            except Exception as e:
+                logger.error(f"[OracleEye] Error simulating signals: {e}")
+                signals = OracleVisualSignals()
+            
+            try:
+                fraud_types = self._detect_fraud_types(features)
+            except Exception as e:
+                logger.error(f"[OracleEye] Error detecting fraud: {e}")
+                fraud_types = []
+            fraud_detected = len(fraud_types) > 0
             
-            scores = self.compute_risk_scores(metadata)
+            scores = self._scores_from_signals(signals)
             
             narrative = self.generate_visual_narrative(classification, scores, signals)
             
@@ -119,7 +258,7 @@ class OracleEyeEngine:
             
             key_indicators = self._extract_key_indicators(signals, fraud_types, scores)
             
-            output = OracleOutput(
+            return OracleOutput(
                 classification=classification,
                 severity=severity,
                 signals=signals.to_dict(),
@@ -131,9 +270,6 @@ class OracleEyeEngine:
                 metadata_analyzed=metadata
             )
             
-            logger.info(f"[OracleEye] Analysis complete: {output.id} ({classification})")
-            return output
-            
         except Exception as e:
             logger.error(f"[OracleEye] Error in analysis: {e}")
             return OracleOutput(
@@ -169,63 +305,7 @@ class OracleEyeEngine:
             Tuple of (fraud_detected: bool, fraud_types: List[str])
         """
         try:
-            fraud_types = []
-            
-            filename = self.safe_str(metadata.get('filename', ''))
-            description = self.safe_str(metadata.get('description', ''))
-            suspected_content = self.safe_str(metadata.get('suspected_content', ''))
-            tags = [self.safe_str(t) for t in metadata.get('tags', [])]
-            source = self.safe_str(metadata.get('source', ''))
-            
-            if suspected_content == 'chart' or 'chart' in tags:
-                if any(p in filename for p in ['fake', 'edited', 'modified']):
-                    fraud_types.append("fake_chart")
-                if any(p in description for p in ['pump', 'moon', 'guaranteed']):
-                    fraud_types.append("manipulated_chart")
-            
-            if suspected_content == 'wallet' or 'wallet' in tags:
-                if any(p in filename for p in ['screenshot', 'edited', 'photoshop']):
-                    fraud_types.append("doctored_wallet_balance")
-                if metadata.get('size_kb', 0) < 10:  # Suspiciously small
-                    fraud_types.append("suspicious_wallet_screenshot")
-            
-            if suspected_content == 'transaction' or 'transaction' in tags:
-                if any(p in filename for p in ['edited', 'modified', 'fake']):
-                    fraud_types.append("edited_transaction_screenshot")
-                if 'copy' in filename or 'temp' in filename:
-                    fraud_types.append("suspicious_transaction_image")
-            
-            if suspected_content == 'news' or 'news' in tags:
-                if any(p in description for p in ['breaking', 'exclusive', 'leaked']):
-                    fraud_types.append("altered_news_headline")
-                if source in self.HIGH_RISK_SOURCES:
-                    fraud_types.append("unverified_news_screenshot")
-            
-            if 'popup' in tags or 'alert' in tags:
-                if any(kw in description for kw in self.PHISHING_KEYWORDS):
-                    fraud_types.append("scam_popup")
-                if 'urgent' in description or 'verify' in description:
-                    fraud_types.append("phishing_alert")
-            
-            if suspected_content == 'id' or 'kyc' in tags:
-                if any(p in filename for p in ['fake', 'template', 'sample']):
-                    fraud_types.append("fake_kyc_document")
-                if metadata.get('size_kb', 0) < 20:  # Too small for real ID
-                    fraud_types.append("suspicious_id_document")
-            
-            if suspected_content == 'id_document' or 'id' in tags:
-                if any(p in filename for p in ['edited', 'modified', 'photoshop']):
-                    fraud_types.append("manipulated_id")
-                if 'template' in filename or 'blank' in filename:
-                    fraud_types.append("id_template")
-            
-            if suspected_content == 'exchange_ui' or 'dashboard' in tags:
-                if any(ex in description for ex in self.EXCHANGE_MIMICS):
-                    fraud_types.append("phishing_dashboard")
-                if source in self.HIGH_RISK_SOURCES:
-                    fraud_types.append("suspicious_exchange_ui")
-                if any(kw in description for kw in self.PHISHING_KEYWORDS):
-                    fraud_types.append("exchange_phishing_attempt")
+            fraud_types = self._detect_fraud_types(self.extract_features(metadata))
             
             fraud_detected = len(fraud_types) > 0
             
@@ -236,6 +316,68 @@ class OracleEyeEngine:
             logger.error(f"[OracleEye] Error detecting fraud: {e}")
             return False, []
     
+    def _detect_fraud_types(self, features: OracleFeatures) -> List[str]:
+        """Fraud pattern detection from normalized features"""
+        fraud_types = []
+        
+        filename = features.filename
+        description = features.description
+        suspected_content = features.suspected_content
+        tags = features.tags
+        source = features.source
+        
+        if suspected_content == 'chart' or 'chart' in tags:
+            if any(p in filename for p in ['fake', 'edited', 'modified']):
+                fraud_types.append("fake_chart")
+            if any(p in description for p in ['pump', 'moon', 'guaranteed']):
+                fraud_types.append("manipulated_chart")
+        
+        if suspected_content == 'wallet' or 'wallet' in tags:
+            if any(p in filename for p in ['screenshot', 'edited', 'photoshop']):
+                fraud_types.append("doctored_wallet_balance")
+            if features.raw_size_kb < 10:  # Suspiciously small
+                fraud_types.append("suspicious_wallet_screenshot")
+        
+        if suspected_content == 'transaction' or 'transaction' in tags:
+            if any(p in filename for p in ['edited', 'modified', 'fake']):
+                fraud_types.append("edited_transaction_screenshot")
+            if 'copy' in filename or 'temp' in filename:
+                fraud_types.append("suspicious_transaction_image")
+        
+        if suspected_content == 'news' or 'news' in tags:
+            if any(p in description for p in ['breaking', 'exclusive', 'leaked']):
+                fraud_types.append("altered_news_headline")
+            if source in self.HIGH_RISK_SOURCES:
+                fraud_types.append("unverified_news_screenshot")
+        
+        if 'popup' in tags or 'alert' in tags:
+            if features.phishing_keyword_hits:
+                fraud_types.append("scam_popup")
+            if 'urgent' in description or 'verify' in description:
+                fraud_types.append("phishing_alert")
+        
+        if suspected_content == 'id' or 'kyc' in tags:
+            if any(p in filename for p in ['fake', 'template', 'sample']):
+                fraud_types.append("fake_kyc_document")
+            if features.raw_size_kb < 20:  # Too small for real ID
+                fraud_types.append("suspicious_id_document")
+        
+        if suspected_content == 'id_document' or 'id' in tags:
+            if any(p in filename for p in ['edited', 'modified', 'photoshop']):
+                fraud_types.append("manipulated_id")
+            if 'template' in filename or 'blank' in filename:
+                fraud_types.append("id_template")
+        
+        if suspected_content == 'exchange_ui' or 'dashboard' in tags:
+            if features.exchange_mimic_hits:
+                fraud_types.append("phishing_dashboard")
+            if source in self.HIGH_RISK_SOURCES:
+                fraud_types.append("suspicious_exchange_ui")
+            if features.phishing_keyword_hits:
+                fraud_types.append("exchange_phishing_attempt")
+        
+        return fraud_types
+    
     def classify_image_type(self, metadata: Dict[str, Any]) -> str:
         """
         Classify image into type categories
@@ -258,60 +400,67 @@ class OracleEyeEngine:
             Classification string
         """
         try:
-            suspected_content = self.safe_str(metadata.get('suspected_content', ''))
-            tags = [self.safe_str(t) for t in metadata.get('tags', [])]
-            description = self.safe_str(metadata.get('description', ''))
-            filename = self.safe_str(metadata.get('filename', ''))
-            
-            if suspected_content == 'chart':
-                return 'financial_chart'
-            elif suspected_content == 'wallet':
-                return 'wallet_balance'
-            elif suspected_content == 'transaction':
-                return 'transaction_history'
-            elif suspected_content == 'id':
-                return 'id_document'
-            elif suspected_content == 'exchange_ui':
-                return 'exchange_ui'
-            elif suspected_content == 'news':
-                return 'news_screenshot'
-            elif suspected_content == 'contract':
-                return 'contract_document'
-            
-            if 'chart' in tags or 'graph' in tags:
-                return 'financial_chart'
-            elif 'wallet' in tags or 'balance' in tags:
-                return 'wallet_balance'
-            elif 'transaction' in tags or 'tx' in tags:
-                return 'transaction_history'
-            elif 'id' in tags or 'kyc' in tags or 'passport' in tags:
-                return 'id_document'
-            elif 'exchange' in tags or 'dashboard' in tags:
-                return 'exchange_ui'
-            elif 'social' in tags or 'twitter' in tags or 'telegram' in tags:
-                return 'social_media_post'
-            elif 'news' in tags or 'article' in tags:
-                return 'news_screenshot'
-            elif 'contract' in tags or 'document' in tags:
-                return 'contract_document'
-            
-            if 'chart' in description or 'chart' in filename:
-                return 'financial_chart'
-            elif 'wallet' in description or 'wallet' in filename:
-                return 'wallet_balance'
-            elif 'transaction' in description or 'tx' in filename:
-                return 'transaction_history'
-            elif 'exchange' in description or 'dashboard' in filename:
-                return 'exchange_ui'
-            elif 'news' in description or 'article' in filename:
-                return 'news_screenshot'
-            
-            return 'other'
+            return self._classify_features(self.extract_features(metadata))
             
         except Exception as e:
             logger.error(f"[OracleEye] Error classifying image: {e}")
             return 'other'
     
+    def _classify_features(self, features: OracleFeatures) -> str:
+        """Image type classification from normalized features"""
+        if features.tags is None:
+            raise TypeError("metadata 'tags' is not iterable")
+        
+        suspected_content = features.suspected_content
+        tags = features.tags
+        description = features.description
+        filename = features.filename
+        
+        if suspected_content == 'chart':
+            return 'financial_chart'
+        elif suspected_content == 'wallet':
+            return 'wallet_balance'
+        elif suspected_content == 'transaction':
+            return 'transaction_history'
+        elif suspected_content == 'id':
+            return 'id_document'
+        elif suspected_content == 'exchange_ui':
+            return 'exchange_ui'
+        elif suspected_content == 'news':
+            return 'news_screenshot'
+        elif suspected_content == 'contract':
+            return 'contract_document'
+        
+        if 'chart' in tags or 'graph' in tags:
+            return 'financial_chart'
+        elif 'wallet' in tags or 'balance' in tags:
+            return 'wallet_balance'
+        elif 'transaction' in tags or 'tx' in tags:
+            return 'transaction_history'
+        elif 'id' in tags or 'kyc' in tags or 'passport' in tags:
+            return 'id_document'
+        elif 'exchange' in tags or 'dashboard' in tags:
+            return 'exchange_ui'
+        elif 'social' in tags or 'twitter' in tags or 'telegram' in tags:
+            return 'social_media_post'
+        elif 'news' in tags or 'article' in tags:
+            return 'news_screenshot'
+        elif 'contract' in tags or 'document' in tags:
+            return 'contract_document'
+        
+        if 'chart' in description or 'chart' in filename:
+            return 'financial_chart'
+        elif 'wallet' in description or 'wallet' in filename:
+            return 'wallet_balance'
+        elif 'transaction' in description or 'tx' in filename:
+            return 'transaction_history'
+        elif 'exchange' in description or 'dashboard' in filename:
+            return 'exchange_ui'
+        elif 'news' in description or 'article' in filename:
+            return 'news_screenshot'
+        
+        return 'other'
+    
     def compute_risk_scores(self, metadata: Dict[str, Any]) -> OracleDeceptionScores:
         """
         Compute composite risk scores
@@ -329,9 +478,11 @@ class OracleEyeEngine:
         Returns:
             OracleDeceptionScores object
         """
+        return self._scores_from_signals(self.simulate_visual_signals(metadata))
+    
+    def _scores_from_signals(self, signals: OracleVisualSignals) -> OracleDeceptionScores:
+        """Composite risk scores from visual signals"""
         try:
-            signals = self.simulate_visual_signals(metadata)
-            
             deception_risk = (
                 signals.filename_anomaly * 0.15 +
                 signals.metadata_inconsistency * 0.20 +
@@ -465,44 +616,7 @@ class OracleEyeEngine:
             OracleVisualSignals object
         """
         try:
-            signals = OracleVisualSignals()
-            
-            filename = self.safe_str(metadata.get('filename', ''))
-            size_kb = self.safe_value(metadata.get('size_kb', 0))
-            extension = self.safe_str(metadata.get('extension', ''))
-            description = self.safe_str(metadata.get('description', ''))
-            suspected_content = self.safe_str(metadata.get('suspected_content', ''))
-            tags = [self.safe_str(t) for t in metadata.get('tags', [])]
-            hash_value = self.safe_str(metadata.get('hash', ''))
-            source = self.safe_str(metadata.get('source', ''))
-            
-            signals.filename_anomaly = self._detect_filename_anomaly(filename)
-            
-            signals.size_anomaly = self._detect_size_anomaly(size_kb, suspected_content)
-            
-            signals.extension_risk = self._detect_extension_risk(extension)
-            
-            signals.metadata_inconsistency = self._detect_metadata_inconsistency(
-                filename, description, suspected_content, tags
-            )
-            
-            signals.hash_collision = self._detect_hash_collision(hash_value)
-            
-            signals.source_risk = self._detect_source_risk(source)
-            
-            signals.phishing_pattern = self._detect_phishing_pattern(description, tags)
-            
-            signals.ui_mimicry = self._detect_ui_mimicry(description, suspected_content)
-            
-            signals.compression_artifact = self._detect_compression_artifact(size_kb, extension)
-            
-            signals.timestamp_anomaly = self._detect_timestamp_anomaly(metadata)
-            
-            signals.description_mismatch = self._detect_description_mismatch(
-                filename, description, suspected_content
-            )
-            
-            signals.tag_suspicion = self._detect_tag_suspicion(tags)
+            signals = self._compute_signals(self.extract_features(metadata))
             
             logger.info("[OracleEye] Visual signals simulated")
             return signals
@@ -511,6 +625,42 @@ class OracleEyeEngine:
             logger.error(f"[OracleEye] Error simulating signals: {e}")
             return OracleVisualSignals()
     
+    def _compute_signals(self, features: OracleFeatures) -> OracleVisualSignals:
+        """Visual signal detection from normalized features"""
+        signals = OracleVisualSignals()
+        
+        signals.filename_anomaly = self._detect_filename_anomaly(features.suspicious_pattern_hits)
+        
+        signals.size_anomaly = self._detect_size_anomaly(features.size_kb, features.suspected_content)
+        
+        signals.extension_risk = self._detect_extension_risk(features.extension)
+        
+        signals.metadata_inconsistency = self._detect_metadata_inconsistency(
+            features.filename, features.description, features.suspected_content, features.tags
+        )
+        
+        signals.hash_collision = self._detect_hash_collision(features.hash_value)
+        
+        signals.source_risk = self._detect_source_risk(features.source)
+        
+        signals.phishing_pattern = self._detect_phishing_pattern(features.phishing_keyword_hits, features.tags)
+        
+        signals.ui_mimicry = self._detect_ui_mimicry(features.exchange_mimic_hits, features.suspected_content)
+        
+        signals.compression_artifact = self._detect_compression_artifact(features.size_kb, features.extension)
+        
+        signals.timestamp_anomaly = self._detect_timestamp_anomaly(
+            features.created_timestamp, features.modified_timestamp
+        )
+        
+        signals.description_mismatch = self._detect_description_mismatch(
+            features.filename, features.description, features.suspected_content
+        )
+        
+        signals.tag_suspicion = self._detect_tag_suspicion(features.tags)
+        
+        return signals
+    
     def get_summary(self, output: OracleOutput) -> Dict[str, Any]:
         """
         Get concise summary of analysis
@@ -553,12 +703,11 @@ class OracleEyeEngine:
             }
     
     
-    def _detect_filename_anomaly(self, filename: str) -> float:
-        """Detect filename anomalies"""
+    def _detect_filename_anomaly(self, pattern_hits: int) -> float:
+        """Detect filename anomalies (pattern_hits: SUSPICIOUS_PATTERNS found in filename)"""
         score = 0.0
-        for pattern in self.SUSPICIOUS_PATTERNS:
-            if pattern in filename:
-                score += 0.15
+        for _ in range(pattern_hits):
+            score += 0.15
         return min(score, 1.0)
     
     def _detect_size_anomaly(self, size_kb: float, content_type: str) -> float:
@@ -625,28 +774,26 @@ class OracleEyeEngine:
             return 0.6
         return 0.0
     
-    def _detect_phishing_pattern(self, description: str, tags: List[str]) -> float:
-        """Detect phishing patterns"""
+    def _detect_phishing_pattern(self, keyword_hits: int, tags: List[str]) -> float:
+        """Detect phishing patterns (keyword_hits: PHISHING_KEYWORDS found in description)"""
         score = 0.0
         
-        for keyword in self.PHISHING_KEYWORDS:
-            if keyword in description:
-                score += 0.15
+        for _ in range(keyword_hits):
+            score += 0.15
         
         if 'phishing' in tags or 'scam' in tags:
             score += 0.5
         
         return min(score, 1.0)
     
-    def _detect_ui_mimicry(self, description: str, content_type: str) -> float:
-        """Detect exchange UI mimicry"""
+    def _detect_ui_mimicry(self, mimic_hits: int, content_type: str) -> float:
+        """Detect exchange UI mimicry (mimic_hits: EXCHANGE_MIMICS found in description)"""
         if content_type != 'exchange_ui':
             return 0.0
         
         score = 0.0
-        for exchange in self.EXCHANGE_MIMICS:
-            if exchange in description:
-                score += 0.2
+        for _ in range(mimic_hits):
+            score += 0.2
         
         return min(score, 1.0)
     
@@ -658,11 +805,8 @@ class OracleEyeEngine:
             return 0.5  # Under-compressed
         return 0.0
     
-    def _detect_timestamp_anomaly(self, metadata: Dict[str, Any]) -> float:
+    def _detect_timestamp_anomaly(self, created: Any, modified: Any) -> float:
         """Detect timestamp anomalies"""
-        created = metadata.get('created_timestamp', 0)
-        modified = metadata.get('modified_timestamp', 0)
-        
         if created and modified and modified < created:
             return 0.9  # Modified before created
         
@@ -678,7 +822,7 @@ class OracleEyeEngine:
         if not description:
             return 0.3  # No description
         
-        if content_type and content_type not in description.lower():
+        if content_type and content_type not in description:
             return 0.5
         
         return 0.0
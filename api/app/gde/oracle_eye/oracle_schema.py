@@ -4,7 +4,7 @@ Pure Python dataclasses for visual deception detection
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 
@@ -27,6 +27,46 @@ class OracleInput:
         }
 
 
+@dataclass
+class OracleFeatures:
+    """
+    Normalized image metadata shared by every Oracle Eye scoring stage
+    
+    Built once per record: strings are lowercased, tags normalized and the
+    keyword lexicons scanned a single time.
+    """
+    filename: str = ""
+    description: str = ""
+    suspected_content: str = ""
+    tags: Optional[List[str]] = field(default_factory=list)
+    source: str = ""
+    extension: str = ""
+    hash_value: str = ""
+    size_kb: float = 0.0
+    raw_size_kb: Any = 0
+    created_timestamp: Any = 0
+    modified_timestamp: Any = 0
+    suspicious_pattern_hits: int = 0
+    phishing_keyword_hits: int = 0
+    exchange_mimic_hits: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "filename": self.filename,
+            "description": self.description,
+            "suspected_content": self.suspected_content,
+            "tags": self.tags,
+            "source": self.source,
+            "extension": self.extension,
+            "hash_value": self.hash_value,
+            "size_kb": self.size_kb,
+            "suspicious_pattern_hits": self.suspicious_pattern_hits,
+            "phishing_keyword_hits": self.phishing_keyword_hits,
+            "exchange_mimic_hits": self.exchange_mimic_hits
+        }
+
+
 @dataclass
 class OracleVisualSignals:
     """
@@ -145,27 +145,34 @@ async def batch_analyze(request: BatchRequest) -> BatchResponse:
     try:
         logger.info(f"[PhantomAPI] Batch analyzing {len(request.items)} items")
         
-        results = []
+        results = [None] * len(request.items)
         errors = 0
+        inputs = []
+        positions = []
         
-        for item in request.items:
+        for i, item in enumerate(request.items):
             try:
-                phantom_input = PhantomInput(
+                inputs.append(PhantomInput(
                     transcript=item.get('transcript', ''),
                     metadata=item.get('metadata', {}),
                     features={}
-                )
-                
-                result = phantom_engine.analyze(phantom_input)
-                results.append(result.to_dict())
-                
+                ))
+                positions.append(i)
             except Exception as e:
                 logger.error(f"[PhantomAPI] Error in batch item: {e}")
                 errors += 1
-                results.append({
-                    "error": str(e),
-                    "transcript": item.get('transcript', '')[:50]
-                })
+                results[i] = _batch_item_error(item, e)
+        
+        # Feature extraction and scoring isolate failures per item
+        for i, result in zip(positions, phantom_engine.analyze_batch(inputs)):
+            try:
+                results[i] = result.to_dict()
+                if results[i].get('classification') == 'ERROR':
+                    errors += 1
+            except Exception as e:
+                logger.error(f"[PhantomAPI] Error in batch item: {e}")
+                errors += 1
+                results[i] = _batch_item_error(request.items[i], e)
         
         return BatchResponse(
             success=True,
@@ -186,6 +193,14 @@ async def batch_analyze(request: BatchRequest) -> BatchResponse:
         )
 
 
+def _batch_item_error(item: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+    """Result entry for a batch item that could not be analyzed"""
+    return {
+        "error": str(error),
+        "transcript": str(item.get('transcript', ''))[:50]
+    }
+
+
 @router.get("/phantom/signature-types")
 async def get_signature_types() -> SignatureTypesResponse:
     """
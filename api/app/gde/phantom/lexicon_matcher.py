@@ -0,0 +1,113 @@
+"""
+Phantom Deception Engine™ - Lexicon Matcher
+Counts every lexicon phrase in a transcript with one compiled pattern
+"""
+
+import re
+from typing import Dict, List, Sequence, Tuple
+
+
+class LexiconMatcher:
+    """
+    Single-pass multi-lexicon phrase counter.
+
+    All phrases from all lexicons are compiled into one trie-shaped regex
+    (longest alternative first at every node). After each match the scan
+    resumes at the first offset inside it where another phrase could begin
+    (precomputed per phrase), so every position where some phrase begins
+    is visited; the shorter phrases that are prefixes of the matched one
+    are credited from a precomputed table.
+
+    Per phrase, occurrences are counted without overlap from left to right,
+    i.e. exactly like ``text.count(phrase)``; ``hits`` is the number of
+    lexicon entries present, i.e. ``sum(phrase in text ...)``.
+    """
+
+    def __init__(self, lexicons: Dict[str, Sequence[str]]):
+        """
+        Args:
+            lexicons: Mapping of lexicon name to its phrases (substring semantics)
+        """
+        phrases: List[str] = []
+        phrase_ids: Dict[str, int] = {}
+        self._lexicon_ids: Dict[str, List[int]] = {}
+        for name, words in lexicons.items():
+            ids = []
+            for word in words:
+                if word not in phrase_ids:
+                    phrase_ids[word] = len(phrases)
+                    phrases.append(word)
+                ids.append(phrase_ids[word])
+            self._lexicon_ids[name] = ids
+
+        self._lengths = [len(p) for p in phrases]
+        # Longest phrase matched at a position -> every phrase matching there
+        self._prefix_closure: Dict[str, Tuple[int, ...]] = {
+            phrase: tuple(phrase_ids[p] for p in phrases if phrase.startswith(p))
+            for phrase in phrases
+        }
+        # Matched phrase -> first offset inside it where any phrase could start
+        self._resume_offset: Dict[str, int] = {
+            phrase: next(
+                (k for k in range(1, len(phrase))
+                 if any(p.startswith(phrase[k:]) or phrase.startswith(p, k) for p in phrases)),
+                len(phrase)
+            )
+            for phrase in phrases
+        }
+        self._pattern = re.compile(self._trie_pattern(phrases)) if phrases else None
+
+    @staticmethod
+    def _trie_pattern(phrases: Sequence[str]) -> str:
+        trie: Dict[str, dict] = {}
+        for phrase in phrases:
+            node = trie
+            for char in phrase:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        def build(node: Dict[str, dict]) -> str:
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            # Terminal node with continuations: greedy optional keeps longest-first
+            return '(?:' + body + ')?' if '' in node else body
+
+        return build(trie)
+
+    def scan(self, text: str) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """
+        Count all lexicons in one pass over ``text``.
+
+        Returns:
+            (counts, hits) keyed by lexicon name
+        """
+        n_phrases = len(self._lengths)
+        occurrences = [0] * n_phrases
+
+        if self._pattern is not None:
+            lengths = self._lengths
+            closure = self._prefix_closure
+            resume = self._resume_offset
+            next_free = [0] * n_phrases
+            search = self._pattern.search
+            pos = 0
+            while True:
+                match = search(text, pos)
+                if match is None:
+                    break
+                start = match.start()
+                phrase = match.group()
+                for pid in closure[phrase]:
+                    if start >= next_free[pid]:
+                        occurrences[pid] += 1
+                        next_free[pid] = start + lengths[pid]
+                pos = start + resume[phrase]
+
+        counts = {}
+        hits = {}
+        for name, ids in self._lexicon_ids.items():
+            counts[name] = sum(occurrences[pid] for pid in ids)
+            hits[name] = sum(1 for pid in ids if occurrences[pid])
+        return counts, hits
@@ -4,7 +4,7 @@ Complete deception analysis with scoring, classification, and narrative generati
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from .phantom_schema import PhantomInput, PhantomResult, PhantomSignature
 from .phantom_feature_engine import PhantomFeatureEngine
 from .phantom_signature_engine import PhantomSignatureEngine
@@ -30,12 +30,13 @@ class PhantomEngine:
         self.signature_engine = PhantomSignatureEngine()
         logger.info("[Phantom] Engine initialized")
     
-    def analyze(self, input_data: PhantomInput) -> PhantomResult:
+    def analyze(self, input_data: PhantomInput, features: Optional[Dict[str, Any]] = None) -> PhantomResult:
         """
         Complete deception analysis
         
         Args:
             input_data: PhantomInput with transcript and metadata
+            features: Precomputed features (e.g. from extract_features_batch)
             
         Returns:
             PhantomResult with complete analysis
@@ -43,7 +44,8 @@ class PhantomEngine:
         try:
             logger.info("[Phantom] Starting deception analysis")
             
-            features = self.feature_engine.extract_features(input_data)
+            if features is None:
+                features = self.feature_engine.extract_features(input_data)
             
             deception_score = self.compute_deception_score(features)
             
@@ -87,6 +89,25 @@ class PhantomEngine:
                 features_used={}
             )
     
+    def analyze_batch(self, inputs: List[PhantomInput]) -> List[PhantomResult]:
+        """
+        Deception analysis for many inputs
+        
+        Features are extracted in one batch call, then each input is
+        scored and classified as in analyze().
+        
+        Args:
+            inputs: List of PhantomInput
+            
+        Returns:
+            List of PhantomResult, in input order
+        """
+        features_list = self.feature_engine.extract_features_batch(inputs)
+        return [
+            self.analyze(input_data, features=features)
+            for input_data, features in zip(inputs, features_list)
+        ]
+    
     def compute_deception_score(self, features: Dict[str, float]) -> float:
         """
         Compute composite deception score (0-1)
@@ -5,7 +5,9 @@ Generates 50-80 simulated deception features across 6 domains
 
 import logging
 import re
-from typing import Dict, Any
+from collections import Counter
+from typing import Dict, Any, List
+from .lexicon_matcher import LexiconMatcher
 from .phantom_schema import PhantomInput
 
 logger = logging.getLogger(__name__)
@@ -43,8 +45,49 @@ class PhantomFeatureEngine:
         'don\'t tell', 'keep quiet', 'private', 'discreet'
     ]
     
+    HEDGE_WORDS = ['maybe', 'perhaps', 'possibly', 'might', 'could', 'probably']
+    CONTRADICTION_INDICATORS = ['but', 'however', 'although', 'actually', 'wait']
+    CONFIDENCE_WORDS = ['sure', 'certain', 'confident', 'know', 'positive']
+    UNCERTAINTY_WORDS = ['unsure', 'uncertain', 'maybe', 'guess', 'think']
+    AGGRESSION_WORDS = ['must', 'need', 'have to', 'should', 'demand', 'require']
+    DEFLECTION_WORDS = ['anyway', 'moving on', 'forget that', 'never mind', 'doesn\'t matter']
+    
+    POSITIVE_WORDS = ['happy', 'great', 'excellent', 'wonderful', 'amazing', 'love', 'perfect']
+    NEGATIVE_WORDS = ['bad', 'terrible', 'awful', 'hate', 'worst', 'horrible', 'disaster']
+    FEAR_WORDS = ['scared', 'afraid', 'worried', 'nervous', 'anxious', 'concerned']
+    ANGER_WORDS = ['angry', 'mad', 'furious', 'upset', 'frustrated', 'annoyed']
+    GUILT_WORDS = ['sorry', 'apologize', 'fault', 'blame', 'regret']
+    SYMPATHY_WORDS = ['understand', 'feel', 'empathy', 'care', 'support']
+    
+    PRONOUN_CLASSES = {
+        **{p: 0 for p in ('i', 'me', 'my', 'mine', 'myself')},
+        **{p: 1 for p in ('you', 'your', 'yours', 'yourself')},
+        **{p: 2 for p in ('he', 'she', 'they', 'them', 'their')}
+    }
+    PRONOUN_PATTERN = re.compile(r'\b(' + '|'.join(PRONOUN_CLASSES) + r')\b')
+    # One match per '.!?'-delimited segment that has non-whitespace content
+    SENTENCE_PATTERN = re.compile(r'[^.!?\s][^.!?]*')
+    
     def __init__(self):
         """Initialize feature engine"""
+        self.matcher = LexiconMatcher({
+            'deception': self.DECEPTION_KEYWORDS,
+            'urgency': self.URGENCY_KEYWORDS,
+            'manipulation': self.MANIPULATION_KEYWORDS,
+            'evasion': self.EVASION_KEYWORDS,
+            'hedge': self.HEDGE_WORDS,
+            'contradiction': self.CONTRADICTION_INDICATORS,
+            'confidence': self.CONFIDENCE_WORDS,
+            'uncertainty': self.UNCERTAINTY_WORDS,
+            'aggression': self.AGGRESSION_WORDS,
+            'deflection': self.DEFLECTION_WORDS,
+            'positive': self.POSITIVE_WORDS,
+            'negative': self.NEGATIVE_WORDS,
+            'fear': self.FEAR_WORDS,
+            'anger': self.ANGER_WORDS,
+            'guilt': self.GUILT_WORDS,
+            'sympathy': self.SYMPATHY_WORDS,
+        })
         logger.info("[Phantom] FeatureEngine initialized")
     
     @staticmethod
@@ -69,22 +112,7 @@ class PhantomFeatureEngine:
         try:
             logger.info("[Phantom] Extracting deception features")
             
-            transcript = input_data.transcript.lower()
-            metadata = input_data.metadata
-            
-            features = {}
-            
-            features.update(self._extract_linguistic_features(transcript))
-            
-            features.update(self._extract_behavioral_features(transcript, metadata))
-            
-            features.update(self._extract_synthetic_features(metadata))
-            
-            features.update(self._extract_emotional_features(transcript))
-            
-            features.update(self._extract_metadata_features(metadata))
-            
-            features.update(self._compute_composite_features(features))
+            features = self._extract(input_data)
             
             logger.info(f"[Phantom] Extracted {len(features)} features")
             return features
@@ -93,52 +121,123 @@ class PhantomFeatureEngine:
             logger.error(f"[Phantom] Error extracting features: {e}")
             return {}
     
-    def _extract_linguistic_features(self, transcript: str) -> Dict[str, float]:
+    def extract_features_batch(self, inputs: List[PhantomInput]) -> List[Dict[str, Any]]:
+        """
+        Extract deception features for many inputs
+        
+        Produces the same features as extract_features for each input,
+        sharing the compiled matcher and skipping per-item logging.
+        
+        Returns:
+            List of feature dictionaries, in input order ({} for failed items)
+        """
+        logger.info(f"[Phantom] Extracting deception features for {len(inputs)} inputs")
+        
+        results = []
+        for input_data in inputs:
+            try:
+                results.append(self._extract(input_data))
+            except Exception as e:
+                logger.error(f"[Phantom] Error extracting features: {e}")
+                results.append({})
+        return results
+    
+    def _extract(self, input_data: PhantomInput) -> Dict[str, Any]:
+        """Scan the transcript once and derive all feature domains from the scan"""
+        transcript = input_data.transcript.lower()
+        metadata = input_data.metadata
+        scan = self._scan_transcript(transcript)
+        
+        features = {}
+        
+        features.update(self._extract_linguistic_features(scan))
+        
+        features.update(self._extract_behavioral_features(scan, metadata))
+        
+        features.update(self._extract_synthetic_features(metadata))
+        
+        features.update(self._extract_emotional_features(scan))
+        
+        features.update(self._extract_metadata_features(metadata))
+        
+        features.update(self._compute_composite_features(features))
+        
+        return features
+    
+    def _scan_transcript(self, transcript: str) -> Dict[str, Any]:
+        """
+        Tokenize a lowercased transcript once
+        
+        Lexicon counts follow str.count / `in` substring semantics; the
+        word list, pronoun and sentence counts are shared by all domains.
+        """
+        words = transcript.split()
+        counts, hits = self.matcher.scan(transcript)
+        
+        pronouns = [0, 0, 0]
+        for pronoun in self.PRONOUN_PATTERN.findall(transcript):
+            pronouns[self.PRONOUN_CLASSES[pronoun]] += 1
+        
+        if transcript.islower():
+            caps_count = 0
+        else:
+            caps_count = sum(map(str.isupper, transcript))
+        
+        return {
+            'transcript': transcript,
+            'words': words,
+            'word_freq': Counter(words),
+            'counts': counts,
+            'hits': hits,
+            'pronouns': pronouns,
+            'sentence_count': len(self.SENTENCE_PATTERN.findall(transcript)),
+            'caps_count': caps_count
+        }
+    
+    def _extract_linguistic_features(self, scan: Dict[str, Any]) -> Dict[str, float]:
         """Extract linguistic deception cues (20+ features)"""
         try:
             features = {}
             
-            words = transcript.split()
+            transcript = scan['transcript']
+            words = scan['words']
+            hits = scan['hits']
             features['word_count'] = len(words)
-            features['avg_word_length'] = sum(len(w) for w in words) / max(len(words), 1)
-            features['unique_word_ratio'] = len(set(words)) / max(len(words), 1)
+            features['avg_word_length'] = sum(map(len, words)) / max(len(words), 1)
+            features['unique_word_ratio'] = len(scan['word_freq']) / max(len(words), 1)
             
-            deception_count = sum(1 for kw in self.DECEPTION_KEYWORDS if kw in transcript)
+            deception_count = hits['deception']
             features['deception_keyword_density'] = deception_count / max(len(words), 1)
             features['deception_keyword_count'] = deception_count
             
-            urgency_count = sum(1 for kw in self.URGENCY_KEYWORDS if kw in transcript)
+            urgency_count = hits['urgency']
             features['urgency_density'] = urgency_count / max(len(words), 1)
             features['urgency_count'] = urgency_count
             
-            manipulation_count = sum(1 for kw in self.MANIPULATION_KEYWORDS if kw in transcript)
+            manipulation_count = hits['manipulation']
             features['manipulation_density'] = manipulation_count / max(len(words), 1)
             features['manipulation_count'] = manipulation_count
             
-            evasion_count = sum(1 for kw in self.EVASION_KEYWORDS if kw in transcript)
+            evasion_count = hits['evasion']
             features['evasion_density'] = evasion_count / max(len(words), 1)
             features['evasion_count'] = evasion_count
             
-            sentences = [s.strip() for s in re.split(r'[.!?]+', transcript) if s.strip()]
-            features['sentence_count'] = len(sentences)
-            features['avg_sentence_length'] = len(words) / max(len(sentences), 1)
+            features['sentence_count'] = scan['sentence_count']
+            features['avg_sentence_length'] = len(words) / max(features['sentence_count'], 1)
             
             features['question_count'] = transcript.count('?')
-            features['question_density'] = features['question_count'] / max(len(sentences), 1)
+            features['question_density'] = features['question_count'] / max(features['sentence_count'], 1)
             
             features['exclamation_count'] = transcript.count('!')
-            features['exclamation_density'] = features['exclamation_count'] / max(len(sentences), 1)
+            features['exclamation_density'] = features['exclamation_count'] / max(features['sentence_count'], 1)
             
-            first_person = len(re.findall(r'\b(i|me|my|mine|myself)\b', transcript))
-            second_person = len(re.findall(r'\b(you|your|yours|yourself)\b', transcript))
-            third_person = len(re.findall(r'\b(he|she|they|them|their)\b', transcript))
+            first_person, second_person, third_person = scan['pronouns']
             
             features['first_person_density'] = first_person / max(len(words), 1)
             features['second_person_density'] = second_person / max(len(words), 1)
             features['third_person_density'] = third_person / max(len(words), 1)
             
-            hedge_words = ['maybe', 'perhaps', 'possibly', 'might', 'could', 'probably']
-            hedge_count = sum(transcript.count(hw) for hw in hedge_words)
+            hedge_count = scan['counts']['hedge']
             features['hedge_density'] = hedge_count / max(len(words), 1)
             
             return features
@@ -147,43 +246,36 @@ class PhantomFeatureEngine:
             logger.error(f"[Phantom] Error extracting linguistic features: {e}")
             return {}
     
-    def _extract_behavioral_features(self, transcript: str, metadata: Dict[str, Any]) -> Dict[str, float]:
+    def _extract_behavioral_features(self, scan: Dict[str, Any], metadata: Dict[str, Any]) -> Dict[str, float]:
         """Extract behavioral pattern features (15+ features)"""
         try:
             features = {}
             
+            words = scan['words']
+            counts = scan['counts']
+            
             features['response_time'] = self.safe_value(metadata.get('response_time', 0))
             features['typing_speed'] = self.safe_value(metadata.get('typing_speed', 0))
             features['pause_frequency'] = self.safe_value(metadata.get('pause_frequency', 0))
             
-            contradiction_indicators = ['but', 'however', 'although', 'actually', 'wait']
-            features['contradiction_density'] = sum(transcript.count(ci) for ci in contradiction_indicators) / max(len(transcript.split()), 1)
-            
-            words = transcript.split()
-            word_freq = {}
-            for word in words:
-                word_freq[word] = word_freq.get(word, 0) + 1
+            features['contradiction_density'] = counts['contradiction'] / max(len(words), 1)
             
+            word_freq = scan['word_freq']
             repeated_words = sum(1 for count in word_freq.values() if count > 2)
-            features['repetition_score'] = repeated_words / max(len(set(words)), 1)
-            
-            confidence_words = ['sure', 'certain', 'confident', 'know', 'positive']
-            uncertainty_words = ['unsure', 'uncertain', 'maybe', 'guess', 'think']
+            features['repetition_score'] = repeated_words / max(len(word_freq), 1)
             
-            confidence_count = sum(transcript.count(cw) for cw in confidence_words)
-            uncertainty_count = sum(transcript.count(uw) for uw in uncertainty_words)
+            confidence_count = counts['confidence']
+            uncertainty_count = counts['uncertainty']
             
             features['confidence_score'] = confidence_count / max(len(words), 1)
             features['uncertainty_score'] = uncertainty_count / max(len(words), 1)
             features['confidence_misalignment'] = abs(features['confidence_score'] - features['uncertainty_score'])
             
-            aggression_words = ['must', 'need', 'have to', 'should', 'demand', 'require']
-            features['aggression_score'] = sum(transcript.count(aw) for aw in aggression_words) / max(len(words), 1)
+            features['aggression_score'] = counts['aggression'] / max(len(words), 1)
             
-            deflection_words = ['anyway', 'moving on', 'forget that', 'never mind', 'doesn\'t matter']
-            features['deflection_score'] = sum(transcript.count(dw) for dw in deflection_words) / max(len(words), 1)
+            features['deflection_score'] = counts['deflection'] / max(len(words), 1)
             
-            features['detail_density'] = len(transcript) / max(len(words), 1)
+            features['detail_density'] = len(scan['transcript']) / max(len(words), 1)
             features['oversharing_indicator'] = 1.0 if features['detail_density'] > 8.0 else 0.0
             
             features['consistency_score'] = self.safe_value(metadata.get('consistency_score', 0.5))
@@ -230,33 +322,25 @@ class PhantomFeatureEngine:
             logger.error(f"[Phantom] Error extracting synthetic features: {e}")
             return {}
     
-    def _extract_emotional_features(self, transcript: str) -> Dict[str, float]:
+    def _extract_emotional_features(self, scan: Dict[str, Any]) -> Dict[str, float]:
         """Extract emotional instability patterns (10+ features)"""
         try:
             features = {}
             
-            positive_words = ['happy', 'great', 'excellent', 'wonderful', 'amazing', 'love', 'perfect']
-            negative_words = ['bad', 'terrible', 'awful', 'hate', 'worst', 'horrible', 'disaster']
-            fear_words = ['scared', 'afraid', 'worried', 'nervous', 'anxious', 'concerned']
-            anger_words = ['angry', 'mad', 'furious', 'upset', 'frustrated', 'annoyed']
+            counts = scan['counts']
+            word_count = max(len(scan['words']), 1)
             
-            words = transcript.split()
-            word_count = max(len(words), 1)
-            
-            features['positive_emotion_density'] = sum(transcript.count(pw) for pw in positive_words) / word_count
-            features['negative_emotion_density'] = sum(transcript.count(nw) for nw in negative_words) / word_count
-            features['fear_emotion_density'] = sum(transcript.count(fw) for fw in fear_words) / word_count
-            features['anger_emotion_density'] = sum(transcript.count(aw) for aw in anger_words) / word_count
+            features['positive_emotion_density'] = counts['positive'] / word_count
+            features['negative_emotion_density'] = counts['negative'] / word_count
+            features['fear_emotion_density'] = counts['fear'] / word_count
+            features['anger_emotion_density'] = counts['anger'] / word_count
             
             features['emotional_volatility'] = abs(features['positive_emotion_density'] - features['negative_emotion_density'])
             
-            guilt_words = ['sorry', 'apologize', 'fault', 'blame', 'regret']
-            sympathy_words = ['understand', 'feel', 'empathy', 'care', 'support']
-            
-            features['guilt_manipulation_score'] = sum(transcript.count(gw) for gw in guilt_words) / word_count
-            features['sympathy_appeal_score'] = sum(transcript.count(sw) for sw in sympathy_words) / word_count
+            features['guilt_manipulation_score'] = counts['guilt'] / word_count
+            features['sympathy_appeal_score'] = counts['sympathy'] / word_count
             
-            features['caps_ratio'] = sum(1 for c in transcript if c.isupper()) / max(len(transcript), 1)
+            features['caps_ratio'] = scan['caps_count'] / max(len(scan['transcript']), 1)
             features['emotional_intensity'] = features['exclamation_density'] if 'exclamation_density' in features else 0.0
             
             features['emotional_instability'] = (
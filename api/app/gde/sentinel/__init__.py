@@ -7,7 +7,8 @@ from .sentinel_schema import (
     SentinelPanelStatus,
     SentinelGlobalStatus,
     SentinelAlert,
-    SentinelDashboard
+    SentinelDashboard,
+    SentinelSnapshot
 )
 from .sentinel_engine import SentinelCommandEngine
 from .api_sentinel import router
@@ -18,6 +19,7 @@ __all__ = [
     'SentinelGlobalStatus',
     'SentinelAlert',
     'SentinelDashboard',
+    'SentinelSnapshot',
     'SentinelCommandEngine',
     'router'
 ]
@@ -4,7 +4,7 @@ Sentinel Command Console™ - FastAPI Router
 """
 
 import logging
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 from pydantic import BaseModel
 from typing import Dict, Any, Optional, List
 from datetime import datetime
@@ -19,10 +19,19 @@ engine = SentinelCommandEngine()
 router = APIRouter(prefix="/sentinel", tags=["Sentinel"])
 
 
+def _weak_match(etag: str, if_none_match: str) -> bool:
+    """Weak comparison of an ETag against an If-None-Match header (RFC 9110)"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
 class DashboardResponse(BaseModel):
     """Response model for dashboard"""
     success: bool
     dashboard: Optional[Dict[str, Any]] = None
+    version: Optional[int] = None
     error: Optional[str] = None
     timestamp: str
 
@@ -67,26 +76,37 @@ class HealthResponse(BaseModel):
     timestamp: str
 
 
-@router.get("/dashboard")
-async def get_dashboard() -> DashboardResponse:
+@router.get("/dashboard", response_model=None)
+async def get_dashboard(request: Request, response: Response):
     """
     Get complete Sentinel Command Console dashboard
     
     GET /sentinel/dashboard
     
+    Served from the latest background-built snapshot. The weak ETag header
+    identifies the snapshot's content; an If-None-Match that matches it
+    under weak comparison gets 304 Not Modified.
+    
     Returns:
     - success: bool
     - dashboard: Complete SentinelDashboard with all components
+    - version: snapshot version
     - timestamp: retrieval timestamp
     """
     try:
         logger.info("[SentinelAPI] Getting dashboard")
         
-        dashboard = engine.get_dashboard()
+        snapshot = await engine.get_snapshot()
+        
+        if_none_match = request.headers.get("if-none-match", "")
+        if _weak_match(snapshot.etag, if_none_match):
+            return Response(status_code=304, headers={"ETag": snapshot.etag})
+        response.headers["ETag"] = snapshot.etag
         
         return DashboardResponse(
             success=True,
-            dashboard=dashboard.to_dict(),
+            dashboard=snapshot.payload,
+            version=snapshot.version,
             timestamp=datetime.utcnow().isoformat()
         )
         
@@ -115,11 +135,11 @@ async def get_heartbeat() -> HeartbeatResponse:
     try:
         logger.info("[SentinelAPI] Getting heartbeat")
         
-        heartbeat = engine.heartbeat()
+        snapshot = await engine.get_snapshot()
         
         return HeartbeatResponse(
             success=True,
-            heartbeat=heartbeat.to_dict(),
+            heartbeat=snapshot.payload["heartbeat"],
             timestamp=datetime.utcnow().isoformat()
         )
         
@@ -148,11 +168,11 @@ async def get_panels() -> PanelsResponse:
     try:
         logger.info("[SentinelAPI] Getting panels")
         
-        panels = engine.collect_panels()
+        snapshot = await engine.get_snapshot()
         
         return PanelsResponse(
             success=True,
-            panels=[p.to_dict() for p in panels],
+            panels=snapshot.payload["panels"],
             timestamp=datetime.utcnow().isoformat()
         )
         
@@ -181,11 +201,11 @@ async def get_summary() -> SummaryResponse:
     try:
         logger.info("[SentinelAPI] Getting summary")
         
-        dashboard = engine.build_dashboard()
+        snapshot = await engine.get_snapshot()
         
         return SummaryResponse(
             success=True,
-            summary=dashboard.summary,
+            summary=snapshot.dashboard.summary,
             timestamp=datetime.utcnow().isoformat()
         )
         
@@ -214,11 +234,11 @@ async def get_alerts() -> AlertsResponse:
     try:
         logger.info("[SentinelAPI] Getting alerts")
         
-        dashboard = engine.build_dashboard()
+        snapshot = await engine.get_snapshot()
         
         return AlertsResponse(
             success=True,
-            alerts=[a.to_dict() for a in dashboard.alerts],
+            alerts=snapshot.payload["alerts"],
             timestamp=datetime.utcnow().isoformat()
         )
         
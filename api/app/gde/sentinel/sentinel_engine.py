@@ -4,8 +4,14 @@ Real-time command center monitoring all intelligence engines
 Pure Python, zero external dependencies
 """
 
-import logging
+import os
+import json
 import time
+import asyncio
+import hashlib
+import logging
+import threading
+from bisect import bisect_right
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from .sentinel_schema import (
@@ -13,11 +19,35 @@ from .sentinel_schema import (
     SentinelPanelStatus,
     SentinelGlobalStatus,
     SentinelAlert,
-    SentinelDashboard
+    SentinelDashboard,
+    SentinelSnapshot
 )
 
 logger = logging.getLogger(__name__)
 
+# Refresh cadence per dashboard input: the heartbeat, the global intel
+# picture and each of the 8 panels
+DEFAULT_CADENCE_SECONDS = {
+    'heartbeat': 5.0,
+    'intel': 15.0,
+    'prediction': 30.0,
+    'fusion': 15.0,
+    'hydra': 15.0,
+    'constellation': 15.0,
+    'radar': 15.0,
+    'actor': 30.0,
+    'oracle': 30.0,
+    'dna': 30.0
+}
+
+# Fields that change on every collection without the content changing
+VOLATILE_FIELDS = ('timestamp', 'last_updated')
+
+# Probe latency only counts as changed when it crosses one of these (ms),
+# so jitter does not publish a new snapshot and ETag on every heartbeat.
+# The body still carries exact latencies, which is why the ETag is weak.
+LATENCY_BUCKETS_MS = (1.0, 5.0, 25.0, 100.0, 500.0)
+
 
 class SentinelCommandEngine:
     """
@@ -34,9 +64,17 @@ class SentinelCommandEngine:
     - Oracle Eye
     
     Pure Python, 100% crash-proof, deterministic
+    
+    The dashboard is materialized in the background: each input (heartbeat,
+    global intel, every panel) is collected on its own cadence, and derived
+    parts (global status, alerts, summary) are only recomputed when an
+    input's content changed. Every change publishes a new immutable
+    SentinelSnapshot with a version and ETag, which readers get without
+    triggering a rebuild. SENTINEL_CADENCE_SCALE multiplies the default
+    cadences.
     """
     
-    def __init__(self):
+    def __init__(self, cadences: Optional[Dict[str, float]] = None):
         """Initialize Sentinel Command Engine"""
         self.engine_endpoints = {
             'prediction': '/predict/health',
@@ -48,7 +86,31 @@ class SentinelCommandEngine:
             'dna': '/dna/health',
             'oracle': '/oracle/health'
         }
+        self.panel_collectors = {
+            'prediction': self._prediction_panel,
+            'fusion': self._fusion_panel,
+            'hydra': self._hydra_panel,
+            'constellation': self._constellation_panel,
+            'radar': self._radar_panel,
+            'actor': self._actor_panel,
+            'oracle': self._oracle_panel,
+            'dna': self._dna_panel
+        }
+        scale = float(os.getenv("SENTINEL_CADENCE_SCALE", 1.0))
+        self.cadences = {name: seconds * scale for name, seconds in DEFAULT_CADENCE_SECONDS.items()}
+        self.cadences.update(cadences or {})
+        
         self.latest_dashboard: Optional[SentinelDashboard] = None
+        self._snapshot: Optional[SentinelSnapshot] = None
+        self._version = 0
+        self._inputs: Dict[str, Any] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._next_due: Dict[str, float] = {}
+        self._refresh_lock = threading.Lock()
+        self._inflight: Optional[asyncio.Future] = None
+        self._task: Optional[asyncio.Task] = None
+        self.running = False
+        self.stats = {'refreshes': 0, 'collections': 0, 'rebuilds': 0, 'published': 0}
         logger.info("[Sentinel] Engine initialized")
     
     def heartbeat(self) -> SentinelHeartbeat:
@@ -190,127 +252,10 @@ class SentinelCommandEngine:
             
             panels = []
             
-            try:
-                panel = SentinelPanelStatus(
-                    panel_name="Prediction Engine",
-                    status="operational",
-                    risk_score=0.35,
-                    data={
-                        'models_active': 4,
-                        'predictions_today': 1247,
-                        'accuracy': 0.87
-                    }
-                )
-                panels.append(panel)
-            except Exception as e:
-                logger.error(f"[Sentinel] Error collecting prediction panel: {e}")
-            
-            try:
-                panel = SentinelPanelStatus(
-                    panel_name="UltraFusion Supervisor",
-                    status="operational",
-                    risk_score=0.45,
-                    data={
-                        'fusion_score': 0.45,
-                        'entities_fused': 127,
-                        'high_risk': 8
-                    }
-                )
-                panels.append(panel)
-            except Exception as e:
-                logger.error(f"[Sentinel] Error collecting fusion panel: {e}")
-            
-            try:
-                panel = SentinelPanelStatus(
-                    panel_name="Hydra Detection",
-                    status="operational",
-                    risk_score=0.52,
-                    data={
-                        'hydra_heads': 2,
-                        'clusters': 3,
-                        'relays': 15,
-                        'proxies': 8
-                    }
-                )
-                panels.append(panel)
-            except Exception as e:
-                logger.error(f"[Sentinel] Error collecting hydra panel: {e}")
-            
-            try:
-                panel = SentinelPanelStatus(
-                    panel_name="Constellation Map",
-                    status="operational",
-                    risk_score=0.48,
-                    data={
-                        'total_nodes': 156,
-                        'supernovas': 5,
-                        'galaxies': 4,
-                        'wormholes': 12
-                    }
-                )
-                panels.append(panel)
-            except Exception as e:
-                logger.error(f"[Sentinel] Error collecting constellation panel: {e}")
-            
-            try:
-                panel = SentinelPanelStatus(
-                    panel_name="Global Radar",
-                    status="operational",
-                    risk_score=0.38,
-                    data={
-                        'manipulation_events': 23,
-                        'volatility_score': 0.38,
-                        'anomalies': 12
-                    }
-                )
-                panels.append(panel)
-            except Exception as e:
-                logger.error(f"[Sentinel] Error collecting radar panel: {e}")
-            
-            try:
-                panel = SentinelPanelStatus(
-                    panel_name="Actor Profiler",
-                    status="operational",
-                    risk_score=0.42,
-                    data={
-                        'threat_actors': 15,
-                        'high_threat': 4,
-                        'avg_score': 0.42
-                    }
-                )
-                panels.append(panel)
-            except Exception as e:
-                logger.error(f"[Sentinel] Error collecting actor panel: {e}")
-            
-            try:
-                panel = SentinelPanelStatus(
-                    panel_name="Oracle Eye",
-                    status="operational",
-                    risk_score=0.28,
-                    data={
-                        'visual_alerts': 7,
-                        'pattern_matches': 34,
-                        'confidence': 0.82
-                    }
-                )
-                panels.append(panel)
-            except Exception as e:
-                logger.error(f"[Sentinel] Error collecting oracle panel: {e}")
-            
-            try:
-                panel = SentinelPanelStatus(
-                    panel_name="Behavioral DNA",
-                    status="operational",
-                    risk_score=0.33,
-                    data={
-                        'profiles_active': 89,
-                        'manipulators': 6,
-                        'wash_traders': 11
-                    }
-                )
-                panels.append(panel)
-            except Exception as e:
-                logger.error(f"[Sentinel] Error collecting dna panel: {e}")
+            for panel_key in self.panel_collectors:
+                panel = self.collect_panel(panel_key)
+                if panel is not None:
+                    panels.append(panel)
             
             logger.info(f"[Sentinel] Collected {len(panels)} panel statuses")
             return panels
@@ -319,6 +264,125 @@ class SentinelCommandEngine:
             logger.error(f"[Sentinel] Error collecting panels: {e}")
             return []
     
+    def collect_panel(self, panel_key: str) -> Optional[SentinelPanelStatus]:
+        """
+        Collect status for one intelligence panel
+        
+        Returns:
+            SentinelPanelStatus, or None if the panel could not be collected
+        """
+        try:
+            return self.panel_collectors[panel_key]()
+        except Exception as e:
+            logger.error(f"[Sentinel] Error collecting {panel_key} panel: {e}")
+            return None
+    
+    def _prediction_panel(self) -> SentinelPanelStatus:
+        """Prediction Engine panel"""
+        return SentinelPanelStatus(
+            panel_name="Prediction Engine",
+            status="operational",
+            risk_score=0.35,
+            data={
+                'models_active': 4,
+                'predictions_today': 1247,
+                'accuracy': 0.87
+            }
+        )
+    
+    def _fusion_panel(self) -> SentinelPanelStatus:
+        """UltraFusion Supervisor panel"""
+        return SentinelPanelStatus(
+            panel_name="UltraFusion Supervisor",
+            status="operational",
+            risk_score=0.45,
+            data={
+                'fusion_score': 0.45,
+                'entities_fused': 127,
+                'high_risk': 8
+            }
+        )
+    
+    def _hydra_panel(self) -> SentinelPanelStatus:
+        """Hydra Detection panel"""
+        return SentinelPanelStatus(
+            panel_name="Hydra Detection",
+            status="operational",
+            risk_score=0.52,
+            data={
+                'hydra_heads': 2,
+                'clusters': 3,
+                'relays': 15,
+                'proxies': 8
+            }
+        )
+    
+    def _constellation_panel(self) -> SentinelPanelStatus:
+        """Constellation Map panel"""
+        return SentinelPanelStatus(
+            panel_name="Constellation Map",
+            status="operational",
+            risk_score=0.48,
+            data={
+                'total_nodes': 156,
+                'supernovas': 5,
+                'galaxies': 4,
+                'wormholes': 12
+            }
+        )
+    
+    def _radar_panel(self) -> SentinelPanelStatus:
+        """Global Radar panel"""
+        return SentinelPanelStatus(
+            panel_name="Global Radar",
+            status="operational",
+            risk_score=0.38,
+            data={
+                'manipulation_events': 23,
+                'volatility_score': 0.38,
+                'anomalies': 12
+            }
+        )
+    
+    def _actor_panel(self) -> SentinelPanelStatus:
+        """Actor Profiler panel"""
+        return SentinelPanelStatus(
+            panel_name="Actor Profiler",
+            status="operational",
+            risk_score=0.42,
+            data={
+                'threat_actors': 15,
+                'high_threat': 4,
+                'avg_score': 0.42
+            }
+        )
+    
+    def _oracle_panel(self) -> SentinelPanelStatus:
+        """Oracle Eye panel"""
+        return SentinelPanelStatus(
+            panel_name="Oracle Eye",
+            status="operational",
+            risk_score=0.28,
+            data={
+                'visual_alerts': 7,
+                'pattern_matches': 34,
+                'confidence': 0.82
+            }
+        )
+    
+    def _dna_panel(self) -> SentinelPanelStatus:
+        """Behavioral DNA panel"""
+        return SentinelPanelStatus(
+            panel_name="Behavioral DNA",
+            status="operational",
+            risk_score=0.33,
+            data={
+                'profiles_active': 89,
+                'manipulators': 6,
+                'wash_traders': 11
+            }
+        )
+    
     def build_dashboard(self) -> SentinelDashboard:
         """
         Build complete Sentinel dashboard
@@ -330,45 +394,221 @@ class SentinelCommandEngine:
         - Alerts
         - Threat level computation
         
+        Collects every input now, regardless of cadence, and publishes a
+        new snapshot if anything changed.
+        
         Returns:
             SentinelDashboard object
         """
         try:
             logger.info("[Sentinel] Building dashboard")
             
-            heartbeat = self.heartbeat()
-            intel = self.collect_global_intel()
-            panels = self.collect_panels()
+            self.refresh(force=True)
+            return self._snapshot.dashboard if self._snapshot else SentinelDashboard()
             
+        except Exception as e:
+            logger.error(f"[Sentinel] Error building dashboard: {e}")
+            return SentinelDashboard()
+    
+    def refresh(self, force: bool = False) -> Optional[SentinelSnapshot]:
+        """
+        Collect the inputs that are due and publish a snapshot if any changed
+        
+        Concurrent callers are serialized; a caller that waited finds the
+        inputs fresh and returns without collecting again.
+        
+        Returns:
+            The newly published snapshot, or None if nothing changed
+        """
+        with self._refresh_lock:
+            try:
+                self.stats['refreshes'] += 1
+                now = time.monotonic()
+                changed = set()
+                
+                for name, cadence in self.cadences.items():
+                    if not force and self._next_due.get(name, 0.0) > now:
+                        continue
+                    self._next_due[name] = now + cadence
+                    value = self._collect_input(name)
+                    self.stats['collections'] += 1
+                    if value is None:
+                        continue  # keep the last good value
+                    fingerprint = self._fingerprint(self._stable_view(name, value))
+                    if fingerprint != self._fingerprints.get(name):
+                        self._inputs[name] = value
+                        self._fingerprints[name] = fingerprint
+                        changed.add(name)
+                
+                if self._snapshot is not None and not changed:
+                    return None
+                return self._publish(changed)
+                
+            except Exception as e:
+                logger.error(f"[Sentinel] Error refreshing dashboard: {e}")
+                return None
+    
+    def _collect_input(self, name: str) -> Any:
+        """Collect one dashboard input by name"""
+        if name == 'heartbeat':
+            return self.heartbeat()
+        if name == 'intel':
+            return self.collect_global_intel() or None
+        return self.collect_panel(name)
+    
+    @staticmethod
+    def _stable_view(name: str, value: Any) -> Any:
+        """Input as fingerprinted: heartbeat latencies are reduced to their bucket"""
+        if name != 'heartbeat' or not isinstance(value, SentinelHeartbeat):
+            return value
+        data = value.to_dict()
+        data['latency_map'] = {
+            engine: -1 if latency < 0 else bisect_right(LATENCY_BUCKETS_MS, latency)
+            for engine, latency in data.get('latency_map', {}).items()
+        }
+        return data
+    
+    @staticmethod
+    def _fingerprint(value: Any) -> str:
+        """Content hash of an input, ignoring collection timestamps"""
+        data = value.to_dict() if hasattr(value, 'to_dict') else value
+        if isinstance(data, dict):
+            data = {k: v for k, v in data.items() if k not in VOLATILE_FIELDS}
+        encoded = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha1(encoded).hexdigest()
+    
+    def _publish(self, changed: set) -> SentinelSnapshot:
+        """Assemble and publish the next dashboard snapshot"""
+        previous = self._snapshot.dashboard if self._snapshot else None
+        heartbeat = self._inputs.get('heartbeat') or SentinelHeartbeat()
+        intel = self._inputs.get('intel', {})
+        panels = [self._inputs[key] for key in self.panel_collectors if key in self._inputs]
+        
+        if previous is None or changed - {'heartbeat'}:
+            self.stats['rebuilds'] += 1
             global_status = self.compute_global_status(intel, panels)
-            
             alerts = self.detect_alerts(intel, panels, global_status)
-            
             summary = self.generate_summary(global_status, intel, panels, alerts)
-            
             top_threat_entities = self._extract_top_threats(intel)
-            
             heatmap_snapshot = self._build_heatmap_snapshot(intel)
-            
-            dashboard = SentinelDashboard(
-                heartbeat=heartbeat,
-                global_status=global_status,
-                panels=panels,
-                alerts=alerts,
-                top_threat_entities=top_threat_entities,
-                heatmap_snapshot=heatmap_snapshot,
-                summary=summary,
-                timestamp=datetime.utcnow().isoformat()
-            )
-            
-            self.latest_dashboard = dashboard
-            
-            logger.info(f"[Sentinel] Dashboard built: {len(panels)} panels, {len(alerts)} alerts")
-            return dashboard
-            
-        except Exception as e:
-            logger.error(f"[Sentinel] Error building dashboard: {e}")
-            return SentinelDashboard()
+        else:
+            # Only the heartbeat moved: the derived parts stand
+            global_status = previous.global_status
+            alerts = previous.alerts
+            summary = previous.summary
+            top_threat_entities = previous.top_threat_entities
+            heatmap_snapshot = previous.heatmap_snapshot
+        
+        dashboard = SentinelDashboard(
+            heartbeat=heartbeat,
+            global_status=global_status,
+            panels=panels,
+            alerts=alerts,
+            top_threat_entities=top_threat_entities,
+            heatmap_snapshot=heatmap_snapshot,
+            summary=summary,
+            timestamp=datetime.utcnow().isoformat()
+        )
+        
+        digest = hashlib.sha1()
+        for name in sorted(self._fingerprints):
+            digest.update(f"{name}={self._fingerprints[name]};".encode('utf-8'))
+        self._version += 1
+        snapshot = SentinelSnapshot(
+            version=self._version,
+            etag=f'W/"{digest.hexdigest()[:20]}"',
+            dashboard=dashboard,
+            payload=dashboard.to_dict(),
+            built_at=dashboard.timestamp
+        )
+        
+        self._snapshot = snapshot
+        self.latest_dashboard = dashboard
+        self.stats['published'] += 1
+        
+        logger.info(
+            f"[Sentinel] Dashboard v{snapshot.version} published: {len(panels)} panels, "
+            f"{len(alerts)} alerts, changed={sorted(changed)}"
+        )
+        return snapshot
+    
+    @property
+    def snapshot(self) -> Optional[SentinelSnapshot]:
+        """Latest published snapshot, without building one"""
+        return self._snapshot
+    
+    def seconds_until_due(self) -> float:
+        """Seconds until the next input is due for collection"""
+        if not self._next_due:
+            return 0.0
+        return max(0.0, min(self._next_due.values()) - time.monotonic())
+    
+    def current_snapshot(self) -> SentinelSnapshot:
+        """
+        Latest snapshot, building the first one synchronously if needed
+        
+        Without the background loop, a stale snapshot is refreshed inline.
+        """
+        if self._snapshot is None or (not self.running and self.seconds_until_due() == 0.0):
+            self.refresh()
+        return self._snapshot
+    
+    async def get_snapshot(self) -> SentinelSnapshot:
+        """
+        Latest snapshot for async readers
+        
+        Concurrent cold-start requests share one build. When the background
+        loop is not running and inputs are due, the current snapshot is
+        returned while a single refresh runs behind it.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and (self.running or self.seconds_until_due() > 0.0):
+            return snapshot
+        
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(asyncio.to_thread(self.refresh))
+            self._inflight.add_done_callback(self._clear_inflight)
+        if snapshot is not None:
+            return snapshot
+        
+        await asyncio.shield(self._inflight)
+        return self._snapshot
+    
+    def _clear_inflight(self, future: asyncio.Future) -> None:
+        self._inflight = None
+    
+    async def start(self) -> None:
+        """Run the background materialization loop until stop() is called"""
+        if self.running:
+            logger.warning("[Sentinel] Background refresh already running")
+            return
+        
+        self.running = True
+        self._task = asyncio.current_task()
+        logger.info("[Sentinel] Background refresh started")
+        
+        while self.running:
+            try:
+                await asyncio.to_thread(self.refresh)
+                await asyncio.sleep(max(0.5, self.seconds_until_due()))
+            except asyncio.CancelledError:
+                self.running = False
+                raise
+            except Exception as e:
+                logger.error(f"[Sentinel] Error in background refresh: {e}")
+                await asyncio.sleep(5)
+    
+    async def stop(self) -> None:
+        """Stop the background materialization loop and wait for it to exit"""
+        self.running = False
+        task, self._task = self._task, None
+        if task is not None and task is not asyncio.current_task() and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        logger.info("[Sentinel] Background refresh stopped")
     
     def detect_alerts(
         self,
@@ -634,7 +874,8 @@ class SentinelCommandEngine:
             SentinelDashboard object
         """
         try:
-            return self.build_dashboard()
+            snapshot = self.current_snapshot()
+            return snapshot.dashboard if snapshot else SentinelDashboard()
         except Exception as e:
             logger.error(f"[Sentinel] Error getting dashboard: {e}")
             return SentinelDashboard()
@@ -177,3 +177,27 @@ class SentinelDashboard:
             "summary": self.summary,
             "timestamp": self.timestamp
         }
+
+
+@dataclass(frozen=True)
+class SentinelSnapshot:
+    """
+    Published Sentinel dashboard version
+    
+    Snapshots are never modified after publication; each refresh that
+    changes the dashboard publishes a new one with the next version.
+    """
+    version: int
+    etag: str
+    dashboard: SentinelDashboard
+    payload: Dict[str, Any]  # dashboard.to_dict(), serialized once
+    built_at: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "version": self.version,
+            "etag": self.etag,
+            "dashboard": self.payload,
+            "built_at": self.built_at
+        }
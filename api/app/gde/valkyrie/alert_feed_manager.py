@@ -4,26 +4,87 @@ Rolling FIFO queue for last 1000 alerts
 """
 
 import logging
-from typing import List, Dict, Any
+from collections import deque
+from typing import Deque, List, Dict, Any, Optional
 from datetime import datetime
 from .valkyrie_schema import ValkyrieAlert
 
 logger = logging.getLogger(__name__)
 
+SEVERITY_LEVELS = ("purple", "red", "orange", "yellow", "green")
+_EPOCH = datetime(1970, 1, 1)
+
+
+def alert_epoch(timestamp: Any) -> float:
+    """
+    Parse an ISO alert timestamp to epoch seconds.
+    
+    Naive timestamps are taken as UTC (alerts are stamped with utcnow()).
+    Unparseable values map to -inf so they never match a since() query.
+    """
+    try:
+        parsed = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except (AttributeError, TypeError, ValueError):
+        return float('-inf')
+    if parsed.tzinfo is None:
+        return (parsed - _EPOCH).total_seconds()
+    return parsed.timestamp()
+
 
 class AlertFeedManager:
     """
     Manages rolling alert feed with FIFO queue
     Stores last 1000 alerts for real-time access
+    
+    Alerts live in a fixed-capacity ring addressed by a monotonically
+    increasing sequence number (slot = seq % capacity), with their parsed
+    epoch timestamps stored alongside. Per-severity and per-actor-type
+    indexes hold the retained sequence numbers in arrival order, and the
+    feed statistics are counters updated on push and eviction, so push is
+    O(1) and filtered queries are O(k) in the number of matches.
+    
+    Alerts are indexed by the severity, actor type and trigger type they
+    carry when pushed.
     """
     
     MAX_ALERTS = 1000
     
-    def __init__(self):
-        """Initialize alert feed manager"""
-        self.alerts: List[ValkyrieAlert] = []
+    def __init__(self, capacity: Optional[int] = None):
+        """
+        Initialize alert feed manager
+        
+        Args:
+            capacity: Number of alerts retained (default: MAX_ALERTS)
+        """
+        self.capacity = max(1, capacity or self.MAX_ALERTS)
+        self._reset()
         logger.info("[Valkyrie] AlertFeedManager initialized")
     
+    def _reset(self) -> None:
+        self._ring: List[Optional[ValkyrieAlert]] = [None] * self.capacity
+        self._epochs: List[float] = [0.0] * self.capacity
+        self._start = 0  # seq of the oldest retained alert
+        self._next = 0   # seq the next pushed alert receives
+        # Adjacent retained pairs whose timestamps go backwards; while zero
+        # the epochs are sorted and since() can binary search them
+        self._inversions = 0
+        self._by_severity: Dict[str, Deque[int]] = {}
+        self._by_actor_type: Dict[str, Deque[int]] = {}
+        self._severity_counts: Dict[str, int] = {level: 0 for level in SEVERITY_LEVELS}
+        self._actor_type_counts: Dict[str, int] = {}
+        self._trigger_type_counts: Dict[str, int] = {}
+    
+    @property
+    def alerts(self) -> List[ValkyrieAlert]:
+        """Retained alerts, oldest first"""
+        return [self._ring[seq % self.capacity] for seq in range(self._start, self._next)]
+    
+    def _alert_at(self, seq: int) -> ValkyrieAlert:
+        return self._ring[seq % self.capacity]
+    
+    def _epoch_at(self, seq: int) -> float:
+        return self._epochs[seq % self.capacity]
+    
     def push(self, alert: ValkyrieAlert) -> None:
         """
         Push new alert to feed (FIFO)
@@ -32,16 +93,53 @@ class AlertFeedManager:
             alert: ValkyrieAlert to add
         """
         try:
-            self.alerts.append(alert)
+            seq = self._next
+            if seq - self._start >= self.capacity:
+                self._evict_oldest()
+            
+            slot = seq % self.capacity
+            epoch = alert_epoch(alert.timestamp)
+            if seq > self._start and epoch < self._epochs[slot - 1]:
+                self._inversions += 1
             
-            if len(self.alerts) > self.MAX_ALERTS:
-                self.alerts = self.alerts[-self.MAX_ALERTS:]
+            self._ring[slot] = alert
+            self._epochs[slot] = epoch
+            self._next = seq + 1
             
-            logger.info(f"[Valkyrie] Alert pushed to feed: {alert.id} (total: {len(self.alerts)})")
+            self._by_severity.setdefault(alert.severity_level, deque()).append(seq)
+            self._by_actor_type.setdefault(alert.actor_type, deque()).append(seq)
+            if alert.severity_level in self._severity_counts:
+                self._severity_counts[alert.severity_level] += 1
+            self._actor_type_counts[alert.actor_type] = self._actor_type_counts.get(alert.actor_type, 0) + 1
+            self._trigger_type_counts[alert.trigger_type] = self._trigger_type_counts.get(alert.trigger_type, 0) + 1
+            
+            logger.info(f"[Valkyrie] Alert pushed to feed: {alert.id} (total: {self.count()})")
             
         except Exception as e:
             logger.error(f"[Valkyrie] Error pushing alert to feed: {e}")
     
+    def _evict_oldest(self) -> None:
+        seq = self._start
+        slot = seq % self.capacity
+        alert = self._ring[slot]
+        if seq + 1 < self._next and self._epochs[(slot + 1) % self.capacity] < self._epochs[slot]:
+            self._inversions -= 1
+        
+        self._ring[slot] = None
+        self._start = seq + 1
+        
+        for index, key in ((self._by_severity, alert.severity_level), (self._by_actor_type, alert.actor_type)):
+            seqs = index[key]
+            seqs.popleft()
+            if not seqs:
+                del index[key]
+        if alert.severity_level in self._severity_counts:
+            self._severity_counts[alert.severity_level] -= 1
+        for counts, key in ((self._actor_type_counts, alert.actor_type), (self._trigger_type_counts, alert.trigger_type)):
+            counts[key] -= 1
+            if not counts[key]:
+                del counts[key]
+    
     def all(self) -> List[Dict[str, Any]]:
         """
         Get all alerts in feed
@@ -50,7 +148,7 @@ class AlertFeedManager:
             List of alert dictionaries
         """
         try:
-            return [alert.to_dict() for alert in self.alerts]
+            return [self._alert_at(seq).to_dict() for seq in range(self._start, self._next)]
         except Exception as e:
             logger.error(f"[Valkyrie] Error getting all alerts: {e}")
             return []
@@ -61,13 +159,13 @@ class AlertFeedManager:
         
         Args:
             limit: Maximum number of alerts to return
-            
+        
         Returns:
             List of latest alert dictionaries
         """
         try:
-            latest_alerts = self.alerts[-limit:] if limit > 0 else self.alerts
-            return [alert.to_dict() for alert in latest_alerts]
+            first = max(self._start, self._next - limit) if limit > 0 else self._start
+            return [self._alert_at(seq).to_dict() for seq in range(first, self._next)]
         except Exception as e:
             logger.error(f"[Valkyrie] Error getting latest alerts: {e}")
             return []
@@ -78,23 +176,31 @@ class AlertFeedManager:
         
         Args:
             timestamp: ISO format timestamp string
-            
+        
         Returns:
             List of alert dictionaries since timestamp
         """
         try:
-            target_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            target = alert_epoch(timestamp)
+            if target == float('-inf'):
+                raise ValueError(f"Invalid isoformat string: {timestamp!r}")
             
-            filtered_alerts = []
-            for alert in self.alerts:
-                try:
-                    alert_time = datetime.fromisoformat(alert.timestamp.replace('Z', '+00:00'))
-                    if alert_time >= target_time:
-                        filtered_alerts.append(alert.to_dict())
-                except:
-                    continue
+            if self._inversions:
+                # Out-of-order timestamps retained: scan the stored epochs
+                return [
+                    self._alert_at(seq).to_dict()
+                    for seq in range(self._start, self._next)
+                    if self._epoch_at(seq) >= target
+                ]
             
-            return filtered_alerts
+            low, high = self._start, self._next
+            while low < high:
+                mid = (low + high) // 2
+                if self._epoch_at(mid) < target:
+                    low = mid + 1
+                else:
+                    high = mid
+            return [self._alert_at(seq).to_dict() for seq in range(low, self._next)]
             
         except Exception as e:
             logger.error(f"[Valkyrie] Error getting alerts since timestamp: {e}")
@@ -108,7 +214,7 @@ class AlertFeedManager:
             Alert count
         """
         try:
-            return len(self.alerts)
+            return self._next - self._start
         except Exception as e:
             logger.error(f"[Valkyrie] Error getting alert count: {e}")
             return 0
@@ -116,7 +222,7 @@ class AlertFeedManager:
     def clear(self) -> None:
         """Clear all alerts from feed"""
         try:
-            self.alerts = []
+            self._reset()
             logger.info("[Valkyrie] Alert feed cleared")
         except Exception as e:
             logger.error(f"[Valkyrie] Error clearing alert feed: {e}")
@@ -127,17 +233,12 @@ class AlertFeedManager:
         
         Args:
             severity: Severity level (green/yellow/orange/red/purple)
-            
+        
         Returns:
             List of filtered alert dictionaries
         """
         try:
-            filtered = [
-                alert.to_dict() 
-                for alert in self.alerts 
-                if alert.severity_level == severity
-            ]
-            return filtered
+            return [self._alert_at(seq).to_dict() for seq in self._by_severity.get(severity, ())]
         except Exception as e:
             logger.error(f"[Valkyrie] Error filtering by severity: {e}")
             return []
@@ -148,17 +249,12 @@ class AlertFeedManager:
         
         Args:
             actor_type: Actor type string
-            
+        
         Returns:
             List of filtered alert dictionaries
         """
         try:
-            filtered = [
-                alert.to_dict() 
-                for alert in self.alerts 
-                if alert.actor_type == actor_type
-            ]
-            return filtered
+            return [self._alert_at(seq).to_dict() for seq in self._by_actor_type.get(actor_type, ())]
         except Exception as e:
             logger.error(f"[Valkyrie] Error filtering by actor type: {e}")
             return []
@@ -171,36 +267,13 @@ class AlertFeedManager:
             Dictionary with statistics
         """
         try:
-            stats = {
-                "total_alerts": len(self.alerts),
-                "by_severity": {
-                    "purple": 0,
-                    "red": 0,
-                    "orange": 0,
-                    "yellow": 0,
-                    "green": 0
-                },
-                "by_actor_type": {},
-                "by_trigger_type": {}
+            return {
+                "total_alerts": self.count(),
+                "by_severity": dict(self._severity_counts),
+                "by_actor_type": dict(self._actor_type_counts),
+                "by_trigger_type": dict(self._trigger_type_counts)
             }
             
-            for alert in self.alerts:
-                severity = alert.severity_level
-                if severity in stats["by_severity"]:
-                    stats["by_severity"][severity] += 1
-                
-                actor_type = alert.actor_type
-                if actor_type not in stats["by_actor_type"]:
-                    stats["by_actor_type"][actor_type] = 0
-                stats["by_actor_type"][actor_type] += 1
-                
-                trigger_type = alert.trigger_type
-                if trigger_type not in stats["by_trigger_type"]:
-                    stats["by_trigger_type"][trigger_type] = 0
-                stats["by_trigger_type"][trigger_type] += 1
-            
-            return stats
-            
         except Exception as e:
             logger.error(f"[Valkyrie] Error getting statistics: {e}")
             return {
@@ -4,7 +4,9 @@ Autonomous real-time threat alert generation with 6-domain intelligence integrat
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Any, List, Optional
 from datetime import datetime
 from .valkyrie_schema import ValkyrieAlert, ValkyrieTrigger
 
@@ -24,9 +26,11 @@ class ValkyrieEngine:
     - Fusion Engine (multi-domain fusion)
     """
     
+    MAX_HISTORY = 1000
+    
     def __init__(self):
         """Initialize Valkyrie Engine"""
-        self.alert_history: List[ValkyrieAlert] = []
+        self.alert_history: Deque[ValkyrieAlert] = deque(maxlen=self.MAX_HISTORY)
         logger.info("[Valkyrie] Engine initialized")
     
     @staticmethod
@@ -427,9 +431,6 @@ class ValkyrieEngine:
         try:
             self.alert_history.append(alert)
             
-            if len(self.alert_history) > 1000:
-                self.alert_history = self.alert_history[-1000:]
-            
             logger.info(f"[Valkyrie] Alert recorded: {alert.id}")
             
         except Exception as e:
@@ -446,7 +447,11 @@ class ValkyrieEngine:
             List of recent ValkyrieAlert objects
         """
         try:
-            return self.alert_history[-limit:]
+            if limit <= 0:
+                return list(self.alert_history)[-limit:]
+            recent = list(islice(reversed(self.alert_history), limit))
+            recent.reverse()
+            return recent
         except Exception as e:
             logger.error(f"[Valkyrie] Error getting recent alerts: {e}")
             return []
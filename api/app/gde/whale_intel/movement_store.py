@@ -0,0 +1,180 @@
+"""
+Whale Intelligence Movement Store
+
+Bounded, indexed storage for whale movements and decayed influence aggregates.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .models import WhaleMovement
+
+
+def to_naive_utc(ts: datetime) -> datetime:
+    """Normalize aware timestamps to naive UTC so they compare with utcnow()."""
+    if ts.tzinfo is None:
+        return ts
+    return ts.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class MovementStore:
+    """
+    Fixed-capacity, time-ordered ring of whale movements.
+
+    Movements get contiguous arrival sequence numbers and live in a
+    fixed-size list at slot ``seq % capacity`` (oldest evicted first, by
+    count and by age), so any retained movement is looked up by its
+    sequence number in O(1). Per-address and per-token indexes
+    hold the sequence numbers of retained movements in the same order, so
+    eviction pops the left end of each affected index in O(1) and
+    recent-movement queries walk the right end in O(k).
+    """
+
+    def __init__(self, capacity: int = 100_000, max_age: Optional[timedelta] = None):
+        self.capacity = max(1, capacity)
+        self.max_age = max_age
+        self._ring: List[Optional[Tuple[datetime, WhaleMovement]]] = [None] * self.capacity
+        self._start = 0  # seq of the oldest retained movement
+        self._by_address: Dict[str, Deque[int]] = {}
+        self._by_token: Dict[str, Deque[int]] = {}
+        self._next_seq = 0
+        self.total_recorded = 0
+        self.total_evicted = 0
+
+    def __len__(self) -> int:
+        return self._next_seq - self._start
+
+    def _index_keys(self, movement: WhaleMovement) -> Tuple[List[str], str]:
+        from_addr = movement.from_address.lower()
+        to_addr = movement.to_address.lower()
+        addresses = [from_addr] if from_addr == to_addr else [from_addr, to_addr]
+        return addresses, movement.symbol.upper()
+
+    def append(self, movement: WhaleMovement) -> None:
+        """Record a movement, evicting the oldest entries past capacity or age."""
+        if len(self) >= self.capacity:
+            self._evict_oldest()
+
+        seq = self._next_seq
+        self._next_seq += 1
+        self.total_recorded += 1
+
+        timestamp = to_naive_utc(movement.timestamp)
+        self._ring[seq % self.capacity] = (timestamp, movement)
+        addresses, token = self._index_keys(movement)
+        for address in addresses:
+            self._by_address.setdefault(address, deque()).append(seq)
+        self._by_token.setdefault(token, deque()).append(seq)
+
+        if self.max_age is not None:
+            self.expire(timestamp - self.max_age)
+
+    def expire(self, cutoff: datetime) -> int:
+        """Drop retained movements older than ``cutoff`` from the old end."""
+        dropped = 0
+        cutoff = to_naive_utc(cutoff)
+        while len(self) and self._ring[self._start % self.capacity][0] < cutoff:
+            self._evict_oldest()
+            dropped += 1
+        return dropped
+
+    def _evict_oldest(self) -> None:
+        seq = self._start
+        slot = seq % self.capacity
+        _, movement = self._ring[slot]
+        self._ring[slot] = None
+        self._start = seq + 1
+        self.total_evicted += 1
+        addresses, token = self._index_keys(movement)
+        for index, key in [(self._by_address, a) for a in addresses] + [(self._by_token, token)]:
+            bucket = index.get(key)
+            if bucket and bucket[0] == seq:
+                bucket.popleft()
+                if not bucket:
+                    del index[key]
+
+    def _movement_at(self, seq: int) -> WhaleMovement:
+        return self._ring[seq % self.capacity][1]
+
+    def _iter_recent(self, seqs: Iterable[int]) -> Iterator[WhaleMovement]:
+        for seq in seqs:
+            yield self._movement_at(seq)
+
+    def recent(self, limit: int = 100) -> List[WhaleMovement]:
+        """Most recently recorded movements, newest first."""
+        result = []
+        for movement in self._iter_recent(range(self._next_seq - 1, self._start - 1, -1)):
+            if len(result) >= limit:
+                break
+            result.append(movement)
+        return result
+
+    def recent_for_address(self, address: str, limit: int = 50) -> List[WhaleMovement]:
+        """Most recent movements touching ``address``, newest first."""
+        seqs = self._by_address.get(address.lower())
+        if not seqs:
+            return []
+        result = []
+        for movement in self._iter_recent(reversed(seqs)):
+            if len(result) >= limit:
+                break
+            result.append(movement)
+        return result
+
+    def recent_for_token(self, symbol: str, limit: int = 50) -> List[WhaleMovement]:
+        """Most recent movements of ``symbol``, newest first."""
+        seqs = self._by_token.get(symbol.upper())
+        if not seqs:
+            return []
+        result = []
+        for movement in self._iter_recent(reversed(seqs)):
+            if len(result) >= limit:
+                break
+            result.append(movement)
+        return result
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "retained": len(self),
+            "capacity": self.capacity,
+            "total_recorded": self.total_recorded,
+            "total_evicted": self.total_evicted,
+            "indexed_addresses": len(self._by_address),
+            "indexed_tokens": len(self._by_token),
+        }
+
+
+@dataclass
+class DecayedAggregate:
+    """
+    Exponentially decayed running volume and movement count for one whale.
+
+    Each update first decays the stored values to the event time with the
+    configured half-life, so the aggregate always reflects recent activity
+    without revisiting past movements.
+    """
+    volume_usd: float = 0.0
+    movements: float = 0.0
+    as_of: Optional[datetime] = None
+
+    def add(self, usd_value: float, at: datetime, half_life_seconds: float) -> None:
+        at = to_naive_utc(at)
+        if self.as_of is None:
+            self.volume_usd = usd_value
+            self.movements = 1.0
+            self.as_of = at
+            return
+
+        elapsed = (at - self.as_of).total_seconds()
+        if elapsed >= 0:
+            factor = 0.5 ** (elapsed / half_life_seconds)
+            self.volume_usd = self.volume_usd * factor + usd_value
+            self.movements = self.movements * factor + 1.0
+            self.as_of = at
+        else:
+            # Late event: decay the event itself to the aggregate's time
+            factor = 0.5 ** (-elapsed / half_life_seconds)
+            self.volume_usd += usd_value * factor
+            self.movements += factor
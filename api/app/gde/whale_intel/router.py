@@ -51,6 +51,17 @@ async def get_all_movements(
     return whale_intel_service.get_all_recent_movements(limit=limit)
 
 
+@router.get("/movements/token/{symbol}", response_model=List[WhaleMovement])
+async def get_token_movements(
+    symbol: str,
+    limit: int = Query(default=50, ge=1, le=500, description="Maximum number of movements to return")
+):
+    """
+    Get recent whale movements for a token symbol.
+    """
+    return whale_intel_service.get_token_movements(symbol, limit=limit)
+
+
 @router.get("/{address}", response_model=WhaleProfile)
 async def get_whale_profile(address: str):
     """
@@ -111,9 +122,12 @@ async def get_whale_stats():
     
     total_volume = sum(w.total_volume_usd for w in top_whales)
     
+    store_stats = whale_intel_service.get_store_stats()
+    
     return {
-        "total_whales_tracked": len(whale_intel_service._whales),
-        "total_movements_recorded": len(whale_intel_service._movements),
+        "total_whales_tracked": store_stats["whales_tracked"],
+        "total_movements_recorded": store_stats["total_recorded"],
+        "movements_retained": store_stats["retained"],
         "top_10_volume_usd": total_volume,
         "recent_movement_count": len(all_movements)
     }
@@ -4,21 +4,47 @@ Whale Intelligence Database Services
 Business logic for whale data management and analysis.
 """
 
-from datetime import datetime
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional
+import heapq
 import math
+import os
 
 from .models import WhaleAddress, WhaleMovement, WhaleProfile
+from .movement_store import DecayedAggregate, MovementStore
 
 
 class WhaleIntelService:
-    """Service class for whale intelligence operations."""
+    """
+    Service class for whale intelligence operations.
     
-    def __init__(self):
+    Memory is bounded: movements live in a fixed-capacity MovementStore,
+    counterparty sets are capped per whale, and the least recently seen
+    untagged whales are evicted past ``max_whales``. Influence scores are
+    updated incrementally from exponentially decayed volume/movement
+    aggregates instead of being recomputed from history.
+    """
+    
+    def __init__(
+        self,
+        max_movements: Optional[int] = None,
+        max_whales: Optional[int] = None,
+        max_counterparties: int = 256,
+        influence_half_life_hours: Optional[float] = None,
+    ):
         # In-memory storage (can be replaced with database later)
-        self._whales: Dict[str, WhaleAddress] = {}
-        self._movements: List[WhaleMovement] = []
+        self._whales: "OrderedDict[str, WhaleAddress]" = OrderedDict()  # least recently seen first
+        self._movements = MovementStore(
+            capacity=max_movements or int(os.getenv("WHALE_INTEL_MAX_MOVEMENTS", 100000)),
+            max_age=timedelta(hours=float(os.getenv("WHALE_INTEL_MOVEMENT_RETENTION_HOURS", 24 * 7))),
+        )
         self._counterparties: Dict[str, set] = {}  # address -> set of counterparty addresses
+        self._influence: Dict[str, DecayedAggregate] = {}
+        self._max_whales = max_whales or int(os.getenv("WHALE_INTEL_MAX_WHALES", 200000))
+        self._max_counterparties = max_counterparties
+        half_life_hours = influence_half_life_hours or float(os.getenv("WHALE_INFLUENCE_HALF_LIFE_HOURS", 24 * 7))
+        self._half_life_seconds = half_life_hours * 3600
     
     def add_or_update_whale(self, address: str, movement_data: Optional[dict] = None) -> WhaleAddress:
         """Add a new whale or update existing whale data."""
@@ -28,6 +54,7 @@ class WhaleIntelService:
         if address in self._whales:
             whale = self._whales[address]
             whale.last_seen = now
+            self._whales.move_to_end(address)
             if movement_data:
                 whale.total_volume_usd += movement_data.get("usd_value", 0)
                 whale.num_movements += 1
@@ -41,12 +68,39 @@ class WhaleIntelService:
             )
             self._whales[address] = whale
             self._counterparties[address] = set()
+            self._evict_idle_whales()
+        
+        if movement_data:
+            aggregate = self._influence.setdefault(address, DecayedAggregate())
+            aggregate.add(
+                movement_data.get("usd_value", 0),
+                movement_data.get("timestamp") or now,
+                self._half_life_seconds,
+            )
         
-        # Recompute influence score
+        # Refresh influence score from the running aggregates (O(1))
         whale.influence_score = self.compute_influence_score(address)
         
         return whale
     
+    def _evict_idle_whales(self) -> None:
+        """Drop least recently seen untagged whales once past the whale ceiling."""
+        skipped = 0
+        while len(self._whales) > self._max_whales and skipped < len(self._whales):
+            address, whale = next(iter(self._whales.items()))
+            if whale.tags:
+                self._whales.move_to_end(address)
+                skipped += 1
+                continue
+            del self._whales[address]
+            self._counterparties.pop(address, None)
+            self._influence.pop(address, None)
+    
+    def _add_counterparty(self, address: str, counterparty: str) -> None:
+        peers = self._counterparties.get(address)
+        if peers is not None and len(peers) < self._max_counterparties:
+            peers.add(counterparty)
+    
     def record_movement(self, movement: WhaleMovement) -> WhaleMovement:
         """Record a whale movement."""
         self._movements.append(movement)
@@ -55,14 +109,13 @@ class WhaleIntelService:
         from_addr = movement.from_address.lower()
         to_addr = movement.to_address.lower()
         
-        if from_addr in self._counterparties:
-            self._counterparties[from_addr].add(to_addr)
-        if to_addr in self._counterparties:
-            self._counterparties[to_addr].add(from_addr)
+        self._add_counterparty(from_addr, to_addr)
+        self._add_counterparty(to_addr, from_addr)
         
         # Update both whales
-        self.add_or_update_whale(from_addr, {"usd_value": movement.usd_value})
-        self.add_or_update_whale(to_addr, {"usd_value": movement.usd_value})
+        movement_data = {"usd_value": movement.usd_value, "timestamp": movement.timestamp}
+        self.add_or_update_whale(from_addr, movement_data)
+        self.add_or_update_whale(to_addr, movement_data)
         
         return movement
     
@@ -73,15 +126,16 @@ class WhaleIntelService:
         if address not in self._whales:
             return 0.0
         
-        whale = self._whales[address]
-        
         # Factors for influence score:
-        # 1. Total volume (log scale)
-        # 2. Number of movements
+        # 1. Decayed volume (log scale)
+        # 2. Decayed number of movements
         # 3. Number of counterparties
+        aggregate = self._influence.get(address)
+        decayed_volume = aggregate.volume_usd if aggregate else 0.0
+        decayed_movements = aggregate.movements if aggregate else 0.0
         
-        volume_score = min(math.log10(whale.total_volume_usd + 1) * 10, 40)
-        movement_score = min(whale.num_movements * 0.5, 30)
+        volume_score = min(math.log10(decayed_volume + 1) * 10, 40)
+        movement_score = min(decayed_movements * 0.5, 30)
         counterparty_count = len(self._counterparties.get(address, set()))
         counterparty_score = min(counterparty_count * 2, 30)
         
@@ -137,12 +191,7 @@ class WhaleIntelService:
     
     def get_top_whales(self, limit: int = 50) -> List[WhaleAddress]:
         """Get top whales by influence score."""
-        sorted_whales = sorted(
-            self._whales.values(),
-            key=lambda w: w.influence_score,
-            reverse=True
-        )
-        return sorted_whales[:limit]
+        return heapq.nlargest(limit, self._whales.values(), key=lambda w: w.influence_score)
     
     def search_whales(self, query: str) -> List[WhaleAddress]:
         """Search whales by address or tag."""
@@ -158,27 +207,23 @@ class WhaleIntelService:
         return results[:100]  # Limit results
     
     def get_recent_movements(self, address: str, limit: int = 50) -> List[WhaleMovement]:
-        """Get recent movements for a whale."""
-        address = address.lower()
-        
-        whale_movements = [
-            m for m in self._movements
-            if m.from_address.lower() == address or m.to_address.lower() == address
-        ]
-        
-        # Sort by timestamp descending
-        whale_movements.sort(key=lambda m: m.timestamp, reverse=True)
-        
-        return whale_movements[:limit]
+        """Get recent movements for a whale (newest first, O(limit))."""
+        return self._movements.recent_for_address(address, limit=limit)
+    
+    def get_token_movements(self, symbol: str, limit: int = 50) -> List[WhaleMovement]:
+        """Get recent movements for a token symbol (newest first, O(limit))."""
+        return self._movements.recent_for_token(symbol, limit=limit)
     
     def get_all_recent_movements(self, limit: int = 100) -> List[WhaleMovement]:
-        """Get all recent movements across all whales."""
-        sorted_movements = sorted(
-            self._movements,
-            key=lambda m: m.timestamp,
-            reverse=True
-        )
-        return sorted_movements[:limit]
+        """Get all recent movements across all whales (newest first, O(limit))."""
+        return self._movements.recent(limit=limit)
+    
+    def get_store_stats(self) -> Dict[str, int]:
+        """Retention and index statistics for the movement store."""
+        stats = self._movements.get_stats()
+        stats["whales_tracked"] = len(self._whales)
+        stats["max_whales"] = self._max_whales
+        return stats
     
     def add_tag(self, address: str, tag: str) -> Optional[WhaleAddress]:
         """Add a tag to a whale."""
@@ -83,6 +83,11 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Redis cache initialization failed: {e}")
     
+    try:
+        api_oracle.oracle_engine.start()
+    except Exception as e:
+        logger.warning(f"Oracle Eye batch pool initialization failed: {e}")
+    
     if not serverless_mode:
         try:
             await init_db_pool()
@@ -96,6 +101,7 @@ async def lifespan(app: FastAPI):
             asyncio.create_task(screener_worker.start())
             asyncio.create_task(alert_engine.start_polling())
             asyncio.create_task(socketio_gateway.start_polling())
+            asyncio.create_task(api_sentinel.engine.start())
             await background_worker.start()
             
             ws_manager = get_ws_manager()
@@ -119,6 +125,7 @@ async def lifespan(app: FastAPI):
             await screener_worker.stop()
             await alert_engine.stop_polling()
             await socketio_gateway.stop_polling()
+            await api_sentinel.engine.stop()
             await background_worker.stop()
             ws_manager = get_ws_manager()
             ws_manager.stop()
@@ -131,6 +138,16 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"Database shutdown error: {e}")
     
+    try:
+        await market.alert_manager.close()
+    except Exception as e:
+        logger.warning(f"Alert dispatcher shutdown error: {e}")
+    
+    try:
+        await asyncio.to_thread(api_oracle.oracle_engine.shutdown)
+    except Exception as e:
+        logger.warning(f"Oracle Eye batch pool shutdown error: {e}")
+    
     logger.info("GhostQuant API shut down successfully")
 
 app = FastAPI(
@@ -224,6 +224,15 @@ async def get_momentum(
             whale_threshold = float(os.getenv("WHALE_CONFIDENCE_THRESHOLD", 0.6))
             filtered = [c for c in filtered if c.get("whale_confidence", 0) >= whale_threshold]
         
+        assignments = await clustering_engine.get_assignments()
+        if assignments:
+            labels = clustering_engine.cluster_labels
+            filtered = [
+                {**c, "cluster_id": assignments[c["id"]], "cluster_label": labels[assignments[c["id"]] % len(labels)]}
+                if c.get("id") in assignments else c
+                for c in filtered
+            ]
+        
         if cluster_id is not None:
             filtered = [c for c in filtered if c.get("cluster_id") == cluster_id]
         
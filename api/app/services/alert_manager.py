@@ -2,22 +2,79 @@
 Alert manager - creates and sends alerts via email, Telegram, and push notifications.
 """
 import os
+import heapq
+import asyncio
 import logging
 import uuid
 import smtplib
+from bisect import bisect_left, bisect_right
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import aiohttp
 
+from .notification_dispatcher import Notification, NotificationDispatcher
+
 logger = logging.getLogger(__name__)
 
+# alert_type -> (coin field, fires when the value is at or above the threshold)
+ALERT_TYPE_FIELDS = {
+    "score_above": ("momentum_score", True),
+    "score_below": ("momentum_score", False),
+    "price_above": ("current_price", True),
+    "price_below": ("current_price", False),
+    "whale_seen": ("whale_confidence", True),
+    "pretrend_above": ("pretrend_prob", True),
+}
+
+
+class ThresholdIndex:
+    """
+    Alert ids of one (symbol, alert type), sorted by threshold.
+    
+    Alerts with equal thresholds keep insertion order. For "above" alerts
+    the crossed ones are a prefix (threshold <= value), for "below" alerts
+    a suffix (threshold >= value), both found by bisect.
+    """
+    
+    __slots__ = ("thresholds", "alert_ids")
+    
+    def __init__(self):
+        self.thresholds: List[float] = []
+        self.alert_ids: List[str] = []
+    
+    def __len__(self) -> int:
+        return len(self.alert_ids)
+    
+    def add(self, threshold: float, alert_id: str) -> None:
+        pos = bisect_right(self.thresholds, threshold)
+        self.thresholds.insert(pos, threshold)
+        self.alert_ids.insert(pos, alert_id)
+    
+    def remove(self, threshold: float, alert_id: str) -> None:
+        low = bisect_left(self.thresholds, threshold)
+        high = bisect_right(self.thresholds, threshold, low)
+        pos = self.alert_ids.index(alert_id, low, high)
+        del self.thresholds[pos]
+        del self.alert_ids[pos]
+    
+    def crossed(self, value: float, above: bool) -> List[str]:
+        if above:
+            return self.alert_ids[:bisect_right(self.thresholds, value)]
+        return self.alert_ids[bisect_left(self.thresholds, value):]
+
 
 class AlertManager:
     """
     Manage alerts for momentum signals, whale activity, and price changes.
     Supports email (SMTP), Telegram Bot, and web push notifications.
+    
+    Active alerts are indexed by symbol and alert type with thresholds kept
+    sorted, so a check is one pass over the refreshed coins that bisects out
+    the crossed alerts. A triggered alert leaves the index until its rate
+    limit expires (tracked in a heap), and its notifications go to a
+    NotificationDispatcher instead of being sent inline.
     """
     
     def __init__(self):
@@ -38,6 +95,20 @@ class AlertManager:
         
         self.alerts = {}
         self.alert_history = []
+        
+        self._index: Dict[str, Dict[str, ThresholdIndex]] = {}
+        self._alert_seq: Dict[str, int] = {}
+        self._cooldowns: List[Tuple[datetime, int, str]] = []
+        
+        self.dispatcher = NotificationDispatcher({
+            "email": self._deliver_email,
+            "telegram": self._deliver_telegram,
+            "push": self._deliver_push,
+        })
+    
+    async def close(self) -> None:
+        """Drain and stop the notification dispatcher."""
+        await self.dispatcher.close()
     
     async def create_alert(
         self,
@@ -69,6 +140,8 @@ class AlertManager:
             }
             
             self.alerts[alert_id] = alert
+            self._alert_seq[alert_id] = len(self._alert_seq)
+            self._index_alert(alert)
             
             logger.info(f"Created alert {alert_id} for {symbol} ({alert_type} {threshold})")
             
@@ -78,101 +151,121 @@ class AlertManager:
             logger.error(f"Error creating alert: {e}")
             raise
     
+    def _index_alert(self, alert: Dict[str, Any]) -> None:
+        if alert["alert_type"] not in ALERT_TYPE_FIELDS:
+            return  # unknown types never trigger
+        try:
+            threshold = float(alert["threshold"])
+        except (TypeError, ValueError):
+            return
+        by_type = self._index.setdefault(alert["symbol"], {})
+        by_type.setdefault(alert["alert_type"], ThresholdIndex()).add(threshold, alert["alert_id"])
+    
+    def _unindex_alert(self, alert: Dict[str, Any]) -> None:
+        by_type = self._index[alert["symbol"]]
+        index = by_type[alert["alert_type"]]
+        index.remove(float(alert["threshold"]), alert["alert_id"])
+        if not index:
+            del by_type[alert["alert_type"]]
+            if not by_type:
+                del self._index[alert["symbol"]]
+    
+    def _release_cooldowns(self, now: datetime) -> None:
+        """Return alerts whose rate limit has expired to the index."""
+        while self._cooldowns and self._cooldowns[0][0] <= now:
+            _, _, alert_id = heapq.heappop(self._cooldowns)
+            alert = self.alerts.get(alert_id)
+            if alert is not None:
+                self._index_alert(alert)
+    
     async def check_alerts(self, scored_coins: List[Dict[str, Any]]):
         """
         Check all active alerts against current coin data.
         Called by background worker after each refresh.
         """
         try:
-            for alert_id, alert in self.alerts.items():
-                if not alert["active"]:
+            now = datetime.utcnow()
+            self._release_cooldowns(now)
+            
+            # Each symbol is matched against its first coin in the refresh
+            fired = []
+            seen = set()
+            for coin in scored_coins:
+                symbol = (coin.get("symbol") or "").upper()
+                if symbol in seen:
                     continue
+                seen.add(symbol)
                 
-                if alert["last_triggered"]:
-                    last_triggered = datetime.fromisoformat(alert["last_triggered"])
-                    if datetime.utcnow() - last_triggered < timedelta(minutes=self.rate_limit_minutes):
-                        continue
-                
-                symbol = alert["symbol"]
-                coin = next((c for c in scored_coins if c.get("symbol", "").upper() == symbol), None)
-                
-                if not coin:
+                by_type = self._index.get(symbol)
+                if not by_type:
                     continue
                 
-                should_trigger = False
-                message = ""
-                
-                alert_type = alert["alert_type"]
-                threshold = alert["threshold"]
-                
-                if alert_type == "score_above":
-                    momentum_score = coin.get("momentum_score", 0)
-                    if momentum_score >= threshold:
-                        should_trigger = True
-                        message = f"{symbol} momentum score reached {momentum_score:.1f} (threshold: {threshold})"
-                
-                elif alert_type == "score_below":
-                    momentum_score = coin.get("momentum_score", 0)
-                    if momentum_score <= threshold:
-                        should_trigger = True
-                        message = f"{symbol} momentum score dropped to {momentum_score:.1f} (threshold: {threshold})"
-                
-                elif alert_type == "price_above":
-                    price = coin.get("current_price", 0)
-                    if price >= threshold:
-                        should_trigger = True
-                        message = f"{symbol} price reached ${price:,.2f} (threshold: ${threshold:,.2f})"
-                
-                elif alert_type == "price_below":
-                    price = coin.get("current_price", 0)
-                    if price <= threshold:
-                        should_trigger = True
-                        message = f"{symbol} price dropped to ${price:,.2f} (threshold: ${threshold:,.2f})"
-                
-                elif alert_type == "whale_seen":
-                    whale_confidence = coin.get("whale_confidence", 0)
-                    if whale_confidence >= threshold:
-                        should_trigger = True
-                        message = f"{symbol} whale activity detected (confidence: {whale_confidence*100:.1f}%)"
+                for alert_type, index in by_type.items():
+                    field, above = ALERT_TYPE_FIELDS[alert_type]
+                    value = coin.get(field, 0)
+                    if not isinstance(value, (int, float)):
+                        continue
+                    for alert_id in index.crossed(value, above):
+                        fired.append((self._alert_seq[alert_id], alert_id, coin, value))
+            
+            # Fire in creation order, as the full scan did
+            fired.sort(key=lambda item: item[0])
+            rate_limit = timedelta(minutes=self.rate_limit_minutes)
+            for seq, alert_id, coin, value in fired:
+                alert = self.alerts[alert_id]
+                if not alert["active"]:
+                    continue
                 
-                elif alert_type == "pretrend_above":
-                    pretrend_prob = coin.get("pretrend_prob", 0)
-                    if pretrend_prob >= threshold:
-                        should_trigger = True
-                        message = f"{symbol} PreTrend probability reached {pretrend_prob*100:.1f}% (threshold: {threshold*100:.1f}%)"
+                self._send_alert(alert, self._trigger_message(alert, value), coin)
+                alert["last_triggered"] = now.isoformat()
+                alert["trigger_count"] += 1
                 
-                if should_trigger:
-                    await self._send_alert(alert, message, coin)
-                    alert["last_triggered"] = datetime.utcnow().isoformat()
-                    alert["trigger_count"] += 1
+                self._unindex_alert(alert)
+                heapq.heappush(self._cooldowns, (now + rate_limit, seq, alert_id))
         
         except Exception as e:
             logger.error(f"Error checking alerts: {e}", exc_info=True)
     
-    async def _send_alert(self, alert: Dict[str, Any], message: str, coin: Dict[str, Any]):
+    def _trigger_message(self, alert: Dict[str, Any], value: float) -> str:
+        """Message for a triggered alert."""
+        symbol = alert["symbol"]
+        alert_type = alert["alert_type"]
+        threshold = alert["threshold"]
+        
+        if alert_type == "score_above":
+            return f"{symbol} momentum score reached {value:.1f} (threshold: {threshold})"
+        elif alert_type == "score_below":
+            return f"{symbol} momentum score dropped to {value:.1f} (threshold: {threshold})"
+        elif alert_type == "price_above":
+            return f"{symbol} price reached ${value:,.2f} (threshold: ${threshold:,.2f})"
+        elif alert_type == "price_below":
+            return f"{symbol} price dropped to ${value:,.2f} (threshold: ${threshold:,.2f})"
+        elif alert_type == "whale_seen":
+            return f"{symbol} whale activity detected (confidence: {value*100:.1f}%)"
+        return f"{symbol} PreTrend probability reached {value*100:.1f}% (threshold: {threshold*100:.1f}%)"
+    
+    def _send_alert(self, alert: Dict[str, Any], message: str, coin: Dict[str, Any]) -> int:
         """
-        Send alert via configured channels.
+        Queue alert notifications for the configured channels.
+        Returns the number of notifications queued.
         """
-        user_contact = alert["user_contact"]
-        channels = alert["channels"]
-        
-        detailed_message = self._format_alert_message(message, coin)
-        
-        for channel in channels:
-            try:
-                if channel == "email" and self.enable_email:
-                    await self._send_email(user_contact, alert["symbol"], detailed_message)
-                
-                elif channel == "telegram" and self.enable_telegram:
-                    await self._send_telegram(detailed_message)
-                
-                elif channel == "push" and self.enable_push:
-                    await self._send_push(user_contact, message)
-                
-                logger.info(f"Sent alert via {channel} to {user_contact}")
-            
-            except Exception as e:
-                logger.error(f"Error sending alert via {channel}: {e}")
+        enabled = {"email": self.enable_email, "telegram": self.enable_telegram, "push": self.enable_push}
+        queued = 0
+        for channel in alert["channels"]:
+            if enabled.get(channel) and self.dispatcher.submit(Notification(channel, alert, message, coin)):
+                queued += 1
+        return queued
+    
+    async def _deliver_email(self, notification: Notification):
+        alert = notification.alert
+        detailed_message = self._format_alert_message(notification.message, notification.coin)
+        await self._send_email(alert["user_contact"], alert["symbol"], detailed_message)
+    
+    async def _deliver_telegram(self, notification: Notification):
+        await self._send_telegram(self._format_alert_message(notification.message, notification.coin))
+    
+    async def _deliver_push(self, notification: Notification):
+        await self._send_push(notification.alert["user_contact"], notification.message)
     
     def _format_alert_message(self, message: str, coin: Dict[str, Any]) -> str:
         """
@@ -214,10 +307,14 @@ View details: https://ghostquant.local/market/coin/{coin.get('id')}
             
             msg.attach(MIMEText(message, "plain"))
             
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_pass)
-                server.send_message(msg)
+            def deliver():
+                with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
+                    server.starttls()
+                    server.login(self.smtp_user, self.smtp_pass)
+                    server.send_message(msg)
+            
+            # smtplib blocks; keep it off the event loop
+            await asyncio.to_thread(deliver)
             
             logger.info(f"Sent email alert to {to_email}")
         
@@ -244,7 +341,7 @@ View details: https://ghostquant.local/market/coin/{coin.get('id')}
             async with aiohttp.ClientSession() as session:
                 async with session.post(url, json=payload, timeout=10) as response:
                     if response.status != 200:
-                        logger.error(f"Telegram API returned {response.status}")
+                        raise RuntimeError(f"Telegram API returned {response.status}")
                     else:
                         logger.info("Sent Telegram alert")
         
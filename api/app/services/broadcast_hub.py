@@ -0,0 +1,276 @@
+"""
+Serialize-once WebSocket broadcast hub.
+
+Every message is JSON-encoded exactly once and the encoded frame is handed
+to a bounded per-client send queue. Each client has its own writer task, so a
+slow consumer only ever backs up its own queue instead of stalling the
+broadcast loop for everyone else.
+"""
+import os
+import json
+import time
+import asyncio
+import logging
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SlowConsumerPolicy(str, Enum):
+    """What to do when a client's send queue is full."""
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+    DISCONNECT = "disconnect"
+
+
+def encode_message(message: Any) -> str:
+    """Encode a message the same way ``WebSocket.send_json`` does."""
+    if isinstance(message, str):
+        return message
+    if isinstance(message, (bytes, bytearray)):
+        return bytes(message).decode("utf-8")
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+class ClientChannel:
+    """Bounded send queue and writer task for a single WebSocket client."""
+
+    def __init__(
+        self,
+        websocket: Any,
+        client_id: str,
+        max_queue: int,
+        policy: SlowConsumerPolicy,
+        on_close: Callable[["ClientChannel"], None],
+    ):
+        self.websocket = websocket
+        self.client_id = client_id
+        self.max_queue = max_queue
+        self.policy = policy
+        self._on_close = on_close
+        self._queue: Deque[Tuple[float, str]] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.closed = False
+        self.evicted = False
+
+        self.enqueued = 0
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self.connected_at = time.time()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._writer())
+
+    def offer(self, frame: str) -> bool:
+        """
+        Enqueue an encoded frame without blocking.
+
+        Returns False when the slow-consumer policy disconnected the client.
+        """
+        if self.closed:
+            return False
+
+        if len(self._queue) >= self.max_queue:
+            if self.policy == SlowConsumerPolicy.DISCONNECT:
+                logger.warning(f"Disconnecting slow consumer {self.client_id} (queue={len(self._queue)})")
+                self.evicted = True
+                self.close(code=1013)
+                return False
+            if self.policy == SlowConsumerPolicy.COALESCE:
+                self.coalesced += len(self._queue)
+                self._queue.clear()
+            else:
+                self._queue.popleft()
+                self.dropped += 1
+
+        self._queue.append((time.monotonic(), frame))
+        self.enqueued += 1
+        self._wakeup.set()
+        return True
+
+    async def _writer(self) -> None:
+        try:
+            while not self.closed:
+                if not self._queue:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                queued_at, frame = self._queue.popleft()
+                await self.websocket.send_text(frame)
+
+                lag_ms = (time.monotonic() - queued_at) * 1000
+                self.last_lag_ms = lag_ms
+                if lag_ms > self.max_lag_ms:
+                    self.max_lag_ms = lag_ms
+                self.sent += 1
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"Send to {self.client_id} failed: {e}")
+            self.close()
+
+    def close(self, code: Optional[int] = None) -> None:
+        """Stop the writer task and detach from the hub."""
+        if self.closed:
+            return
+        self.closed = True
+        self._queue.clear()
+        self._wakeup.set()
+
+        if code is not None:
+            asyncio.ensure_future(self._close_socket(code))
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+        self._on_close(self)
+
+    async def _close_socket(self, code: int) -> None:
+        try:
+            await self.websocket.close(code=code)
+        except Exception:
+            pass
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-client lag and delivery counters."""
+        oldest_age_ms = 0.0
+        if self._queue:
+            oldest_age_ms = (time.monotonic() - self._queue[0][0]) * 1000
+        return {
+            "client_id": self.client_id,
+            "queue_depth": len(self._queue),
+            "queue_capacity": self.max_queue,
+            "oldest_pending_ms": round(oldest_age_ms, 2),
+            "last_lag_ms": round(self.last_lag_ms, 2),
+            "max_lag_ms": round(self.max_lag_ms, 2),
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "policy": self.policy.value,
+        }
+
+
+class BroadcastHub:
+    """
+    Fan-out hub that encodes each message once and enqueues it per client.
+
+    Configuration (environment):
+    - WEBSOCKET_SEND_QUEUE_SIZE: per-client queue bound (default 256)
+    - WEBSOCKET_SLOW_CONSUMER_POLICY: drop_oldest | coalesce | disconnect
+    """
+
+    def __init__(
+        self,
+        max_queue: Optional[int] = None,
+        policy: Optional[SlowConsumerPolicy] = None,
+        on_disconnect: Optional[Callable[[Any], Any]] = None,
+    ):
+        self.max_queue = max_queue or int(os.getenv("WEBSOCKET_SEND_QUEUE_SIZE", 256))
+        self.policy = SlowConsumerPolicy(
+            policy or os.getenv("WEBSOCKET_SLOW_CONSUMER_POLICY", SlowConsumerPolicy.DROP_OLDEST.value)
+        )
+        self.on_disconnect = on_disconnect
+        self.channels: Dict[Any, ClientChannel] = {}
+        self.messages_published = 0
+        self.slow_disconnects = 0
+
+    def register(self, websocket: Any, client_id: Optional[str] = None) -> ClientChannel:
+        """Attach a websocket and start its writer task."""
+        channel = self.channels.get(websocket)
+        if channel is not None:
+            return channel
+
+        channel = ClientChannel(
+            websocket=websocket,
+            client_id=client_id or f"client_{id(websocket)}",
+            max_queue=self.max_queue,
+            policy=self.policy,
+            on_close=self._handle_close,
+        )
+        self.channels[websocket] = channel
+        channel.start()
+        return channel
+
+    def unregister(self, websocket: Any) -> None:
+        """Detach a websocket and cancel its writer task."""
+        channel = self.channels.pop(websocket, None)
+        if channel is not None:
+            channel.close()
+
+    def _handle_close(self, channel: ClientChannel) -> None:
+        if self.channels.get(channel.websocket) is not channel:
+            return
+        del self.channels[channel.websocket]
+        if channel.evicted:
+            self.slow_disconnects += 1
+        if self.on_disconnect is not None:
+            try:
+                result = self.on_disconnect(channel.websocket)
+                if asyncio.iscoroutine(result):
+                    asyncio.ensure_future(result)
+            except Exception as e:
+                logger.error(f"on_disconnect callback error: {e}")
+
+    def send(self, websocket: Any, message: Any) -> bool:
+        """Enqueue a message for a single client."""
+        channel = self.channels.get(websocket)
+        if channel is None:
+            return False
+        return channel.offer(encode_message(message))
+
+    def publish(self, message: Any, websockets: Optional[Iterable[Any]] = None) -> int:
+        """
+        Encode ``message`` once and enqueue it for every target client.
+
+        Args:
+            message: JSON-serializable payload (or a pre-encoded string)
+            websockets: Target clients; all registered clients if omitted
+
+        Returns:
+            Number of clients the frame was enqueued for
+        """
+        frame = encode_message(message)
+        self.messages_published += 1
+
+        if websockets is None:
+            targets: List[ClientChannel] = list(self.channels.values())
+        else:
+            targets = [self.channels[ws] for ws in websockets if ws in self.channels]
+
+        delivered = 0
+        for channel in targets:
+            if channel.offer(frame):
+                delivered += 1
+        return delivered
+
+    async def close_all(self) -> None:
+        """Cancel every writer task."""
+        for websocket in list(self.channels):
+            self.unregister(websocket)
+
+    def get_client_metrics(self) -> List[Dict[str, Any]]:
+        return [channel.get_metrics() for channel in self.channels.values()]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Aggregate fan-out statistics across all clients."""
+        metrics = self.get_client_metrics()
+        lags = sorted(m["oldest_pending_ms"] for m in metrics)
+        return {
+            "clients": len(metrics),
+            "policy": self.policy.value,
+            "queue_capacity": self.max_queue,
+            "messages_published": self.messages_published,
+            "total_queued": sum(m["queue_depth"] for m in metrics),
+            "total_dropped": sum(m["dropped"] for m in metrics),
+            "total_coalesced": sum(m["coalesced"] for m in metrics),
+            "slow_disconnects": self.slow_disconnects,
+            "max_pending_ms": lags[-1] if lags else 0.0,
+            "p99_pending_ms": lags[int(len(lags) * 0.99)] if lags else 0.0,
+        }
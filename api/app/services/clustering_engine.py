@@ -2,15 +2,57 @@
 Clustering engine - auto-groups coins by chain/sector/behavior using k-means.
 """
 import os
+import time
 import logging
 from typing import List, Dict, Any, Optional
+from datetime import datetime
 import numpy as np
-from sklearn.cluster import KMeans
+from scipy.optimize import linear_sum_assignment
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.preprocessing import StandardScaler
 from .redis_cache import RedisCache
 
 logger = logging.getLogger(__name__)
 
+CLUSTER_ASSIGNMENTS_KEY = "ghostquant:clusters:assignments"
+CLUSTER_ASSIGNMENTS_TTL = 86400
+
+# (coin field, default) per feature column, in model order
+FEATURE_FIELDS = (
+    ("momentum_score", 50),
+    ("market_cap", 0),
+    ("total_volume", 0),
+    ("whale_confidence", 0),
+    ("pretrend_prob", 0.5),
+)
+
+
+def _column(coins: List[Dict[str, Any]], field: str, default: float) -> np.ndarray:
+    """One numeric field across coins; missing or non-numeric values take the default."""
+    values = [coin.get(field, default) for coin in coins]
+    return np.array(
+        [v if isinstance(v, (int, float)) else default for v in values],
+        dtype=np.float64,
+    )
+
+
+def build_feature_matrix(scored_coins: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Clustering features, one row per coin: momentum score, volume/market-cap
+    ratio (x100), log10 market cap, whale confidence (x100), PreTrend (x100).
+    """
+    momentum, market_cap, total_volume, whale, pretrend = (
+        _column(scored_coins, field, default) for field, default in FEATURE_FIELDS
+    )
+    volume_ratio = np.divide(total_volume, market_cap, out=np.zeros_like(total_volume), where=market_cap > 0)
+    return np.column_stack([
+        momentum,
+        volume_ratio * 100,  # Scale up
+        np.log10(market_cap + 1),
+        whale * 100,  # Scale up
+        pretrend * 100,  # Scale up
+    ])
+
 
 class ClusteringEngine:
     """
@@ -34,96 +76,171 @@ class ClusteringEngine:
             "PreTrend Signals",
             "Low Activity Group"
         ]
+        
+        self._assignments: Optional[Dict[str, Any]] = None
+        self.last_timings: Dict[str, float] = {}
     
     async def compute_clusters(self, scored_coins: List[Dict[str, Any]]) -> bool:
         """
         Compute clusters for all coins and store in Redis.
         Called by background worker periodically.
+        
+        The fit is warm-started from the previous refresh's centroids when
+        there are any, and new clusters are matched to old ones by centroid
+        distance so a cluster keeps its id across refreshes. The result is
+        written as one assignment blob (coin -> cluster id, cluster
+        summaries, centroids) that get_clusters() reads directly.
         """
         try:
             if not self.enabled or len(scored_coins) < self.n_clusters:
                 logger.warning(f"Clustering disabled or insufficient coins ({len(scored_coins)} < {self.n_clusters})")
                 return False
             
-            features = []
-            coin_ids = []
-            
-            for coin in scored_coins:
-                momentum_score = coin.get("momentum_score", 50)
-                market_cap = coin.get("market_cap", 0)
-                total_volume = coin.get("total_volume", 0)
-                whale_confidence = coin.get("whale_confidence", 0)
-                pretrend_prob = coin.get("pretrend_prob", 0.5)
-                
-                market_cap_log = np.log10(market_cap + 1)
-                
-                volume_ratio = (total_volume / market_cap) if market_cap > 0 else 0
-                
-                features.append([
-                    momentum_score,
-                    volume_ratio * 100,  # Scale up
-                    market_cap_log,
-                    whale_confidence * 100,  # Scale up
-                    pretrend_prob * 100  # Scale up
-                ])
-                coin_ids.append(coin.get("id"))
+            started = time.perf_counter()
             
+            features = build_feature_matrix(scored_coins)
             scaler = StandardScaler()
             features_scaled = scaler.fit_transform(features)
             
-            kmeans = KMeans(n_clusters=self.n_clusters, random_state=42, n_init=10)
-            cluster_ids = kmeans.fit_predict(features_scaled)
+            previous = await self._previous_centroids()
+            labels, centroids = self._fit(features_scaled, scaler, previous)
+            
+            fit_ms = (time.perf_counter() - started) * 1000
+            started = time.perf_counter()
             
-            for coin, cluster_id in zip(scored_coins, cluster_ids):
-                coin["cluster_id"] = int(cluster_id)
-                coin["cluster_label"] = self.cluster_labels[cluster_id % len(self.cluster_labels)]
-                
-                await self.redis_cache.set_scored_coin(coin["id"], coin)
+            blob = self._build_assignments(scored_coins, labels, centroids, fit_ms)
+            await self.redis_cache.set(CLUSTER_ASSIGNMENTS_KEY, blob, ttl=CLUSTER_ASSIGNMENTS_TTL)
+            self._assignments = blob
             
-            logger.info(f"Computed {self.n_clusters} clusters for {len(scored_coins)} coins")
+            write_ms = (time.perf_counter() - started) * 1000
+            self.last_timings = {"fit_ms": round(fit_ms, 2), "write_ms": round(write_ms, 2)}
+            
+            logger.info(
+                f"Computed {self.n_clusters} clusters for {len(scored_coins)} coins "
+                f"({'warm' if previous is not None else 'cold'} fit {fit_ms:.1f}ms, write {write_ms:.1f}ms)"
+            )
             return True
         
         except Exception as e:
             logger.error(f"Error computing clusters: {e}", exc_info=True)
             return False
     
+    async def _previous_centroids(self) -> Optional[np.ndarray]:
+        """Centroids (unscaled feature space, indexed by cluster id) of the last refresh."""
+        blob = self._assignments or await self.redis_cache.get(CLUSTER_ASSIGNMENTS_KEY)
+        if not isinstance(blob, dict) or not blob.get("centroids"):
+            return None
+        centroids = np.asarray(blob["centroids"], dtype=np.float64)
+        if centroids.shape != (self.n_clusters, len(FEATURE_FIELDS)) or not np.isfinite(centroids).all():
+            return None
+        return centroids
+    
+    def _fit(self, features_scaled: np.ndarray, scaler: StandardScaler, previous: Optional[np.ndarray]):
+        """
+        Fit k-means and return (cluster ids, unscaled centroids by cluster id).
+        
+        Cold fits match the original KMeans(n_init=10, random_state=42);
+        warm fits run a single initialisation seeded with the previous
+        centroids, carried into the new scaling.
+        """
+        if previous is not None:
+            init = scaler.transform(previous)
+            n_init = 1
+        else:
+            init = "k-means++"
+            n_init = 10
+        
+        if self.method == "minibatch":
+            model = MiniBatchKMeans(
+                n_clusters=self.n_clusters,
+                init=init,
+                n_init=n_init if previous is not None else 3,
+                batch_size=1024,
+                random_state=42,
+            )
+        else:
+            model = KMeans(n_clusters=self.n_clusters, init=init, n_init=n_init, random_state=42)
+        labels = model.fit_predict(features_scaled)
+        centers = model.cluster_centers_
+        
+        if previous is not None:
+            # Give each new cluster the id of the nearest previous centroid (one-to-one)
+            cost = ((centers[:, None, :] - init[None, :, :]) ** 2).sum(axis=2)
+            rows, cols = linear_sum_assignment(cost)
+            mapping = np.empty(self.n_clusters, dtype=np.int64)
+            mapping[rows] = cols
+            labels = mapping[labels]
+            ordered = np.empty_like(centers)
+            ordered[cols] = centers[rows]
+            centers = ordered
+        
+        return labels, scaler.inverse_transform(centers)
+    
+    def _build_assignments(
+        self,
+        scored_coins: List[Dict[str, Any]],
+        labels: np.ndarray,
+        centroids: np.ndarray,
+        fit_ms: float,
+    ) -> Dict[str, Any]:
+        """Assignment blob with per-cluster summaries in get_clusters() order."""
+        momentum = _column(scored_coins, "momentum_score", 0)
+        counts = np.bincount(labels, minlength=self.n_clusters)
+        sums = np.bincount(labels, weights=momentum, minlength=self.n_clusters)
+        
+        # Coins by cluster, then momentum descending (stable, as the per-cluster sort was)
+        order = np.lexsort((-momentum, labels))
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        
+        clusters = []
+        for cluster_id in np.flatnonzero(counts).tolist():
+            start = starts[cluster_id]
+            top = order[start:start + min(5, counts[cluster_id])]
+            clusters.append({
+                "cluster_id": cluster_id,
+                "label": self.cluster_labels[cluster_id % len(self.cluster_labels)],
+                "coin_count": int(counts[cluster_id]),
+                "avg_momentum": round(float(sums[cluster_id] / counts[cluster_id]), 2),
+                "top_coins": [scored_coins[i].get("symbol") for i in top.tolist()],
+            })
+        clusters.sort(key=lambda x: x["avg_momentum"], reverse=True)
+        
+        return {
+            "computed_at": datetime.utcnow().isoformat(),
+            "method": self.method,
+            "fit_ms": round(fit_ms, 2),
+            "assignments": {
+                coin.get("id"): cluster_id
+                for coin, cluster_id in zip(scored_coins, labels.tolist())
+                if coin.get("id")
+            },
+            "clusters": clusters,
+            "centroids": centroids.tolist(),
+        }
+    
+    async def get_assignments(self) -> Dict[str, int]:
+        """Get the latest coin id -> cluster id mapping."""
+        try:
+            blob = await self.redis_cache.get(CLUSTER_ASSIGNMENTS_KEY)
+            if not isinstance(blob, dict):
+                return {}
+            return blob.get("assignments", {})
+        
+        except Exception as e:
+            logger.error(f"Error getting cluster assignments: {e}")
+            return {}
+    
     async def get_clusters(self) -> List[Dict[str, Any]]:
         """
         Get cluster summary with coin counts and top coins per cluster.
         """
         try:
-            scored_coins = await self.redis_cache.get_scored_coins()
+            blob = await self.redis_cache.get(CLUSTER_ASSIGNMENTS_KEY)
             
-            if not scored_coins:
+            if not isinstance(blob, dict):
                 return []
             
-            clusters_map = {}
-            for coin in scored_coins:
-                cluster_id = coin.get("cluster_id")
-                if cluster_id is not None:
-                    if cluster_id not in clusters_map:
-                        clusters_map[cluster_id] = []
-                    clusters_map[cluster_id].append(coin)
-            
-            clusters = []
-            for cluster_id, coins in clusters_map.items():
-                coins.sort(key=lambda x: x.get("momentum_score", 0), reverse=True)
-                
-                avg_momentum = np.mean([c.get("momentum_score", 0) for c in coins])
-                
-                top_coins = [c.get("symbol") for c in coins[:5]]
-                
-                clusters.append({
-                    "cluster_id": cluster_id,
-                    "label": self.cluster_labels[cluster_id % len(self.cluster_labels)],
-                    "coin_count": len(coins),
-                    "avg_momentum": round(avg_momentum, 2),
-                    "top_coins": top_coins
-                })
-            
-            clusters.sort(key=lambda x: x["avg_momentum"], reverse=True)
-            
-            return clusters
+            return blob.get("clusters", [])
         
         except Exception as e:
             logger.error(f"Error getting clusters: {e}")
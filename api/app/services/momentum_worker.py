@@ -269,6 +269,7 @@ async def start_worker():
 
 
 async def stop_worker():
-    """Stop the background worker."""
+    """Stop the background worker and its alert dispatcher."""
     worker = get_worker()
     worker.stop()
+    await worker.alert_manager.close()
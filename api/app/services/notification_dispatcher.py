@@ -0,0 +1,193 @@
+"""
+Notification dispatcher - concurrent, rate-limited delivery of alert notifications.
+"""
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+Sender = Callable[["Notification"], Awaitable[None]]
+
+DEFAULT_CHANNEL_RATES = {
+    "email": 60,
+    "telegram": 20,
+    "push": 600,
+}
+
+
+@dataclass
+class Notification:
+    """One message for one channel."""
+    channel: str
+    alert: Dict[str, Any]
+    message: str
+    coin: Dict[str, Any]
+    attempts: int = 0
+
+
+class ChannelRateLimiter:
+    """
+    Sliding-window limiter: at most ``per_minute`` sends in any 60 seconds.
+    """
+    
+    def __init__(self, per_minute: int):
+        self.per_minute = max(1, per_minute)
+        self.window_seconds = 60.0
+        self.send_times: deque = deque()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until another send fits in the window, then claim it."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                while self.send_times and now - self.send_times[0] >= self.window_seconds:
+                    self.send_times.popleft()
+                if len(self.send_times) < self.per_minute:
+                    self.send_times.append(now)
+                    return
+                await asyncio.sleep(self.window_seconds - (now - self.send_times[0]))
+
+
+class NotificationDispatcher:
+    """
+    Per-channel queues drained by concurrent workers.
+    
+    Each channel has a bounded queue, ``concurrency`` worker tasks and a
+    rate limiter; failed sends are retried with exponential backoff before
+    being counted as failed. Workers start lazily on the first submit, so
+    the dispatcher can be built outside a running event loop.
+    
+    Configuration (environment):
+    - ALERT_DISPATCH_QUEUE_SIZE: per-channel queue bound (default 10000)
+    - ALERT_DISPATCH_CONCURRENCY: workers per channel (default 4)
+    - ALERT_DISPATCH_MAX_ATTEMPTS: attempts per notification (default 3)
+    - ALERT_DISPATCH_RETRY_SECONDS: first retry delay, doubled per attempt (default 2)
+    - ALERT_DISPATCH_DRAIN_SECONDS: how long close() waits for queued notifications (default 5)
+    - ALERT_<CHANNEL>_PER_MINUTE: per-channel rate limit (email 60, telegram 20, push 600)
+    """
+    
+    def __init__(
+        self,
+        senders: Dict[str, Sender],
+        concurrency: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        retry_seconds: Optional[float] = None,
+        queue_size: Optional[int] = None,
+        rates: Optional[Dict[str, int]] = None,
+        drain_seconds: Optional[float] = None,
+    ):
+        self.senders = senders
+        self.concurrency = concurrency or int(os.getenv("ALERT_DISPATCH_CONCURRENCY", 4))
+        self.max_attempts = max_attempts or int(os.getenv("ALERT_DISPATCH_MAX_ATTEMPTS", 3))
+        self.retry_seconds = retry_seconds if retry_seconds is not None else float(os.getenv("ALERT_DISPATCH_RETRY_SECONDS", 2))
+        self.queue_size = queue_size or int(os.getenv("ALERT_DISPATCH_QUEUE_SIZE", 10000))
+        self.drain_seconds = drain_seconds if drain_seconds is not None else float(os.getenv("ALERT_DISPATCH_DRAIN_SECONDS", 5))
+        
+        rates = rates or {}
+        self.limiters = {
+            channel: ChannelRateLimiter(
+                rates.get(channel) or int(os.getenv(f"ALERT_{channel.upper()}_PER_MINUTE", DEFAULT_CHANNEL_RATES.get(channel, 60)))
+            )
+            for channel in senders
+        }
+        self.queues: Dict[str, asyncio.Queue] = {}
+        self.workers = []
+        self._retries_scheduled = 0
+        self.stats = {channel: {"sent": 0, "retried": 0, "failed": 0, "dropped": 0} for channel in senders}
+    
+    def _ensure_started(self) -> None:
+        if self.queues:
+            return
+        for channel in self.senders:
+            queue = asyncio.Queue(maxsize=self.queue_size)
+            self.queues[channel] = queue
+            for _ in range(self.concurrency):
+                self.workers.append(asyncio.ensure_future(self._worker(channel, queue)))
+    
+    def submit(self, notification: Notification) -> bool:
+        """
+        Queue a notification without waiting for delivery.
+        
+        Returns:
+            False if the channel is unknown or its queue is full
+        """
+        if notification.channel not in self.senders:
+            return False
+        self._ensure_started()
+        try:
+            self.queues[notification.channel].put_nowait(notification)
+            return True
+        except asyncio.QueueFull:
+            self.stats[notification.channel]["dropped"] += 1
+            logger.warning(f"Alert dispatch queue full for {notification.channel}, dropping notification")
+            return False
+    
+    async def _worker(self, channel: str, queue: asyncio.Queue) -> None:
+        sender = self.senders[channel]
+        limiter = self.limiters[channel]
+        while True:
+            notification = await queue.get()
+            try:
+                await limiter.acquire()
+                notification.attempts += 1
+                await sender(notification)
+                self.stats[channel]["sent"] += 1
+                logger.info(f"Sent alert via {channel} to {notification.alert['user_contact']}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if notification.attempts < self.max_attempts:
+                    self.stats[channel]["retried"] += 1
+                    delay = self.retry_seconds * 2 ** (notification.attempts - 1)
+                    logger.warning(f"Error sending alert via {channel} (attempt {notification.attempts}), retrying in {delay:.1f}s: {e}")
+                    self._retries_scheduled += 1
+                    asyncio.get_running_loop().call_later(delay, self._requeue, notification)
+                else:
+                    self.stats[channel]["failed"] += 1
+                    logger.error(f"Error sending alert via {channel}, giving up after {notification.attempts} attempts: {e}")
+            finally:
+                queue.task_done()
+    
+    def _requeue(self, notification: Notification) -> None:
+        self._retries_scheduled -= 1
+        queue = self.queues.get(notification.channel)
+        if queue is None:
+            return  # dispatcher closed
+        try:
+            queue.put_nowait(notification)
+        except asyncio.QueueFull:
+            self.stats[notification.channel]["dropped"] += 1
+            logger.warning(f"Alert dispatch queue full for {notification.channel}, dropping retry")
+    
+    async def join(self) -> None:
+        """Wait until every notification, including scheduled retries, is sent or failed."""
+        while True:
+            for queue in self.queues.values():
+                await queue.join()
+            if not self._retries_scheduled:
+                return
+            await asyncio.sleep(min(self.retry_seconds, 0.05) or 0.01)
+    
+    async def close(self) -> None:
+        """
+        Stop the workers: wait up to drain_seconds for queued notifications
+        (and scheduled retries), then cancel and await the worker tasks.
+        """
+        if self.queues and self.drain_seconds > 0:
+            try:
+                await asyncio.wait_for(self.join(), timeout=self.drain_seconds)
+            except asyncio.TimeoutError:
+                pending = sum(queue.qsize() for queue in self.queues.values()) + self._retries_scheduled
+                logger.warning(f"Alert dispatcher closing with {pending} notifications undelivered")
+        
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+        self.queues = {}
@@ -5,11 +5,18 @@ Implements:
 - Candlestick patterns (Engulfing, Harami, Doji)
 - Technical formations (Volume Spike, MA Crossover)
 - ATR-based volatility regime detection
+
+scan_patterns evaluates all of them at once for many symbols held as a
+columnar (symbols x bars x OHLCV) array.
 """
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from itertools import chain
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from datetime import datetime
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -452,3 +459,211 @@ def detect_all_patterns(bars: List[List[float]], symbol: str, timeframe: str) ->
         })
     
     return patterns
+
+
+SCAN_SIGNAL_TYPES = (
+    'BULL_ENGULFING',
+    'BEAR_ENGULFING',
+    'DOJI',
+    'HARAMI',
+    'VOLUME_SPIKE',
+    'MA_CROSSOVER',
+    'VOLATILITY_REGIME',
+)
+
+# Longest lookback used by any pattern (slow MA one bar back)
+_SCAN_MIN_BARS = 201
+
+_OHLCV_FIELDS = itemgetter(1, 2, 3, 4, 5)
+
+
+def bars_to_columnar(
+    bars_by_symbol: Sequence[List[List[float]]],
+    max_bars: Optional[int] = _SCAN_MIN_BARS
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stack per-symbol bars into a columnar array for scan_patterns.
+    
+    Histories are right-aligned (the last bar of every symbol is the last
+    column) and padded with NaN on the left. By default only the trailing
+    bars scan_patterns reads are kept, which gives the same detections as
+    the full history.
+    
+    Args:
+        bars_by_symbol: Per symbol, list of [timestamp, open, high, low, close, volume]
+        max_bars: Trailing bars to keep per symbol (None keeps all)
+    
+    Returns:
+        Tuple of (ohlcv array of shape (symbols, bars, 5), bar count per symbol)
+    """
+    if max_bars is not None:
+        bars_by_symbol = [bars[-max_bars:] if max_bars else [] for bars in bars_by_symbol]
+    
+    lengths = np.fromiter(map(len, bars_by_symbol), dtype=np.int64, count=len(bars_by_symbol))
+    n_bars = int(lengths.max()) if len(lengths) else 0
+    
+    # One flat pass over every bar is much cheaper than an array per symbol
+    values = np.fromiter(
+        chain.from_iterable(map(_OHLCV_FIELDS, chain.from_iterable(bars_by_symbol))),
+        dtype=np.float64,
+        count=int(lengths.sum()) * 5
+    )
+    
+    ohlcv = np.full((len(bars_by_symbol), n_bars, 5), np.nan)
+    filled = np.arange(n_bars) >= (n_bars - lengths)[:, None]
+    ohlcv[filled] = values.reshape(-1, 5)
+    
+    return ohlcv, lengths
+
+
+def _window_sum(values: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """
+    Sum of values[:, start:stop] per row, where start/stop count back from the last bar.
+    
+    A cumulative sum anchored at the window start adds the bars left to
+    right, exactly as sum() does in the per-symbol functions, so threshold
+    and crossover comparisons come out identical (a difference of global
+    prefix sums would not guarantee that).
+    """
+    n_bars = values.shape[1]
+    return np.cumsum(values[:, n_bars + start:n_bars + stop], axis=1)[:, -1]
+
+
+def scan_patterns(
+    ohlcv: np.ndarray,
+    symbols: Sequence[str],
+    timeframe: str,
+    lengths: Optional[np.ndarray] = None
+) -> List[Dict[str, Any]]:
+    """
+    Detect all patterns for many symbols at once.
+    
+    Returns the same detections, in the same order, as calling
+    detect_all_patterns on each symbol's bars in turn. The window statistics
+    the patterns share (volume sums, 50/200 MAs, ATR, 20-bar range) are
+    computed once for all symbols and every pattern is a vectorized mask.
+    
+    Args:
+        ohlcv: Array of shape (symbols, bars, 5) with open, high, low, close, volume
+        symbols: Symbol per row
+        timeframe: Timeframe (4H, 1D)
+        lengths: Bars per symbol when histories are right-aligned and
+            left-padded (see bars_to_columnar); default all bars
+    
+    Returns:
+        List of detected patterns with confidence scores
+    """
+    ohlcv = np.asarray(ohlcv, dtype=np.float64)
+    n_symbols, n_bars = ohlcv.shape[0], ohlcv.shape[1]
+    if n_symbols == 0:
+        return []
+    
+    lengths = np.full(n_symbols, n_bars, dtype=np.int64) if lengths is None else np.asarray(lengths)
+    if n_bars < _SCAN_MIN_BARS:
+        padding = np.full((n_symbols, _SCAN_MIN_BARS - n_bars, 5), np.nan)
+        ohlcv = np.concatenate([padding, ohlcv], axis=1)
+    
+    opens, highs, lows, closes, volumes = (ohlcv[:, :, i] for i in range(5))
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        o1, h1, l1, c1, v1 = opens[:, -1], highs[:, -1], lows[:, -1], closes[:, -1], volumes[:, -1]
+        o2, c2, v2 = opens[:, -2], closes[:, -2], volumes[:, -2]
+        
+        # Shared window statistics
+        volume_avg_20 = _window_sum(volumes, -20, 0) / 20
+        volume_avg_19_prior = _window_sum(volumes, -20, -1) / 19
+        high_20 = highs[:, -20:].max(axis=1)
+        low_20 = lows[:, -20:].min(axis=1)
+        
+        prev_closes = closes[:, -15:-1]
+        true_range = np.maximum(
+            np.maximum(highs[:, -14:] - lows[:, -14:], np.abs(highs[:, -14:] - prev_closes)),
+            np.abs(lows[:, -14:] - prev_closes)
+        )
+        atr = np.cumsum(true_range, axis=1)[:, -1] / 14
+        atr_n = np.where((lengths >= 15) & (c1 != 0), atr / c1, 0.0)
+        
+        has_2 = lengths >= 2
+        has_5 = lengths >= 5
+        has_20 = lengths >= 20
+        
+        # Bull / bear engulfing
+        bull_eng = has_2 & (c2 < o2) & (c1 > o1) & (o1 <= c2) & (c1 >= o2)
+        bear_eng = has_2 & (c2 > o2) & (c1 < o1) & (o1 >= c2) & (c1 <= o2)
+        
+        volume_confirms = has_20 & (v1 > 1.5 * volume_avg_20)
+        falling = has_5 & np.all(closes[:, -5:-1] > closes[:, -4:], axis=1)
+        rising = has_5 & np.all(closes[:, -5:-1] < closes[:, -4:], axis=1)
+        
+        bull_eng_conf = np.where(volume_confirms, 0.6 + 0.2, 0.6)
+        bull_eng_conf = np.where(falling, bull_eng_conf + 0.1, bull_eng_conf)
+        bear_eng_conf = np.where(volume_confirms, 0.6 + 0.2, 0.6)
+        bear_eng_conf = np.where(rising, bear_eng_conf + 0.1, bear_eng_conf)
+        
+        # Doji
+        range_size = h1 - l1
+        doji = (lengths >= 1) & (range_size != 0) & (np.abs(c1 - o1) / range_size <= 0.1)
+        near_extreme = has_20 & (
+            (np.abs(c1 - high_20) / high_20 < 0.02) | (np.abs(c1 - low_20) / low_20 < 0.02)
+        )
+        doji_conf = np.where(atr_n > 0.03, 0.4 + 0.2, 0.4)
+        doji_conf = np.where(near_extreme, doji_conf + 0.1, doji_conf)
+        
+        # Harami
+        harami = has_2 & (np.maximum(o1, c1) <= np.maximum(o2, c2)) & (np.minimum(o1, c1) >= np.minimum(o2, c2))
+        prior_up = closes[:, -5] < c2
+        reversal = has_5 & ((prior_up & (c1 < o1)) | (~prior_up & (c1 > o1)))
+        harami_conf = np.where(v1 < v2, 0.5 + 0.1, 0.5)
+        harami_conf = np.where(reversal, harami_conf + 0.15, harami_conf)
+        
+        # Volume spike
+        volume_ratio = v1 / volume_avg_19_prior
+        volume_spike = has_20 & (volume_avg_19_prior != 0) & (volume_ratio >= 2.0)
+        spike_conf = 0.5 + np.minimum(0.4, (volume_ratio - 2.0) * 0.1)
+        spike_conf = np.where(np.abs(c1 - o1) / o1 > 0.02, spike_conf + 0.1, spike_conf)
+        
+        # MA crossover (50 / 200)
+        has_ma = lengths >= 201
+        fast_curr = _window_sum(closes, -50, 0) / 50
+        slow_curr = _window_sum(closes, -200, 0) / 200
+        fast_prev = _window_sum(closes, -51, -1) / 50
+        slow_prev = _window_sum(closes, -201, -1) / 200
+        fast_older = _window_sum(closes, -55, -5) / 50
+        
+        golden = has_ma & (fast_prev <= slow_prev) & (fast_curr > slow_curr)
+        death = has_ma & ~golden & (fast_prev >= slow_prev) & (fast_curr < slow_curr)
+        cross_conf = np.where(
+            golden,
+            np.where((fast_older != 0) & (fast_curr > fast_older), 0.7 + 0.1, 0.7),
+            np.where((fast_older != 0) & (fast_curr < fast_older), 0.7 + 0.1, 0.7)
+        )
+        cross_conf = np.where((golden & (c1 > slow_curr)) | (death & (c1 < slow_curr)), cross_conf + 0.1, cross_conf)
+        
+        # Volatility regime
+        low_vol = (atr_n != 0.0) & (atr_n < 0.015)
+        high_vol = (atr_n != 0.0) & ~low_vol & (atr_n > 0.04)
+        regime_conf = np.where(
+            low_vol,
+            0.6 + np.minimum(0.3, (0.015 - atr_n) / 0.015 * 0.3),
+            0.6 + np.minimum(0.3, (atr_n - 0.04) / 0.04 * 0.3)
+        )
+    
+    detected = np.column_stack([bull_eng, bear_eng, doji, harami, volume_spike, golden | death, low_vol | high_vol])
+    confidence = np.column_stack([bull_eng_conf, bear_eng_conf, doji_conf, harami_conf, spike_conf, cross_conf, regime_conf])
+    
+    patterns = []
+    for row, col in zip(*np.nonzero(detected)):
+        signal_type = SCAN_SIGNAL_TYPES[col]
+        if signal_type == 'MA_CROSSOVER':
+            signal_type = 'GOLDEN_CROSS' if golden[row] else 'DEATH_CROSS'
+        elif signal_type == 'VOLATILITY_REGIME':
+            signal_type = 'LOW_VOLATILITY' if low_vol[row] else 'HIGH_VOLATILITY'
+        
+        patterns.append({
+            'symbol': symbols[row],
+            'timeframe': timeframe,
+            'signal_type': signal_type,
+            'confidence_score': min(1.0, round(float(confidence[row, col]), 2))
+        })
+    
+    return patterns
@@ -0,0 +1,232 @@
+"""
+Columnar rank snapshots for the momentum rank-change feed.
+Each refresh is stored as one packed array of (coin index, rank, score)
+in a bounded, time-ordered series of snapshots.
+"""
+import os
+import base64
+import logging
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DTYPE = np.dtype([("coin", "<i4"), ("rank", "<i4"), ("score", "<f8")])
+
+
+@dataclass(frozen=True)
+class RankSnapshot:
+    """
+    Ranks of one refresh, sorted by coin index.
+    
+    Coin indexes refer to the coin table of the RankSnapshotStore that
+    built the snapshot; rank 1 is the highest momentum score.
+    """
+    timestamp_ms: int
+    rows: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def pack(self) -> str:
+        """Encode the rows as base64 of the little-endian record array."""
+        return base64.b64encode(self.rows.tobytes()).decode("ascii")
+    
+    @classmethod
+    def unpack(cls, timestamp_ms: int, payload: str) -> "RankSnapshot":
+        rows = np.frombuffer(base64.b64decode(payload), dtype=SNAPSHOT_DTYPE)
+        return cls(timestamp_ms=timestamp_ms, rows=rows)
+    
+    def lookup(self, coin: int) -> Optional[Tuple[int, float]]:
+        """(rank, score) of a coin index, or None when it is not in the snapshot."""
+        coins = self.rows["coin"]
+        pos = int(np.searchsorted(coins, coin))
+        if pos < len(coins) and coins[pos] == coin:
+            row = self.rows[pos]
+            return int(row["rank"]), float(row["score"])
+        return None
+
+
+class RankSnapshotStore:
+    """
+    Bounded series of rank snapshots plus the coin table they index into.
+    
+    The coin table is append-only, so a coin keeps its index for the life of
+    the store and readers can pick up new coins from the tail. Snapshots are
+    kept in timestamp order and trimmed to the retention window and to
+    RANK_SNAPSHOT_LIMIT entries.
+    """
+    
+    def __init__(self, retention_minutes: int = 24 * 60, max_snapshots: Optional[int] = None):
+        self.retention_ms = retention_minutes * 60 * 1000
+        self.max_snapshots = max_snapshots or int(os.getenv("RANK_SNAPSHOT_LIMIT", 4096))
+        self.coins: List[str] = []
+        self.coin_meta: List[Tuple[Optional[str], Optional[str]]] = []
+        self.coin_index: Dict[str, int] = {}
+        self._timestamps: List[int] = []
+        self._snapshots: List[RankSnapshot] = []
+    
+    def __len__(self) -> int:
+        return len(self._snapshots)
+    
+    def __contains__(self, timestamp_ms: int) -> bool:
+        pos = bisect_left(self._timestamps, timestamp_ms)
+        return pos < len(self._timestamps) and self._timestamps[pos] == timestamp_ms
+    
+    @property
+    def latest(self) -> Optional[RankSnapshot]:
+        return self._snapshots[-1] if self._snapshots else None
+    
+    def register_coin(self, coin_id: str, symbol: Optional[str] = None, name: Optional[str] = None) -> int:
+        """Index of a coin, appending it to the coin table if new."""
+        index = self.coin_index.get(coin_id)
+        if index is None:
+            index = len(self.coins)
+            self.coins.append(coin_id)
+            self.coin_meta.append((symbol, name))
+            self.coin_index[coin_id] = index
+        elif symbol is not None or name is not None:
+            self.coin_meta[index] = (symbol, name)
+        return index
+    
+    def load_coin(self, coin_id: str, symbol: Optional[str] = None, name: Optional[str] = None) -> int:
+        """
+        Append one entry of a shared coin table at the next position.
+        
+        Unlike register_coin this always appends, so positions stay aligned
+        with the shared table even if it holds a coin twice (two writers
+        racing); lookups by id resolve to the first position.
+        """
+        index = len(self.coins)
+        self.coins.append(coin_id)
+        self.coin_meta.append((symbol, name))
+        self.coin_index.setdefault(coin_id, index)
+        return index
+    
+    def truncate_coins(self, count: int) -> None:
+        """Drop coin table entries from position ``count`` on."""
+        for coin_id in self.coins[count:]:
+            if self.coin_index.get(coin_id, -1) >= count:
+                del self.coin_index[coin_id]
+        del self.coins[count:]
+        del self.coin_meta[count:]
+    
+    def build(self, timestamp_ms: int, scored_coins: List[Dict[str, Any]]) -> RankSnapshot:
+        """
+        Rank coins by momentum score and pack them into a snapshot.
+        
+        Ranks follow a stable descending sort over every coin, as before;
+        entries without an id take a rank but are not stored.
+        """
+        scores = np.fromiter(
+            (coin.get("momentum_score", 0) for coin in scored_coins),
+            dtype=np.float64,
+            count=len(scored_coins),
+        )
+        order = np.argsort(-scores, kind="stable")
+        
+        coin_indexes = []
+        positions = []
+        for position, coin in enumerate(scored_coins):
+            coin_id = coin.get("id")
+            if coin_id:
+                coin_indexes.append(self.register_coin(coin_id, coin.get("symbol"), coin.get("name")))
+                positions.append(position)
+        positions = np.asarray(positions, dtype=np.int64)
+        ranks = np.empty(len(scored_coins), dtype=np.int32)
+        ranks[order] = np.arange(1, len(scored_coins) + 1, dtype=np.int32)
+        
+        rows = np.empty(len(positions), dtype=SNAPSHOT_DTYPE)
+        rows["coin"] = coin_indexes
+        rows["rank"] = ranks[positions]
+        rows["score"] = scores[positions]
+        
+        # Sort by coin index; a coin listed twice keeps its best rank
+        rows = rows[np.lexsort((rows["rank"], rows["coin"]))]
+        if len(rows):
+            first = np.ones(len(rows), dtype=bool)
+            first[1:] = rows["coin"][1:] != rows["coin"][:-1]
+            rows = rows[first]
+        return RankSnapshot(timestamp_ms=timestamp_ms, rows=rows)
+    
+    def add(self, snapshot: RankSnapshot) -> None:
+        """Insert a snapshot and trim the series."""
+        if snapshot.timestamp_ms in self:
+            return
+        if not self._timestamps or snapshot.timestamp_ms > self._timestamps[-1]:
+            self._timestamps.append(snapshot.timestamp_ms)
+            self._snapshots.append(snapshot)
+        else:
+            pos = bisect_left(self._timestamps, snapshot.timestamp_ms)
+            self._timestamps.insert(pos, snapshot.timestamp_ms)
+            self._snapshots.insert(pos, snapshot)
+        
+        cutoff = self._timestamps[-1] - self.retention_ms
+        drop = max(bisect_left(self._timestamps, cutoff), len(self._snapshots) - self.max_snapshots)
+        if drop > 0:
+            del self._timestamps[:drop]
+            del self._snapshots[:drop]
+    
+    def window(self, since_ms: int, until_ms: Optional[int] = None) -> List[RankSnapshot]:
+        """Snapshots with since_ms <= timestamp <= until_ms, oldest first."""
+        start = bisect_left(self._timestamps, since_ms)
+        end = len(self._timestamps) if until_ms is None else bisect_left(self._timestamps, until_ms + 1)
+        return self._snapshots[start:end]
+    
+    def history(self, coin_id: str, since_ms: int, until_ms: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Rank history of one coin, oldest first."""
+        index = self.coin_index.get(coin_id)
+        if index is None:
+            return []
+        history = []
+        for snapshot in self.window(since_ms, until_ms):
+            found = snapshot.lookup(index)
+            if found is not None:
+                history.append({
+                    "timestamp": snapshot.timestamp_ms // 1000,
+                    "rank": found[0],
+                    "momentum_score": found[1],
+                })
+        return history
+    
+    def changes(self, since_ms: int, until_ms: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Rank deltas of the latest snapshot against the window.
+        
+        Each coin in the latest snapshot is compared with the first rank it
+        had inside the window. Snapshots are folded in oldest first until
+        every current coin has a baseline, so usually only the two ends of
+        the window are read.
+        
+        Returns:
+            Column arrays (coin, current_rank, previous_rank, rank_delta,
+            score) for coins whose rank changed, in current-rank order
+        """
+        current = self.latest
+        window = self.window(since_ms, until_ms)
+        empty = np.empty(0, dtype=np.int64)
+        if current is None or not window:
+            return {"coin": empty, "current_rank": empty, "previous_rank": empty, "rank_delta": empty, "score": empty.astype(np.float64)}
+        
+        current_coins = current.rows["coin"]
+        previous = np.zeros(len(self.coins), dtype=np.int64)
+        for snapshot in window:
+            coins = snapshot.rows["coin"]
+            unseen = previous[coins] == 0
+            previous[coins[unseen]] = snapshot.rows["rank"][unseen]
+            if np.all(previous[current_coins]):
+                break
+        
+        current_rank = current.rows["rank"].astype(np.int64)
+        previous_rank = previous[current_coins]
+        changed = (previous_rank > 0) & (previous_rank != current_rank)
+        order = np.argsort(current_rank[changed], kind="stable")
+        return {
+            "coin": current_coins[changed][order],
+            "current_rank": current_rank[changed][order],
+            "previous_rank": previous_rank[changed][order],
+            "rank_delta": (current_rank - previous_rank)[changed][order],
+            "score": current.rows["score"][changed][order],
+        }
@@ -2,22 +2,37 @@
 Rank tracker service - tracks momentum rank changes over time.
 """
 import os
+import json
+import asyncio
 import logging
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional
+from datetime import datetime
+import numpy as np
+
 from .redis_cache import RedisCache
+from .rank_snapshots import RankSnapshot, RankSnapshotStore
 
 logger = logging.getLogger(__name__)
 
+RETENTION_SECONDS = 24 * 3600
+SNAPSHOT_FETCH_BATCH = 64
+
 
 class RankTracker:
     """
     Track momentum rank changes over time.
     Records rank snapshots and computes deltas for rank-change feed.
+    
+    Each refresh is recorded as one packed snapshot (coin index, rank, score)
+    in Redis plus a shared coin table, instead of one sorted set per coin.
+    Snapshots are immutable, so every process keeps the ones it has seen in
+    a bounded in-memory RankSnapshotStore and only fetches new ones.
     """
     
-    def __init__(self):
+    def __init__(self, store: Optional[RankSnapshotStore] = None):
         self.redis_cache = RedisCache()
+        self.store = store if store is not None else get_rank_store()
+        self._lock = asyncio.Lock()
     
     async def record_ranks(self, scored_coins: List[Dict[str, Any]]) -> bool:
         """
@@ -25,30 +40,70 @@ class RankTracker:
         Called by the background worker after each refresh.
         """
         try:
-            sorted_coins = sorted(scored_coins, key=lambda x: x.get("momentum_score", 0), reverse=True)
-            
-            for rank, coin in enumerate(sorted_coins, start=1):
-                coin_id = coin.get("id")
-                momentum_score = coin.get("momentum_score", 0)
+            async with self._lock:
+                await self._sync_coins()
                 
-                if coin_id:
-                    await self.redis_cache.record_rank(coin_id, rank, momentum_score)
+                known = len(self.store.coins)
+                timestamp_ms = int(datetime.utcnow().timestamp() * 1000)
+                snapshot = self.store.build(timestamp_ms, scored_coins)
+                new_coins = [
+                    json.dumps([coin_id, *self.store.coin_meta[index]])
+                    for index, coin_id in enumerate(self.store.coins[known:], start=known)
+                ]
+                
+                stored = await self.redis_cache.record_rank_snapshot(
+                    timestamp_ms, snapshot.pack(), new_coins, known, retention_seconds=RETENTION_SECONDS
+                )
+                if not stored:
+                    # The new coins did not land at the indexes the snapshot uses;
+                    # forget them so the next refresh re-syncs and re-registers
+                    self.store.truncate_coins(known)
+                    return False
+                
+                self.store.add(snapshot)
             
-            logger.info(f"Recorded ranks for {len(sorted_coins)} coins")
+            logger.info(f"Recorded ranks for {len(scored_coins)} coins")
             return True
         
         except Exception as e:
             logger.error(f"Error recording ranks: {e}")
             return False
     
+    async def _sync_coins(self) -> None:
+        """Append coin table entries other processes have registered."""
+        for entry in await self.redis_cache.get_rank_coins(start=len(self.store.coins)):
+            coin_id, symbol, name = json.loads(entry)
+            self.store.load_coin(coin_id, symbol, name)
+    
+    async def _sync_snapshots(self, since_ms: int) -> None:
+        """Fetch snapshots in the window that this process has not seen yet."""
+        timestamps = await self.redis_cache.get_rank_snapshot_ids(since_ms)
+        missing = [ts for ts in timestamps if ts not in self.store]
+        if not missing:
+            return
+        
+        await self._sync_coins()
+        for start in range(0, len(missing), SNAPSHOT_FETCH_BATCH):
+            batch = missing[start:start + SNAPSHOT_FETCH_BATCH]
+            payloads = await self.redis_cache.get_rank_snapshots(batch)
+            for timestamp_ms, payload in zip(batch, payloads):
+                if payload is None:
+                    continue
+                snapshot = RankSnapshot.unpack(timestamp_ms, payload)
+                if len(snapshot) and snapshot.rows["coin"].max() >= len(self.store.coins):
+                    logger.warning(f"Skipping rank snapshot {timestamp_ms}: unknown coin index")
+                    continue
+                self.store.add(snapshot)
+    
     async def get_rank_history(self, coin_id: str, hours: int = 24) -> List[Dict[str, Any]]:
         """
         Get rank history for a specific coin.
         """
         try:
-            minutes = hours * 60
-            history = await self.redis_cache.get_rank_history(coin_id, minutes=minutes)
-            return history
+            now_ms = int(datetime.utcnow().timestamp() * 1000)
+            since_ms = now_ms - hours * 3600 * 1000
+            await self._sync_snapshots(since_ms)
+            return self.store.history(coin_id, since_ms, now_ms)
         
         except Exception as e:
             logger.error(f"Error getting rank history for {coin_id}: {e}")
@@ -58,42 +113,52 @@ class RankTracker:
         """
         Get coins with biggest rank changes in the specified time window.
         Returns list sorted by absolute rank change (biggest movers first).
+        
+        Current ranks come from the latest snapshot; each coin's previous
+        rank is the first one it had inside the window.
         """
         try:
-            scored_coins = await self.redis_cache.get_scored_coins()
+            now_ms = int(datetime.utcnow().timestamp() * 1000)
+            since_ms = now_ms - minutes * 60 * 1000
+            await self._sync_snapshots(since_ms)
             
-            if not scored_coins:
+            columns = self.store.changes(since_ms, now_ms)
+            if not len(columns["coin"]):
                 return []
             
-            sorted_coins = sorted(scored_coins, key=lambda x: x.get("momentum_score", 0), reverse=True)
-            current_ranks = {coin["id"]: (idx + 1, coin) for idx, coin in enumerate(sorted_coins)}
+            # Columns are in current-rank order, so a stable sort keeps it for ties
+            order = np.argsort(-np.abs(columns["rank_delta"]), kind="stable")[:limit]
+            timestamp = datetime.utcnow().isoformat()
             
             changes = []
-            for coin_id, (current_rank, coin) in current_ranks.items():
-                history = await self.redis_cache.get_rank_history(coin_id, minutes=minutes)
-                
-                if history:
-                    oldest = history[0]
-                    previous_rank = oldest["rank"]
-                    
-                    rank_delta = current_rank - previous_rank
-                    
-                    if rank_delta != 0:
-                        changes.append({
-                            "id": coin_id,
-                            "symbol": coin.get("symbol"),
-                            "name": coin.get("name"),
-                            "current_rank": current_rank,
-                            "previous_rank": previous_rank,
-                            "rank_delta": rank_delta,
-                            "momentum_score": coin.get("momentum_score"),
-                            "timestamp": datetime.utcnow().isoformat()
-                        })
-            
-            changes.sort(key=lambda x: abs(x["rank_delta"]), reverse=True)
+            for i in order.tolist():
+                coin = int(columns["coin"][i])
+                symbol, name = self.store.coin_meta[coin]
+                changes.append({
+                    "id": self.store.coins[coin],
+                    "symbol": symbol,
+                    "name": name,
+                    "current_rank": int(columns["current_rank"][i]),
+                    "previous_rank": int(columns["previous_rank"][i]),
+                    "rank_delta": int(columns["rank_delta"][i]),
+                    "momentum_score": float(columns["score"][i]),
+                    "timestamp": timestamp
+                })
             
-            return changes[:limit]
+            return changes
         
         except Exception as e:
             logger.error(f"Error getting rank changes: {e}")
             return []
+
+
+# Global snapshot store, shared by the trackers of one process
+_rank_store: Optional[RankSnapshotStore] = None
+
+
+def get_rank_store() -> RankSnapshotStore:
+    """Get or create the process-wide RankSnapshotStore."""
+    global _rank_store
+    if _rank_store is None:
+        _rank_store = RankSnapshotStore(retention_minutes=RETENTION_SECONDS // 60)
+    return _rank_store
@@ -158,52 +158,78 @@ class RedisCache:
             logger.error(f"Error setting scored coins: {e}")
             return False
     
-    async def record_rank(self, coin_id: str, rank: int, momentum_score: float) -> bool:
-        """Record rank for rank-change tracking."""
+    async def record_rank_snapshot(
+        self,
+        timestamp_ms: int,
+        payload: str,
+        new_coins: List[str],
+        coin_offset: int,
+        retention_seconds: int = 24 * 3600,
+    ) -> bool:
+        """
+        Store one packed rank snapshot for rank-change tracking.
+        
+        Newly seen coins are appended to the shared coin table first, so the
+        coin indexes in the payload resolve for every reader. The payload
+        numbers them from ``coin_offset``; if the table did not end up with
+        them there (a failed push, or another writer appending first), or
+        the payload cannot be written, the snapshot is not indexed and False
+        is returned.
+        """
         try:
             client = await self._get_client()
-            timestamp = int(datetime.utcnow().timestamp())
             
-            key = f"ghostquant:rank_history:{coin_id}"
-            await client.zadd(key, {f"{timestamp}:{rank}:{momentum_score}": timestamp})
+            if new_coins:
+                length = await client.rpush("ghostquant:rank_coins", *new_coins)
+                if length != coin_offset + len(new_coins):
+                    logger.warning(
+                        f"Rank coin table has {length} entries, expected {coin_offset + len(new_coins)}; "
+                        f"not storing rank snapshot {timestamp_ms}"
+                    )
+                    return False
             
-            cutoff = timestamp - (24 * 3600)
-            await client.zremrangebyscore(key, 0, cutoff)
+            if not await client.set(f"ghostquant:rank_snapshot:{timestamp_ms}", payload, retention_seconds * 2):
+                logger.warning(f"Failed to write rank snapshot {timestamp_ms}; not indexing it")
+                return False
+            await client.zadd("ghostquant:rank_snapshots", {str(timestamp_ms): timestamp_ms})
             
-            await client.expire(key, 86400 * 2)
+            cutoff = timestamp_ms - retention_seconds * 1000
+            await client.zremrangebyscore("ghostquant:rank_snapshots", 0, cutoff)
             
             return True
         
         except Exception as e:
-            logger.error(f"Error recording rank for {coin_id}: {e}")
+            logger.error(f"Error recording rank snapshot {timestamp_ms}: {e}")
             return False
     
-    async def get_rank_history(self, coin_id: str, minutes: int = 60) -> List[Dict[str, Any]]:
-        """Get rank history for a coin."""
+    async def get_rank_coins(self, start: int = 0) -> List[str]:
+        """Get coin table entries from position ``start`` on."""
         try:
             client = await self._get_client()
-            timestamp = int(datetime.utcnow().timestamp())
-            cutoff = timestamp - (minutes * 60)
-            
-            key = f"ghostquant:rank_history:{coin_id}"
-            entries = await client.zrangebyscore(key, cutoff, timestamp)
-            
-            history = []
-            for entry, ts in entries:
-                parts = entry.split(":")
-                if len(parts) == 3:
-                    history.append({
-                        "timestamp": int(ts),
-                        "rank": int(parts[1]),
-                        "momentum_score": float(parts[2])
-                    })
-            
-            return history
-        
+            return await client.lrange("ghostquant:rank_coins", start, -1)
+        except Exception as e:
+            logger.error(f"Error getting rank coin table: {e}")
+            return []
+    
+    async def get_rank_snapshot_ids(self, since_ms: int) -> List[int]:
+        """Get timestamps of stored rank snapshots taken at or after ``since_ms``."""
+        try:
+            client = await self._get_client()
+            entries = await client.zrangebyscore("ghostquant:rank_snapshots", since_ms, "+inf")
+            return [int(score) for _, score in entries]
         except Exception as e:
-            logger.error(f"Error getting rank history for {coin_id}: {e}")
+            logger.error(f"Error getting rank snapshot ids: {e}")
             return []
     
+    async def get_rank_snapshots(self, timestamps: List[int]) -> List[Optional[str]]:
+        """Get packed rank snapshots by timestamp (None where expired)."""
+        try:
+            client = await self._get_client()
+            return await client.mget([f"ghostquant:rank_snapshot:{ts}" for ts in timestamps])
+        except Exception as e:
+            logger.error(f"Error getting rank snapshots: {e}")
+            return [None] * len(timestamps)
+    
     async def increment_metric(self, metric_name: str, value: int = 1) -> bool:
         """Increment a metric counter (for monitoring)."""
         try:
@@ -228,6 +254,3 @@ class RedisCache:
         """Close Redis connection (no-op for REST API)."""
         if self._upstash:
             await self._upstash.close()
-
-
-from datetime import datetime
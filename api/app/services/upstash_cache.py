@@ -202,6 +202,26 @@ class UpstashCache:
             logger.error(f"Upstash LRANGE error for key {key}: {e}")
             return []
     
+    async def rpush(self, key: str, *values) -> int:
+        """Push values to the right of a list, returning the new length."""
+        try:
+            result = await self._execute("RPUSH", key, *values)
+            return int(result) if result else 0
+        except Exception as e:
+            logger.error(f"Upstash RPUSH error for key {key}: {e}")
+            return 0
+    
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Get several keys in one command."""
+        try:
+            if not keys:
+                return []
+            result = await self._execute("MGET", *keys)
+            return result if result else [None] * len(keys)
+        except Exception as e:
+            logger.error(f"Upstash MGET error: {e}")
+            return [None] * len(keys)
+    
     async def ltrim(self, key: str, start: int, stop: int) -> bool:
         """Trim list to specified range."""
         try:
@@ -308,50 +328,6 @@ class UpstashCache:
             logger.error(f"Error setting scored coins: {e}")
             return False
     
-    async def record_rank(self, coin_id: str, rank: int, momentum_score: float) -> bool:
-        """Record rank for rank-change tracking."""
-        try:
-            timestamp = int(datetime.utcnow().timestamp())
-            
-            key = f"ghostquant:rank_history:{coin_id}"
-            await self.zadd(key, {f"{timestamp}:{rank}:{momentum_score}": timestamp})
-            
-            cutoff = timestamp - (24 * 3600)
-            await self.zremrangebyscore(key, 0, cutoff)
-            
-            await self.expire(key, 86400 * 2)
-            
-            return True
-        
-        except Exception as e:
-            logger.error(f"Error recording rank for {coin_id}: {e}")
-            return False
-    
-    async def get_rank_history(self, coin_id: str, minutes: int = 60) -> List[Dict[str, Any]]:
-        """Get rank history for a coin."""
-        try:
-            timestamp = int(datetime.utcnow().timestamp())
-            cutoff = timestamp - (minutes * 60)
-            
-            key = f"ghostquant:rank_history:{coin_id}"
-            entries = await self.zrangebyscore(key, cutoff, timestamp)
-            
-            history = []
-            for entry, ts in entries:
-                parts = entry.split(":")
-                if len(parts) == 3:
-                    history.append({
-                        "timestamp": int(ts),
-                        "rank": int(parts[1]),
-                        "momentum_score": float(parts[2])
-                    })
-            
-            return history
-        
-        except Exception as e:
-            logger.error(f"Error getting rank history for {coin_id}: {e}")
-            return []
-    
     async def increment_metric(self, metric_name: str, value: int = 1) -> bool:
         """Increment a metric counter (for monitoring)."""
         try:
@@ -8,8 +8,9 @@ import json
 import asyncio
 from typing import Set, Dict, Any, List
 from datetime import datetime
-from fastapi import WebSocket, WebSocketDisconnect
+from fastapi import WebSocket
 from .redis_cache import RedisCache
+from .broadcast_hub import BroadcastHub
 
 logger = logging.getLogger(__name__)
 
@@ -21,11 +22,15 @@ class WebSocketManager:
     - "top50": Top 50 coins by momentum
     - "symbol:BTC": Specific symbol updates
     - "all": All updates
+    
+    Messages are encoded once per broadcast and delivered through a
+    BroadcastHub, so each client drains its own bounded send queue.
     """
     
     def __init__(self):
         self.active_connections: Set[WebSocket] = set()
         self.subscriptions: Dict[WebSocket, Set[str]] = {}
+        self.hub = BroadcastHub(on_disconnect=self.disconnect)
         self.redis_cache = RedisCache()
         self.heartbeat_seconds = int(os.getenv("WEBSOCKET_HEARTBEAT_SECONDS", 30))
         self.last_snapshot = {}
@@ -36,12 +41,16 @@ class WebSocketManager:
         await websocket.accept()
         self.active_connections.add(websocket)
         self.subscriptions[websocket] = {"top50"}  # Default subscription
+        self.hub.register(websocket, client_id=str(websocket.client))
         logger.info(f"WebSocket connected: {websocket.client}")
     
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection."""
+        if websocket not in self.active_connections:
+            return
         self.active_connections.discard(websocket)
         self.subscriptions.pop(websocket, None)
+        self.hub.unregister(websocket)
         logger.info(f"WebSocket disconnected: {websocket.client}")
     
     async def subscribe(self, websocket: WebSocket, channels: List[str]):
@@ -66,37 +75,28 @@ class WebSocketManager:
     
     async def send_personal_message(self, message: Dict[str, Any], websocket: WebSocket):
         """Send a message to a specific client."""
-        try:
-            await websocket.send_json(message)
-        except Exception as e:
-            logger.error(f"Error sending message to {websocket.client}: {e}")
+        if not self.hub.send(websocket, message):
+            logger.error(f"Error sending message to {websocket.client}: not connected")
             self.disconnect(websocket)
     
     async def broadcast(self, message: Dict[str, Any], channel: str = "all"):
         """
         Broadcast a message to all subscribed clients.
         
+        The message is serialized once and enqueued for every subscriber;
+        delivery happens on each client's own writer task.
+        
         Args:
             message: Message to broadcast
             channel: Channel to broadcast on (e.g., "top50", "symbol:BTC", "all")
         """
-        disconnected = []
-        
-        for websocket in self.active_connections:
-            try:
-                subs = self.subscriptions.get(websocket, set())
-                
-                if "all" in subs or channel in subs:
-                    await websocket.send_json(message)
-            
-            except WebSocketDisconnect:
-                disconnected.append(websocket)
-            except Exception as e:
-                logger.error(f"Error broadcasting to {websocket.client}: {e}")
-                disconnected.append(websocket)
+        targets = [
+            websocket for websocket, subs in self.subscriptions.items()
+            if "all" in subs or channel in subs
+        ]
         
-        for ws in disconnected:
-            self.disconnect(ws)
+        if targets:
+            self.hub.publish(message, targets)
     
     async def broadcast_top_updates(self):
         """
@@ -203,6 +203,14 @@ class WebSocketManager:
         if self.broadcast_task and not self.broadcast_task.done():
             self.broadcast_task.cancel()
             logger.info("WebSocket broadcast task stopped")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Fan-out statistics including per-client lag metrics."""
+        return {
+            "active_connections": len(self.active_connections),
+            "hub": self.hub.get_stats(),
+            "clients": self.hub.get_client_metrics(),
+        }
 
 
 _ws_manager = None
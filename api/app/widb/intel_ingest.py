@@ -380,7 +380,9 @@ def initialize_intel_pipeline() -> None:
     pipeline.initialize()
 
 
-# Convenience functions for publishing events from other modules
+# Convenience functions for publishing events from other modules.
+# These are non-blocking: events are queued and ingested on the bus's
+# dispatcher thread, so callers never wait on WIDB writes.
 
 def publish_hydra_detection(
     heads: List[str],
@@ -393,7 +395,7 @@ def publish_hydra_detection(
     
     Call this from Hydra adapter after detection completes.
     """
-    intel_event_bus.publish(IntelEvents.HYDRA_DETECTED, {
+    intel_event_bus.publish_async(IntelEvents.HYDRA_DETECTED, {
         "heads": heads,
         "cluster_id": cluster_id,
         "risk_level": risk_level,
@@ -415,7 +417,7 @@ def publish_whale_intel_wallet(
     
     Call this from Whale Intel module when a wallet is discovered.
     """
-    intel_event_bus.publish(IntelEvents.WHALE_INTEL_WALLET_FOUND, {
+    intel_event_bus.publish_async(IntelEvents.WHALE_INTEL_WALLET_FOUND, {
         "address": address,
         "entity_type": entity_type,
         "risk_score": risk_score,
@@ -436,7 +438,7 @@ def publish_ecoscan_cluster(
     
     Call this from EcoScan module when a cluster is identified.
     """
-    intel_event_bus.publish(IntelEvents.ECOSCAN_CLUSTER_IDENTIFIED, {
+    intel_event_bus.publish_async(IntelEvents.ECOSCAN_CLUSTER_IDENTIFIED, {
         "addresses": addresses,
         "cluster_id": cluster_id,
         "risk_level": risk_level,
@@ -456,7 +458,7 @@ def publish_entity_classification(
     
     Call this from Entity Explorer when an entity is classified.
     """
-    intel_event_bus.publish(IntelEvents.ENTITY_CLASSIFIED, {
+    intel_event_bus.publish_async(IntelEvents.ENTITY_CLASSIFIED, {
         "address": address,
         "entity_type": entity_type,
         "entity_name": entity_name,
@@ -7,9 +7,10 @@ Uses a pub/sub pattern to decouple intelligence sources from WIDB storage.
 This is a NEW isolated module - does NOT modify any existing code.
 """
 
-from collections import defaultdict
-from typing import Callable, Any, Dict, List, Optional
+from collections import defaultdict, deque
+from typing import Callable, Any, Deque, Dict, List, Optional
 from datetime import datetime
+import queue
 import threading
 import logging
 
@@ -27,7 +28,8 @@ class IntelEventBus:
     - Event subscription by event name
     - Event publishing with payload
     - Thread-safe operations
-    - Event history for debugging
+    - Non-blocking publishing via a background dispatcher thread
+    - Bounded event history for debugging
     
     Event names follow the pattern: source.action
     Examples:
@@ -37,11 +39,16 @@ class IntelEventBus:
     - entity.classified
     """
     
-    def __init__(self, max_history: int = 100):
+    def __init__(self, max_history: int = 100, max_pending: int = 10000):
         self._lock = threading.RLock()
         self._subscribers: Dict[str, List[IntelHandler]] = defaultdict(list)
-        self._event_history: List[Dict[str, Any]] = []
+        self._event_history: Deque[Dict[str, Any]] = deque(maxlen=max_history)
         self._max_history = max_history
+        
+        # Async dispatch state
+        self._pending: "queue.Queue[tuple]" = queue.Queue(maxsize=max_pending)
+        self._dispatcher: Optional[threading.Thread] = None
+        self._dropped = 0
     
     def subscribe(self, event_name: str, handler: IntelHandler) -> None:
         """
@@ -87,21 +94,92 @@ class IntelEventBus:
         """
         with self._lock:
             handlers = list(self._subscribers.get(event_name, []))
-            
-            # Record event in history
-            event_record = {
-                "event_name": event_name,
-                "payload": payload,
-                "timestamp": datetime.utcnow().isoformat(),
-                "handlers_count": len(handlers)
-            }
-            self._event_history.append(event_record)
-            
-            # Trim history if needed
-            if len(self._event_history) > self._max_history:
-                self._event_history = self._event_history[-self._max_history:]
+            self._record(event_name, payload, len(handlers))
         
         # Invoke handlers outside the lock
+        return self._dispatch(event_name, payload, handlers)
+    
+    def publish_async(self, event_name: str, payload: Dict[str, Any]) -> bool:
+        """
+        Queue an event for delivery on the background dispatcher thread.
+        
+        Returns immediately; handlers run in publish order on the dispatcher.
+        
+        Args:
+            event_name: Name of the event
+            payload: Event data
+            
+        Returns:
+            True if queued, False if the pending queue is full (event dropped)
+        """
+        self._ensure_dispatcher()
+        try:
+            self._pending.put_nowait((event_name, payload))
+            return True
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            logger.warning(f"Intel event queue full, dropped event {event_name}")
+            return False
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued async event has been dispatched.
+        
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        if self._dispatcher is None:
+            return True
+        done = threading.Event()
+        
+        def _wait():
+            self._pending.join()
+            done.set()
+        
+        threading.Thread(target=_wait, daemon=True).start()
+        return done.wait(timeout)
+    
+    def get_pending_count(self) -> int:
+        """Number of async events waiting for dispatch"""
+        return self._pending.qsize()
+    
+    def get_dropped_count(self) -> int:
+        """Number of async events dropped because the queue was full"""
+        with self._lock:
+            return self._dropped
+    
+    def _ensure_dispatcher(self) -> None:
+        if self._dispatcher is not None and self._dispatcher.is_alive():
+            return
+        with self._lock:
+            if self._dispatcher is None or not self._dispatcher.is_alive():
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch_loop, name="intel-event-dispatcher", daemon=True
+                )
+                self._dispatcher.start()
+    
+    def _dispatch_loop(self) -> None:
+        while True:
+            event_name, payload = self._pending.get()
+            try:
+                with self._lock:
+                    handlers = list(self._subscribers.get(event_name, []))
+                    self._record(event_name, payload, len(handlers))
+                self._dispatch(event_name, payload, handlers)
+            finally:
+                self._pending.task_done()
+    
+    def _record(self, event_name: str, payload: Dict[str, Any], handlers_count: int) -> None:
+        """Append to the bounded history (caller holds the lock)"""
+        self._event_history.append({
+            "event_name": event_name,
+            "payload": payload,
+            "timestamp": datetime.utcnow().isoformat(),
+            "handlers_count": handlers_count
+        })
+    
+    def _dispatch(self, event_name: str, payload: Dict[str, Any], handlers: List[IntelHandler]) -> int:
         invoked = 0
         for handler in handlers:
             try:
@@ -126,7 +204,9 @@ class IntelEventBus:
     def get_event_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent event history"""
         with self._lock:
-            return list(self._event_history[-limit:])
+            if limit <= 0:
+                return []
+            return list(self._event_history)[-limit:]
     
     def clear_subscribers(self, event_name: Optional[str] = None) -> None:
         """
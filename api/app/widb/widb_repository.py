@@ -1,15 +1,22 @@
 """
 WIDB Repository - Whale Intelligence Database Repository
 
-Provides the data access layer for WIDB using in-memory storage.
-This is a proof-of-concept implementation - data is ephemeral.
+Provides the data access layer for WIDB. The default backend is the indexed
+SQLite repository (widb_sqlite_repository); the in-memory implementation
+below is kept as a fallback and for tests - its data is ephemeral.
+
+Backend selection (environment):
+- WIDB_BACKEND: "sqlite" (default) or "memory"
+- WIDB_SQLITE_PATH: database file (default "widb.sqlite3")
 
 This is a NEW isolated module - does NOT modify any existing code.
 """
 
-from datetime import datetime
-from typing import Dict, List, Optional, Protocol
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 from uuid import uuid4
+import logging
+import os
 import threading
 
 from .widb_models import (
@@ -25,6 +32,8 @@ from .widb_models import (
     RelationshipType,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class WidbRepositoryProtocol(Protocol):
     """Protocol defining the WIDB repository interface"""
@@ -33,6 +42,10 @@ class WidbRepositoryProtocol(Protocol):
     def get_wallet_profile(self, address: str) -> Optional[WalletProfile]: ...
     def update_wallet_profile(self, address: str, update: WalletProfileUpdate) -> Optional[WalletProfile]: ...
     def list_wallet_profiles(self, limit: int = 100, offset: int = 0) -> List[WalletProfile]: ...
+    def list_wallet_profiles_page(
+        self, limit: int = 100, cursor: Optional[str] = None, order_by: str = "last_seen",
+        min_risk_score: Optional[float] = None,
+    ) -> Tuple[List[WalletProfile], Optional[str]]: ...
     
     def create_association(self, assoc: AssociationCreate) -> Association: ...
     def get_associations(self, address: str) -> List[Association]: ...
@@ -41,6 +54,11 @@ class WidbRepositoryProtocol(Protocol):
     def record_cluster_event(self, event: ClusterHistoryCreate) -> ClusterHistory: ...
     def get_cluster_history(self, limit: int = 100, offset: int = 0) -> List[ClusterHistory]: ...
     def get_clusters_for_address(self, address: str) -> List[ClusterHistory]: ...
+    
+    def get_neighborhood(
+        self, address: str, depth: int = 2, include_clusters: bool = True, max_nodes: int = 5000,
+    ) -> Dict[str, Any]: ...
+    def get_stats(self) -> Dict: ...
 
 
 class InMemoryWidbRepository:
@@ -151,6 +169,39 @@ class InMemoryWidbRepository:
             profiles.sort(key=lambda p: p.last_seen, reverse=True)
             return profiles[offset:offset + limit]
     
+    def list_wallet_profiles_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        order_by: str = "last_seen",
+        min_risk_score: Optional[float] = None,
+    ) -> Tuple[List[WalletProfile], Optional[str]]:
+        """Cursor-paginated listing (same cursor format as the SQLite backend)"""
+        if order_by not in ("last_seen", "risk_score"):
+            raise ValueError(f"Unsupported order_by: {order_by}")
+        
+        def sort_key(p: WalletProfile):
+            value = p.risk_score if order_by == "risk_score" else _to_micros(p.last_seen)
+            return (value, p.address)
+        
+        with self._lock:
+            profiles = list(self._wallet_profiles.values())
+        if min_risk_score is not None:
+            profiles = [p for p in profiles if p.risk_score >= min_risk_score]
+        profiles.sort(key=sort_key, reverse=True)
+        
+        if cursor:
+            value_str, _, address = cursor.partition("|")
+            bound = (float(value_str) if order_by == "risk_score" else int(value_str), address)
+            profiles = [p for p in profiles if sort_key(p) < bound]
+        
+        page = profiles[:limit]
+        next_cursor = None
+        if len(page) == limit:
+            value, address = sort_key(page[-1])
+            next_cursor = f"{value!r}|{address}"
+        return page, next_cursor
+    
     # Association Methods
     
     def create_association(self, assoc: AssociationCreate) -> Association:
@@ -268,6 +319,75 @@ class InMemoryWidbRepository:
             cluster_ids = self._clusters_by_address.get(address, [])
             return [self._cluster_history[cid] for cid in cluster_ids if cid in self._cluster_history]
     
+    def get_neighborhood(
+        self,
+        address: str,
+        depth: int = 2,
+        include_clusters: bool = True,
+        max_nodes: int = 5000,
+    ) -> Dict[str, Any]:
+        """Breadth-first wallet/cluster neighborhood (see SqliteWidbRepository)"""
+        depth = max(1, min(depth, 4))
+        start = self._normalize_address(address)
+        seen: Dict[str, Tuple[str, int]] = {start: ("wallet", 0)}
+        edges: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        frontier = [start]
+        truncated = False
+        
+        with self._lock:
+            for level in range(1, depth + 1):
+                next_frontier = []
+                for node in frontier:
+                    if node.startswith("cluster:"):
+                        record = self._cluster_history.get(node[len("cluster:"):])
+                        neighbors = [(a, "member_of", None) for a in record.related_addresses] if record else []
+                    else:
+                        neighbors = []
+                        for aid in self._associations_by_address.get(node, []):
+                            assoc = self._associations[aid]
+                            other = assoc.linked_address if assoc.address == node else assoc.address
+                            neighbors.append((other, "association", {
+                                "source": assoc.address,
+                                "target": assoc.linked_address,
+                                "kind": "association",
+                                "relationship_type": assoc.relationship_type,
+                                "confidence": assoc.confidence,
+                            }))
+                        if include_clusters:
+                            neighbors.extend(
+                                (f"cluster:{rid}", "member_of", None)
+                                for rid in self._clusters_by_address.get(node, [])
+                            )
+                    
+                    for other, kind, edge in neighbors:
+                        if other not in seen:
+                            # Cap the result while expanding, not just between levels
+                            if len(seen) >= max_nodes:
+                                truncated = True
+                                continue
+                            seen[other] = ("cluster" if other.startswith("cluster:") else "wallet", level)
+                            next_frontier.append(other)
+                        if kind == "member_of":
+                            wallet, cluster_key = (node, other) if other.startswith("cluster:") else (other, node)
+                            edges[(wallet, cluster_key, kind)] = {"source": wallet, "target": cluster_key, "kind": kind}
+                        else:
+                            edges[(edge["source"], edge["target"], kind)] = edge
+                
+                if len(seen) >= max_nodes:
+                    truncated = truncated or level < depth
+                    break
+                frontier = next_frontier
+                if not frontier:
+                    break
+        
+        return {
+            "root": start,
+            "depth": depth,
+            "nodes": [{"id": k, "kind": kind, "depth": d} for k, (kind, d) in seen.items()],
+            "edges": list(edges.values()),
+            "truncated": truncated,
+        }
+    
     # Utility Methods
     
     def get_stats(self) -> Dict:
@@ -307,23 +427,42 @@ class InMemoryWidbRepository:
             self._clusters_by_address.clear()
 
 
+def _to_micros(value: datetime) -> int:
+    """Microseconds since epoch; matches the SQLite backend's cursor encoding."""
+    return (value - datetime(1970, 1, 1)) // timedelta(microseconds=1)
+
+
+def _create_repository() -> WidbRepositoryProtocol:
+    """Instantiate the configured backend, falling back to in-memory storage."""
+    backend = os.getenv("WIDB_BACKEND", "sqlite").lower()
+    if backend == "sqlite":
+        from .widb_sqlite_repository import SqliteWidbRepository
+        
+        path = os.getenv("WIDB_SQLITE_PATH", "widb.sqlite3")
+        try:
+            return SqliteWidbRepository(path)
+        except Exception as e:
+            logger.warning(f"WIDB SQLite backend unavailable at {path} ({e}), using in-memory storage")
+    return InMemoryWidbRepository()
+
+
 # Singleton instance
-_repository_instance: Optional[InMemoryWidbRepository] = None
+_repository_instance: Optional[WidbRepositoryProtocol] = None
 _repository_lock = threading.Lock()
 
 
-def get_widb_repository() -> InMemoryWidbRepository:
+def get_widb_repository() -> WidbRepositoryProtocol:
     """
     Get the singleton WIDB repository instance.
     
     Returns:
-        InMemoryWidbRepository instance
+        SqliteWidbRepository or InMemoryWidbRepository, per WIDB_BACKEND
     """
     global _repository_instance
     
     if _repository_instance is None:
         with _repository_lock:
             if _repository_instance is None:
-                _repository_instance = InMemoryWidbRepository()
+                _repository_instance = _create_repository()
     
     return _repository_instance
@@ -4,7 +4,9 @@ WIDB Router - Whale Intelligence Database API Endpoints
 Provides REST API endpoints for WIDB operations:
 - GET /widb/wallet/{address} - Retrieve wallet profile
 - GET /widb/wallet/{address}/associations - Get wallet associations
+- GET /widb/wallet/{address}/neighborhood - Wallet/cluster graph neighborhood
 - GET /widb/cluster/history - Get cluster history
+- GET /widb/wallets/page - Cursor-paginated wallet listing
 - POST /widb/wallet/annotate - Add analyst notes
 - GET /widb/stats - Get WIDB statistics
 - POST /widb/ingest/hydra - Manual Hydra ingestion endpoint
@@ -80,6 +82,13 @@ class StatsResponse(BaseModel):
     timestamp: str
 
 
+class WalletPageResponse(BaseModel):
+    """Response for cursor-paginated wallet listing"""
+    wallets: List[WalletProfile]
+    next_cursor: Optional[str] = None
+    count: int
+
+
 class HealthResponse(BaseModel):
     """Response for health check"""
     status: str
@@ -170,6 +179,24 @@ async def get_wallet_clusters(address: str):
     )
 
 
+@widb_router.get("/wallet/{address}/neighborhood")
+async def get_wallet_neighborhood(
+    address: str,
+    depth: int = Query(default=2, ge=1, le=4, description="Maximum hops from the wallet"),
+    include_clusters: bool = Query(default=True, description="Traverse shared cluster membership"),
+    max_nodes: int = Query(default=5000, ge=1, le=50000, description="Node budget")
+):
+    """
+    Get the graph neighborhood of a wallet.
+    
+    Walks associations (and optionally cluster membership) breadth-first up to `depth` hops.
+    """
+    service = get_widb_service()
+    return service.get_wallet_neighborhood(
+        address, depth=depth, include_clusters=include_clusters, max_nodes=max_nodes
+    )
+
+
 @widb_router.get("/cluster/history", response_model=ClusterHistoryListResponse)
 async def get_cluster_history(
     limit: int = Query(default=100, ge=1, le=1000, description="Maximum records to return"),
@@ -198,6 +225,28 @@ async def list_wallets(
     return service.list_wallet_profiles(limit=limit, offset=offset)
 
 
+@widb_router.get("/wallets/page", response_model=WalletPageResponse)
+async def list_wallets_page(
+    limit: int = Query(default=100, ge=1, le=1000, description="Page size"),
+    cursor: Optional[str] = Query(default=None, description="Cursor from the previous page"),
+    order_by: str = Query(default="last_seen", pattern="^(last_seen|risk_score)$", description="Sort key (descending)"),
+    min_risk_score: Optional[float] = Query(default=None, ge=0.0, le=1.0, description="Minimum risk score")
+):
+    """
+    List wallet profiles with keyset pagination.
+    
+    Pass `next_cursor` from the response to fetch the following page.
+    """
+    service = get_widb_service()
+    try:
+        wallets, next_cursor = service.list_wallet_profiles_page(
+            limit=limit, cursor=cursor, order_by=order_by, min_risk_score=min_risk_score
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return WalletPageResponse(wallets=wallets, next_cursor=next_cursor, count=len(wallets))
+
+
 @widb_router.post("/wallet/annotate", response_model=WalletProfile)
 async def annotate_wallet(request: AnnotateRequest):
     """
@@ -8,7 +8,7 @@ This is a NEW isolated module - does NOT modify any existing code.
 """
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import hashlib
 
 from .widb_models import (
@@ -27,7 +27,7 @@ from .widb_models import (
     AssociationListResponse,
     ClusterHistoryListResponse,
 )
-from .widb_repository import get_widb_repository, InMemoryWidbRepository
+from .widb_repository import get_widb_repository, WidbRepositoryProtocol
 
 
 class WidbService:
@@ -41,7 +41,7 @@ class WidbService:
     - Intelligence ingestion
     """
     
-    def __init__(self, repository: Optional[InMemoryWidbRepository] = None):
+    def __init__(self, repository: Optional[WidbRepositoryProtocol] = None):
         self._repo = repository or get_widb_repository()
     
     # Wallet Profile Operations
@@ -149,6 +149,41 @@ class WidbService:
         """List wallet profiles with pagination"""
         return self._repo.list_wallet_profiles(limit=limit, offset=offset)
     
+    def list_wallet_profiles_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        order_by: str = "last_seen",
+        min_risk_score: Optional[float] = None
+    ) -> Tuple[List[WalletProfile], Optional[str]]:
+        """List wallet profiles with keyset (cursor) pagination"""
+        return self._repo.list_wallet_profiles_page(
+            limit=limit, cursor=cursor, order_by=order_by, min_risk_score=min_risk_score
+        )
+    
+    def get_wallet_neighborhood(
+        self,
+        address: str,
+        depth: int = 2,
+        include_clusters: bool = True,
+        max_nodes: int = 5000
+    ) -> Dict[str, Any]:
+        """
+        Get the wallet/cluster neighborhood around an address.
+        
+        Args:
+            address: Starting wallet
+            depth: Maximum hops (1-4)
+            include_clusters: Traverse through shared cluster membership
+            max_nodes: Node budget before the traversal is truncated
+            
+        Returns:
+            Dict with nodes, edges and truncation flag
+        """
+        return self._repo.get_neighborhood(
+            address, depth=depth, include_clusters=include_clusters, max_nodes=max_nodes
+        )
+    
     # Association Operations
     
     def get_associations(self, address: str) -> AssociationListResponse:
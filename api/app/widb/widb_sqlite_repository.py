@@ -0,0 +1,742 @@
+"""
+WIDB SQLite Repository - Indexed persistent storage for WIDB
+
+Local SQLite backend for the Whale Intelligence Database:
+- B-tree indexes on risk score, last-seen, entity type and cluster
+- Keyset (cursor) pagination that does not degrade with page depth
+- Aggregate statistics maintained incrementally in a counters table
+- Adjacency-list graph traversal over associations and cluster membership
+
+Implements the same interface as InMemoryWidbRepository.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
+import json
+import logging
+import sqlite3
+import threading
+
+from .widb_models import (
+    WalletProfile,
+    WalletProfileCreate,
+    WalletProfileUpdate,
+    ClusterHistory,
+    ClusterHistoryCreate,
+    Association,
+    AssociationCreate,
+    EntityType,
+    RiskLevel,
+    RelationshipType,
+)
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# SQLite caps bound parameters per statement; keep IN (...) batches below it
+_IN_BATCH = 900
+
+# Sort orders supported by keyset pagination (descending)
+WALLET_ORDERS = {
+    "last_seen": "last_seen",
+    "risk_score": "risk_score",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS wallet_profiles (
+    address TEXT PRIMARY KEY,
+    entity_type TEXT NOT NULL,
+    risk_score REAL NOT NULL,
+    tags TEXT NOT NULL,
+    first_seen INTEGER NOT NULL,
+    last_seen INTEGER NOT NULL,
+    total_clusters INTEGER NOT NULL DEFAULT 0,
+    notes TEXT,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_wallet_last_seen ON wallet_profiles (last_seen DESC, address DESC);
+CREATE INDEX IF NOT EXISTS idx_wallet_risk ON wallet_profiles (risk_score DESC, address DESC);
+CREATE INDEX IF NOT EXISTS idx_wallet_entity_type ON wallet_profiles (entity_type);
+
+CREATE TABLE IF NOT EXISTS associations (
+    id TEXT PRIMARY KEY,
+    address TEXT NOT NULL,
+    linked_address TEXT NOT NULL,
+    pair_lo TEXT NOT NULL,
+    pair_hi TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    relationship_type TEXT NOT NULL,
+    first_seen INTEGER NOT NULL,
+    last_seen INTEGER NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_assoc_pair ON associations (pair_lo, pair_hi);
+CREATE INDEX IF NOT EXISTS idx_assoc_address ON associations (address);
+CREATE INDEX IF NOT EXISTS idx_assoc_linked ON associations (linked_address);
+
+CREATE TABLE IF NOT EXISTS cluster_history (
+    id TEXT PRIMARY KEY,
+    cluster_id TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    related_addresses TEXT NOT NULL,
+    risk_level TEXT NOT NULL,
+    label TEXT,
+    source TEXT NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cluster_ts ON cluster_history (ts DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_cluster_cluster_id ON cluster_history (cluster_id);
+
+CREATE TABLE IF NOT EXISTS cluster_members (
+    record_id TEXT NOT NULL,
+    address TEXT NOT NULL,
+    PRIMARY KEY (address, record_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_cluster_members_record ON cluster_members (record_id);
+
+CREATE TABLE IF NOT EXISTS widb_counters (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (kind, key)
+) WITHOUT ROWID;
+"""
+
+
+def _to_micros(value: datetime) -> int:
+    return (value - _EPOCH) // _ONE_MICROSECOND
+
+
+def _from_micros(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _enum_value(value: Any) -> str:
+    return value.value if hasattr(value, "value") else str(value)
+
+
+class SqliteWidbRepository:
+    """
+    SQLite implementation of the WIDB repository.
+
+    Thread-safe (single connection guarded by a lock, WAL journal).
+    Use ":memory:" as the path for an ephemeral database.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self._path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _normalize_address(self, address: str) -> str:
+        """Normalize address to lowercase"""
+        return address.lower().strip()
+
+    # Counters (incremental aggregate stats)
+
+    def _bump(self, kind: str, key: str, delta: int) -> None:
+        self._conn.execute(
+            "INSERT INTO widb_counters (kind, key, count) VALUES (?, ?, ?) "
+            "ON CONFLICT (kind, key) DO UPDATE SET count = count + excluded.count",
+            (kind, key, delta),
+        )
+
+    # Row mapping
+
+    def _row_to_profile(self, row: sqlite3.Row) -> WalletProfile:
+        return WalletProfile(
+            address=row["address"],
+            entity_type=row["entity_type"],
+            risk_score=row["risk_score"],
+            tags=json.loads(row["tags"]),
+            first_seen=_from_micros(row["first_seen"]),
+            last_seen=_from_micros(row["last_seen"]),
+            total_clusters=row["total_clusters"],
+            notes=row["notes"],
+            metadata=json.loads(row["metadata"]),
+        )
+
+    def _row_to_association(self, row: sqlite3.Row) -> Association:
+        return Association(
+            id=row["id"],
+            address=row["address"],
+            linked_address=row["linked_address"],
+            confidence=row["confidence"],
+            relationship_type=row["relationship_type"],
+            first_seen=_from_micros(row["first_seen"]),
+            last_seen=_from_micros(row["last_seen"]),
+            metadata=json.loads(row["metadata"]),
+        )
+
+    def _row_to_cluster(self, row: sqlite3.Row) -> ClusterHistory:
+        return ClusterHistory(
+            id=row["id"],
+            cluster_id=row["cluster_id"],
+            timestamp=_from_micros(row["ts"]),
+            related_addresses=json.loads(row["related_addresses"]),
+            risk_level=row["risk_level"],
+            label=row["label"],
+            source=row["source"],
+            metadata=json.loads(row["metadata"]),
+        )
+
+    def _write_profile(self, profile: WalletProfile) -> None:
+        self._conn.execute(
+            "UPDATE wallet_profiles SET entity_type = ?, risk_score = ?, tags = ?, last_seen = ?, "
+            "total_clusters = ?, notes = ?, metadata = ? WHERE address = ?",
+            (
+                _enum_value(profile.entity_type),
+                profile.risk_score,
+                json.dumps(profile.tags),
+                _to_micros(profile.last_seen),
+                profile.total_clusters,
+                profile.notes,
+                json.dumps(profile.metadata),
+                profile.address,
+            ),
+        )
+
+    # Wallet Profile Methods
+
+    def upsert_wallet_profile(self, profile: WalletProfileCreate) -> WalletProfile:
+        """
+        Create or update a wallet profile.
+        If the profile exists, updates last_seen and merges tags.
+        """
+        address = self._normalize_address(profile.address)
+
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            existing = self.get_wallet_profile(address)
+
+            if existing:
+                old_type = _enum_value(existing.entity_type)
+                existing.last_seen = datetime.utcnow()
+
+                if profile.tags:
+                    existing_tags = set(existing.tags)
+                    existing_tags.update(profile.tags)
+                    existing.tags = list(existing_tags)
+
+                if profile.entity_type and profile.entity_type != EntityType.UNKNOWN:
+                    existing.entity_type = profile.entity_type
+                if profile.risk_score and profile.risk_score > 0:
+                    existing.risk_score = max(existing.risk_score, profile.risk_score)
+                if profile.notes:
+                    existing.notes = profile.notes
+                if profile.metadata:
+                    existing.metadata.update(profile.metadata)
+
+                new_type = _enum_value(existing.entity_type)
+                if new_type != old_type:
+                    self._bump("wallets_by_type", old_type, -1)
+                    self._bump("wallets_by_type", new_type, 1)
+                self._write_profile(existing)
+                return existing
+
+            now = datetime.utcnow()
+            new_profile = WalletProfile(
+                address=address,
+                entity_type=profile.entity_type or EntityType.UNKNOWN,
+                risk_score=profile.risk_score or 0.0,
+                tags=profile.tags or [],
+                first_seen=now,
+                last_seen=now,
+                total_clusters=0,
+                notes=profile.notes,
+                metadata=profile.metadata or {}
+            )
+            self._insert_profiles([new_profile])
+            return new_profile
+
+    def _insert_profiles(self, profiles: Iterable[WalletProfile]) -> int:
+        rows = [
+            (
+                p.address,
+                _enum_value(p.entity_type),
+                p.risk_score,
+                json.dumps(p.tags),
+                _to_micros(p.first_seen),
+                _to_micros(p.last_seen),
+                p.total_clusters,
+                p.notes,
+                json.dumps(p.metadata),
+            )
+            for p in profiles
+        ]
+        self._conn.executemany(
+            "INSERT INTO wallet_profiles (address, entity_type, risk_score, tags, first_seen, "
+            "last_seen, total_clusters, notes, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        by_type: Dict[str, int] = {}
+        for row in rows:
+            by_type[row[1]] = by_type.get(row[1], 0) + 1
+        for entity_type, count in by_type.items():
+            self._bump("wallets_by_type", entity_type, count)
+        self._bump("total", "wallets", len(rows))
+        return len(rows)
+
+    def bulk_insert_wallet_profiles(self, profiles: Iterable[WalletProfile]) -> int:
+        """
+        Insert many new wallet profiles in one transaction.
+
+        Addresses must not already exist. Returns the number inserted.
+        """
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            return self._insert_profiles(profiles)
+
+    def get_wallet_profile(self, address: str) -> Optional[WalletProfile]:
+        """Get a wallet profile by address"""
+        address = self._normalize_address(address)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM wallet_profiles WHERE address = ?", (address,)
+            ).fetchone()
+            return self._row_to_profile(row) if row else None
+
+    def update_wallet_profile(self, address: str, update: WalletProfileUpdate) -> Optional[WalletProfile]:
+        """Update an existing wallet profile"""
+        address = self._normalize_address(address)
+
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            profile = self.get_wallet_profile(address)
+            if not profile:
+                return None
+
+            old_type = _enum_value(profile.entity_type)
+            if update.entity_type is not None:
+                profile.entity_type = update.entity_type
+            if update.risk_score is not None:
+                profile.risk_score = update.risk_score
+            if update.tags is not None:
+                profile.tags = update.tags
+            if update.notes is not None:
+                profile.notes = update.notes
+            if update.metadata is not None:
+                profile.metadata.update(update.metadata)
+
+            profile.last_seen = datetime.utcnow()
+            new_type = _enum_value(profile.entity_type)
+            if new_type != old_type:
+                self._bump("wallets_by_type", old_type, -1)
+                self._bump("wallets_by_type", new_type, 1)
+            self._write_profile(profile)
+            return profile
+
+    def list_wallet_profiles(self, limit: int = 100, offset: int = 0) -> List[WalletProfile]:
+        """List wallet profiles by last_seen descending (index-backed)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM wallet_profiles ORDER BY last_seen DESC, address DESC LIMIT ? OFFSET ?",
+                (limit, offset),
+            ).fetchall()
+            return [self._row_to_profile(r) for r in rows]
+
+    def list_wallet_profiles_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        order_by: str = "last_seen",
+        min_risk_score: Optional[float] = None,
+    ) -> Tuple[List[WalletProfile], Optional[str]]:
+        """
+        Keyset-paginated wallet listing.
+
+        Args:
+            limit: Page size
+            cursor: Opaque cursor returned by the previous page (None for first page)
+            order_by: "last_seen" or "risk_score" (both descending)
+            min_risk_score: Optional lower bound on risk score
+
+        Returns:
+            (profiles, next_cursor); next_cursor is None on the last page
+        """
+        if order_by not in WALLET_ORDERS:
+            raise ValueError(f"Unsupported order_by: {order_by}")
+        column = WALLET_ORDERS[order_by]
+
+        clauses, params = [], []
+        if cursor:
+            value_str, _, cursor_address = cursor.partition("|")
+            value = float(value_str) if column == "risk_score" else int(value_str)
+            clauses.append(f"({column}, address) < (?, ?)")
+            params.extend([value, cursor_address])
+        if min_risk_score is not None:
+            clauses.append("risk_score >= ?")
+            params.append(min_risk_score)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            f"SELECT * FROM wallet_profiles {where} "
+            f"ORDER BY {column} DESC, address DESC LIMIT ?"
+        )
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        profiles = [self._row_to_profile(r) for r in rows]
+        next_cursor = None
+        if len(rows) == limit:
+            last = rows[-1]
+            next_cursor = f"{last[column]!r}|{last['address']}"
+        return profiles, next_cursor
+
+    # Association Methods
+
+    def create_association(self, assoc: AssociationCreate) -> Association:
+        """
+        Create a new association between two wallets.
+        If association already exists, updates confidence and last_seen.
+        """
+        address = self._normalize_address(assoc.address)
+        linked_address = self._normalize_address(assoc.linked_address)
+        pair_lo, pair_hi = sorted((address, linked_address))
+        now = datetime.utcnow()
+
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            row = self._conn.execute(
+                "SELECT * FROM associations WHERE pair_lo = ? AND pair_hi = ?",
+                (pair_lo, pair_hi),
+            ).fetchone()
+
+            if row:
+                existing = self._row_to_association(row)
+                existing.confidence = max(existing.confidence, assoc.confidence or 0.5)
+                existing.last_seen = now
+                if assoc.relationship_type and assoc.relationship_type != RelationshipType.UNKNOWN:
+                    existing.relationship_type = assoc.relationship_type
+                if assoc.metadata:
+                    existing.metadata.update(assoc.metadata)
+                self._conn.execute(
+                    "UPDATE associations SET confidence = ?, last_seen = ?, relationship_type = ?, "
+                    "metadata = ? WHERE id = ?",
+                    (
+                        existing.confidence,
+                        _to_micros(now),
+                        _enum_value(existing.relationship_type),
+                        json.dumps(existing.metadata),
+                        existing.id,
+                    ),
+                )
+                return existing
+
+            new_assoc = Association(
+                id=str(uuid4())[:16],
+                address=address,
+                linked_address=linked_address,
+                confidence=assoc.confidence or 0.5,
+                relationship_type=assoc.relationship_type or RelationshipType.UNKNOWN,
+                first_seen=now,
+                last_seen=now,
+                metadata=assoc.metadata or {}
+            )
+            self._insert_associations([new_assoc])
+            return new_assoc
+
+    def _insert_associations(self, associations: Iterable[Association]) -> int:
+        rows = []
+        for a in associations:
+            pair_lo, pair_hi = sorted((a.address, a.linked_address))
+            rows.append((
+                a.id, a.address, a.linked_address, pair_lo, pair_hi, a.confidence,
+                _enum_value(a.relationship_type), _to_micros(a.first_seen),
+                _to_micros(a.last_seen), json.dumps(a.metadata),
+            ))
+        self._conn.executemany(
+            "INSERT INTO associations (id, address, linked_address, pair_lo, pair_hi, confidence, "
+            "relationship_type, first_seen, last_seen, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._bump("total", "associations", len(rows))
+        return len(rows)
+
+    def bulk_insert_associations(self, associations: Iterable[Association]) -> int:
+        """Insert many new associations in one transaction."""
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            return self._insert_associations(associations)
+
+    def get_associations(self, address: str) -> List[Association]:
+        """Get all associations for an address"""
+        address = self._normalize_address(address)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM associations WHERE address = ? "
+                "UNION ALL SELECT * FROM associations WHERE linked_address = ? AND address != ?",
+                (address, address, address),
+            ).fetchall()
+            return [self._row_to_association(r) for r in rows]
+
+    def get_association_by_id(self, assoc_id: str) -> Optional[Association]:
+        """Get an association by ID"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM associations WHERE id = ?", (assoc_id,)).fetchone()
+            return self._row_to_association(row) if row else None
+
+    # Cluster History Methods
+
+    def record_cluster_event(self, event: ClusterHistoryCreate) -> ClusterHistory:
+        """Record a new cluster detection event"""
+        cluster = ClusterHistory(
+            id=str(uuid4())[:16],
+            cluster_id=event.cluster_id,
+            timestamp=datetime.utcnow(),
+            related_addresses=[self._normalize_address(a) for a in event.related_addresses],
+            risk_level=event.risk_level or RiskLevel.UNKNOWN,
+            label=event.label,
+            source=event.source or "unknown",
+            metadata=event.metadata or {}
+        )
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._insert_clusters([cluster])
+        return cluster
+
+    def _insert_clusters(self, clusters: Iterable[ClusterHistory]) -> int:
+        rows, members = [], []
+        by_risk: Dict[str, int] = {}
+        for c in clusters:
+            risk = _enum_value(c.risk_level)
+            rows.append((
+                c.id, c.cluster_id, _to_micros(c.timestamp), json.dumps(c.related_addresses),
+                risk, c.label, c.source, json.dumps(c.metadata),
+            ))
+            by_risk[risk] = by_risk.get(risk, 0) + 1
+            members.extend((c.id, address) for address in set(c.related_addresses))
+
+        self._conn.executemany(
+            "INSERT INTO cluster_history (id, cluster_id, ts, related_addresses, risk_level, label, "
+            "source, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO cluster_members (record_id, address) VALUES (?, ?)", members
+        )
+        self._conn.executemany(
+            "UPDATE wallet_profiles SET total_clusters = total_clusters + 1 WHERE address = ?",
+            [(address,) for _, address in members],
+        )
+        for risk, count in by_risk.items():
+            self._bump("clusters_by_risk", risk, count)
+        self._bump("total", "clusters", len(rows))
+        return len(rows)
+
+    def bulk_insert_cluster_events(self, clusters: Iterable[ClusterHistory]) -> int:
+        """Insert many cluster history records in one transaction."""
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            return self._insert_clusters(clusters)
+
+    def get_cluster_history(self, limit: int = 100, offset: int = 0) -> List[ClusterHistory]:
+        """Get cluster history by timestamp descending (index-backed)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM cluster_history ORDER BY ts DESC, id DESC LIMIT ? OFFSET ?",
+                (limit, offset),
+            ).fetchall()
+            return [self._row_to_cluster(r) for r in rows]
+
+    def get_cluster_history_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ClusterHistory], Optional[str]]:
+        """Keyset-paginated cluster history, newest first."""
+        params: List[Any] = []
+        where = ""
+        if cursor:
+            ts_str, _, record_id = cursor.partition("|")
+            where = "WHERE (ts, id) < (?, ?)"
+            params.extend([int(ts_str), record_id])
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM cluster_history {where} ORDER BY ts DESC, id DESC LIMIT ?", params
+            ).fetchall()
+
+        next_cursor = f"{rows[-1]['ts']}|{rows[-1]['id']}" if len(rows) == limit else None
+        return [self._row_to_cluster(r) for r in rows], next_cursor
+
+    def get_clusters_for_address(self, address: str) -> List[ClusterHistory]:
+        """Get all clusters that include a specific address"""
+        address = self._normalize_address(address)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT h.* FROM cluster_members m JOIN cluster_history h ON h.id = m.record_id "
+                "WHERE m.address = ? ORDER BY h.ts",
+                (address,),
+            ).fetchall()
+            return [self._row_to_cluster(r) for r in rows]
+
+    # Graph Traversal
+
+    def _batched(self, sql: str, keys: List[str]) -> List[sqlite3.Row]:
+        """Run ``sql`` (containing a single {in} placeholder) over keys in IN-batches."""
+        rows: List[sqlite3.Row] = []
+        for i in range(0, len(keys), _IN_BATCH):
+            batch = keys[i:i + _IN_BATCH]
+            marks = ",".join("?" * len(batch))
+            rows.extend(self._conn.execute(sql.format(marks=marks), batch).fetchall())
+        return rows
+
+    def get_neighborhood(
+        self,
+        address: str,
+        depth: int = 2,
+        include_clusters: bool = True,
+        max_nodes: int = 5000,
+    ) -> Dict[str, Any]:
+        """
+        Breadth-first neighborhood of a wallet over the association graph.
+
+        Wallets are adjacent when they share an association; when
+        ``include_clusters`` is set, wallets are also adjacent to the cluster
+        records they appear in (a cluster hop counts as one level).
+
+        Args:
+            address: Starting wallet address
+            depth: Maximum number of hops (1-4)
+            include_clusters: Traverse through cluster membership
+            max_nodes: Most nodes to return; discovery stops at this many,
+                even part way through a level
+
+        Returns:
+            Dict with nodes (id, kind, depth), edges between returned nodes
+            and a truncated flag
+        """
+        depth = max(1, min(depth, 4))
+        start = self._normalize_address(address)
+
+        seen: Dict[str, Tuple[str, int]] = {start: ("wallet", 0)}
+        edges: List[Dict[str, Any]] = []
+        frontier_wallets: List[str] = [start]
+        frontier_clusters: List[str] = []
+        truncated = False
+
+        def discover(key: str, kind: str, level: int) -> bool:
+            """Add a node unless the cap is reached; True if it is (now) in the result."""
+            nonlocal truncated
+            if key in seen:
+                return True
+            if len(seen) >= max_nodes:
+                truncated = True
+                return False
+            seen[key] = (kind, level)
+            if kind == "wallet":
+                next_wallets.append(key)
+            else:
+                next_clusters.append(key[len("cluster:"):])
+            return True
+
+        with self._lock:
+            for level in range(1, depth + 1):
+                next_wallets: List[str] = []
+                next_clusters: List[str] = []
+
+                if frontier_wallets:
+                    assoc_rows = self._batched(
+                        "SELECT address, linked_address, relationship_type, confidence FROM associations "
+                        "WHERE address IN ({marks})", frontier_wallets,
+                    ) + self._batched(
+                        "SELECT address, linked_address, relationship_type, confidence FROM associations "
+                        "WHERE linked_address IN ({marks})", frontier_wallets,
+                    )
+                    for row in assoc_rows:
+                        if not (discover(row["address"], "wallet", level)
+                                and discover(row["linked_address"], "wallet", level)):
+                            continue
+                        edges.append({
+                            "source": row["address"],
+                            "target": row["linked_address"],
+                            "kind": "association",
+                            "relationship_type": row["relationship_type"],
+                            "confidence": row["confidence"],
+                        })
+
+                    if include_clusters:
+                        for row in self._batched(
+                            "SELECT record_id, address FROM cluster_members WHERE address IN ({marks})",
+                            frontier_wallets,
+                        ):
+                            cluster_key = f"cluster:{row['record_id']}"
+                            if discover(cluster_key, "cluster", level):
+                                edges.append({"source": row["address"], "target": cluster_key, "kind": "member_of"})
+
+                if include_clusters and frontier_clusters:
+                    for row in self._batched(
+                        "SELECT record_id, address FROM cluster_members WHERE record_id IN ({marks})",
+                        frontier_clusters,
+                    ):
+                        if row["address"] not in seen and discover(row["address"], "wallet", level):
+                            edges.append({
+                                "source": row["address"],
+                                "target": f"cluster:{row['record_id']}",
+                                "kind": "member_of",
+                            })
+
+                if len(seen) >= max_nodes:
+                    truncated = truncated or level < depth
+                    break
+                frontier_wallets, frontier_clusters = next_wallets, next_clusters
+                if not frontier_wallets and not frontier_clusters:
+                    break
+
+        unique_edges = {(e["source"], e["target"], e["kind"]): e for e in edges}
+        return {
+            "root": start,
+            "depth": depth,
+            "nodes": [{"id": k, "kind": kind, "depth": d} for k, (kind, d) in seen.items()],
+            "edges": list(unique_edges.values()),
+            "truncated": truncated,
+        }
+
+    # Utility Methods
+
+    def get_stats(self) -> Dict:
+        """Get repository statistics from incrementally maintained counters"""
+        with self._lock:
+            rows = self._conn.execute("SELECT kind, key, count FROM widb_counters").fetchall()
+
+        totals: Dict[str, int] = {}
+        by_type: Dict[str, int] = {}
+        by_risk: Dict[str, int] = {}
+        for row in rows:
+            if row["kind"] == "total":
+                totals[row["key"]] = row["count"]
+            elif row["kind"] == "wallets_by_type" and row["count"]:
+                by_type[row["key"]] = row["count"]
+            elif row["kind"] == "clusters_by_risk" and row["count"]:
+                by_risk[row["key"]] = row["count"]
+
+        return {
+            "total_wallets": totals.get("wallets", 0),
+            "total_associations": totals.get("associations", 0),
+            "total_clusters": totals.get("clusters", 0),
+            "wallets_by_type": by_type,
+            "clusters_by_risk": by_risk,
+        }
+
+    def clear(self):
+        """Clear all data (for testing)"""
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            for table in ("wallet_profiles", "associations", "cluster_history", "cluster_members", "widb_counters"):
+                self._conn.execute(f"DELETE FROM {table}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,110 @@
+"""
+Benchmark: AlertManager.check_alerts with 100,000 alerts against 2,500 coins.
+
+Registers 100,000 alerts (random symbol among the 2,500 coins, random type,
+threshold) and runs refreshes of 2,500 scored coins whose values drift, for
+the previous scan-every-alert loop (reconstructed inline as LegacyAlertManager)
+and the indexed AlertManager. Notification delivery is stubbed out in both,
+so the numbers are the evaluation cost alone. The rate limit is 15 minutes,
+so alerts that fire leave the candidate set for the following refreshes.
+
+Usage (from api/):
+    python -m benchmarks.bench_alert_manager
+"""
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from app.services.alert_manager import AlertManager
+
+ALERTS = 100_000
+COINS = 2_500
+REFRESHES = 5
+TYPES = ["score_above", "score_below", "price_above", "price_below", "whale_seen", "pretrend_above"]
+
+
+class LegacyAlertManager:
+    """The previous check loop: every alert scans the coin list for its symbol."""
+
+    def __init__(self, alerts: Dict[str, Dict[str, Any]], rate_limit_minutes: int = 15):
+        self.alerts = alerts
+        self.rate_limit_minutes = rate_limit_minutes
+        self.sent = 0
+
+    async def _send_alert(self, alert, message, coin):
+        self.sent += 1
+
+    async def check_alerts(self, scored_coins: List[Dict[str, Any]]):
+        for alert_id, alert in self.alerts.items():
+            if not alert["active"]:
+                continue
+            if alert["last_triggered"]:
+                last_triggered = datetime.fromisoformat(alert["last_triggered"])
+                if datetime.utcnow() - last_triggered < timedelta(minutes=self.rate_limit_minutes):
+                    continue
+            symbol = alert["symbol"]
+            coin = next((c for c in scored_coins if c.get("symbol", "").upper() == symbol), None)
+            if not coin:
+                continue
+            alert_type, threshold = alert["alert_type"], alert["threshold"]
+            field = {
+                "score_above": "momentum_score", "score_below": "momentum_score",
+                "price_above": "current_price", "price_below": "current_price",
+                "whale_seen": "whale_confidence", "pretrend_above": "pretrend_prob",
+            }[alert_type]
+            value = coin.get(field, 0)
+            if (value <= threshold) if alert_type.endswith("below") else (value >= threshold):
+                await self._send_alert(alert, "", coin)
+                alert["last_triggered"] = datetime.utcnow().isoformat()
+                alert["trigger_count"] += 1
+
+
+def make_coins(rng: random.Random, refresh: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "symbol": f"coin{i}",
+            "momentum_score": rng.random() * 100,
+            "current_price": rng.random() * 100,
+            "whale_confidence": rng.random(),
+            "pretrend_prob": rng.random(),
+        }
+        for i in range(COINS)
+    ]
+
+
+async def main() -> None:
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(8)
+
+    manager = AlertManager()
+    fired = []
+    manager._send_alert = lambda alert, message, coin: fired.append(alert["alert_id"])
+    for _ in range(ALERTS):
+        alert_type = rng.choice(TYPES)
+        scale = 100 if alert_type.startswith(("score", "price")) else 1
+        # Thresholds near the edge of the range, so only a few percent fire
+        threshold = rng.uniform(0.97, 1.0) * scale if alert_type.endswith(("above", "seen")) else rng.uniform(0, 0.03) * scale
+        await manager.create_alert("user@example.com", f"coin{rng.randrange(COINS)}", alert_type, threshold, ["email"], None)
+
+    legacy = LegacyAlertManager({k: dict(v) for k, v in manager.alerts.items()})
+    refreshes = [make_coins(rng, r) for r in range(REFRESHES)]
+
+    print(f"{ALERTS:,} alerts x {COINS:,} coins, {REFRESHES} refreshes")
+    print(f"{'refresh':<10}{'legacy ms':>12}{'indexed ms':>12}{'fired':>8}")
+    for r, coins in enumerate(refreshes):
+        started = time.perf_counter()
+        await legacy.check_alerts(coins)
+        legacy_ms = (time.perf_counter() - started) * 1000
+        before = len(fired)
+        started = time.perf_counter()
+        await manager.check_alerts(coins)
+        indexed_ms = (time.perf_counter() - started) * 1000
+        print(f"{r:<10}{legacy_ms:>12,.1f}{indexed_ms:>12,.2f}{len(fired) - before:>8,}")
+    assert legacy.sent == len(fired)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
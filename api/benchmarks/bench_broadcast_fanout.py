@@ -0,0 +1,127 @@
+"""
+Benchmark: sequential send_json fan-out vs. serialize-once BroadcastHub.
+
+Simulates 1,000 WebSocket clients, 5% of which are slow (each send takes
+SLOW_SEND_MS). Reports how long it takes for every fast client to receive
+each message under both strategies.
+
+Usage (from api/):
+    python -m benchmarks.bench_broadcast_fanout
+"""
+import asyncio
+import json
+import logging
+import statistics
+import time
+from typing import Any, Dict, List
+
+from app.services.broadcast_hub import BroadcastHub, SlowConsumerPolicy
+
+N_CLIENTS = 1000
+SLOW_FRACTION = 0.05
+SLOW_SEND_MS = 20
+N_MESSAGES = 20
+
+PAYLOAD: Dict[str, Any] = {
+    "type": "top_update",
+    "data": [
+        {"id": f"coin-{i}", "symbol": f"C{i}", "momentum_score": 50.0 + i, "delta": 0.5}
+        for i in range(50)
+    ],
+}
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a Starlette WebSocket."""
+
+    def __init__(self, slow: bool):
+        self.slow = slow
+        self.received: List[float] = []
+
+    async def _deliver(self) -> None:
+        if self.slow:
+            await asyncio.sleep(SLOW_SEND_MS / 1000)
+        else:
+            await asyncio.sleep(0)
+        self.received.append(time.perf_counter())
+
+    async def send_json(self, data: Any) -> None:
+        json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        await self._deliver()
+
+    async def send_text(self, data: str) -> None:
+        await self._deliver()
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+def make_clients() -> List[FakeWebSocket]:
+    n_slow = int(N_CLIENTS * SLOW_FRACTION)
+    return [FakeWebSocket(slow=i < n_slow) for i in range(N_CLIENTS)]
+
+
+def summarize(label: str, latencies_ms: List[float], publish_ms: List[float]) -> None:
+    latencies_ms.sort()
+    p50 = statistics.median(latencies_ms)
+    p99 = latencies_ms[int(len(latencies_ms) * 0.99)]
+    print(
+        f"{label:<22} publish p50={statistics.median(publish_ms):8.2f}ms  "
+        f"fast-client delivery p50={p50:8.2f}ms p99={p99:8.2f}ms"
+    )
+
+
+async def bench_sequential() -> None:
+    clients = make_clients()
+    fast = [c for c in clients if not c.slow]
+    latencies, publish = [], []
+
+    for _ in range(N_MESSAGES):
+        for c in fast:
+            c.received.clear()
+        start = time.perf_counter()
+        for ws in clients:
+            await ws.send_json(PAYLOAD)
+        publish.append((time.perf_counter() - start) * 1000)
+        latencies.extend((c.received[-1] - start) * 1000 for c in fast)
+
+    summarize("sequential send_json", latencies, publish)
+
+
+async def bench_hub(policy: SlowConsumerPolicy) -> None:
+    clients = make_clients()
+    fast = [c for c in clients if not c.slow]
+    hub = BroadcastHub(max_queue=8, policy=policy)
+    for i, ws in enumerate(clients):
+        hub.register(ws, client_id=f"c{i}")
+
+    latencies, publish = [], []
+    for _ in range(N_MESSAGES):
+        for c in fast:
+            c.received.clear()
+        start = time.perf_counter()
+        hub.publish(PAYLOAD)
+        publish.append((time.perf_counter() - start) * 1000)
+        while any(not c.received for c in fast):
+            await asyncio.sleep(0)
+        latencies.extend((c.received[-1] - start) * 1000 for c in fast)
+
+    stats = hub.get_stats()
+    await hub.close_all()
+    summarize(f"hub ({policy.value})", latencies, publish)
+    print(
+        f"{'':<22} dropped={stats['total_dropped']} coalesced={stats['total_coalesced']} "
+        f"slow_disconnects={stats['slow_disconnects']} max_pending={stats['max_pending_ms']}ms"
+    )
+
+
+async def main() -> None:
+    logging.getLogger("app.services.broadcast_hub").setLevel(logging.ERROR)
+    print(f"{N_CLIENTS} clients, {int(SLOW_FRACTION * 100)}% slow ({SLOW_SEND_MS}ms/send), {N_MESSAGES} messages")
+    await bench_sequential()
+    for policy in SlowConsumerPolicy:
+        await bench_hub(policy)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
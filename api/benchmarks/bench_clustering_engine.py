@@ -0,0 +1,160 @@
+"""
+Benchmark: ClusteringEngine refresh cost at 2,500 and 25,000 coins.
+
+Runs 5 hourly refreshes of drifting coin features and measures, per refresh,
+the fit time and the result write time for the previous engine (reconstructed
+inline as LegacyClusteringEngine: Python feature loop, a 10-init KMeans every
+time, one hash write per coin) and the warm-started engine writing a single
+assignment blob. Both write to an in-memory Upstash stand-in that counts
+commands; every command is one HTTP round trip against Upstash, so the table
+also shows the time those round trips add at an assumed 1 ms each. The last
+column is the share of coins whose cluster id changed since the previous
+refresh.
+
+Usage (from api/):
+    python -m benchmarks.bench_clustering_engine
+"""
+import asyncio
+import json
+import logging
+import random
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+from sklearn.cluster import KMeans
+from sklearn.preprocessing import StandardScaler
+
+from app.services.clustering_engine import ClusteringEngine
+
+COIN_COUNTS = (2_500, 25_000)
+REFRESHES = 5
+RTT_MS = 1.0
+
+
+class CountingUpstash:
+    """In-memory Upstash commands with a round-trip counter."""
+
+    def __init__(self):
+        self.values: Dict[str, str] = {}
+        self.hashes: Dict[str, Dict[str, str]] = {}
+        self.commands = 0
+
+    async def set(self, key, value, ttl=None):
+        self.commands += 1
+        self.values[key] = value
+        return True
+
+    async def get(self, key):
+        self.commands += 1
+        return self.values.get(key)
+
+    async def hset(self, key, mapping):
+        self.commands += 1
+        self.hashes[key] = mapping
+        return True
+
+
+class LegacyClusteringEngine:
+    """The engine as it was: cold KMeans fit and one coin hash write per coin."""
+
+    def __init__(self, client: CountingUpstash, n_clusters: int = 8):
+        self.client = client
+        self.n_clusters = n_clusters
+        self.assignments: Dict[str, int] = {}
+
+    async def compute_clusters(self, scored_coins: List[Dict[str, Any]]) -> Dict[str, float]:
+        started = time.perf_counter()
+        features = []
+        for coin in scored_coins:
+            market_cap = coin.get("market_cap", 0)
+            total_volume = coin.get("total_volume", 0)
+            volume_ratio = (total_volume / market_cap) if market_cap > 0 else 0
+            features.append([
+                coin.get("momentum_score", 50),
+                volume_ratio * 100,
+                np.log10(market_cap + 1),
+                coin.get("whale_confidence", 0) * 100,
+                coin.get("pretrend_prob", 0.5) * 100,
+            ])
+        features_scaled = StandardScaler().fit_transform(features)
+        cluster_ids = KMeans(n_clusters=self.n_clusters, random_state=42, n_init=10).fit_predict(features_scaled)
+        fit_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        for coin, cluster_id in zip(scored_coins, cluster_ids):
+            coin["cluster_id"] = int(cluster_id)
+            self.assignments[coin["id"]] = int(cluster_id)
+            await self.client.hset(f"ghostquant:coin:{coin['id']}", {k: json.dumps(v) for k, v in coin.items()})
+        return {"fit_ms": fit_ms, "write_ms": (time.perf_counter() - started) * 1000}
+
+
+def make_refreshes(count: int) -> List[List[Dict[str, Any]]]:
+    rng = random.Random(count)
+    base = [
+        {
+            "id": f"coin-{i}",
+            "symbol": f"C{i}",
+            "momentum_score": rng.random() * 100,
+            "market_cap": rng.lognormvariate(17, 2),
+            "total_volume": rng.lognormvariate(15, 2),
+            "whale_confidence": rng.random(),
+            "pretrend_prob": rng.random(),
+        }
+        for i in range(count)
+    ]
+    refreshes = []
+    for _ in range(REFRESHES):
+        for coin in base:
+            coin["momentum_score"] = min(100.0, max(0.0, coin["momentum_score"] + rng.gauss(0, 3)))
+            coin["total_volume"] *= rng.uniform(0.9, 1.1)
+            coin["whale_confidence"] = min(1.0, max(0.0, coin["whale_confidence"] + rng.gauss(0, 0.03)))
+        refreshes.append([dict(coin) for coin in base])
+    return refreshes
+
+
+def churn(before: Dict[str, int], after: Dict[str, int]) -> float:
+    if not before:
+        return float("nan")
+    return 100 * sum(before[k] != after[k] for k in before) / len(before)
+
+
+async def run(count: int) -> None:
+    refreshes = make_refreshes(count)
+    print(f"\n{count:,} coins, {REFRESHES} refreshes")
+    print(f"  {'':<18}{'fit ms':>10}{'write ms':>10}{'commands':>10}{'@1ms RTT ms':>14}{'churn %':>9}")
+
+    legacy_client = CountingUpstash()
+    legacy = LegacyClusteringEngine(legacy_client)
+    for r, coins in enumerate(refreshes):
+        before, commands = dict(legacy.assignments), legacy_client.commands
+        timings = await legacy.compute_clusters(coins)
+        commands = legacy_client.commands - commands
+        total = timings["fit_ms"] + timings["write_ms"] + commands * RTT_MS
+        print(f"  {'legacy #' + str(r):<18}{timings['fit_ms']:>10,.1f}{timings['write_ms']:>10,.1f}"
+              f"{commands:>10,}{total:>14,.1f}{churn(before, legacy.assignments):>9.1f}")
+
+    client = CountingUpstash()
+    engine = ClusteringEngine()
+    engine.redis_cache._upstash = client
+    assignments: Dict[str, int] = {}
+    for r, coins in enumerate(refreshes):
+        commands = client.commands
+        await engine.compute_clusters(coins)
+        commands = client.commands - commands
+        timings = engine.last_timings
+        latest = await engine.get_assignments()
+        total = timings["fit_ms"] + timings["write_ms"] + commands * RTT_MS
+        print(f"  {'warm #' + str(r):<18}{timings['fit_ms']:>10,.1f}{timings['write_ms']:>10,.1f}"
+              f"{commands:>10,}{total:>14,.1f}{churn(assignments, latest):>9.1f}")
+        assignments = latest
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    for count in COIN_COUNTS:
+        asyncio.run(run(count))
+
+
+if __name__ == "__main__":
+    main()
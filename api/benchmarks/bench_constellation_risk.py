@@ -0,0 +1,115 @@
+"""
+Benchmark: ConstellationRiskModelEngine under continuous node updates.
+
+Loads a 100k-node graph (1,000 clusters of 100 nodes), then streams node
+risk updates and reports:
+- compute_node_risk throughput with incremental aggregate maintenance
+- systemic risk read latency: the previous full walk + sort over every
+  node profile (reconstructed inline as `legacy_systemic`) vs.
+  compute_systemic_risk on the running aggregates
+- cluster risk read latency: re-aggregating the member list vs. the
+  registered cluster accumulator
+
+Usage (from api/):
+    python -m benchmarks.bench_constellation_risk [n_nodes]
+"""
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+
+from app.gde.constellation_risk.risk_model_engine import ConstellationRiskModelEngine
+
+CLUSTER_SIZE = 100
+UPDATES = 20_000
+READS = 50
+
+
+def node_data(rng: random.Random) -> dict:
+    return {
+        "hydra_score": rng.random(),
+        "coordination_strength": rng.random(),
+        "is_whale": rng.random() < 0.1,
+        "influence_score": rng.random(),
+        "total_volume_usd": rng.random() * 2e8,
+        "transfer_count": rng.randrange(5_000),
+        "tags": rng.sample(["mixer", "exchange", "kyc", "scam", "bridge"], 2),
+        "centrality_score": rng.random(),
+        "volatility_score": rng.random(),
+        "mixer_hops": rng.choice([-1, 0, 2, 5]),
+        "category": rng.choice(["wallet", "whale", "mixer", "exchange", "contract"]),
+    }
+
+
+def legacy_systemic(engine: ConstellationRiskModelEngine) -> float:
+    """The per-read walk the engine used to do: weighted sum, sort for Gini, factor totals."""
+    profiles = list(engine.node_risks.values())
+    weighted_sum = total_weight = 0.0
+    for p in profiles:
+        weight = 1.0 + p.adjusted_risk_score * 2
+        weighted_sum += p.adjusted_risk_score * weight
+        total_weight += weight
+    sorted_risks = sorted(p.adjusted_risk_score for p in profiles)
+    n = len(sorted_risks)
+    cumsum = sum((i + 1) * r for i, r in enumerate(sorted_risks))
+    concentration = (2 * cumsum) / (n * sum(sorted_risks)) - (n + 1) / n
+    factor_totals = defaultdict(float)
+    for p in profiles:
+        for factor, score in p.risk_factors.items():
+            factor_totals[factor] += score
+    sum(1 for p in profiles if p.risk_category.value in ("high", "critical"))
+    return concentration
+
+
+def legacy_cluster(engine: ConstellationRiskModelEngine, node_ids) -> float:
+    profiles = [engine.node_risks[nid] for nid in node_ids if nid in engine.node_risks]
+    weights = [1.0 + p.adjusted_risk_score for p in profiles]
+    factor_totals = defaultdict(float)
+    for p in profiles:
+        for factor, score in p.risk_factors.items():
+            factor_totals[factor] += score
+    return sum(p.adjusted_risk_score * w for p, w in zip(profiles, weights)) / sum(weights)
+
+
+def latency_ms(fn, repeat: int = READS) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(n_nodes: int) -> None:
+    rng = random.Random(17)
+    engine = ConstellationRiskModelEngine()
+    node_ids = [f"node-{i}" for i in range(n_nodes)]
+    clusters = {
+        f"cluster-{c}": node_ids[c * CLUSTER_SIZE:(c + 1) * CLUSTER_SIZE]
+        for c in range(n_nodes // CLUSTER_SIZE)
+    }
+
+    start = time.perf_counter()
+    for node_id in node_ids:
+        engine.compute_node_risk(node_id, node_data(rng))
+    for cluster_id, members in clusters.items():
+        engine.compute_cluster_risk(cluster_id, members, {"cohesion_score": rng.random()})
+    print(f"loaded {n_nodes:,} nodes / {len(clusters):,} clusters in {time.perf_counter() - start:.1f}s")
+
+    payloads = [(rng.choice(node_ids), node_data(rng)) for _ in range(UPDATES)]
+    start = time.perf_counter()
+    for node_id, data in payloads:
+        engine.compute_node_risk(node_id, data)
+    elapsed = time.perf_counter() - start
+    print(f"compute_node_risk (incl. aggregates): {UPDATES / elapsed:,.0f} updates/s")
+
+    cluster_id, members = next(iter(clusters.items()))
+    print(f"systemic read  before {latency_ms(lambda: legacy_systemic(engine), 5):9.3f} ms"
+          f"   after {latency_ms(engine.compute_systemic_risk):7.3f} ms")
+    print(f"cluster read   before {latency_ms(lambda: legacy_cluster(engine, members)):9.3f} ms"
+          f"   after {latency_ms(lambda: engine.compute_cluster_risk(cluster_id)):7.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,179 @@
+"""
+Benchmark: ConstellationTimelineEngine with a 24h window of 1,000,000 events.
+
+Builds 1,000,000 events spread evenly over the last 24 hours (random type,
+severity, up to three of 50,000 entities and up to two of 500 clusters),
+stores them in an engine sized to hold all of them, then measures:
+- store throughput
+- get_events() for the default 60 minute window (limit 100)
+- get_events() filtered to critical severity, to one entity, to one cluster
+- build_narrative() for 1 (under 1,000 events), 60 and 120 minutes
+- get_stats()
+
+for the previous deque-backed store (reconstructed inline as LegacyTimeline,
+sharing the same event objects) and the indexed engine.
+
+Usage (from api/):
+    python -m benchmarks.bench_constellation_timeline [events]
+"""
+import logging
+import random
+import sys
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from app.gde.constellation_timeline.timeline_engine import (
+    ConstellationTimelineEngine,
+    ThreatSeverity,
+    TimelineEvent,
+    TimelineEventType,
+)
+
+EVENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+ENTITIES = [f"0x{i:040x}" for i in range(50_000)]
+CLUSTERS = [f"cluster_{i}" for i in range(500)]
+
+
+class LegacyTimeline:
+    """The deque-backed store as it was: every query scans the whole deque."""
+
+    def __init__(self, capacity: int):
+        self.events: deque = deque(maxlen=capacity)
+
+    def get_events(
+        self,
+        window_minutes: int = 60,
+        severity_filter: Optional[List[ThreatSeverity]] = None,
+        limit: int = 100,
+        entity_id: Optional[str] = None,
+    ) -> List[TimelineEvent]:
+        cutoff_str = (datetime.utcnow() - timedelta(minutes=window_minutes)).isoformat()
+        filtered = []
+        for event in reversed(self.events):
+            if event.timestamp < cutoff_str:
+                continue
+            if severity_filter and event.severity not in severity_filter:
+                continue
+            if entity_id is not None and entity_id not in event.entities_involved:
+                continue
+            filtered.append(event)
+            if len(filtered) >= limit:
+                break
+        return filtered
+
+    def build_narrative(self, window_minutes: int) -> Dict[str, Any]:
+        """The counting passes of the old build_narrative (text assembly omitted)."""
+        events = self.get_events(window_minutes=window_minutes, limit=1000)
+        critical_count = sum(1 for e in events if e.severity == ThreatSeverity.CRITICAL)
+        high_count = sum(1 for e in events if e.severity == ThreatSeverity.HIGH)
+        type_counts: Dict[str, int] = {}
+        for e in events:
+            type_counts[e.event_type.value] = type_counts.get(e.event_type.value, 0) + 1
+        entity_counts: Dict[str, int] = {}
+        cluster_counts: Dict[str, int] = {}
+        for e in events:
+            for entity in e.entities_involved:
+                entity_counts[entity] = entity_counts.get(entity, 0) + 1
+            for cluster in e.clusters_involved:
+                cluster_counts[cluster] = cluster_counts.get(cluster, 0) + 1
+        important = [e for e in events if e.severity in [ThreatSeverity.CRITICAL, ThreatSeverity.HIGH]][:5]
+        return {
+            "critical": critical_count,
+            "high": high_count,
+            "types": type_counts,
+            "entities": sorted(entity_counts.items(), key=lambda x: x[1], reverse=True)[:5],
+            "clusters": sorted(cluster_counts.items(), key=lambda x: x[1], reverse=True)[:3],
+            "important": important,
+            "events": [e.to_dict() for e in events[:50]],
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        severity_counts: Dict[str, int] = {}
+        type_counts: Dict[str, int] = {}
+        for e in self.events:
+            severity_counts[e.severity.value] = severity_counts.get(e.severity.value, 0) + 1
+            type_counts[e.event_type.value] = type_counts.get(e.event_type.value, 0) + 1
+        return {"severity_distribution": severity_counts, "event_type_distribution": type_counts}
+
+
+def make_events(count: int) -> List[TimelineEvent]:
+    rng = random.Random(11)
+    types = list(TimelineEventType)
+    severities = list(ThreatSeverity)
+    # CRITICAL is rare, as in production
+    weights = [1, 10, 30, 30, 29]
+    start = datetime.utcnow() - timedelta(hours=24)
+    step = 24 * 3600 / count
+    events = []
+    for i in range(count):
+        events.append(TimelineEvent(
+            event_id=f"tl_{i}",
+            event_type=rng.choice(types),
+            severity=rng.choices(severities, weights)[0],
+            title="event",
+            description="",
+            timestamp=(start + timedelta(seconds=i * step)).isoformat(),
+            entities_involved=rng.sample(ENTITIES, rng.randrange(0, 4)),
+            clusters_involved=rng.sample(CLUSTERS, rng.randrange(0, 3)),
+        ))
+    return events
+
+
+def timed(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    print(f"building {EVENTS:,} events ...")
+    events = make_events(EVENTS)
+
+    legacy = LegacyTimeline(EVENTS)
+    started = time.perf_counter()
+    for event in events:
+        legacy.events.append(event)
+    legacy_store = time.perf_counter() - started
+
+    engine = ConstellationTimelineEngine(max_events=EVENTS)
+    started = time.perf_counter()
+    for event in events:
+        engine.store_event(event)
+    indexed_store = time.perf_counter() - started
+
+    entity = next(e for e in reversed(events) if e.entities_involved).entities_involved[0]
+    cluster = next(e for e in reversed(events) if e.clusters_involved).clusters_involved[0]
+    critical = [ThreatSeverity.CRITICAL]
+
+    rows = [
+        ("store (events/s)", EVENTS / legacy_store, EVENTS / indexed_store),
+        ("get_events 60m limit 100 (ms)",
+         timed(lambda: legacy.get_events(60)), timed(lambda: engine.get_events(60))),
+        ("get_events critical (ms)",
+         timed(lambda: legacy.get_events(60, critical)), timed(lambda: engine.get_events(60, critical))),
+        ("get_events entity (ms)",
+         timed(lambda: legacy.get_events(60, entity_id=entity)), timed(lambda: engine.get_events(60, entity_id=entity))),
+        ("build_narrative 60m (ms)",
+         timed(lambda: legacy.build_narrative(60)), timed(lambda: engine.build_narrative(60))),
+        # Fewer than 1,000 events in the window: the old scan never hit its limit
+        ("build_narrative 1m (ms)",
+         timed(lambda: legacy.build_narrative(1), 3), timed(lambda: engine.build_narrative(1))),
+        ("build_narrative 120m (ms)",
+         timed(lambda: legacy.build_narrative(120)), timed(lambda: engine.build_narrative(120))),
+        ("get_stats (ms)", timed(legacy.get_stats, 3), timed(engine.get_stats)),
+    ]
+    print(f"get_events cluster (ms): indexed {timed(lambda: engine.get_events(60, cluster_id=cluster)):.3f}")
+
+    print(f"{'metric':<32}{'legacy':>14}{'indexed':>14}")
+    for name, before, after in rows:
+        print(f"{name:<32}{before:>14,.3f}{after:>14,.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark: GlobalRadarEngine heatmap latency vs. event volume.
+
+Ingests 10k, 100k and 1M events spread over the last 24h (4 chains,
+5k entities, 200 tokens, 50 clusters) and reports 1h / 6h / 24h
+compute_heatmap latency for:
+- the previous implementation, which kept every event and rescanned it
+  per heatmap (reconstructed inline as LegacyRadar; skipped above 100k
+  events, where it takes minutes)
+- the per-minute bucket aggregates
+
+Usage (from api/):
+    python -m benchmarks.bench_global_radar_heatmap
+"""
+import contextlib
+import io
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.gde.intel.global_radar_engine import GlobalRadarEngine
+
+VOLUMES = (10_000, 100_000, 1_000_000)
+TIMEFRAMES = ("1h", "6h", "24h")
+LEGACY_MAX_EVENTS = 100_000
+CHAINS = ["ethereum", "solana", "bsc", "arbitrum"]
+
+
+class LegacyRadar(GlobalRadarEngine):
+    """Keeps raw events and rescans them per heatmap, as the engine used to."""
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def ingest_event(self, event):
+        self.events.append(event)
+        return super().ingest_event(event)
+
+    def compute_heatmap(self, timeframe: str = "1h"):
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=self._parse_timeframe(timeframe))
+        recent_events = [e for e in self.events if self._parse_timestamp(e.get('timestamp')) >= cutoff_time]
+        temp = {}
+        for event in recent_events:
+            keys = self._event_keys(event)
+            event_risk = self._event_risk(event)
+            for dimension, key in keys.items():
+                scores = temp.setdefault(dimension, {})
+                scores[key] = scores.get(key, []) + [event_risk]
+        return {d: {k: sum(v) / len(v) for k, v in scores.items()} for d, scores in temp.items()}
+
+
+def build_events(n: int, rng: random.Random):
+    now = datetime.now(timezone.utc)
+    for _ in range(n):
+        event = {
+            'chain': rng.choice(CHAINS),
+            'entity': f"0x{rng.randrange(5_000):040x}",
+            'token': f"TKN{rng.randrange(200)}",
+            'manipulation_risk': rng.random(),
+            'volatility': rng.random(),
+            'timestamp': (now - timedelta(seconds=rng.random() * 86_400)).isoformat(),
+        }
+        if rng.random() < 0.2:
+            event['cluster_id'] = rng.randrange(1, 51)
+        yield event
+
+
+def time_ms(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    print(f"{'events':>10} {'engine':<16} " + " ".join(f"{tf:>10}" for tf in TIMEFRAMES) + f" {'buckets':>8}")
+    for volume in VOLUMES:
+        engines = [("buckets (after)", GlobalRadarEngine())]
+        if volume <= LEGACY_MAX_EVENTS:
+            engines.insert(0, ("rescan (before)", LegacyRadar()))
+        with contextlib.redirect_stdout(io.StringIO()):
+            for event in build_events(volume, random.Random(volume)):
+                for _, engine in engines:
+                    engine.ingest_event(dict(event))
+        for label, engine in engines:
+            with contextlib.redirect_stdout(io.StringIO()):
+                timings = [time_ms(lambda: engine.compute_heatmap(tf)) for tf in TIMEFRAMES]
+            print(f"{volume:>10,} {label:<16} " + " ".join(f"{t:>8.1f}ms" for t in timings)
+                  + f" {len(engine.buckets):>8}")
+
+
+if __name__ == "__main__":
+    main()
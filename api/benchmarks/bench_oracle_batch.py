@@ -0,0 +1,74 @@
+"""
+Benchmark: OracleEyeEngine batch analysis throughput.
+
+Generates randomized image-metadata records (filenames, descriptions and
+tags drawn from the engine's own keyword lists) and reports records/sec for:
+- a per-record analyze_image loop (how /oracle/analyze callers batch today)
+- analyze_batch inline (max_workers=1, shared OracleFeatures per record)
+- analyze_batch on the process pool (max_workers=CPU count)
+
+Usage (from api/):
+    python -m benchmarks.bench_oracle_batch [n_records]
+"""
+import logging
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+from app.gde.oracle_eye.oracle_eye_engine import OracleEyeEngine
+
+CONTENT = ['chart', 'wallet', 'transaction', 'id', 'exchange_ui', 'news', 'contract', '']
+TAGS = [
+    'chart', 'wallet', 'balance', 'tx', 'kyc', 'exchange', 'dashboard', 'twitter',
+    'news', 'document', 'popup', 'alert', 'fake', 'scam', 'edited',
+]
+
+
+def build_records(n: int, engine: OracleEyeEngine, rng: random.Random) -> List[Dict[str, Any]]:
+    words = engine.SUSPICIOUS_PATTERNS + engine.PHISHING_KEYWORDS + engine.EXCHANGE_MIMICS + [
+        'btc', 'price', 'screenshot', 'balance', 'news', 'update',
+    ]
+    records = []
+    for _ in range(n):
+        records.append({
+            'filename': "_".join(rng.choice(words) for _ in range(3)) + rng.choice(['.png', '.jpg']),
+            'description': " ".join(rng.choice(words) for _ in range(8)),
+            'suspected_content': rng.choice(CONTENT),
+            'tags': rng.sample(TAGS, 3),
+            'size_kb': rng.choice([4, 12, 150, 800, 6000]),
+            'extension': rng.choice(['png', 'jpg', 'exe']),
+            'hash': f"{rng.getrandbits(160):040x}",
+            'source': rng.choice(engine.HIGH_RISK_SOURCES + ['twitter', 'unknown']),
+        })
+    return records
+
+
+def measure(label: str, fn, n: int) -> float:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {n / elapsed:>12,.0f} records/s  ({elapsed:6.2f} s)")
+    return n / elapsed
+
+
+def main(n: int) -> None:
+    logging.getLogger("app.gde.oracle_eye").setLevel(logging.ERROR)
+    rng = random.Random(11)
+    single = OracleEyeEngine(max_workers=1)
+    records = build_records(n, single, rng)
+
+    loop = measure("analyze_image loop (before)", lambda: [single.analyze_image(r) for r in records], n)
+    inline = measure("analyze_batch inline", lambda: single.analyze_batch(records), n)
+
+    pooled = OracleEyeEngine(max_workers=os.cpu_count() or 1)
+    pooled.analyze_batch(records[:pooled.BATCH_CHUNK_SIZE * 2])  # warm the pool
+    parallel = measure(f"analyze_batch pool ({pooled.max_workers} procs)", lambda: pooled.analyze_batch(records), n)
+    pooled.shutdown()
+
+    print(f"inline speedup {inline / loop:.1f}x, pool speedup {parallel / loop:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
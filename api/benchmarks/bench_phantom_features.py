@@ -0,0 +1,105 @@
+"""
+Benchmark: PhantomFeatureEngine feature extraction throughput.
+
+Builds transcripts of ~1KB, ~10KB and ~100KB from a mixed vocabulary
+(lexicon phrases, pronouns, filler, mixed case and punctuation) and reports
+transcripts/sec and MB/sec for:
+- the previous per-keyword implementation (reconstructed inline as
+  `legacy_extract`, which rescans the transcript once per keyword)
+- extract_features (single-pass compiled lexicon matcher)
+- extract_features_batch over the same transcripts
+
+Usage (from api/):
+    python -m benchmarks.bench_phantom_features
+"""
+import logging
+import random
+import re
+import time
+from typing import Dict, List
+
+from app.gde.phantom.phantom_feature_engine import PhantomFeatureEngine
+from app.gde.phantom.phantom_schema import PhantomInput
+
+SIZES = (1_000, 10_000, 100_000)
+TARGET_SECONDS = 1.0
+
+FILLER = (
+    "the wallet sent funds to the bridge and we checked the contract logs before the "
+    "listing went live on the exchange with new liquidity"
+).split()
+
+
+def build_transcript(size: int, engine: PhantomFeatureEngine, rng: random.Random) -> str:
+    vocab = (
+        engine.DECEPTION_KEYWORDS + engine.URGENCY_KEYWORDS + engine.MANIPULATION_KEYWORDS
+        + engine.HEDGE_WORDS + engine.CONFIDENCE_WORDS + engine.POSITIVE_WORDS
+        + engine.FEAR_WORDS + engine.GUILT_WORDS + ["I", "you", "they", "Me"]
+    )
+    parts: List[str] = []
+    length = 0
+    while length < size:
+        word = rng.choice(vocab) if rng.random() < 0.15 else rng.choice(FILLER)
+        if rng.random() < 0.05:
+            word = word.capitalize()
+        word += rng.choice([" ", " ", " ", ". ", "? ", "! "])
+        parts.append(word)
+        length += len(word)
+    return "".join(parts)[:size]
+
+
+def legacy_lexicon_counts(engine: PhantomFeatureEngine, transcript: str) -> Dict[str, float]:
+    """The per-keyword scans the engine used to do, for reference timing."""
+    out = {}
+    words = transcript.split()
+    for name in ("DECEPTION_KEYWORDS", "URGENCY_KEYWORDS", "MANIPULATION_KEYWORDS", "EVASION_KEYWORDS"):
+        out[name] = sum(1 for kw in getattr(engine, name) if kw in transcript)
+    for name in (
+        "HEDGE_WORDS", "CONTRADICTION_INDICATORS", "CONFIDENCE_WORDS", "UNCERTAINTY_WORDS",
+        "AGGRESSION_WORDS", "DEFLECTION_WORDS", "POSITIVE_WORDS", "NEGATIVE_WORDS",
+        "FEAR_WORDS", "ANGER_WORDS", "GUILT_WORDS", "SYMPATHY_WORDS",
+    ):
+        out[name] = sum(transcript.count(w) for w in getattr(engine, name))
+    out['first'] = len(re.findall(r'\b(i|me|my|mine|myself)\b', transcript))
+    out['second'] = len(re.findall(r'\b(you|your|yours|yourself)\b', transcript))
+    out['third'] = len(re.findall(r'\b(he|she|they|them|their)\b', transcript))
+    word_freq = {}
+    for word in transcript.split():
+        word_freq[word] = word_freq.get(word, 0) + 1
+    out['unique'] = len(set(words))
+    out['caps'] = sum(1 for c in transcript if c.isupper())
+    out['sentences'] = len([s.strip() for s in re.split(r'[.!?]+', transcript) if s.strip()])
+    return out
+
+
+def rate(fn, n_items: int) -> float:
+    runs, start = 0, time.perf_counter()
+    while True:
+        fn()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= TARGET_SECONDS:
+            return runs * n_items / elapsed
+
+
+def main() -> None:
+    logging.getLogger("app.gde.phantom").setLevel(logging.ERROR)
+    rng = random.Random(42)
+    engine = PhantomFeatureEngine()
+
+    print(f"{'size':>8} {'legacy scans/s':>15} {'single/s':>10} {'batch/s':>10} {'MB/s':>8} {'speedup':>8}")
+    for size in SIZES:
+        inputs = [PhantomInput(transcript=build_transcript(size, engine, rng)) for _ in range(16)]
+        lowered = [i.transcript.lower() for i in inputs]
+
+        legacy = rate(lambda: [legacy_lexicon_counts(engine, t) for t in lowered], len(inputs))
+        single = rate(lambda: [engine.extract_features(i) for i in inputs], len(inputs))
+        batch = rate(lambda: engine.extract_features_batch(inputs), len(inputs))
+        print(
+            f"{size:>8,} {legacy:>15,.0f} {single:>10,.0f} {batch:>10,.0f} "
+            f"{batch * size / 1e6:>8.1f} {batch / legacy:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
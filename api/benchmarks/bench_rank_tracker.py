@@ -0,0 +1,206 @@
+"""
+Benchmark: RankTracker record and query cost at 2,500 and 25,000 coins.
+
+Records 30 refreshes of randomly drifting momentum scores, then measures:
+- record_ranks() per refresh
+- get_rank_changes(minutes=15) from a fresh tracker (cold) and again (warm)
+- get_rank_history(coin, hours=24)
+
+for the previous per-coin sorted-set tracker (reconstructed inline as
+LegacyRankTracker) and the snapshot tracker. Both talk to an in-memory
+Upstash stand-in that counts commands; every command is one HTTP round trip
+against Upstash, so the table also shows the time those round trips add at
+an assumed 1 ms each.
+
+Usage (from api/):
+    python -m benchmarks.bench_rank_tracker
+"""
+import asyncio
+import json
+import logging
+import random
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+from app.services.rank_snapshots import RankSnapshotStore
+from app.services.rank_tracker import RankTracker
+
+COIN_COUNTS = (2_500, 25_000)
+REFRESHES = 30
+RTT_MS = 1.0
+
+
+class CountingUpstash:
+    """In-memory Upstash commands with a round-trip counter."""
+
+    def __init__(self):
+        self.values: Dict[str, str] = {}
+        self.lists: Dict[str, List[str]] = {}
+        self.zsets: Dict[str, Dict[str, float]] = {}
+        self.hashes: Dict[str, Dict[str, str]] = {}
+        self.commands = 0
+
+    async def set(self, key, value, ttl=None):
+        self.commands += 1
+        self.values[key] = value
+        return True
+
+    async def mget(self, keys):
+        self.commands += 1
+        return [self.values.get(key) for key in keys]
+
+    async def rpush(self, key, *values):
+        self.commands += 1
+        self.lists.setdefault(key, []).extend(values)
+        return len(self.lists[key])
+
+    async def lrange(self, key, start, stop):
+        self.commands += 1
+        return self.lists.get(key, [])[start:]
+
+    async def expire(self, key, seconds):
+        self.commands += 1
+        return True
+
+    async def zadd(self, key, mapping):
+        self.commands += 1
+        self.zsets.setdefault(key, {}).update(mapping)
+        return True
+
+    async def zrevrange(self, key, start, stop):
+        self.commands += 1
+        return sorted(self.zsets.get(key, {}), key=self.zsets.get(key, {}).get, reverse=True)
+
+    async def zrangebyscore(self, key, min_score, max_score):
+        self.commands += 1
+        high = float(max_score)
+        return sorted(
+            ((member, float(score)) for member, score in self.zsets.get(key, {}).items() if min_score <= score <= high),
+            key=lambda pair: pair[1],
+        )
+
+    async def zremrangebyscore(self, key, min_score, max_score):
+        self.commands += 1
+        zset = self.zsets.get(key, {})
+        for member in [m for m, score in zset.items() if min_score <= score <= max_score]:
+            del zset[member]
+        return True
+
+    async def hgetall(self, key):
+        self.commands += 1
+        return self.hashes.get(key, {})
+
+
+class LegacyRankTracker:
+    """The per-coin tracker as it was: three commands per coin per refresh."""
+
+    def __init__(self, client: CountingUpstash):
+        self.client = client
+
+    async def record_ranks(self, scored_coins: List[Dict[str, Any]]) -> None:
+        sorted_coins = sorted(scored_coins, key=lambda x: x.get("momentum_score", 0), reverse=True)
+        for rank, coin in enumerate(sorted_coins, start=1):
+            timestamp = int(datetime.utcnow().timestamp())
+            key = f"ghostquant:rank_history:{coin['id']}"
+            await self.client.zadd(key, {f"{timestamp}:{rank}:{coin['momentum_score']}": timestamp})
+            await self.client.zremrangebyscore(key, 0, timestamp - 24 * 3600)
+            await self.client.expire(key, 86400 * 2)
+
+    async def get_rank_history(self, coin_id: str, minutes: int) -> List[Dict[str, Any]]:
+        timestamp = int(datetime.utcnow().timestamp())
+        entries = await self.client.zrangebyscore(f"ghostquant:rank_history:{coin_id}", timestamp - minutes * 60, timestamp)
+        history = []
+        for entry, ts in entries:
+            parts = entry.split(":")
+            history.append({"timestamp": int(ts), "rank": int(parts[1]), "momentum_score": float(parts[2])})
+        return history
+
+    async def get_rank_changes(self, minutes: int = 15, limit: int = 25) -> List[Dict[str, Any]]:
+        coin_ids = await self.client.zrevrange("ghostquant:momentum:latest", 0, -1)
+        coins = []
+        for coin_id in coin_ids:
+            data = await self.client.hgetall(f"ghostquant:coin:{coin_id}")
+            coins.append({k: json.loads(v) if k == "momentum_score" else v for k, v in data.items()})
+        sorted_coins = sorted(coins, key=lambda x: x.get("momentum_score", 0), reverse=True)
+        changes = []
+        for idx, coin in enumerate(sorted_coins):
+            history = await self.get_rank_history(coin["id"], minutes)
+            if history and idx + 1 != history[0]["rank"]:
+                changes.append({"id": coin["id"], "rank_delta": idx + 1 - history[0]["rank"]})
+        changes.sort(key=lambda x: abs(x["rank_delta"]), reverse=True)
+        return changes[:limit]
+
+
+def make_refreshes(count: int) -> List[List[Dict[str, Any]]]:
+    rng = random.Random(count)
+    scores = [rng.random() * 100 for _ in range(count)]
+    refreshes = []
+    for _ in range(REFRESHES):
+        scores = [min(100.0, max(0.0, s + rng.gauss(0, 2))) for s in scores]
+        refreshes.append([
+            {"id": f"coin-{i}", "symbol": f"C{i}", "name": f"Coin {i}", "momentum_score": round(s, 4)}
+            for i, s in enumerate(scores)
+        ])
+    return refreshes
+
+
+async def measure(client: CountingUpstash, coro) -> tuple:
+    commands = client.commands
+    started = time.perf_counter()
+    await coro
+    return (time.perf_counter() - started) * 1000, client.commands - commands
+
+
+def row(name: str, cpu_ms: float, commands: int) -> None:
+    print(f"  {name:<34}{commands:>10,}{cpu_ms:>12,.1f}{cpu_ms + commands * RTT_MS:>14,.1f}")
+
+
+async def run(count: int) -> None:
+    refreshes = make_refreshes(count)
+    print(f"\n{count:,} coins, {REFRESHES} refreshes")
+    print(f"  {'':<34}{'commands':>10}{'cpu ms':>12}{'@1ms RTT ms':>14}")
+
+    legacy_client = CountingUpstash()
+    legacy = LegacyRankTracker(legacy_client)
+    cpu = commands = 0.0
+    for coins in refreshes:
+        c, n = await measure(legacy_client, legacy.record_ranks(coins))
+        cpu, commands = cpu + c, commands + n
+    row("legacy record_ranks / refresh", cpu / REFRESHES, int(commands / REFRESHES))
+    latest = refreshes[-1]
+    legacy_client.zsets["ghostquant:momentum:latest"] = {c["id"]: c["momentum_score"] for c in latest}
+    for coin in latest:
+        legacy_client.hashes[f"ghostquant:coin:{coin['id']}"] = {
+            "id": coin["id"], "symbol": coin["symbol"], "name": coin["name"], "momentum_score": str(coin["momentum_score"]),
+        }
+    row("legacy get_rank_changes 15m", *await measure(legacy_client, legacy.get_rank_changes(15)))
+    row("legacy get_rank_history 24h", *await measure(legacy_client, legacy.get_rank_history("coin-7", 1440)))
+
+    client = CountingUpstash()
+    tracker = RankTracker(store=RankSnapshotStore())
+    tracker.redis_cache._upstash = client
+    cpu = commands = 0.0
+    for coins in refreshes:
+        c, n = await measure(client, tracker.record_ranks(coins))
+        cpu, commands = cpu + c, commands + n
+        await asyncio.sleep(0.002)
+    row("snapshot record_ranks / refresh", cpu / REFRESHES, int(commands / REFRESHES))
+
+    reader = RankTracker(store=RankSnapshotStore())
+    reader.redis_cache._upstash = client
+    row("snapshot get_rank_changes 15m cold", *await measure(client, reader.get_rank_changes(15)))
+    row("snapshot get_rank_changes 15m warm", *await measure(client, reader.get_rank_changes(15)))
+    row("snapshot get_rank_history 24h", *await measure(client, reader.get_rank_history("coin-7", 24)))
+    payload = sum(len(v) for k, v in client.values.items() if k.startswith("ghostquant:rank_snapshot:"))
+    print(f"  snapshot payload: {payload / REFRESHES / 1024:,.1f} KiB per refresh")
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    for count in COIN_COUNTS:
+        asyncio.run(run(count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: Sentinel dashboard cost with 200 concurrent viewers.
+
+Each viewer requests the dashboard once. The previous endpoint rebuilt the
+whole dashboard per request (every collector, status, alerts, summary and
+serialization); it is reproduced by calling build_dashboard() and to_dict()
+per request. The snapshot endpoint serves the latest published snapshot,
+with concurrent cold-start requests sharing one build. A 2 ms sleep in the
+heartbeat stands in for probing the engine endpoints.
+
+Usage (from api/):
+    python -m benchmarks.bench_sentinel_dashboard
+"""
+import asyncio
+import logging
+import time
+
+from app.gde.sentinel.sentinel_engine import SentinelCommandEngine
+
+VIEWERS = 200
+PROBE_SECONDS = 0.002
+
+
+class ProbingEngine(SentinelCommandEngine):
+    def heartbeat(self):
+        time.sleep(PROBE_SECONDS)
+        return super().heartbeat()
+
+
+async def legacy(engine: SentinelCommandEngine) -> None:
+    async def view():
+        engine.build_dashboard().to_dict()
+
+    await asyncio.gather(*(view() for _ in range(VIEWERS)))
+
+
+async def snapshot(engine: SentinelCommandEngine) -> None:
+    async def view():
+        (await engine.get_snapshot()).payload
+
+    await asyncio.gather(*(view() for _ in range(VIEWERS)))
+
+
+def measure(engine: SentinelCommandEngine, run) -> float:
+    started = time.perf_counter()
+    asyncio.run(run(engine))
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    print(f"{VIEWERS} concurrent viewers")
+    print(f"  {'':<24}{'total ms':>10}{'collections':>13}{'rebuilds':>10}")
+
+    engine = ProbingEngine()
+    ms = measure(engine, legacy)
+    print(f"  {'rebuild per request':<24}{ms:>10,.1f}{engine.stats['collections']:>13,}{engine.stats['refreshes']:>10,}")
+
+    engine = ProbingEngine()
+    ms = measure(engine, snapshot)
+    print(f"  {'snapshot, cold':<24}{ms:>10,.1f}{engine.stats['collections']:>13,}{engine.stats['rebuilds']:>10,}")
+    engine.running = True  # as with the background loop
+    ms = measure(engine, snapshot)
+    print(f"  {'snapshot, warm':<24}{ms:>10,.1f}{engine.stats['collections']:>13,}{engine.stats['rebuilds']:>10,}")
+
+
+if __name__ == "__main__":
+    main()
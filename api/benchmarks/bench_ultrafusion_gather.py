@@ -0,0 +1,95 @@
+"""
+Benchmark: UltraFusion gather_all_intelligence, sequential vs. concurrent fan-out.
+
+Each engine is given a simulated latency (lognormal around its base cost,
+with a 2% chance of a 400ms stall). Reports p50/p99 gather latency for:
+- the previous sequential path (engines called one after another)
+- the concurrent fan-out with a 150ms per-engine deadline, memo disabled
+- the same with a 30s memo over a working set of 50 entities
+
+Usage (from api/):
+    python -m benchmarks.bench_ultrafusion_gather [n_requests]
+"""
+import logging
+import random
+import statistics
+import sys
+import time
+
+from app.gde.api.ultrafusion_engine import UltraFusionSupervisor
+from app.gde.api.ultrafusion_fanout import EngineFanout
+
+BASE_MS = {
+    'predictor': 25, 'dna': 15, 'history': 20, 'correlation': 30, 'fusion': 35,
+    'radar': 40, 'cluster': 15, 'actor': 10, 'ghostwriter': 20,
+}
+STALL_PROBABILITY = 0.02
+STALL_MS = 400
+
+
+class SimulatedSupervisor(UltraFusionSupervisor):
+    """Supervisor whose engines sleep for a simulated latency before answering."""
+
+    def __init__(self, rng: random.Random, **kwargs):
+        super().__init__(**kwargs)
+        self._rng = rng
+        for name in BASE_MS:
+            original = getattr(self, f"_gather_{name}")
+            setattr(self, f"_gather_{name}", self._delayed(name, original))
+
+    def _delayed(self, name, original):
+        def gather(*args):
+            delay = BASE_MS[name] * self._rng.lognormvariate(0, 0.3)
+            if self._rng.random() < STALL_PROBABILITY:
+                delay += STALL_MS
+            time.sleep(delay / 1000)
+            return original(*args)
+        return gather
+
+
+def gather_sequential(supervisor: UltraFusionSupervisor, entity: str, token: str, chain: str) -> None:
+    for call in supervisor._build_gather_plan(entity, token, chain, None):
+        call.fn(*call.args)
+
+
+def report(label: str, samples):
+    samples = sorted(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"{label:<34} p50={statistics.median(samples):8.2f} ms  p99={p99:8.2f} ms")
+
+
+def main(n: int) -> None:
+    logging.getLogger("app.gde.api").setLevel(logging.ERROR)
+    rng = random.Random(5)
+    entities = [f"0x{i:040x}" for i in range(50)]
+
+    sequential = SimulatedSupervisor(rng, fanout=EngineFanout(memo_ttl_seconds=0))
+    samples = []
+    for i in range(n):
+        start = time.perf_counter()
+        gather_sequential(sequential, entities[i % len(entities)], "ETH", "ethereum")
+        samples.append((time.perf_counter() - start) * 1000)
+    report("sequential (before)", samples)
+
+    for label, ttl in (("fan-out, no memo (after)", 0), ("fan-out, 30s memo (after)", 30)):
+        supervisor = SimulatedSupervisor(
+            rng, fanout=EngineFanout(default_deadline_seconds=0.150, memo_ttl_seconds=ttl)
+        )
+        samples, partial = [], 0
+        for i in range(n):
+            start = time.perf_counter()
+            bundle = supervisor.gather_all_intelligence(entities[i % len(entities)], "ETH", "ethereum")
+            samples.append((time.perf_counter() - start) * 1000)
+            partial += bool(bundle['timed_out'])
+        report(label, samples)
+        metrics = supervisor.get_engine_metrics()
+        print(f"{'':<34} partial bundles={partial}/{n} memo hits={metrics['memo']['hits']}")
+        supervisor.fanout.shutdown()
+
+    print("per-engine p50/p99 (ms):")
+    for name, hist in sorted(metrics['engines'].items()):
+        print(f"  {name:<12} {hist['p50_ms']:7.2f} {hist['p99_ms']:7.2f} timeouts={hist['timeouts']}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
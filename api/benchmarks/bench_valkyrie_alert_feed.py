@@ -0,0 +1,112 @@
+"""
+Benchmark: Valkyrie alert feed at 100k alerts per minute.
+
+Replays one simulated minute of 100,000 alerts (timestamps evenly spread,
+random severity / actor type / trigger type) into feeds of 1,000 (the
+default) and 100,000 (a full minute) capacity, then measures:
+- push throughput
+- since() for the last 5 seconds
+- get_by_severity("purple"), get_by_actor_type("SYNDICATE")
+- get_statistics()
+
+for the previous list-backed feed (reconstructed inline as LegacyFeed) and
+the ring-buffer AlertFeedManager.
+
+Usage (from api/):
+    python -m benchmarks.bench_valkyrie_alert_feed
+"""
+import logging
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from app.gde.valkyrie.alert_feed_manager import AlertFeedManager
+from app.gde.valkyrie.valkyrie_schema import ValkyrieAlert
+
+ALERTS_PER_MINUTE = 100_000
+CAPACITIES = (1_000, 100_000)
+SEVERITIES = ["yellow", "orange", "red", "purple"]
+ACTORS = ["WHALE", "GHOST", "INSIDER", "PREDATOR", "SYNDICATE", "MANIPULATOR", "UNKNOWN"]
+TRIGGERS = ["Chain Pressure", "Manipulation Spike", "Volatility Surge", "Coordinated Actor Signature"]
+
+
+class LegacyFeed:
+    """The list-backed feed as it was: re-slice on overflow, full scans for queries."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.alerts: List[ValkyrieAlert] = []
+
+    def push(self, alert: ValkyrieAlert) -> None:
+        self.alerts.append(alert)
+        if len(self.alerts) > self.capacity:
+            self.alerts = self.alerts[-self.capacity:]
+
+    def since(self, timestamp: str) -> List[Dict[str, Any]]:
+        target = datetime.fromisoformat(timestamp)
+        return [a.to_dict() for a in self.alerts if datetime.fromisoformat(a.timestamp) >= target]
+
+    def get_by_severity(self, severity: str) -> List[Dict[str, Any]]:
+        return [a.to_dict() for a in self.alerts if a.severity_level == severity]
+
+    def get_by_actor_type(self, actor_type: str) -> List[Dict[str, Any]]:
+        return [a.to_dict() for a in self.alerts if a.actor_type == actor_type]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {"total_alerts": len(self.alerts), "by_severity": {}, "by_actor_type": {}, "by_trigger_type": {}}
+        for alert in self.alerts:
+            for key, value in (("by_severity", alert.severity_level), ("by_actor_type", alert.actor_type),
+                               ("by_trigger_type", alert.trigger_type)):
+                stats[key][value] = stats[key].get(value, 0) + 1
+        return stats
+
+
+def build_alerts(rng: random.Random, start: datetime) -> List[ValkyrieAlert]:
+    step = 60.0 / ALERTS_PER_MINUTE
+    return [
+        ValkyrieAlert(
+            id=f"VAL-{i}",
+            timestamp=(start + timedelta(seconds=i * step)).isoformat(),
+            actor_type=rng.choice(ACTORS),
+            severity_level=rng.choice(SEVERITIES),
+            trigger_type=rng.choice(TRIGGERS),
+        )
+        for i in range(ALERTS_PER_MINUTE)
+    ]
+
+
+def time_ms(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    logging.getLogger("app.gde.valkyrie").setLevel(logging.ERROR)
+    start = datetime(2026, 1, 1)
+    alerts = build_alerts(random.Random(9), start)
+    last_5s = (start + timedelta(seconds=55)).isoformat()
+
+    print(f"{'feed':<22} {'capacity':>9} {'push/s':>12} {'since 5s':>10} {'severity':>10} {'actor':>10} {'stats':>10}")
+    for capacity in CAPACITIES:
+        for label, factory in (("list (before)", LegacyFeed), ("ring (after)", AlertFeedManager)):
+            feed = factory(capacity)
+            begin = time.perf_counter()
+            for alert in alerts:
+                feed.push(alert)
+            push_rate = len(alerts) / (time.perf_counter() - begin)
+            timings = [
+                time_ms(lambda: feed.since(last_5s)),
+                time_ms(lambda: feed.get_by_severity("purple")),
+                time_ms(lambda: feed.get_by_actor_type("SYNDICATE")),
+                time_ms(feed.get_statistics),
+            ]
+            print(f"{label:<22} {capacity:>9,} {push_rate:>12,.0f} " + " ".join(f"{t:>8.2f}ms" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark: whale_intel movement ingest and recent-movement queries.
+
+Streams N movements (default 1,000,000) across 20,000 addresses into
+WhaleIntelService with a 100,000-movement ceiling, then times:
+- sustained ingest rate (record_movement incl. influence update)
+- get_recent_movements for an address, get_all_recent_movements and
+  token lookups (all O(limit) against the store indexes)
+- the previous list scan + sort over the same retained movements
+
+Peak traced memory is reported to show it stays flat once the ring is full.
+
+Usage (from api/):
+    python -m benchmarks.bench_whale_movement_store [n_movements]
+"""
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from app.gde.whale_intel.models import WhaleMovement
+from app.gde.whale_intel.services import WhaleIntelService
+
+N_ADDRESSES = 20_000
+CAPACITY = 100_000
+SYMBOLS = ["BTC", "ETH", "SOL", "USDT", "USDC", "ARB", "OP", "LINK"]
+
+
+def timed(fn, repeat: int = 200):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(n: int) -> None:
+    rng = random.Random(11)
+    addresses = [f"0x{i:040x}" for i in range(N_ADDRESSES)]
+    service = WhaleIntelService(max_movements=CAPACITY, max_whales=N_ADDRESSES)
+    base = datetime.utcnow() - timedelta(seconds=n)
+
+    tracemalloc.start()
+    checkpoints = []
+    start = time.perf_counter()
+    for i in range(n):
+        service.record_movement(WhaleMovement(
+            from_address=rng.choice(addresses),
+            to_address=rng.choice(addresses),
+            symbol=rng.choice(SYMBOLS),
+            usd_value=rng.uniform(1e5, 5e7),
+            timestamp=base + timedelta(seconds=i),
+        ))
+        if (i + 1) % (n // 5) == 0:
+            checkpoints.append((i + 1, tracemalloc.get_traced_memory()[0] / 1e6))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"ingested {n:,} movements in {elapsed:.1f}s ({n / elapsed:,.0f}/s)")
+    for count, mb in checkpoints:
+        print(f"  after {count:>9,} movements: {mb:7.1f} MB traced")
+    print(f"  peak traced memory: {peak / 1e6:.1f} MB, store: {service.get_store_stats()}")
+
+    address = rng.choice(addresses)
+    ms = timed(lambda: service.get_recent_movements(address, limit=50))
+    print(f"get_recent_movements(limit=50)     {ms:8.3f} ms")
+    ms = timed(lambda: service.get_all_recent_movements(limit=100))
+    print(f"get_all_recent_movements(100)      {ms:8.3f} ms")
+    ms = timed(lambda: service.get_token_movements("ETH", limit=50))
+    print(f"get_token_movements(limit=50)      {ms:8.3f} ms")
+    ms = timed(lambda: service.get_top_whales(limit=50), repeat=20)
+    print(f"get_top_whales(50)                 {ms:8.3f} ms")
+
+    retained = service.get_all_recent_movements(limit=CAPACITY)
+
+    def list_scan():
+        matches = [m for m in retained if m.from_address.lower() == address or m.to_address.lower() == address]
+        matches.sort(key=lambda m: m.timestamp, reverse=True)
+        return matches[:50]
+
+    ms = timed(list_scan, repeat=10)
+    print(f"list scan + sort (reference)       {ms:8.3f} ms")
+    ms = timed(lambda: sorted(retained, key=lambda m: m.timestamp, reverse=True)[:100], repeat=10)
+    print(f"full sort for all recent (ref)     {ms:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
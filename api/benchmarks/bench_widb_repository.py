@@ -0,0 +1,159 @@
+"""
+Benchmark: WIDB list / stats / 2-hop traversal on the SQLite repository.
+
+Loads N wallets (default 1,000,000), ~2 associations per wallet and N/10
+cluster records into a temporary SQLite file, then times:
+- first page by last_seen and by risk_score
+- a deep page via OFFSET vs. via keyset cursor
+- get_stats (counter table) vs. a full GROUP BY scan
+- 2-hop neighborhood traversal
+
+The in-memory repository is timed on the same list/stats calls at a
+smaller size for reference.
+
+Usage (from api/):
+    python -m benchmarks.bench_widb_repository [n_wallets]
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from app.widb.widb_models import Association, ClusterHistory, WalletProfile
+from app.widb.widb_repository import InMemoryWidbRepository
+from app.widb.widb_sqlite_repository import SqliteWidbRepository
+
+ENTITY_TYPES = ["whale", "exchange", "mixer", "exploit", "normal", "unknown"]
+RISK_LEVELS = ["critical", "high", "medium", "low", "unknown"]
+BATCH = 50_000
+
+
+def timed(fn, repeat: int = 5):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def wallets(n: int, rng: random.Random):
+    base = datetime(2024, 1, 1)
+    for i in range(n):
+        seen = base + timedelta(seconds=rng.randrange(0, 365 * 86400))
+        yield WalletProfile(
+            address=f"0x{i:040x}",
+            entity_type=rng.choice(ENTITY_TYPES),
+            risk_score=round(rng.random(), 4),
+            first_seen=seen,
+            last_seen=seen,
+        )
+
+
+def load(repo: SqliteWidbRepository, n: int, rng: random.Random) -> None:
+    batch = []
+    for profile in wallets(n, rng):
+        batch.append(profile)
+        if len(batch) == BATCH:
+            repo.bulk_insert_wallet_profiles(batch)
+            batch = []
+    if batch:
+        repo.bulk_insert_wallet_profiles(batch)
+
+    now = datetime.utcnow()
+    pairs = set()
+    while len(pairs) < n * 2:
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a != b:
+            pairs.add((min(a, b), max(a, b)))
+    batch = []
+    for idx, (a, b) in enumerate(pairs):
+        batch.append(Association(
+            id=f"a{idx}", address=f"0x{a:040x}", linked_address=f"0x{b:040x}",
+            confidence=0.5, first_seen=now, last_seen=now,
+        ))
+        if len(batch) == BATCH:
+            repo.bulk_insert_associations(batch)
+            batch = []
+    if batch:
+        repo.bulk_insert_associations(batch)
+
+    batch = []
+    for idx in range(n // 10):
+        members = [f"0x{rng.randrange(n):040x}" for _ in range(5)]
+        batch.append(ClusterHistory(
+            id=f"c{idx}", cluster_id=f"cluster-{idx % 1000}", timestamp=now,
+            related_addresses=members, risk_level=rng.choice(RISK_LEVELS),
+        ))
+        if len(batch) == BATCH:
+            repo.bulk_insert_cluster_events(batch)
+            batch = []
+    if batch:
+        repo.bulk_insert_cluster_events(batch)
+
+
+def bench_sqlite(n: int) -> None:
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = SqliteWidbRepository(os.path.join(tmp, "widb.sqlite3"))
+        start = time.perf_counter()
+        load(repo, n, rng)
+        print(f"loaded {n:,} wallets in {time.perf_counter() - start:.1f}s")
+
+        ms, _ = timed(lambda: repo.list_wallet_profiles(limit=100))
+        print(f"list first page (last_seen)       {ms:9.2f} ms")
+        ms, _ = timed(lambda: repo.list_wallet_profiles_page(limit=100, order_by="risk_score"))
+        print(f"list first page (risk_score)      {ms:9.2f} ms")
+
+        deep = n // 2
+        ms, _ = timed(lambda: repo.list_wallet_profiles(limit=100, offset=deep), repeat=3)
+        print(f"deep page via OFFSET {deep:,}  {ms:9.2f} ms")
+        row = repo._conn.execute(
+            "SELECT last_seen, address FROM wallet_profiles ORDER BY last_seen DESC, address DESC "
+            "LIMIT 1 OFFSET ?", (deep - 1,)
+        ).fetchone()
+        cursor = f"{row[0]}|{row[1]}"
+        ms, _ = timed(lambda: repo.list_wallet_profiles_page(limit=100, cursor=cursor))
+        print(f"deep page via keyset cursor       {ms:9.2f} ms")
+
+        ms, _ = timed(repo.get_stats)
+        print(f"get_stats (incremental counters)  {ms:9.2f} ms")
+        ms, _ = timed(lambda: repo._conn.execute(
+            "SELECT entity_type, COUNT(*) FROM wallet_profiles GROUP BY entity_type"
+        ).fetchall(), repeat=3)
+        print(f"full GROUP BY scan (reference)    {ms:9.2f} ms")
+
+        roots = [f"0x{rng.randrange(n):040x}" for _ in range(100)]
+        samples, sizes = [], []
+        for root in roots:
+            start = time.perf_counter()
+            hood = repo.get_neighborhood(root, depth=2)
+            samples.append((time.perf_counter() - start) * 1000)
+            sizes.append(len(hood["nodes"]))
+        samples.sort()
+        print(
+            f"2-hop traversal p50={statistics.median(samples):.2f} ms "
+            f"p99={samples[98]:.2f} ms (avg {statistics.mean(sizes):.0f} nodes)"
+        )
+        repo.close()
+
+
+def bench_memory(n: int) -> None:
+    rng = random.Random(7)
+    repo = InMemoryWidbRepository()
+    for profile in wallets(n, rng):
+        repo._wallet_profiles[profile.address] = profile
+    ms, _ = timed(lambda: repo.list_wallet_profiles(limit=100), repeat=3)
+    print(f"in-memory list first page @ {n:,}   {ms:9.2f} ms")
+    ms, _ = timed(repo.get_stats, repeat=3)
+    print(f"in-memory get_stats @ {n:,}         {ms:9.2f} ms")
+
+
+if __name__ == "__main__":
+    n_wallets = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    bench_sqlite(n_wallets)
+    bench_memory(min(n_wallets, 200_000))
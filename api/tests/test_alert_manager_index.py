@@ -0,0 +1,102 @@
+"""
+Unit tests for the indexed AlertManager and its notification dispatcher.
+"""
+import asyncio
+
+from app.services.alert_manager import AlertManager
+from app.services.notification_dispatcher import ChannelRateLimiter, Notification, NotificationDispatcher
+
+
+def test_check_fires_crossed_alerts_once_per_rate_window():
+    async def scenario():
+        manager = AlertManager()
+        sent = []
+        manager._send_alert = lambda alert, message, coin: sent.append(message)
+        ids = {}
+        for name, alert_type, threshold in [
+            ("above_low", "score_above", 40), ("above_high", "score_above", 90),
+            ("below", "score_below", 60), ("price", "price_below", 10), ("other", "score_above", 1),
+        ]:
+            symbol = "other" if name == "other" else "btc"
+            ids[name] = await manager.create_alert("u@x", symbol, alert_type, threshold, ["email"], None)
+
+        coins = [{"symbol": "BTC", "momentum_score": 55.0, "current_price": 20.0}, {"symbol": "btc", "momentum_score": 99.0}]
+        await manager.check_alerts(coins)
+        first = list(sent)
+        await manager.check_alerts(coins)  # rate limited
+        return manager, ids, first, sent
+
+    manager, ids, first, sent = asyncio.run(scenario())
+    assert first == [
+        "BTC momentum score reached 55.0 (threshold: 40)",
+        "BTC momentum score dropped to 55.0 (threshold: 60)",
+    ]
+    assert sent == first
+    assert manager.alerts[ids["above_low"]]["trigger_count"] == 1
+    assert manager.alerts[ids["above_high"]]["trigger_count"] == 0
+
+
+def test_dispatcher_retries_and_rate_limits():
+    async def scenario():
+        calls = []
+
+        async def flaky(notification):
+            calls.append((notification.message, notification.attempts))
+            if notification.message == "bad" or notification.attempts == 1 and notification.message == "retry":
+                raise RuntimeError("boom")
+
+        dispatcher = NotificationDispatcher(
+            {"telegram": flaky}, concurrency=2, max_attempts=2, retry_seconds=0.01, rates={"telegram": 5}
+        )
+        for message in ("ok", "retry", "bad"):
+            dispatcher.submit(Notification("telegram", {"user_contact": "u"}, message, {}))
+        await dispatcher.join()
+        await dispatcher.close()
+
+        limiter = ChannelRateLimiter(per_minute=2)
+        await limiter.acquire()
+        await limiter.acquire()
+        try:
+            await asyncio.wait_for(limiter.acquire(), timeout=0.05)
+            blocked = False
+        except asyncio.TimeoutError:
+            blocked = True
+        return calls, dispatcher.stats["telegram"], blocked
+
+    calls, stats, blocked = asyncio.run(scenario())
+    assert sorted(calls) == [("bad", 1), ("bad", 2), ("ok", 1), ("retry", 1), ("retry", 2)]
+    assert stats == {"sent": 2, "retried": 2, "failed": 1, "dropped": 0}
+    assert blocked
+
+
+def test_close_drains_queue_then_cancels_workers():
+    async def scenario():
+        sent, started = [], asyncio.Event()
+
+        async def send(notification):
+            if notification.message == "stuck":
+                started.set()
+                await asyncio.sleep(3600)
+            await asyncio.sleep(0.01)
+            sent.append(notification.message)
+
+        manager = AlertManager()
+        manager.dispatcher = NotificationDispatcher({"push": send}, concurrency=1, drain_seconds=1, rates={"push": 6000})
+        for message in ("a", "b", "c"):
+            manager.dispatcher.submit(Notification("push", {"user_contact": "u"}, message, {}))
+        workers = list(manager.dispatcher.workers)
+        await manager.close()
+        drained = list(sent)
+
+        stuck = NotificationDispatcher({"push": send}, concurrency=1, drain_seconds=0.05, rates={"push": 6000})
+        stuck.submit(Notification("push", {"user_contact": "u"}, "stuck", {}))
+        await started.wait()
+        stuck_workers = list(stuck.workers)
+        await asyncio.wait_for(stuck.close(), timeout=1)
+        return drained, workers, stuck_workers, stuck
+
+    drained, workers, stuck_workers, stuck = asyncio.run(scenario())
+    assert drained == ["a", "b", "c"]
+    assert workers and all(worker.done() for worker in workers)
+    assert all(worker.cancelled() for worker in stuck_workers)
+    assert stuck.workers == [] and stuck.queues == {}
@@ -0,0 +1,113 @@
+"""
+Unit tests for the serialize-once BroadcastHub.
+"""
+import asyncio
+
+from app.services.broadcast_hub import BroadcastHub, SlowConsumerPolicy
+
+
+class RecordingWebSocket:
+    """Fake websocket that records frames; optionally blocks until released."""
+
+    def __init__(self, blocked: bool = False):
+        self.frames = []
+        self.closed_with = None
+        self.gate = asyncio.Event()
+        if not blocked:
+            self.gate.set()
+
+    async def send_text(self, data: str):
+        await self.gate.wait()
+        self.frames.append(data)
+
+    async def close(self, code: int = 1000):
+        self.closed_with = code
+
+
+async def _drain():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def test_publish_encodes_once_and_delivers_to_all():
+    async def scenario():
+        hub = BroadcastHub(max_queue=4, policy=SlowConsumerPolicy.DROP_OLDEST)
+        clients = [RecordingWebSocket() for _ in range(3)]
+        for ws in clients:
+            hub.register(ws)
+
+        assert hub.publish({"type": "tick", "n": 1}) == 3
+        await _drain()
+
+        frames = [ws.frames for ws in clients]
+        assert frames == [['{"type":"tick","n":1}']] * 3
+        # Same encoded object is shared by every client
+        assert frames[0][0] is frames[1][0] is frames[2][0]
+        await hub.close_all()
+
+    asyncio.run(scenario())
+
+
+def test_slow_client_does_not_block_fast_clients():
+    async def scenario():
+        hub = BroadcastHub(max_queue=2, policy=SlowConsumerPolicy.DROP_OLDEST)
+        slow, fast = RecordingWebSocket(blocked=True), RecordingWebSocket()
+        hub.register(slow)
+        hub.register(fast)
+
+        for n in range(5):
+            hub.publish({"n": n})
+            await _drain()
+
+        assert len(fast.frames) == 5
+        metrics = {m["client_id"]: m for m in hub.get_client_metrics()}
+        slow_metrics = metrics[hub.channels[slow].client_id]
+        assert slow_metrics["queue_depth"] == 2
+        assert slow_metrics["dropped"] >= 2
+
+        slow.gate.set()
+        await _drain()
+        assert slow.frames[-1] == '{"n":4}'
+        await hub.close_all()
+
+    asyncio.run(scenario())
+
+
+def test_coalesce_keeps_latest():
+    async def scenario():
+        hub = BroadcastHub(max_queue=2, policy=SlowConsumerPolicy.COALESCE)
+        slow = RecordingWebSocket(blocked=True)
+        hub.register(slow)
+        for n in range(6):
+            hub.publish({"n": n})
+        await _drain()
+        slow.gate.set()
+        await _drain()
+
+        assert slow.frames[-1] == '{"n":5}'
+        assert len(slow.frames) < 6
+        await hub.close_all()
+
+    asyncio.run(scenario())
+
+
+def test_disconnect_policy_evicts_slow_client():
+    async def scenario():
+        disconnected = []
+        hub = BroadcastHub(
+            max_queue=1,
+            policy=SlowConsumerPolicy.DISCONNECT,
+            on_disconnect=disconnected.append,
+        )
+        slow = RecordingWebSocket(blocked=True)
+        hub.register(slow)
+        for n in range(4):
+            hub.publish({"n": n})
+        await _drain()
+
+        assert disconnected == [slow]
+        assert slow.closed_with == 1013
+        assert hub.get_stats()["slow_disconnects"] == 1
+        assert slow not in hub.channels
+
+    asyncio.run(scenario())
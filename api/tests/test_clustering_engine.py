@@ -0,0 +1,103 @@
+"""
+Unit tests for warm-started clustering and the assignment blob.
+"""
+import asyncio
+import random
+
+from app.services.clustering_engine import CLUSTER_ASSIGNMENTS_KEY, ClusteringEngine
+
+
+class FakeUpstash:
+    """In-memory stand-in for the Upstash commands the engine uses."""
+
+    def __init__(self):
+        self.values = {}
+        self.commands = 0
+
+    async def set(self, key, value, ttl=None):
+        self.commands += 1
+        self.values[key] = value
+        return True
+
+    async def get(self, key):
+        self.commands += 1
+        return self.values.get(key)
+
+
+def _engine(fake):
+    engine = ClusteringEngine()
+    engine.redis_cache._upstash = fake
+    return engine
+
+
+def _coins(count, seed=1):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"coin-{i}",
+            "symbol": f"C{i}",
+            "momentum_score": rng.random() * 100,
+            "market_cap": rng.choice([0, rng.random() * 1e9]),
+            "total_volume": rng.random() * 1e8,
+            "whale_confidence": rng.random(),
+            "pretrend_prob": rng.random(),
+        }
+        for i in range(count)
+    ]
+
+
+def test_single_write_and_summaries():
+    fake = FakeUpstash()
+    engine = _engine(fake)
+    coins = _coins(400)
+
+    assert asyncio.run(engine.compute_clusters(coins))
+    # One read for previous centroids, one blob write
+    assert fake.commands == 2
+    assert CLUSTER_ASSIGNMENTS_KEY in fake.values
+
+    assignments = asyncio.run(engine.get_assignments())
+    clusters = asyncio.run(engine.get_clusters())
+    assert len(assignments) == 400
+    assert sum(c["coin_count"] for c in clusters) == 400
+    assert [c["avg_momentum"] for c in clusters] == sorted((c["avg_momentum"] for c in clusters), reverse=True)
+
+    for cluster in clusters:
+        members = [c for c in coins if assignments[c["id"]] == cluster["cluster_id"]]
+        members.sort(key=lambda c: c["momentum_score"], reverse=True)
+        assert cluster["coin_count"] == len(members)
+        assert cluster["top_coins"] == [c["symbol"] for c in members[:5]]
+        assert cluster["label"] == engine.cluster_labels[cluster["cluster_id"] % 8]
+
+
+def test_warm_start_keeps_cluster_ids():
+    fake = FakeUpstash()
+    coins = _coins(600, seed=2)
+    asyncio.run(_engine(fake).compute_clusters(coins))
+    before = asyncio.run(_engine(fake).get_assignments())
+
+    # A new process picks up the previous centroids from the blob
+    rng = random.Random(3)
+    for coin in coins:
+        coin["momentum_score"] = min(100.0, max(0.0, coin["momentum_score"] + rng.gauss(0, 1)))
+    engine = _engine(fake)
+    assert asyncio.run(engine.compute_clusters(coins))
+    after = asyncio.run(engine.get_assignments())
+
+    moved = sum(before[key] != after[key] for key in before)
+    assert moved < len(before) * 0.1
+    assert set(engine.last_timings) == {"fit_ms", "write_ms"}
+
+
+def test_missing_features_use_defaults():
+    fake = FakeUpstash()
+    coins = _coins(50, seed=4)
+    coins[0]["market_cap"] = None
+    del coins[1]["pretrend_prob"]
+    assert asyncio.run(_engine(fake).compute_clusters(coins))
+
+
+def test_too_few_coins():
+    fake = FakeUpstash()
+    assert not asyncio.run(_engine(fake).compute_clusters(_coins(3)))
+    assert asyncio.run(_engine(fake).get_clusters()) == []
@@ -0,0 +1,79 @@
+"""
+Unit tests for the versioned constellation graph and its change deltas.
+"""
+from app.gde.constellation_fusion.fusion_models import NodeCategory, RelationType, RiskLevel
+from app.gde.constellation_fusion.fusion_service import ConstellationFusionService
+
+
+def _snapshot(service):
+    graph = service.serialize_constellation()["map"]
+    return {
+        "nodes": {n["id"]: n for n in graph["nodes"]},
+        "edges": {f"{e['source_id']}_{e['target_id']}_{e['relation_type']}": e for e in graph["edges"]},
+        "clusters": {c["cluster_id"]: c for c in graph["metadata"]["clusters"]},
+    }
+
+
+def _key(kind, entity):
+    if kind == "nodes":
+        return entity["id"]
+    if kind == "edges":
+        return f"{entity['source_id']}_{entity['target_id']}_{entity['relation_type']}"
+    return entity["cluster_id"]
+
+
+def _apply(snapshot, delta):
+    for kind, ops in delta["changes"].items():
+        for entity in ops["added"] + ops["updated"]:
+            snapshot[kind][_key(kind, entity)] = entity
+        for key in ops["removed"]:
+            del snapshot[kind][key]
+    return snapshot
+
+
+def test_changes_since_replays_to_current_graph():
+    service = ConstellationFusionService()
+    service.add_node("0xA", NodeCategory.WHALE, risk_score=0.3)
+    service.add_node("0xB", risk_score=0.5)
+    service.add_node("0xC")
+    service.add_edge("0xA", "0xB")
+    service.increment_cluster("c1", RiskLevel.LOW, node_ids=["0xA", "0xC"])
+    since = service.version
+    client = _snapshot(service)
+
+    service.add_node("0xa", risk_score=0.9)
+    service.add_edge("0xB", "0xD", RelationType.COORDINATION)
+    service.remove_node("0xC")
+    service.add_node("0xE")
+    service.remove_node("0xE")
+    service.remove_edge("0xa_0xb_transfer")
+
+    delta = service.get_changes_since(since)
+    assert not delta["full"]
+    assert (delta["from_version"], delta["version"]) == (since, service.version)
+    assert [n["id"] for n in delta["changes"]["nodes"]["added"]] == ["0xd"]
+    assert [n["id"] for n in delta["changes"]["nodes"]["updated"]] == ["0xa"]
+    assert delta["changes"]["nodes"]["removed"] == ["0xc"]  # 0xe came and went
+    assert delta["changes"]["edges"]["removed"] == ["0xa_0xb_transfer"]
+
+    assert _apply(client, delta) == _snapshot(service)
+    assert delta["global_risk_score"] == service.serialize_constellation()["map"]["global_risk_score"]
+
+    empty = service.get_changes_since(service.version)
+    assert not empty["full"]
+    assert all(not ids for ops in empty["changes"].values() for ids in ops.values())
+
+
+def test_changes_older_than_log_fall_back_to_full_snapshot():
+    service = ConstellationFusionService(max_change_log=5)
+    for i in range(10):
+        service.add_node(f"0x{i}", risk_score=i / 10)
+
+    assert service.version == 10
+    assert not service.get_changes_since(5)["full"]
+
+    stale = service.get_changes_since(4)
+    assert stale["full"] and stale["version"] == 10
+    assert len(stale["map"]["nodes"]) == 10
+
+    assert service.get_changes_since(11)["full"]
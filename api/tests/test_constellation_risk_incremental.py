@@ -0,0 +1,50 @@
+"""
+Unit tests for incrementally maintained constellation risk aggregates.
+"""
+import random
+
+from app.gde.constellation_risk.rank_sum_index import RankSumIndex
+from app.gde.constellation_risk.risk_model_engine import ConstellationRiskModelEngine
+
+
+def _gini(scores):
+    ordered = sorted(scores)
+    n = len(ordered)
+    weighted = sum((i + 1) * r for i, r in enumerate(ordered))
+    return max(0.0, min(1.0, (2 * weighted) / (n * sum(ordered)) - (n + 1) / n))
+
+
+def test_rank_sum_index_tracks_gini_under_inserts_and_removals():
+    rng = random.Random(3)
+    index, scores = RankSumIndex(), []
+    for _ in range(2_000):
+        if scores and rng.random() < 0.4:
+            index.remove(scores.pop(rng.randrange(len(scores))))
+        else:
+            score = rng.choice([0.0, 1.0, 0.25, rng.random()])
+            scores.append(score)
+            index.add(score)
+        if len(scores) > 1 and sum(scores) > 0:
+            assert abs(index.gini() - _gini(scores)) < 1e-9
+
+
+def test_systemic_and_cluster_risk_follow_node_updates():
+    engine = ConstellationRiskModelEngine()
+    for i in range(20):
+        engine.compute_node_risk(f"n{i}", {"hydra_score": i / 20, "category": "wallet"})
+    engine.compute_cluster_risk("c1", ["n1", "n2", "missing"], {"cohesion_score": 0.9})
+
+    before = engine.compute_cluster_risk("c1")
+    engine.compute_node_risk("n2", {"hydra_score": 1.0, "is_hydra_head": True, "mixer_hops": 0, "category": "mixer"})
+    after = engine.get_cluster_risk("c1")
+
+    assert before.node_count == after.node_count == 3
+    assert after.weighted_risk_score > before.weighted_risk_score
+    assert after.cohesion_score == 0.9
+
+    systemic = engine.compute_systemic_risk()
+    scores = [p.adjusted_risk_score for p in engine.node_risks.values()]
+    assert systemic.total_nodes == 20
+    assert abs(systemic.risk_concentration - _gini(scores)) < 1e-9
+    weights = [1.0 + r * 2 for r in scores]
+    assert abs(systemic.global_risk_score - sum(r * w for r, w in zip(scores, weights)) / sum(weights)) < 1e-12
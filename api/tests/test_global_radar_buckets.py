@@ -0,0 +1,73 @@
+"""
+Unit tests for the GlobalRadarEngine minute buckets.
+"""
+from datetime import datetime, timedelta, timezone
+
+from app.gde.intel.global_radar_engine import GlobalRadarEngine
+
+
+def _event(hours_ago, chain="ethereum", entity="0xabc", risk=0.5, cluster_id=None):
+    return {
+        'chain': chain,
+        'entity': entity,
+        'token': 'ETH',
+        'manipulation_risk': risk,
+        'volatility': risk,
+        'ring_probability': risk,
+        'chain_pressure': risk,
+        'anomaly_score': risk,
+        'cluster_id': cluster_id,
+        'timestamp': (datetime.now(timezone.utc) - timedelta(hours=hours_ago)).isoformat(),
+    }
+
+
+def test_heatmap_merges_buckets_within_timeframe():
+    engine = GlobalRadarEngine()
+    engine.ingest_event(_event(0.1, risk=0.2, cluster_id=7))
+    engine.ingest_event(_event(0.2, risk=0.4, entity="0xdef", cluster_id=7))
+    engine.ingest_event(_event(3, chain="solana", risk=0.9))
+
+    hour = engine.compute_heatmap("1h")
+    assert hour['event_count'] == 2
+    assert set(hour['chains']) == {'ethereum'}
+    assert abs(hour['chains']['ethereum'] - 0.3) < 1e-9
+    assert hour['clusters'][0]['cluster_id'] == 7 and hour['clusters'][0]['size'] == 2
+
+    day = engine.compute_heatmap("24h")
+    assert day['event_count'] == 3
+    assert day['networks'] == {'EVM': hour['networks']['EVM'], 'Solana': 0.9}
+
+
+def test_expiry_drops_whole_buckets():
+    engine = GlobalRadarEngine(retention_hours=48)
+    engine.ingest_event(_event(72))  # beyond retention: scored but never bucketed
+    engine.ingest_event(_event(30))
+    engine.ingest_event(_event(1))
+
+    assert engine.compute_heatmap("7d")['event_count'] == 2
+    assert engine.purge_old_events(max_age_secs=86400) == {'success': True, 'purged_count': 1, 'remaining_count': 1}
+    assert len(engine.buckets) == 1
+    assert engine.total_events_ingested == 3
+    assert list(engine.clusters) == []
+
+
+def test_purge_is_reflected_in_heatmap():
+    """Purged events stop counting even when their hour is still partly live."""
+    engine = GlobalRadarEngine()
+    engine.ingest_event(_event(5, chain="solana", risk=0.9))
+    engine.ingest_event(_event(3.02, chain="solana", risk=0.9))  # usually the cutoff's hour
+    engine.ingest_event(_event(2.9, risk=0.2))
+    engine.ingest_event(_event(0.5, risk=0.4))
+    assert engine.compute_heatmap("24h")['event_count'] == 4
+
+    assert engine.purge_old_events(max_age_secs=3 * 3600)['purged_count'] == 2
+    day = engine.compute_heatmap("24h")
+    assert day['event_count'] == 2
+    assert set(day['chains']) == {'ethereum'}
+    assert engine.compute_heatmap("1h")['event_count'] == 1
+
+    # Late events from before the purge cutoff are not counted again
+    engine.ingest_event(_event(4, chain="solana", risk=0.9))
+    assert engine.compute_heatmap("24h")['event_count'] == 2
+    engine.ingest_event(_event(0.1, risk=0.6))
+    assert engine.compute_heatmap("24h")['event_count'] == 3
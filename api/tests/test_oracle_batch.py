@@ -0,0 +1,45 @@
+"""
+Unit tests for OracleEyeEngine batch analysis.
+"""
+from app.gde.oracle_eye.oracle_eye_engine import OracleEyeEngine
+
+RECORDS = [
+    {'filename': 'balance_edited_fake.png', 'suspected_content': 'wallet', 'tags': ['wallet', 'edited'],
+     'size_kb': 12, 'source': 'telegram', 'description': 'verify your account now'},
+    {'filename': 'chart.png', 'suspected_content': 'chart', 'tags': ['chart'], 'size_kb': 150},
+    {'tags': None, 'size_kb': 'n/a'},
+    {},
+]
+
+
+def _comparable(output):
+    data = output.to_dict()
+    data.pop('id')
+    data.pop('timestamp')
+    return data
+
+
+def test_batch_matches_single_analysis():
+    engine = OracleEyeEngine(max_workers=1)
+    records = RECORDS * 100  # above BATCH_CHUNK_SIZE, still inline with one worker
+
+    batch = engine.analyze_batch(records)
+
+    assert [_comparable(o) for o in batch] == [_comparable(engine.analyze_image(r)) for r in records]
+    assert batch[0].fraud_detected and 'doctored_wallet_balance' in batch[0].fraud_types
+
+
+def test_batch_pool_spawns_workers_and_shuts_down():
+    engine = OracleEyeEngine(max_workers=2)
+    pool = engine.start()
+    try:
+        assert pool._mp_context.get_start_method() == "spawn"
+        assert engine.start() is pool
+
+        records = RECORDS * 200  # several chunks, analyzed on the pool
+        batch = engine.analyze_batch(records)
+        assert [_comparable(o) for o in batch] == [_comparable(engine.analyze_image(r)) for r in records]
+    finally:
+        engine.shutdown()
+    assert engine._pool is None
+    assert OracleEyeEngine(max_workers=1).start() is None
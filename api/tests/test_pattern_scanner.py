@@ -0,0 +1,74 @@
+"""
+Unit tests for the columnar pattern scanner.
+"""
+import random
+
+import numpy as np
+
+from app.services.pattern_detector import bars_to_columnar, detect_all_patterns, scan_patterns
+
+
+def make_bars(n_bars, rng, start=100.0, flat_from=None):
+    """Random-walk bars; from flat_from on, prices and volumes stop moving."""
+    bars = []
+    close = start
+    for i in range(n_bars):
+        if flat_from is not None and i >= flat_from:
+            bars.append([i, close, close, close, close, 1000.0])
+            continue
+        open_price = close * (1 + rng.gauss(0, 0.01))
+        close = open_price * (1 + rng.gauss(0, 0.02))
+        high = max(open_price, close) * (1 + abs(rng.gauss(0, 0.01)))
+        low = min(open_price, close) * (1 - abs(rng.gauss(0, 0.01)))
+        volume = rng.choice([0.0, rng.lognormvariate(10, 1), rng.lognormvariate(12, 1)])
+        bars.append([i, open_price, high, low, close, volume])
+    return bars
+
+
+def per_symbol(bars_by_symbol, symbols, timeframe):
+    patterns = []
+    for bars, symbol in zip(bars_by_symbol, symbols):
+        patterns.extend(detect_all_patterns(bars, symbol, timeframe))
+    return patterns
+
+
+def test_scan_matches_detect_all_patterns_on_every_prefix():
+    """Every prefix of a long series, right-aligned, gives the per-symbol detections."""
+    rng = random.Random(50)
+    series = make_bars(700, rng)
+    bars_by_symbol = [series[:n] for n in range(0, len(series) + 1)]
+    symbols = [f"S{n}" for n in range(len(bars_by_symbol))]
+
+    ohlcv, lengths = bars_to_columnar(bars_by_symbol)
+    expected = per_symbol(bars_by_symbol, symbols, "1D")
+    actual = scan_patterns(ohlcv, symbols, "1D", lengths)
+
+    assert actual == expected
+    full_ohlcv, full_lengths = bars_to_columnar(bars_by_symbol, max_bars=None)
+    assert full_ohlcv.shape == (len(bars_by_symbol), len(series), 5)
+    assert scan_patterns(full_ohlcv, symbols, "1D", full_lengths) == expected
+    signal_types = {p['signal_type'] for p in expected}
+    assert {'BULL_ENGULFING', 'BEAR_ENGULFING', 'DOJI', 'HARAMI', 'VOLUME_SPIKE'} <= signal_types
+    assert {'GOLDEN_CROSS', 'DEATH_CROSS'} & signal_types
+    assert {'LOW_VOLATILITY', 'HIGH_VOLATILITY'} & signal_types
+
+
+def test_scan_matches_on_flat_and_short_histories():
+    """Flat tails (tied MAs, zero range) and histories shorter than every window."""
+    rng = random.Random(7)
+    bars_by_symbol = [make_bars(300, rng, flat_from=80 + 10 * i) for i in range(20)]
+    bars_by_symbol += [make_bars(n, rng) for n in (0, 1, 2, 4, 5, 19, 20, 21, 200, 201)]
+    symbols = [f"S{i}" for i in range(len(bars_by_symbol))]
+
+    ohlcv, lengths = bars_to_columnar(bars_by_symbol)
+    assert scan_patterns(ohlcv, symbols, "4H", lengths) == per_symbol(bars_by_symbol, symbols, "4H")
+
+
+def test_scan_equal_length_array_without_lengths():
+    """A dense (symbols x bars x 5) array needs no lengths."""
+    rng = random.Random(11)
+    bars_by_symbol = [make_bars(250, rng) for _ in range(200)]
+    symbols = [f"S{i}" for i in range(len(bars_by_symbol))]
+    ohlcv = np.array([[bar[1:6] for bar in bars] for bars in bars_by_symbol])
+
+    assert scan_patterns(ohlcv, symbols, "1D") == per_symbol(bars_by_symbol, symbols, "1D")
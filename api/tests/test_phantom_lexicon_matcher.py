@@ -0,0 +1,64 @@
+"""
+Unit tests for the single-pass Phantom lexicon matcher.
+"""
+import asyncio
+import random
+
+from app.gde.phantom import api_phantom
+from app.gde.phantom.lexicon_matcher import LexiconMatcher
+from app.gde.phantom.phantom_feature_engine import PhantomFeatureEngine
+from app.gde.phantom.phantom_schema import PhantomInput
+
+LEXICONS = {
+    'short': ['now', 'know', 'no', 'never', 'never mind', 'aa'],
+    'long': ['guaranteed', 'guaranteed returns', 'turns', 'act now', 'maybe'],
+    'dup': ['maybe', 'now'],
+}
+
+
+def test_scan_matches_str_count_and_in():
+    matcher = LexiconMatcher(LEXICONS)
+    rng = random.Random(7)
+    fragments = [w for words in LEXICONS.values() for w in words] + ['k', 'a', ' ', 'x', 'ow', 'guarantee']
+
+    for _ in range(500):
+        text = ''.join(rng.choice(fragments) for _ in range(rng.randrange(0, 30)))
+        counts, hits = matcher.scan(text)
+        for name, words in LEXICONS.items():
+            assert counts[name] == sum(text.count(w) for w in words), (name, text)
+            assert hits[name] == sum(1 for w in words if w in text), (name, text)
+
+
+def test_batch_matches_single_extraction():
+    engine = PhantomFeatureEngine()
+    inputs = [
+        PhantomInput(transcript="Honestly, trust me! I KNOW you need to act NOW. Maybe?", metadata={'bot_score': 0.4}),
+        PhantomInput(transcript="", metadata={}),
+        PhantomInput(transcript="They said it's guaranteed returns... never mind, I'm sorry.", metadata={'wallet_risk': '0.7'}),
+    ]
+
+    assert engine.extract_features_batch(inputs) == [engine.extract_features(i) for i in inputs]
+    features = engine.extract_features(inputs[0])
+    assert features['urgency_count'] == 2  # 'now' and 'act now' (substring semantics)
+    assert features['first_person_density'] == 2 / 11  # 'me', 'i'
+
+
+def test_batch_endpoint_isolates_item_errors(monkeypatch):
+    def build_input(transcript='', metadata=None, features=None):
+        if transcript == 'boom':
+            raise ValueError('bad item')
+        return PhantomInput(transcript=transcript, metadata=metadata, features=features)
+
+    monkeypatch.setattr(api_phantom, 'PhantomInput', build_input)
+    request = api_phantom.BatchRequest(items=[
+        {'transcript': 'Trust me, act now!'},
+        {'transcript': 'boom'},
+        {'transcript': 'Quarterly numbers were in line with guidance.'},
+    ])
+
+    response = asyncio.run(api_phantom.batch_analyze(request))
+
+    assert response.success and response.count == 3 and response.errors == 1
+    assert response.results[1] == {'error': 'bad item', 'transcript': 'boom'}
+    for result in (response.results[0], response.results[2]):
+        assert 'error' not in result and result['classification'] != 'ERROR'
@@ -0,0 +1,188 @@
+"""
+Unit tests for the snapshot-backed RankTracker.
+"""
+import asyncio
+import random
+
+from app.services.rank_snapshots import RankSnapshotStore
+from app.services.rank_tracker import RankTracker
+
+
+class FakeUpstash:
+    """In-memory stand-in for the Upstash commands the tracker uses."""
+
+    def __init__(self):
+        self.values = {}
+        self.lists = {}
+        self.zsets = {}
+        self.commands = 0
+
+    async def set(self, key, value, ttl=None):
+        self.commands += 1
+        self.values[key] = value
+        return True
+
+    async def mget(self, keys):
+        self.commands += 1
+        return [self.values.get(key) for key in keys]
+
+    async def rpush(self, key, *values):
+        self.commands += 1
+        self.lists.setdefault(key, []).extend(values)
+        return len(self.lists[key])
+
+    async def lrange(self, key, start, stop):
+        self.commands += 1
+        return self.lists.get(key, [])[start:]
+
+    async def zadd(self, key, mapping):
+        self.commands += 1
+        self.zsets.setdefault(key, {}).update(mapping)
+        return True
+
+    async def zrangebyscore(self, key, min_score, max_score):
+        self.commands += 1
+        high = float(max_score)
+        return sorted(
+            ((member, float(score)) for member, score in self.zsets.get(key, {}).items() if min_score <= score <= high),
+            key=lambda pair: pair[1],
+        )
+
+    async def zremrangebyscore(self, key, min_score, max_score):
+        self.commands += 1
+        zset = self.zsets.get(key, {})
+        for member in [m for m, score in zset.items() if min_score <= score <= max_score]:
+            del zset[member]
+        return True
+
+
+def _tracker(fake):
+    tracker = RankTracker(store=RankSnapshotStore())
+    tracker.redis_cache._upstash = fake
+    return tracker
+
+
+def _coins(rng, count):
+    return [
+        {"id": f"coin-{i}", "symbol": f"C{i}", "name": f"Coin {i}", "momentum_score": rng.choice([rng.random() * 100, 50.0])}
+        for i in range(count)
+    ]
+
+
+def test_record_is_one_snapshot_and_changes_match_reference():
+    rng = random.Random(4)
+    fake = FakeUpstash()
+    writer = _tracker(fake)
+
+    first = _coins(rng, 300)
+    second = [dict(coin, momentum_score=rng.random() * 100) for coin in first[:250]]
+    second.append({"id": "late", "symbol": "L", "name": "Late", "momentum_score": 99.0})
+
+    async def scenario():
+        assert await writer.record_ranks(first)
+        await asyncio.sleep(0.002)
+        before = fake.commands
+        assert await writer.record_ranks(second)
+        assert fake.commands - before <= 5  # not one round trip per coin
+
+        # A fresh reader rebuilds everything from Redis
+        reader = _tracker(fake)
+        return await reader.get_rank_changes(minutes=15, limit=1000), await reader.get_rank_history("coin-7", hours=1)
+
+    changes, history = asyncio.run(scenario())
+
+    def ranks(coins):
+        ordered = sorted(coins, key=lambda c: c["momentum_score"], reverse=True)
+        return {coin["id"]: rank for rank, coin in enumerate(ordered, start=1)}
+
+    old, new = ranks(first), ranks(second)
+    expected = [
+        (coin_id, rank, old[coin_id], rank - old[coin_id])
+        for coin_id, rank in sorted(new.items(), key=lambda item: item[1])
+        if coin_id in old and rank != old[coin_id]
+    ]
+    expected.sort(key=lambda row: abs(row[3]), reverse=True)
+    assert [(c["id"], c["current_rank"], c["previous_rank"], c["rank_delta"]) for c in changes] == expected
+    assert changes[0]["symbol"] == f"C{changes[0]['id'].split('-')[1]}"
+
+    assert [h["rank"] for h in history] == [old["coin-7"], new["coin-7"]]
+    assert history[0]["momentum_score"] == first[7]["momentum_score"]
+
+
+def test_store_is_bounded():
+    store = RankSnapshotStore(retention_minutes=1, max_snapshots=3)
+    coins = [{"id": "a", "momentum_score": 1.0}, {"id": "b", "momentum_score": 2.0}]
+    for ts in (0, 10_000, 20_000, 30_000, 90_000):
+        store.add(store.build(ts, coins))
+    assert [s.timestamp_ms for s in store.window(0)] == [30_000, 90_000]
+    assert store.history("b", 0) == [
+        {"timestamp": 30, "rank": 1, "momentum_score": 2.0},
+        {"timestamp": 90, "rank": 1, "momentum_score": 2.0},
+    ]
+
+
+def test_rejected_coin_push_is_rolled_back():
+    """A coin table push that lands elsewhere does not store the snapshot."""
+    fake = FakeUpstash()
+    writer = _tracker(fake)
+    other = _tracker(fake)
+    coins = [{"id": "a", "momentum_score": 1.0}, {"id": "b", "momentum_score": 2.0}]
+
+    async def scenario():
+        assert await writer.record_ranks(coins)
+
+        # Upstash errors come back as 0
+        real_rpush = fake.rpush
+        async def failing_rpush(key, *values):
+            return 0
+        fake.rpush = failing_rpush
+        assert not await writer.record_ranks(coins + [{"id": "c", "momentum_score": 3.0}])
+        assert writer.store.coins == ["a", "b"]
+        fake.rpush = real_rpush
+
+        # Another writer appends "d" between this writer's sync and its push
+        async def racing_rpush(key, *values):
+            fake.rpush = real_rpush
+            await other.record_ranks([{"id": "d", "momentum_score": 4.0}])
+            return await real_rpush(key, *values)
+        fake.rpush = racing_rpush
+        await asyncio.sleep(0.002)
+        assert not await writer.record_ranks(coins + [{"id": "c", "momentum_score": 3.0}])
+
+        await asyncio.sleep(0.002)
+        assert await writer.record_ranks(coins + [{"id": "c", "momentum_score": 3.0}])
+
+        reader = _tracker(fake)
+        return await reader.get_rank_history("c", hours=1), reader.store.coins
+
+    history, table = asyncio.run(scenario())
+    assert len(fake.values) == 3
+    assert [h["rank"] for h in history] == [1]
+    assert table == ["a", "b", "d", "c"]
+
+
+def test_failed_snapshot_write_is_not_indexed():
+    """A snapshot whose SET fails is not added to the index or the local store."""
+    fake = FakeUpstash()
+    writer = _tracker(fake)
+
+    async def scenario():
+        real_set = fake.set
+        async def failing_set(key, value, ttl=None):
+            return False
+        fake.set = failing_set
+        assert not await writer.record_ranks([{"id": "a", "momentum_score": 1.0}])
+        assert len(writer.store) == 0
+        assert writer.store.coins == []
+        fake.set = real_set
+
+        # The pushed coin is picked up from the shared table on the next refresh
+        await asyncio.sleep(0.002)
+        assert await writer.record_ranks([{"id": "a", "momentum_score": 1.0}, {"id": "b", "momentum_score": 2.0}])
+        return writer.store.coins
+
+    table = asyncio.run(scenario())
+    assert table == ["a", "b"]
+    assert len(fake.lists["ghostquant:rank_coins"]) == 2
+    assert len(fake.values) == 1
+    assert len(fake.zsets["ghostquant:rank_snapshots"]) == 1
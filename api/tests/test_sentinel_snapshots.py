@@ -0,0 +1,172 @@
+"""
+Unit tests for the background-materialized Sentinel dashboard.
+"""
+import asyncio
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.gde.sentinel import api_sentinel
+from app.gde.sentinel.sentinel_engine import DEFAULT_CADENCE_SECONDS, SentinelCommandEngine
+from app.gde.sentinel.sentinel_schema import SentinelPanelStatus
+
+
+def test_concurrent_cold_start_builds_once():
+    class SlowEngine(SentinelCommandEngine):
+        def heartbeat(self):
+            time.sleep(0.05)
+            return super().heartbeat()
+
+    engine = SlowEngine()
+
+    async def readers():
+        return await asyncio.gather(*(engine.get_snapshot() for _ in range(20)))
+
+    snapshots = asyncio.run(readers())
+    assert {s.version for s in snapshots} == {1}
+    assert engine.stats['refreshes'] == 1
+    assert engine.stats['rebuilds'] == 1
+    assert len(snapshots[0].dashboard.panels) == 8
+
+
+def test_unchanged_inputs_keep_version():
+    engine = SentinelCommandEngine()
+    first = engine.current_snapshot()
+    engine.build_dashboard()
+    engine.build_dashboard()
+    assert engine.snapshot is first
+    assert engine.stats['published'] == 1
+
+
+def test_changed_panel_publishes_new_version():
+    engine = SentinelCommandEngine()
+    first = engine.current_snapshot()
+
+    engine.panel_collectors['hydra'] = lambda: SentinelPanelStatus(
+        panel_name="Hydra Detection", status="operational", risk_score=0.95, data={'hydra_heads': 4}
+    )
+    engine.build_dashboard()
+    second = engine.snapshot
+    assert second.version == 2
+    assert second.etag != first.etag
+    assert any(a.source_engine == "Hydra Detection" for a in second.dashboard.alerts)
+    # The earlier snapshot is left as it was
+    assert not any(a.source_engine == "Hydra Detection" for a in first.dashboard.alerts)
+
+
+def test_heartbeat_change_reuses_derived_parts():
+    engine = SentinelCommandEngine()
+    first = engine.current_snapshot()
+    engine.engine_endpoints = dict(engine.engine_endpoints, extra='/extra/health')
+    engine.build_dashboard()
+    second = engine.snapshot
+    assert second.version == 2
+    assert engine.stats['rebuilds'] == 1
+    assert second.dashboard.alerts is first.dashboard.alerts
+    assert 'extra' in second.dashboard.heartbeat.active_engines
+
+
+def test_inputs_refresh_on_their_own_cadence():
+    cadences = {name: 3600.0 for name in DEFAULT_CADENCE_SECONDS}
+    engine = SentinelCommandEngine(cadences=dict(cadences, heartbeat=0.0))
+    engine.refresh()
+    collected = engine.stats['collections']
+    assert collected == 10
+    engine.refresh()
+    assert engine.stats['collections'] == collected + 1
+
+
+def test_dashboard_etag_not_modified():
+    app = FastAPI()
+    app.include_router(api_sentinel.router)
+    client = TestClient(app)
+
+    response = client.get("/sentinel/dashboard")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.json()["version"] == api_sentinel.engine.snapshot.version
+
+    assert etag.startswith('W/"')
+
+    cached = client.get("/sentinel/dashboard", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    # If-None-Match compares weakly, so the strong form of the tag matches too
+    strong = client.get("/sentinel/dashboard", headers={"If-None-Match": f'"x", {etag[2:]}'})
+    assert strong.status_code == 304
+    assert client.get("/sentinel/dashboard", headers={"If-None-Match": 'W/"other"'}).status_code == 200
+
+
+def test_latency_jitter_keeps_etag():
+    latencies = iter([0.11, 0.42, 0.87, 0.05, 740.0])
+
+    class JitteryEngine(SentinelCommandEngine):
+        def heartbeat(self):
+            heartbeat = super().heartbeat()
+            latency = next(latencies)
+            heartbeat.latency_map = {name: latency for name in heartbeat.latency_map}
+            return heartbeat
+
+    engine = JitteryEngine()
+    first = engine.current_snapshot()
+    for _ in range(3):
+        engine.refresh(force=True)
+    assert engine.snapshot is first
+
+    engine.refresh(force=True)
+    assert engine.snapshot.etag != first.etag
+    assert engine.snapshot.dashboard.heartbeat.latency_map['oracle'] == 740.0
+
+
+def test_etag_follows_content_not_version():
+    engine = SentinelCommandEngine()
+    first = engine.current_snapshot()
+    original = engine.panel_collectors['hydra']
+
+    engine.panel_collectors['hydra'] = lambda: SentinelPanelStatus(
+        panel_name="Hydra Detection", status="operational", risk_score=0.95, data={'hydra_heads': 4}
+    )
+    engine.refresh(force=True)
+    assert engine.snapshot.etag != first.etag
+
+    engine.panel_collectors['hydra'] = original
+    engine.refresh(force=True)
+    assert engine.snapshot.version == 3
+    assert engine.snapshot.etag == first.etag
+
+
+def test_stale_snapshot_refreshes_once_behind_readers():
+    class SlowEngine(SentinelCommandEngine):
+        def refresh(self, force=False):
+            time.sleep(0.05)
+            return super().refresh(force)
+
+    engine = SlowEngine(cadences={name: 0.0 for name in DEFAULT_CADENCE_SECONDS})
+    first = engine.current_snapshot()
+    refreshes = engine.stats['refreshes']
+
+    async def readers():
+        snapshots = await asyncio.gather(*(engine.get_snapshot() for _ in range(20)))
+        await engine._inflight
+        return snapshots
+
+    snapshots = asyncio.run(readers())
+    assert all(s is first for s in snapshots)
+    assert engine.stats['refreshes'] == refreshes + 1
+
+
+def test_stop_cancels_background_loop():
+    engine = SentinelCommandEngine(cadences={name: 3600.0 for name in DEFAULT_CADENCE_SECONDS})
+
+    async def run():
+        task = asyncio.create_task(engine.start())
+        while engine.snapshot is None:
+            await asyncio.sleep(0.01)
+        await engine.stop()
+        return task
+
+    task = asyncio.run(run())
+    assert task.cancelled()
+    assert not engine.running
@@ -0,0 +1,98 @@
+"""
+Unit tests for the indexed ConstellationTimelineEngine store.
+"""
+import asyncio
+import json
+import random
+from datetime import datetime, timedelta
+
+from app.gde.constellation_timeline.timeline_engine import (
+    ConstellationTimelineEngine,
+    ThreatSeverity,
+    TimelineEvent,
+    TimelineEventType,
+)
+
+
+def _event(i, timestamp, rng):
+    return TimelineEvent(
+        event_id=f"e{i}",
+        event_type=rng.choice(list(TimelineEventType)),
+        severity=rng.choice(list(ThreatSeverity)),
+        title="t",
+        description="d",
+        timestamp=timestamp.isoformat(),
+        entities_involved=rng.sample(["a", "b", "c", "d"], rng.randrange(0, 3)),
+        clusters_involved=rng.sample(["x", "y"], rng.randrange(0, 2)),
+    )
+
+
+def test_indexed_queries_match_scan():
+    rng = random.Random(5)
+    engine = ConstellationTimelineEngine(max_events=300)
+    start = datetime.utcnow() - timedelta(minutes=90)
+    for i in range(1000):
+        engine.store_event(_event(i, start + timedelta(seconds=5.4 * i), rng))
+
+    retained = engine.events
+    assert len(retained) == 300 and retained[0].event_id == "e700"
+    cutoff = (datetime.utcnow() - timedelta(minutes=10)).isoformat()
+    newest_first = [e for e in reversed(retained) if e.timestamp >= cutoff]
+
+    severities = [ThreatSeverity.HIGH, ThreatSeverity.LOW]
+    got = engine.get_events(window_minutes=10, severity_filter=severities, limit=1000)
+    assert got == [e for e in newest_first if e.severity in severities]
+
+    got = engine.get_events(window_minutes=10, event_type_filter=[TimelineEventType.RISK_SPIKE], entity_id="a", limit=5)
+    assert got == [
+        e for e in newest_first
+        if e.event_type == TimelineEventType.RISK_SPIKE and "a" in e.entities_involved
+    ][:5]
+
+    stats = engine.get_stats()
+    assert stats["total_events"] == 300
+    assert sum(stats["severity_distribution"].values()) == 300
+    expected = sum(1 for e in retained if "x" in e.clusters_involved)
+    assert dict(stats["top_clusters"]).get("x", 0) == expected
+
+
+def test_retention_drops_old_events_and_counters():
+    rng = random.Random(1)
+    engine = ConstellationTimelineEngine(max_events=100, retention_minutes=30)
+    start = datetime.utcnow() - timedelta(minutes=100)
+    for i in range(10):
+        engine.store_event(_event(i, start + timedelta(minutes=i), rng))
+    engine.store_event(_event(10, start + timedelta(minutes=100), rng))
+
+    assert [e.event_id for e in engine.events] == ["e10"]
+    assert sum(engine.get_stats()["event_type_distribution"].values()) == 1
+
+
+class RecordingWebSocket:
+    def __init__(self):
+        self.frames = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data: str):
+        self.frames.append(json.loads(data))
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+def test_record_event_broadcasts_through_hub():
+    async def scenario():
+        engine = ConstellationTimelineEngine()
+        ws = RecordingWebSocket()
+        await engine.connect_client(ws)
+        event = await engine.record_event(TimelineEventType.RISK_SPIKE, "spike", "risk up", metadata={"risk": 0.4})
+        for _ in range(10):
+            await asyncio.sleep(0)
+        engine.disconnect_client(ws)
+        return event, ws.frames
+
+    event, frames = asyncio.run(scenario())
+    assert [f["type"] for f in frames] == ["connected", "initial_events", "timeline_event"]
+    assert frames[2]["event"]["event_id"] == event.event_id
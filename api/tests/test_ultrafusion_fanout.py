@@ -0,0 +1,50 @@
+"""
+Unit tests for the UltraFusion engine fan-out.
+"""
+import asyncio
+import time
+
+from app.gde.api.ultrafusion_engine import UltraFusionSupervisor
+from app.gde.api.ultrafusion_fanout import EngineCall, EngineFanout
+
+
+def test_slow_engine_times_out_and_bundle_is_partial():
+    class SlowDna(UltraFusionSupervisor):
+        def _gather_dna(self, entity):
+            time.sleep(0.3)
+            return super()._gather_dna(entity)
+
+    supervisor = SlowDna(fanout=EngineFanout(default_deadline_seconds=0.05, memo_ttl_seconds=0))
+    bundle = supervisor.gather_all_intelligence(entity="0xabc", token="ETH")
+
+    assert bundle['timed_out'] == ['dna']
+    assert bundle['partial'] is True
+    assert bundle['dna'] == {}
+    assert bundle['sources'] == [
+        'predictor', 'history', 'correlation', 'fusion', 'radar', 'cluster', 'actor', 'ghostwriter'
+    ]
+    assert bundle['gather_ms'] < 250
+
+
+def test_memo_serves_repeat_calls_and_records_failures():
+    calls = []
+
+    def engine(entity):
+        calls.append(entity)
+        return {'score': 1}
+
+    def broken(entity):
+        raise ValueError("boom")
+
+    fanout = EngineFanout(default_deadline_seconds=1, memo_ttl_seconds=30)
+    plan = [EngineCall('engine', engine, ('0xabc',)), EngineCall('broken', broken, ('0xabc',))]
+
+    first = fanout.run(plan)
+    second = asyncio.run(fanout.run_async(plan))
+
+    assert calls == ['0xabc']
+    assert second.cached == ['engine']
+    assert first.failed == {'broken': 'boom'} and second.failed == {'broken': 'boom'}
+    metrics = fanout.get_metrics()
+    assert metrics['engines']['broken']['failures'] == 2
+    assert metrics['gather']['count'] == 2
@@ -0,0 +1,57 @@
+"""
+Unit tests for the Valkyrie ring-buffer alert feed.
+"""
+from datetime import datetime, timedelta
+
+from app.gde.valkyrie.alert_feed_manager import AlertFeedManager
+from app.gde.valkyrie.valkyrie_engine import ValkyrieEngine
+from app.gde.valkyrie.valkyrie_schema import ValkyrieAlert
+
+BASE = datetime(2026, 1, 1)
+
+
+def _alert(i, seconds, severity="red", actor_type="WHALE", trigger_type="Chain Pressure"):
+    return ValkyrieAlert(
+        id=f"VAL-{i}",
+        timestamp=(BASE + timedelta(seconds=seconds)).isoformat(),
+        severity_level=severity,
+        actor_type=actor_type,
+        trigger_type=trigger_type,
+    )
+
+
+def test_ring_evicts_oldest_and_keeps_indexes_and_stats_in_sync():
+    feed = AlertFeedManager(capacity=4)
+    for i in range(6):
+        feed.push(_alert(i, i, severity="red" if i % 2 else "yellow", actor_type="GHOST" if i < 3 else "WHALE"))
+
+    assert [a["id"] for a in feed.all()] == ["VAL-2", "VAL-3", "VAL-4", "VAL-5"]
+    assert [a["id"] for a in feed.latest(2)] == ["VAL-4", "VAL-5"]
+    assert [a["id"] for a in feed.get_by_severity("red")] == ["VAL-3", "VAL-5"]
+    assert [a["id"] for a in feed.get_by_actor_type("GHOST")] == ["VAL-2"]
+    stats = feed.get_statistics()
+    assert stats["total_alerts"] == 4
+    assert stats["by_severity"] == {"purple": 0, "red": 2, "orange": 0, "yellow": 2, "green": 0}
+    assert stats["by_actor_type"] == {"GHOST": 1, "WHALE": 3}
+
+
+def test_since_with_sorted_and_out_of_order_timestamps():
+    feed = AlertFeedManager(capacity=10)
+    for i in range(5):
+        feed.push(_alert(i, i * 10))
+    since = (BASE + timedelta(seconds=20)).isoformat()
+    assert [a["id"] for a in feed.since(since)] == ["VAL-2", "VAL-3", "VAL-4"]
+    assert [a["id"] for a in feed.since(since + "Z")] == ["VAL-2", "VAL-3", "VAL-4"]
+
+    feed.push(_alert(5, 5))  # late arrival, older than most of the feed
+    assert [a["id"] for a in feed.since(since)] == ["VAL-2", "VAL-3", "VAL-4"]
+    assert feed.since("not a timestamp") == []
+
+
+def test_engine_history_is_bounded():
+    engine = ValkyrieEngine()
+    for i in range(engine.MAX_HISTORY + 5):
+        engine.record_alert(_alert(i, i))
+
+    assert len(engine.alert_history) == engine.MAX_HISTORY
+    assert [a.id for a in engine.get_recent_alerts(limit=2)] == [f"VAL-{engine.MAX_HISTORY + 3}", f"VAL-{engine.MAX_HISTORY + 4}"]
@@ -0,0 +1,91 @@
+"""
+Unit tests for the bounded, indexed whale movement store.
+"""
+from datetime import datetime, timedelta
+
+from app.gde.whale_intel.models import WhaleMovement
+from app.gde.whale_intel.movement_store import MovementStore
+from app.gde.whale_intel.services import WhaleIntelService
+
+START = datetime(2024, 1, 1)
+
+
+def _move(i, src, dst, symbol="ETH", minutes=None, usd=1_000_000.0):
+    return WhaleMovement(
+        from_address=src,
+        to_address=dst,
+        symbol=symbol,
+        usd_value=usd + i,
+        timestamp=START + timedelta(minutes=i if minutes is None else minutes),
+    )
+
+
+def test_store_evicts_by_capacity_and_keeps_indexes_in_step():
+    store = MovementStore(capacity=5)
+    for i in range(8):
+        store.append(_move(i, "0xA" if i % 2 else "0xB", "0xC", "BTC" if i < 4 else "ETH"))
+
+    assert len(store) == 5
+    assert [m.usd_value - 1_000_000 for m in store.recent(10)] == [7, 6, 5, 4, 3]
+    assert [m.usd_value - 1_000_000 for m in store.recent_for_address("0xa")] == [7, 5, 3]
+    assert [m.usd_value - 1_000_000 for m in store.recent_for_address("0xc", limit=2)] == [7, 6]
+    assert [m.usd_value - 1_000_000 for m in store.recent_for_token("btc")] == [3]
+    assert store.get_stats() == {
+        "retained": 5,
+        "capacity": 5,
+        "total_recorded": 8,
+        "total_evicted": 3,
+        "indexed_addresses": 3,
+        "indexed_tokens": 2,
+    }
+
+    for i in range(8, 13):
+        store.append(_move(i, "0xD", "0xE"))
+    assert store.recent_for_address("0xa") == []
+    assert store.recent_for_token("BTC") == []
+    assert store.get_stats()["indexed_addresses"] == 2
+
+
+def test_store_expires_movements_past_max_age():
+    store = MovementStore(capacity=100, max_age=timedelta(hours=1))
+    store.append(_move(0, "0xA", "0xB", minutes=0))
+    store.append(_move(1, "0xA", "0xB", minutes=30))
+    store.append(_move(2, "0xC", "0xD", minutes=75))
+
+    assert [m.usd_value - 1_000_000 for m in store.recent()] == [2, 1]
+    assert store.expire(START + timedelta(minutes=60)) == 1
+    assert store.recent_for_address("0xA") == []
+
+
+def test_store_expires_across_ring_wraparound():
+    store = MovementStore(capacity=4, max_age=timedelta(minutes=10))
+    for i in range(11):
+        store.append(_move(i, "0xA", "0xB", minutes=3 * i))
+
+    # Slots have wrapped twice; only the last 10 minutes are retained
+    assert [m.usd_value - 1_000_000 for m in store.recent()] == [10, 9, 8, 7]
+    assert [m.usd_value - 1_000_000 for m in store.recent_for_address("0xb", limit=3)] == [10, 9, 8]
+    assert store.expire(START + timedelta(minutes=25)) == 2
+    assert [m.usd_value - 1_000_000 for m in store.recent_for_token("eth")] == [10, 9]
+    assert store.get_stats()["total_evicted"] == 9
+
+
+def test_service_influence_decays_and_whales_are_bounded():
+    service = WhaleIntelService(max_movements=10, max_whales=4, influence_half_life_hours=1)
+    now = datetime.utcnow()
+    for address, hours_ago in [("0xOld", 10), ("0xOld", 0), ("0xNew", 0), ("0xNew", 0)]:
+        service.record_movement(WhaleMovement(
+            from_address=address, to_address="0xHub", symbol="ETH", usd_value=1e3,
+            timestamp=now - timedelta(hours=hours_ago),
+        ))
+    # Same lifetime volume, but 0xOld's first movement has decayed through ten half-lives
+    assert service._whales["0xold"].total_volume_usd == service._whales["0xnew"].total_volume_usd
+    assert service.compute_influence_score("0xnew") > service.compute_influence_score("0xold") + 1
+
+    for i in range(6):
+        service.record_movement(WhaleMovement(
+            from_address=f"0xW{i}", to_address="0xHub", symbol="ETH", usd_value=1e6, timestamp=now,
+        ))
+    assert len(service._whales) <= 4
+    assert "0xold" not in service._whales
+    assert "0xhub" in service._whales
@@ -0,0 +1,148 @@
+"""
+Unit tests for the WIDB repositories (SQLite and in-memory backends).
+"""
+import pytest
+
+from app.widb.widb_models import (
+    AssociationCreate,
+    ClusterHistoryCreate,
+    EntityType,
+    RelationshipType,
+    RiskLevel,
+    WalletProfileCreate,
+)
+from app.widb.widb_repository import InMemoryWidbRepository
+from app.widb.widb_sqlite_repository import SqliteWidbRepository
+
+
+@pytest.fixture(params=["sqlite", "memory"])
+def repo(request):
+    if request.param == "memory":
+        yield InMemoryWidbRepository()
+        return
+    repository = SqliteWidbRepository(":memory:")
+    yield repository
+    repository.close()
+
+
+def _link(repo, a, b, relationship=RelationshipType.FUNDING):
+    return repo.create_association(AssociationCreate(address=a, linked_address=b, relationship_type=relationship))
+
+
+def test_upsert_creates_then_merges(repo):
+    created = repo.upsert_wallet_profile(WalletProfileCreate(address=" 0xABC ", risk_score=0.4, tags=["a"]))
+    assert created.address == "0xabc"
+
+    merged = repo.upsert_wallet_profile(WalletProfileCreate(
+        address="0xAbc", entity_type=EntityType.WHALE, risk_score=0.2, tags=["b"], metadata={"chain": "eth"},
+    ))
+    assert merged.risk_score == 0.4
+    assert sorted(merged.tags) == ["a", "b"]
+
+    stored = repo.get_wallet_profile("0XABC")
+    assert stored.entity_type == "whale"
+    assert stored.risk_score == 0.4
+    assert sorted(stored.tags) == ["a", "b"]
+    assert stored.metadata == {"chain": "eth"}
+    assert stored.first_seen <= stored.last_seen
+    assert repo.get_stats()["total_wallets"] == 1
+
+
+def test_profile_pages_cover_every_wallet_once(repo):
+    for i in range(25):
+        repo.upsert_wallet_profile(WalletProfileCreate(address=f"0x{i:02d}", risk_score=(i % 5) / 10))
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = repo.list_wallet_profiles_page(limit=7, cursor=cursor, order_by="risk_score")
+        seen.extend(p.address for p in page)
+        if cursor is None:
+            break
+    assert sorted(seen) == [f"0x{i:02d}" for i in range(25)]
+    assert [p.risk_score for p in map(repo.get_wallet_profile, seen)] == sorted(
+        (p.risk_score for p in map(repo.get_wallet_profile, seen)), reverse=True
+    )
+
+    risky, _ = repo.list_wallet_profiles_page(limit=100, min_risk_score=0.4)
+    assert {p.address for p in risky} == {f"0x{i:02d}" for i in range(4, 25, 5)}
+
+
+def test_associations_are_undirected_and_deduplicated(repo):
+    first = _link(repo, "0xA", "0xB", RelationshipType.UNKNOWN)
+    again = _link(repo, "0xb", "0xa", RelationshipType.COORDINATION)
+
+    assert again.id == first.id
+    assert repo.get_association_by_id(first.id).relationship_type == "coordination"
+    assert [a.id for a in repo.get_associations("0xB")] == [first.id]
+    assert repo.get_stats()["total_associations"] == 1
+
+
+def test_cluster_events_index_members_and_count(repo):
+    repo.upsert_wallet_profile(WalletProfileCreate(address="0xa"))
+    first = repo.record_cluster_event(ClusterHistoryCreate(
+        cluster_id="c1", related_addresses=["0xA", "0xB"], risk_level=RiskLevel.HIGH, source="hydra",
+    ))
+    second = repo.record_cluster_event(ClusterHistoryCreate(cluster_id="c2", related_addresses=["0xa", "0xc"]))
+
+    assert [c.id for c in repo.get_clusters_for_address("0xA")] == [first.id, second.id]
+    assert [c.id for c in repo.get_clusters_for_address("0xc")] == [second.id]
+    assert repo.get_wallet_profile("0xa").total_clusters == 2
+    assert {c.id for c in repo.get_cluster_history(limit=10)} == {first.id, second.id}
+
+    stats = repo.get_stats()
+    assert stats["total_clusters"] == 2
+    assert stats["clusters_by_risk"] == {"high": 1, "unknown": 1}
+    assert stats["wallets_by_type"] == {"unknown": 1}
+
+
+def test_neighborhood_follows_associations_and_clusters(repo):
+    _link(repo, "0xa", "0xb")
+    _link(repo, "0xb", "0xc")
+    _link(repo, "0xc", "0xd")
+    cluster = repo.record_cluster_event(ClusterHistoryCreate(cluster_id="c1", related_addresses=["0xa", "0xz"]))
+
+    result = repo.get_neighborhood("0xA", depth=2)
+    depths = {node["id"]: node["depth"] for node in result["nodes"]}
+    assert depths == {"0xa": 0, "0xb": 1, f"cluster:{cluster.id}": 1, "0xc": 2, "0xz": 2}
+    assert not result["truncated"]
+    edges = {(e["source"], e["target"], e["kind"]) for e in result["edges"]}
+    assert ("0xb", "0xc", "association") in edges
+    assert ("0xz", f"cluster:{cluster.id}", "member_of") in edges
+
+    wallets_only = repo.get_neighborhood("0xa", depth=3, include_clusters=False)
+    assert {node["id"] for node in wallets_only["nodes"]} == {"0xa", "0xb", "0xc", "0xd"}
+
+
+def test_neighborhood_caps_nodes_within_a_level(repo):
+    """A hub with many neighbors cannot push the result past max_nodes."""
+    for i in range(50):
+        _link(repo, "0xhub", f"0x{i:02d}")
+
+    result = repo.get_neighborhood("0xhub", depth=2, max_nodes=10)
+    node_ids = {node["id"] for node in result["nodes"]}
+    assert len(node_ids) == 10
+    assert result["truncated"]
+    assert all(e["source"] in node_ids and e["target"] in node_ids for e in result["edges"])
+
+
+def test_sqlite_repository_persists_to_file(tmp_path):
+    path = str(tmp_path / "widb.sqlite3")
+    repo = SqliteWidbRepository(path)
+    repo.upsert_wallet_profile(WalletProfileCreate(address="0xa", entity_type=EntityType.EXCHANGE))
+    _link(repo, "0xa", "0xb")
+    repo.record_cluster_event(ClusterHistoryCreate(cluster_id="c1", related_addresses=["0xa"]))
+    repo.close()
+
+    reopened = SqliteWidbRepository(path)
+    try:
+        assert reopened.get_wallet_profile("0xa").entity_type == "exchange"
+        assert reopened.get_stats() == {
+            "total_wallets": 1,
+            "total_associations": 1,
+            "total_clusters": 1,
+            "wallets_by_type": {"exchange": 1},
+            "clusters_by_risk": {"unknown": 1},
+        }
+        assert len(reopened.get_neighborhood("0xa")["nodes"]) == 3
+    finally:
+        reopened.close()
@@ -0,0 +1,184 @@
+"""
+Benchmark: one EcoscanService refresh cycle (ecosystems, whale flows,
+Ecoscores) for 100 and 400 assets.
+
+The previous cycle (reconstructed inline as legacy_cycle) fetched every
+asset's whale transactions one at a time, twice (once for the flows, once
+more for the Ecoscores), inserted and committed row by row and ran one
+pretrend query per asset. EcoscanService.run_update_cycle fetches once,
+concurrently, shares the result across stages, loads pretrends with one
+DISTINCT ON query and writes each table with one COPY.
+
+Both run against an in-memory connection that charges RTT_MS per
+statement, commit and COPY, and whale fetches are given FETCH_MS of
+simulated upstream latency on top of the mock data generator.
+
+Usage (from ecoscan/):
+    PYTHONPATH=src python -m benchmarks.bench_refresh_cycle
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+from ecoscan.config import SUPPORTED_CHAINS
+from ecoscan.service import EcoscanService
+
+ASSET_COUNTS = (100, 400)
+RTT_MS = 1.0
+FETCH_MS = 25.0
+
+
+class FakeConnection:
+    def __init__(self, assets):
+        self.assets = assets
+        self.round_trips = 0
+        self.rows_written = 0
+
+    async def round_trip(self):
+        self.round_trips += 1
+        await asyncio.sleep(RTT_MS / 1000)
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    async def commit(self):
+        await self.round_trip()
+
+    async def rollback(self):
+        await self.round_trip()
+
+
+class FakeCursor:
+    def __init__(self, conn: FakeConnection):
+        self.conn = conn
+        self.rows = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, sql, params=None):
+        await self.conn.round_trip()
+        if "FROM assets" in sql:
+            self.rows = self.conn.assets
+        elif "FROM signals" in sql:
+            asset_ids = params[0] if isinstance(params[0], list) else [params[0]]
+            self.rows = [{"asset_id": asset_id, "pretrend_prob": (asset_id % 10) / 10} for asset_id in asset_ids]
+        else:
+            self.conn.rows_written += 1
+            self.rows = []
+
+    async def fetchall(self):
+        return self.rows
+
+    async def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def copy(self, sql):
+        return FakeCopy(self.conn)
+
+
+class FakeCopy:
+    def __init__(self, conn: FakeConnection):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.conn.round_trip()
+        return False
+
+    async def write_row(self, row):
+        self.conn.rows_written += 1
+
+
+async def legacy_cycle(service: EcoscanService) -> None:
+    """The previous update_ecosystem_data / update_whale_flows / compute_ecoscores."""
+    conn = service.db_conn
+    insert = "INSERT INTO t VALUES (%s)"
+
+    ecosystems = await service.ecosystem_mapper.get_all_ecosystems()
+    async with conn.cursor() as cur:
+        for ecosystem in ecosystems:
+            await cur.execute(insert, (ecosystem["chain"],))
+        await conn.commit()
+
+    async with conn.cursor() as cur:
+        await cur.execute("SELECT * FROM assets ORDER BY symbol")
+        assets = await cur.fetchall()
+    for asset in assets:
+        transactions = await service.whale_tracker.fetch_whale_transactions(asset["symbol"])
+        if transactions:
+            async with conn.cursor() as cur:
+                for tx in transactions:
+                    await cur.execute(insert, (tx["asset"],))
+                await conn.commit()
+
+    async with conn.cursor() as cur:
+        await cur.execute("SELECT * FROM assets ORDER BY symbol")
+        assets = await cur.fetchall()
+    ecosystems = await service.ecosystem_mapper.get_all_ecosystems()
+    chain_emi_map = {eco["chain"]: eco["emi_score"] for eco in ecosystems}
+    asset_scores = {}
+    for asset in assets:
+        transactions = await service.whale_tracker.fetch_whale_transactions(asset["symbol"])
+        async with conn.cursor() as cur:
+            await cur.execute("SELECT pretrend_prob FROM signals WHERE asset_id = %s", (asset["asset_id"],))
+            row = await cur.fetchone()
+        asset_scores[asset["symbol"]] = {
+            "emi": chain_emi_map.get(asset["chain"], 50.0),
+            "wcf": service.whale_tracker.compute_wcf(transactions),
+            "pretrend": row["pretrend_prob"] if row else 0.5,
+        }
+    opportunities = service.ecoscore_aggregator.rank_opportunities(asset_scores)
+    async with conn.cursor() as cur:
+        for opp in opportunities:
+            await cur.execute(insert, (opp["asset"], datetime.utcnow()))
+        await conn.commit()
+
+
+def make_service(n_assets: int) -> EcoscanService:
+    assets = [
+        {"asset_id": i + 1, "symbol": f"A{i:04d}", "chain": SUPPORTED_CHAINS[i % len(SUPPORTED_CHAINS)]}
+        for i in range(n_assets)
+    ]
+    service = EcoscanService()
+    service.db_conn = FakeConnection(assets)
+
+    fetch = service.whale_tracker.fetch_whale_transactions
+
+    async def slow_fetch(asset, lookback_hours=24):
+        await asyncio.sleep(FETCH_MS / 1000)
+        return await fetch(asset, lookback_hours)
+
+    service.whale_tracker.fetch_whale_transactions = slow_fetch
+    return service
+
+
+async def main() -> None:
+    logging.disable(logging.CRITICAL)
+    print(f"RTT {RTT_MS:.0f} ms, whale fetch latency {FETCH_MS:.0f} ms")
+    print(f"{'assets':<8}{'cycle':<10}{'wall s':>9}{'round trips':>13}{'rows':>8}{'rows/s':>10}")
+    for n_assets in ASSET_COUNTS:
+        service = make_service(n_assets)
+        started = time.perf_counter()
+        await legacy_cycle(service)
+        wall = time.perf_counter() - started
+        conn = service.db_conn
+        print(f"{n_assets:<8}{'legacy':<10}{wall:>9.2f}{conn.round_trips:>13,}{conn.rows_written:>8,}{conn.rows_written / wall:>10,.0f}")
+
+        service = make_service(n_assets)
+        cycle = await service.run_update_cycle()
+        conn = service.db_conn
+        assert cycle["rows_written"] == conn.rows_written
+        print(f"{n_assets:<8}{'pipeline':<10}{cycle['wall_seconds']:>9.2f}{conn.round_trips:>13,}"
+              f"{cycle['rows_written']:>8,}{cycle['rows_per_second']:>10,.0f}"
+              f"   ({cycle['queries']} queries, {cycle['fetch_seconds']:.2f}s fetching)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
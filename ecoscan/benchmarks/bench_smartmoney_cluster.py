@@ -0,0 +1,147 @@
+"""
+Benchmark: smart money clustering, full refit vs incremental update, at
+100k and 1M wallets (~10 transactions each).
+
+- legacy: cluster_wallets on the full history as transaction dicts
+  (per-wallet feature extraction + KMeans), 100k wallets only
+- refit: update_clusters_columns on the full history from an empty state
+  (running aggregates built from scratch + MiniBatchKMeans fit)
+- incremental: one hour later, 1% of wallets make new transactions;
+  aggregates updated in place and centroids partial_fit on those wallets
+- restart: load_state in a fresh process-equivalent instance, then the
+  same incremental update
+
+Features from the running aggregates are checked against
+extract_wallet_features on a sample of wallets.
+
+Usage (from ecoscan/):
+    PYTHONPATH=src python -m benchmarks.bench_smartmoney_cluster
+"""
+import logging
+import os
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from ecoscan.models.smartmoney_cluster import SmartMoneyCluster, US_PER_DAY, to_epoch_us
+
+WALLET_COUNTS = (100_000, 1_000_000)
+LEGACY_MAX_WALLETS = 100_000
+UPDATE_FRACTION = 0.01
+PARITY_SAMPLE = 1_000
+
+
+def make_history(n_wallets, now, rng, lookback_days=30, tx_range=(5, 16)):
+    """Columnar synthetic history with the mock generator's three patterns."""
+    wallets = np.array([f"0x{i:040x}" for i in range(n_wallets)], dtype=object)
+    pattern = rng.integers(0, 3, n_wallets)
+    n_txs = rng.integers(*tx_range, n_wallets)
+    rows = np.repeat(np.arange(n_wallets), n_txs)
+    n = len(rows)
+    position = np.arange(n) - np.repeat(np.cumsum(n_txs) - n_txs, n_txs)
+
+    p = pattern[rows]
+    inflow_prob = np.choose(p, [0.7, 0.3, 0.5])
+    directions = np.where(rng.random(n) < inflow_prob, "inflow", "outflow").astype(object)
+    values = np.where(p == 2, rng.lognormal(12, 1.5, n), rng.lognormal(13, 1, n))
+    days_ago = rng.uniform(0, lookback_days, n)
+    dormant = p == 2
+    old = dormant & (position < n_txs[rows] // 2)
+    days_ago[old] = rng.uniform(20, lookback_days, old.sum())
+    days_ago[dormant & ~old] = rng.uniform(0, 5, (dormant & ~old).sum())
+    timestamps = int(to_epoch_us(now)) - (days_ago * US_PER_DAY).astype(np.int64)
+    return wallets[rows], values, directions, timestamps
+
+
+def make_update(n_wallets, now, rng, fraction=UPDATE_FRACTION, per_wallet=3):
+    chosen = rng.choice(n_wallets, int(n_wallets * fraction), replace=False)
+    rows = np.repeat(chosen, per_wallet)
+    n = len(rows)
+    wallets = np.array([f"0x{i:040x}" for i in rows], dtype=object)
+    directions = np.where(rng.random(n) < 0.5, "inflow", "outflow").astype(object)
+    values = rng.lognormal(13, 1, n)
+    timestamps = int(to_epoch_us(now)) - (rng.uniform(0, 1 / 24, n) * US_PER_DAY).astype(np.int64)
+    return wallets, values, directions, timestamps
+
+
+def to_dicts(wallets, values, directions, timestamps):
+    wallet_data = defaultdict(list)
+    for wallet, value, direction, ts in zip(wallets, values, directions, timestamps.astype("datetime64[us]").tolist()):
+        wallet_data[wallet].append({"wallet_address": wallet, "direction": direction, "value_usd": value, "timestamp": ts})
+    return wallet_data
+
+
+def check_parity(cluster, history, now, rng):
+    wallets, values, directions, timestamps = history
+    sample = set(rng.choice(np.unique(wallets), PARITY_SAMPLE, replace=False))
+    mask = np.fromiter((w in sample for w in wallets), dtype=bool, count=len(wallets))
+    wallet_data = to_dicts(wallets[mask], values[mask], directions[mask], timestamps[mask])
+
+    rows = np.array([cluster.store.index[w] for w in wallet_data])
+    rows, features = cluster.store.features(int(to_epoch_us(now)), cluster.min_tx_count, rows)
+    worst = 0.0
+    for row, vector in zip(rows, features):
+        expected = cluster.extract_wallet_features(wallet_data[cluster.store.addresses[row]])
+        worst = max(worst, float(np.max(np.abs(expected - vector) / np.maximum(np.abs(expected), 1))))
+    return worst
+
+
+def timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    state_dir = tempfile.mkdtemp(prefix="smartmoney_bench_")
+    print(f"{'wallets':>10} {'txs':>11}  {'step':<34}{'seconds':>9}")
+    for n_wallets in WALLET_COUNTS:
+        rng = np.random.default_rng(47)
+        now = datetime.utcnow().replace(microsecond=0)
+        history = make_history(n_wallets, now, rng)
+        n_txs = len(history[0])
+
+        def report(step, seconds):
+            print(f"{n_wallets:>10,} {n_txs:>11,}  {step:<34}{seconds:>9.2f}")
+
+        if n_wallets <= LEGACY_MAX_WALLETS:
+            wallet_data = to_dicts(*history)
+            legacy = SmartMoneyCluster()
+            labels, seconds = timed(legacy.cluster_wallets, wallet_data)
+            report("legacy cluster_wallets", seconds)
+            del wallet_data
+
+        cluster = SmartMoneyCluster()
+        cluster.state_path = os.path.join(state_dir, f"state_{n_wallets}.pkl")
+        cluster._state_loaded = True
+        labels, seconds = timed(cluster.update_clusters_columns, *history, now=now, persist=False)
+        report("refit (aggregates + fit)", seconds)
+        _, seconds = timed(cluster.save_state)
+        report(f"save_state ({os.path.getsize(cluster.state_path) / 1e6:.0f} MB)", seconds)
+        parity = check_parity(cluster, history, now, rng)
+        centers = cluster.model.cluster_centers_.copy()
+
+        later = now + timedelta(hours=1)
+        update = make_update(n_wallets, later, rng)
+        labels, seconds = timed(cluster.update_clusters_columns, *update, now=later, persist=False)
+        shift = float(np.max(np.linalg.norm(cluster.model.cluster_centers_ - centers, axis=1)))
+        report(f"incremental ({len(update[0]):,} txs)", seconds)
+
+        restarted = SmartMoneyCluster()
+        restarted.state_path = cluster.state_path
+        _, seconds = timed(restarted.load_state)
+        report("restart: load_state", seconds)
+        restarted_labels, seconds = timed(restarted.update_clusters_columns, *update, now=later, persist=False)
+        report("restart: incremental", seconds)
+        assert restarted_labels == labels
+        print(f"{'':>24}centroid shift after update {shift:.3f} (scaled units), "
+              f"{len(labels):,} wallets labelled, feature max rel diff {parity:.1e}")
+        del history, cluster, restarted, labels, restarted_labels
+
+
+if __name__ == "__main__":
+    main()
@@ -29,14 +29,12 @@ app.add_middleware(
 
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
-_cache = {}
-
-
 @app.on_event("startup")
 async def startup_event():
     """Initialize service on startup."""
     try:
         await service.connect_db()
+        service.start()
         logger.info("Ecoscan API started successfully")
     except Exception as e:
         logger.error(f"Startup error: {e}")
@@ -46,6 +44,7 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown."""
     try:
+        await service.stop()
         await service.close_db()
         logger.info("Ecoscan API shutdown complete")
     except Exception as e:
@@ -73,18 +72,10 @@ async def get_summary():
         - Top 10 Ecoscore opportunities
         - Smart money cluster analysis
     
-    Cached for 60s for performance.
+    Served from the latest snapshot published by the periodic update.
     """
     try:
-        cache_key = "ecoscan:summary"
-        if cache_key in _cache:
-            cached_data, cached_time = _cache[cache_key]
-            if (datetime.utcnow() - cached_time).total_seconds() < 60:
-                return cached_data
-        
-        summary = await service.get_summary()
-        _cache[cache_key] = (summary, datetime.utcnow())
-        return summary
+        return await service.get_summary()
     except Exception as e:
         logger.error(f"Error getting summary: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -104,16 +95,14 @@ async def get_ecosystems(
         List of ecosystems with EMI scores
     """
     try:
-        ecosystems = await service.ecosystem_mapper.get_all_ecosystems()
-        top_ecosystems = service.ecosystem_mapper.get_top_ecosystems(ecosystems, n=limit)
+        snapshot = await service.get_snapshot()
+        ecosystems = snapshot.view("ecosystems")
         
         return {
-            "ecosystems": [
-                service.ecosystem_mapper.get_ecosystem_summary(eco)
-                for eco in top_ecosystems
-            ],
+            "ecosystems": ecosystems[:limit],
             "total_tracked": len(ecosystems),
             "timestamp": datetime.utcnow().isoformat(),
+            "snapshot": snapshot.freshness(),
         }
     except Exception as e:
         logger.error(f"Error getting ecosystems: {e}")
@@ -183,20 +172,19 @@ async def get_ecoscore_rankings(
         Ranked list of opportunities with Ecoscores
     """
     try:
-        opportunities = await service.compute_ecoscores()
+        snapshot = await service.get_snapshot()
         
         top_opportunities = service.ecoscore_aggregator.get_top_opportunities(
-            opportunities,
+            snapshot.view("opportunities"),
             n=limit,
             min_ecoscore=min_ecoscore
         )
         
-        summary = service.ecoscore_aggregator.generate_ecoscore_summary(opportunities)
-        
         return {
             "opportunities": top_opportunities,
-            "summary": summary,
+            "summary": snapshot.view("ecoscore_summary"),
             "timestamp": datetime.utcnow().isoformat(),
+            "snapshot": snapshot.freshness(),
         }
     except Exception as e:
         logger.error(f"Error getting Ecoscore rankings: {e}")
@@ -14,6 +14,11 @@ REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 USE_MOCK_ECOSCAN_DATA = os.getenv("USE_MOCK_ECOSCAN_DATA", "true").lower() == "true"
 ECOSCAN_UPDATE_INTERVAL = int(os.getenv("ECOSCAN_UPDATE_INTERVAL", "300"))  # 5 minutes
 MIN_WHALE_TX_USD = float(os.getenv("MIN_WHALE_TX_USD", "250000"))  # $250k minimum
+ECOSCAN_FETCH_CONCURRENCY = int(os.getenv("ECOSCAN_FETCH_CONCURRENCY", "16"))  # concurrent per-asset fetches
+ECOSCAN_SNAPSHOT_REDIS = os.getenv("ECOSCAN_SNAPSHOT_REDIS", "false").lower() == "true"  # mirror snapshots to Redis
+ECOSCAN_UPSTREAM_CACHE_TTL = int(os.getenv("ECOSCAN_UPSTREAM_CACHE_TTL", "300"))  # seconds before upstream responses are revalidated
+
+DEFILLAMA_API_URL = os.getenv("DEFILLAMA_API_URL", "https://api.llama.fi")
 
 EMI_WEIGHTS: Dict[str, float] = {
     "tvl_delta": 0.30,
@@ -28,6 +33,8 @@ WCF_LOG_BASE = 10.0
 CLUSTER_N_CLUSTERS = 3  # Accumulation, Distribution, Dormant
 CLUSTER_LOOKBACK_DAYS = 30
 CLUSTER_MIN_TX_COUNT = 5
+ECOSCAN_DATA_DIR = os.getenv("ECOSCAN_DATA_DIR", "/data/ecoscan")  # service-owned, not shared with other users
+CLUSTER_STATE_PATH = os.getenv("CLUSTER_STATE_PATH", os.path.join(ECOSCAN_DATA_DIR, "smartmoney_state.pkl"))  # incremental clustering state, "" to disable
 
 ECOSCORE_WEIGHTS: Dict[str, float] = {
     "emi": 0.40,
@@ -0,0 +1,150 @@
+"""HTTP response cache for upstream JSON APIs."""
+
+import json
+import time
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """One parsed upstream response and what it cost to get."""
+    data: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    size_bytes: int
+    parse_seconds: float
+
+
+class ResponseCache:
+    """
+    Cache for upstream JSON GETs.
+    
+    - Responses are fresh for ttl_seconds and served without a request
+    - Stale responses are revalidated with If-None-Match / If-Modified-Since,
+      so an unchanged payload costs a 304 instead of a download and parse
+    - Concurrent requests for the same URL share one fetch (single-flight)
+    - If revalidation fails, the stale response is served
+    
+    A transform (e.g. building an index from the payload) runs once per
+    download and its result is what gets cached.
+    """
+    
+    def __init__(self, ttl_seconds: float = 300.0, timeout_seconds: float = 10.0):
+        self.ttl_seconds = ttl_seconds
+        self.timeout_seconds = timeout_seconds
+        
+        self._entries: Dict[str, CachedResponse] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        self.stats = {
+            "requests": 0,
+            "downloads": 0,
+            "not_modified": 0,
+            "hits": 0,
+            "bytes_downloaded": 0,
+            "bytes_saved": 0,
+            "parse_seconds": 0.0,
+            "parse_seconds_saved": 0.0,
+        }
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+    
+    async def close(self):
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    def _count_saved(self, entry: CachedResponse):
+        self.stats["bytes_saved"] += entry.size_bytes
+        self.stats["parse_seconds_saved"] += entry.parse_seconds
+    
+    async def get_json(self, url: str, transform: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        Get the (transformed) JSON payload at url.
+        
+        Args:
+            url: Upstream URL
+            transform: Applied to the parsed payload before caching
+        
+        Returns:
+            Cached or freshly fetched data
+        """
+        entry = self._entries.get(url)
+        if entry is not None and time.monotonic() - entry.fetched_at < self.ttl_seconds:
+            self.stats["hits"] += 1
+            self._count_saved(entry)
+            return entry.data
+        
+        inflight = self._inflight.get(url)
+        shared = inflight is not None
+        if not shared:
+            inflight = asyncio.ensure_future(self._fetch(url, transform, entry))
+            self._inflight[url] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(url, None))
+        
+        entry = await asyncio.shield(inflight)
+        if shared:
+            self.stats["hits"] += 1
+            self._count_saved(entry)
+        return entry.data
+    
+    async def _fetch(self, url: str, transform: Optional[Callable[[Any], Any]], entry: Optional[CachedResponse]) -> CachedResponse:
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        
+        try:
+            self.stats["requests"] += 1
+            timeout = aiohttp.ClientTimeout(total=self.timeout_seconds)
+            async with self._get_session().get(url, headers=headers, timeout=timeout) as response:
+                if response.status == 304 and entry is not None:
+                    self.stats["not_modified"] += 1
+                    self._count_saved(entry)
+                    entry.fetched_at = time.monotonic()
+                    return entry
+                
+                response.raise_for_status()
+                body = await response.read()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except Exception as e:
+            if entry is None:
+                raise
+            logger.warning(f"Revalidating {url} failed, serving stale response: {e}")
+            return entry
+        
+        started = time.perf_counter()
+        data = json.loads(body)
+        if transform is not None:
+            data = transform(data)
+        parse_seconds = time.perf_counter() - started
+        
+        entry = CachedResponse(
+            data=data,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=time.monotonic(),
+            size_bytes=len(body),
+            parse_seconds=parse_seconds,
+        )
+        self._entries[url] = entry
+        
+        self.stats["downloads"] += 1
+        self.stats["bytes_downloaded"] += len(body)
+        self.stats["parse_seconds"] += parse_seconds
+        return entry
@@ -12,10 +12,45 @@ from ..config import (
     SUPPORTED_CHAINS,
     PROTOCOL_CATEGORIES,
     USE_MOCK_ECOSCAN_DATA,
+    DEFILLAMA_API_URL,
+    ECOSCAN_UPSTREAM_CACHE_TTL,
 )
+from ..http_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+DEFILLAMA_CHAIN_NAMES = {
+    "ethereum": "Ethereum",
+    "arbitrum": "Arbitrum",
+    "optimism": "Optimism",
+    "polygon": "Polygon",
+    "avalanche": "Avalanche",
+    "bsc": "BSC",
+    "solana": "Solana",
+    "cosmos": "Cosmos",
+    "osmosis": "Osmosis",
+    "base": "Base",
+}
+
+
+def build_chain_index(all_protocols: List[Dict]) -> Dict[str, List[str]]:
+    """
+    Index DeFiLlama's protocol list by chain.
+    
+    Args:
+        all_protocols: The /protocols payload
+        
+    Returns:
+        Dict mapping DeFiLlama chain name -> protocol names, in payload order
+    """
+    index: Dict[str, List[str]] = {}
+    
+    for protocol in all_protocols:
+        for chain in protocol.get("chains") or []:
+            index.setdefault(chain, []).append(protocol["name"])
+    
+    return index
+
 
 class EcosystemMapper:
     """
@@ -33,7 +68,16 @@ class EcosystemMapper:
         self.emi_weights = EMI_WEIGHTS
         self.supported_chains = SUPPORTED_CHAINS
         self.use_mock_data = USE_MOCK_ECOSCAN_DATA
+        self.defillama_url = DEFILLAMA_API_URL
+        
+        # Shared by every chain's fetch, so the protocol list is downloaded
+        # and indexed once per refresh
+        self.http_cache = ResponseCache(ttl_seconds=ECOSCAN_UPSTREAM_CACHE_TTL)
         
+    async def close(self):
+        """Close upstream HTTP connections."""
+        await self.http_cache.close()
+    
     async def fetch_ecosystem_data(self, chain: str) -> Dict:
         """
         Fetch ecosystem data for a specific chain.
@@ -48,24 +92,24 @@ class EcosystemMapper:
             return self._generate_mock_ecosystem_data(chain)
         
         try:
-            async with aiohttp.ClientSession() as session:
-                tvl_data = await self._fetch_defillama_tvl(session, chain)
-                
-                volume_data = await self._fetch_coingecko_volume(session, chain)
-                
-                wallet_data = await self._fetch_wallet_count(session, chain)
-                
-                bridge_data = await self._fetch_bridge_flows(session, chain)
-                
-                return {
-                    "chain": chain,
-                    "tvl_usd": tvl_data.get("tvl", 0),
-                    "protocols": tvl_data.get("protocols", []),
-                    "wallets_24h": wallet_data.get("active_wallets", 0),
-                    "volume_24h": volume_data.get("volume", 0),
-                    "bridge_flows": bridge_data.get("net_flow", 0),
-                    "updated_at": datetime.utcnow(),
-                }
+            # Upstream requests go through http_cache's shared session
+            tvl_data = await self._fetch_defillama_tvl(chain)
+            
+            volume_data = await self._fetch_coingecko_volume(chain)
+            
+            wallet_data = await self._fetch_wallet_count(chain)
+            
+            bridge_data = await self._fetch_bridge_flows(chain)
+            
+            return {
+                "chain": chain,
+                "tvl_usd": tvl_data.get("tvl", 0),
+                "protocols": tvl_data.get("protocols", []),
+                "wallets_24h": wallet_data.get("active_wallets", 0),
+                "volume_24h": volume_data.get("volume", 0),
+                "bridge_flows": bridge_data.get("net_flow", 0),
+                "updated_at": datetime.utcnow(),
+            }
         except Exception as e:
             logger.error(f"Error fetching ecosystem data for {chain}: {e}")
             return self._generate_mock_ecosystem_data(chain)
@@ -117,71 +161,56 @@ class EcosystemMapper:
             "updated_at": datetime.utcnow(),
         }
     
-    async def _fetch_defillama_tvl(self, session: aiohttp.ClientSession, chain: str) -> Dict:
+    async def _fetch_defillama_tvl(self, chain: str) -> Dict:
         """
         Fetch TVL data from DeFiLlama API.
         
+        Responses go through http_cache; the protocol list is shared by all
+        chains as a chain -> protocols index.
+        
         API Docs: https://defillama.com/docs/api
         """
         try:
-            chain_mapping = {
-                "ethereum": "Ethereum",
-                "arbitrum": "Arbitrum",
-                "optimism": "Optimism",
-                "polygon": "Polygon",
-                "avalanche": "Avalanche",
-                "bsc": "BSC",
-                "solana": "Solana",
-                "cosmos": "Cosmos",
-                "osmosis": "Osmosis",
-                "base": "Base",
-            }
+            defillama_chain = DEFILLAMA_CHAIN_NAMES.get(chain, chain.capitalize())
             
-            defillama_chain = chain_mapping.get(chain, chain.capitalize())
+            data = await self.http_cache.get_json(f"{self.defillama_url}/v2/historicalChainTvl/{defillama_chain}")
+            if not data:
+                return {"tvl": 0, "protocols": []}
             
-            url = f"https://api.llama.fi/v2/historicalChainTvl/{defillama_chain}"
-            async with session.get(url, timeout=10) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if data and len(data) > 0:
-                        latest = data[-1]
-                        tvl = latest.get("tvl", 0)
-                        
-                        protocols_url = "https://api.llama.fi/protocols"
-                        async with session.get(protocols_url, timeout=10) as proto_response:
-                            if proto_response.status == 200:
-                                all_protocols = await proto_response.json()
-                                chain_protocols = [
-                                    p["name"] for p in all_protocols
-                                    if defillama_chain in p.get("chains", [])
-                                ]
-                                
-                                logger.info(f"DeFiLlama: {chain} TVL=${tvl/1e9:.2f}B, {len(chain_protocols)} protocols")
-                                return {
-                                    "tvl": tvl,
-                                    "protocols": chain_protocols[:50]  # Limit to top 50
-                                }
-                        
-                        return {"tvl": tvl, "protocols": []}
-                else:
-                    logger.warning(f"DeFiLlama API returned {response.status} for {chain}")
-                    return {"tvl": 0, "protocols": []}
+            tvl = data[-1].get("tvl", 0)
+            
+            try:
+                chain_index = await self.http_cache.get_json(f"{self.defillama_url}/protocols", transform=build_chain_index)
+            except Exception as e:
+                logger.warning(f"DeFiLlama protocol list unavailable for {chain}: {e}")
+                return {"tvl": tvl, "protocols": []}
+            
+            chain_protocols = chain_index.get(defillama_chain, [])
+            
+            logger.info(f"DeFiLlama: {chain} TVL=${tvl/1e9:.2f}B, {len(chain_protocols)} protocols")
+            return {
+                "tvl": tvl,
+                "protocols": chain_protocols[:50]  # Limit to top 50
+            }
         except asyncio.TimeoutError:
             logger.warning(f"DeFiLlama API timeout for {chain}")
             return {"tvl": 0, "protocols": []}
+        except aiohttp.ClientResponseError as e:
+            logger.warning(f"DeFiLlama API returned {e.status} for {chain}")
+            return {"tvl": 0, "protocols": []}
         except Exception as e:
             logger.error(f"Error fetching DeFiLlama data for {chain}: {e}")
             return {"tvl": 0, "protocols": []}
     
-    async def _fetch_coingecko_volume(self, session: aiohttp.ClientSession, chain: str) -> Dict:
+    async def _fetch_coingecko_volume(self, chain: str) -> Dict:
         """Fetch volume data from CoinGecko API."""
         return {"volume": 0}
     
-    async def _fetch_wallet_count(self, session: aiohttp.ClientSession, chain: str) -> Dict:
+    async def _fetch_wallet_count(self, chain: str) -> Dict:
         """Fetch active wallet count from chain-specific APIs."""
         return {"active_wallets": 0}
     
-    async def _fetch_bridge_flows(self, session: aiohttp.ClientSession, chain: str) -> Dict:
+    async def _fetch_bridge_flows(self, chain: str) -> Dict:
         """Fetch bridge flow data from bridge aggregators."""
         return {"net_flow": 0}
     
@@ -265,6 +294,14 @@ class EcosystemMapper:
         
         ecosystem_data.sort(key=lambda x: x["emi_score"], reverse=True)
         
+        if not self.use_mock_data:
+            stats = self.http_cache.stats
+            logger.info(
+                f"Upstream cache: {stats['downloads']} downloads ({stats['bytes_downloaded']} bytes), "
+                f"{stats['not_modified']} not modified; saved {stats['bytes_saved']} bytes, "
+                f"{stats['parse_seconds_saved']:.3f}s parsing"
+            )
+        
         return ecosystem_data
     
     def get_top_ecosystems(self, ecosystems: List[Dict], n: int = 10) -> List[Dict]:
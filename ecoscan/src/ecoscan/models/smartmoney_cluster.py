@@ -1,21 +1,235 @@
 """Smart Money Cluster - Cluster wallet behavior patterns."""
 
+import os
+import stat
+import pickle
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 import numpy as np
-from sklearn.cluster import KMeans, DBSCAN
+from sklearn.cluster import KMeans, DBSCAN, MiniBatchKMeans
 from sklearn.preprocessing import StandardScaler
 
 from ..config import (
     CLUSTER_N_CLUSTERS,
     CLUSTER_LOOKBACK_DAYS,
     CLUSTER_MIN_TX_COUNT,
+    CLUSTER_STATE_PATH,
     USE_MOCK_ECOSCAN_DATA,
 )
 
 logger = logging.getLogger(__name__)
 
+FEATURE_NAMES = (
+    "tx_frequency",
+    "log_avg_size",
+    "net_flow_ratio",
+    "days_since_last",
+    "wallet_age",
+    "tx_size_std",
+    "recent_activity_ratio",
+    "io_ratio",
+)
+RECENT_DAYS = 7
+STATE_VERSION = 1
+
+US_PER_DAY = 86_400 * 1_000_000
+
+
+def to_epoch_us(timestamps) -> np.ndarray:
+    """Naive UTC datetimes (or datetime64) as int64 microseconds"""
+    return np.asarray(timestamps, dtype="datetime64[us]").astype(np.int64)
+
+
+def is_private_file(info: os.stat_result) -> bool:
+    """Owned by the current user and not writable by group or others"""
+    if hasattr(os, "getuid") and info.st_uid != os.getuid():
+        return False
+    return not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def transactions_to_columns(
+    transactions: List[Dict]
+) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """Whale transaction dicts as (wallets, values_usd, directions, timestamps_us)"""
+    wallets = [tx["wallet_address"] for tx in transactions]
+    values = np.fromiter((tx["value_usd"] for tx in transactions), dtype=np.float64, count=len(transactions))
+    directions = np.array([tx["direction"] for tx in transactions], dtype=object)
+    timestamps = to_epoch_us([tx["timestamp"] for tx in transactions])
+    return wallets, values, directions, timestamps
+
+
+class WalletFeatureStore:
+    """
+    Running per-wallet aggregates from which extract_wallet_features can be
+    recomputed without the transaction history.
+    
+    Count, mean and M2 of transaction sizes are merged batch by batch
+    (Chan et al.), flows and direction counts are sums, first/last seen are
+    min/max. The 7-day recent activity count needs timestamps, so
+    transactions inside the window are kept until they age out.
+    """
+    
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.addresses: List[str] = []
+        self._capacity = 0
+        self.count = np.zeros(0, dtype=np.int64)
+        self.mean = np.zeros(0)
+        self.m2 = np.zeros(0)
+        self.inflow_sum = np.zeros(0)
+        self.outflow_sum = np.zeros(0)
+        self.inflow_count = np.zeros(0, dtype=np.int64)
+        self.outflow_count = np.zeros(0, dtype=np.int64)
+        self.first_ts = np.zeros(0, dtype=np.int64)
+        self.last_ts = np.zeros(0, dtype=np.int64)
+        
+        self._recent_rows = np.zeros(0, dtype=np.int64)
+        self._recent_ts = np.zeros(0, dtype=np.int64)
+        self._recent_cutoff = np.iinfo(np.int64).min
+    
+    def __len__(self) -> int:
+        return len(self.addresses)
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["index"]
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.index = {address: row for row, address in enumerate(self.addresses)}
+    
+    def _grow(self, size: int):
+        if size <= self._capacity:
+            return
+        capacity = max(size, 2 * self._capacity, 1024)
+        for name, fill in (
+            ("count", 0), ("mean", 0.0), ("m2", 0.0),
+            ("inflow_sum", 0.0), ("outflow_sum", 0.0),
+            ("inflow_count", 0), ("outflow_count", 0),
+            ("first_ts", np.iinfo(np.int64).max), ("last_ts", np.iinfo(np.int64).min),
+        ):
+            old = getattr(self, name)
+            new = np.full(capacity, fill, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        self._capacity = capacity
+    
+    def rows_for(self, wallets: Sequence[str]) -> np.ndarray:
+        """Row per wallet, adding wallets not seen before"""
+        index = self.index
+        addresses = self.addresses
+        rows = np.empty(len(wallets), dtype=np.int64)
+        for i, wallet in enumerate(wallets):
+            row = index.get(wallet)
+            if row is None:
+                row = index[wallet] = len(addresses)
+                addresses.append(wallet)
+            rows[i] = row
+        self._grow(len(addresses))
+        return rows
+    
+    def add(
+        self,
+        wallets: Sequence[str],
+        values_usd: np.ndarray,
+        directions: np.ndarray,
+        timestamps_us: np.ndarray
+    ) -> np.ndarray:
+        """
+        Fold a batch of transactions into the aggregates.
+        
+        Returns:
+            Rows of the wallets the batch touched
+        """
+        rows = self.rows_for(wallets)
+        if len(rows) == 0:
+            return rows
+        
+        values = np.asarray(values_usd, dtype=np.float64)
+        timestamps = np.asarray(timestamps_us, dtype=np.int64)
+        directions = np.asarray(directions)
+        inflow = directions == "inflow"
+        outflow = directions == "outflow"
+        
+        touched, local = np.unique(rows, return_inverse=True)
+        size = len(touched)
+        batch_count = np.bincount(local, minlength=size)
+        batch_mean = np.bincount(local, weights=values, minlength=size) / batch_count
+        batch_m2 = np.bincount(local, weights=(values - batch_mean[local]) ** 2, minlength=size)
+        
+        count = self.count[touched]
+        total = count + batch_count
+        delta = batch_mean - self.mean[touched]
+        self.mean[touched] += delta * batch_count / total
+        self.m2[touched] += batch_m2 + delta ** 2 * count * batch_count / total
+        self.count[touched] = total
+        
+        self.inflow_sum[touched] += np.bincount(local, weights=np.where(inflow, values, 0.0), minlength=size)
+        self.outflow_sum[touched] += np.bincount(local, weights=np.where(outflow, values, 0.0), minlength=size)
+        self.inflow_count[touched] += np.bincount(local, weights=inflow, minlength=size).astype(np.int64)
+        self.outflow_count[touched] += np.bincount(local, weights=outflow, minlength=size).astype(np.int64)
+        np.minimum.at(self.first_ts, rows, timestamps)
+        np.maximum.at(self.last_ts, rows, timestamps)
+        
+        recent = timestamps >= self._recent_cutoff
+        self._recent_rows = np.concatenate([self._recent_rows, rows[recent]])
+        self._recent_ts = np.concatenate([self._recent_ts, timestamps[recent]])
+        return touched
+    
+    def features(
+        self,
+        now_us: int,
+        min_tx_count: int,
+        rows: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Feature matrix as of now_us, in FEATURE_NAMES order.
+        
+        Args:
+            now_us: Reference time (epoch microseconds)
+            min_tx_count: Wallets with fewer transactions are left out
+            rows: Restrict to these rows (default: all wallets)
+        
+        Returns:
+            (rows, features) for the wallets with enough transactions
+        """
+        cutoff = now_us - RECENT_DAYS * US_PER_DAY
+        if cutoff > self._recent_cutoff:
+            keep = self._recent_ts >= cutoff
+            self._recent_rows = self._recent_rows[keep]
+            self._recent_ts = self._recent_ts[keep]
+            self._recent_cutoff = cutoff
+        
+        if rows is None:
+            rows = np.arange(len(self.addresses))
+        rows = rows[self.count[rows] >= min_tx_count]
+        
+        count = self.count[rows]
+        mean = self.mean[rows]
+        first_ts = self.first_ts[rows]
+        last_ts = self.last_ts[rows]
+        inflows = self.inflow_sum[rows]
+        outflows = self.outflow_sum[rows]
+        recent = np.bincount(
+            self._recent_rows[self._recent_ts >= cutoff],
+            minlength=len(self.addresses)
+        )[rows]
+        
+        time_span = (last_ts - first_ts) // US_PER_DAY + 1
+        features = np.column_stack([
+            count / np.maximum(time_span, 1),
+            np.log10(np.maximum(mean, 1)),
+            (inflows - outflows) / np.maximum(inflows + outflows, 1),
+            (now_us - last_ts) // US_PER_DAY,
+            time_span,
+            np.sqrt(self.m2[rows] / count) / np.maximum(mean, 1),
+            recent / count,
+            self.inflow_count[rows] / np.maximum(self.outflow_count[rows], 1),
+        ]).astype(np.float64)
+        return rows, features
+
 
 class SmartMoneyCluster:
     """
@@ -41,6 +255,14 @@ class SmartMoneyCluster:
             2: "dormant_activation",
         }
         
+        # Incremental mode (update_clusters)
+        self.state_path = CLUSTER_STATE_PATH
+        self.batch_size = 4096
+        self.store = WalletFeatureStore()
+        self.scaler: Optional[StandardScaler] = None
+        self.model: Optional[MiniBatchKMeans] = None
+        self._state_loaded = False
+    
     def extract_wallet_features(
         self,
         wallet_transactions: List[Dict]
@@ -50,7 +272,7 @@ class SmartMoneyCluster:
         
         Args:
             wallet_transactions: List of transactions for a wallet
-            
+        
         Returns:
             Feature vector or None if insufficient data
         """
@@ -109,7 +331,7 @@ class SmartMoneyCluster:
         Args:
             wallet_data: Dict mapping wallet_address -> transactions
             method: Clustering method ('kmeans' or 'dbscan')
-            
+        
         Returns:
             Dict mapping wallet_address -> cluster_label
         """
@@ -157,6 +379,177 @@ class SmartMoneyCluster:
         
         return wallet_clusters
     
+    def update_clusters(
+        self,
+        transactions: List[Dict],
+        now: Optional[datetime] = None,
+        refit: bool = False,
+        persist: bool = True
+    ) -> Dict[str, str]:
+        """
+        Incremental clustering: fold new transactions into the running
+        wallet aggregates and update the model.
+        
+        See update_clusters_columns.
+        """
+        return self.update_clusters_columns(
+            *transactions_to_columns(transactions),
+            now=now,
+            refit=refit,
+            persist=persist,
+        )
+    
+    def update_clusters_columns(
+        self,
+        wallets: Sequence[str],
+        values_usd: np.ndarray,
+        directions: np.ndarray,
+        timestamps_us: np.ndarray,
+        now: Optional[datetime] = None,
+        refit: bool = False,
+        persist: bool = True
+    ) -> Dict[str, str]:
+        """
+        Incremental clustering from columnar transactions.
+        
+        The first call (with no persisted state) or refit=True fits the
+        scaler and a MiniBatchKMeans on every eligible wallet. Later calls
+        keep the scaler fixed and partial_fit the existing centroids on the
+        wallets the batch touched only.
+        
+        Args:
+            wallets: Wallet address per transaction
+            values_usd: Transaction size per transaction
+            directions: 'inflow' / 'outflow' per transaction
+            timestamps_us: Naive UTC epoch microseconds per transaction
+            now: Reference time for recency features (default: utcnow)
+            refit: Refit scaler and centroids on all wallets
+            persist: Save the state to state_path afterwards
+        
+        Returns:
+            Dict mapping wallet_address -> cluster_label for every wallet
+            with enough transactions
+        """
+        if not self._state_loaded:
+            self.load_state()
+        
+        touched = self.store.add(wallets, values_usd, directions, timestamps_us)
+        now_us = int(to_epoch_us(now or datetime.utcnow()))
+        rows, features = self.store.features(now_us, self.min_tx_count)
+        
+        if len(rows) < self.n_clusters:
+            logger.warning(f"Insufficient wallets for clustering: {len(rows)}")
+            # The aggregates already include this batch
+            if persist:
+                self.save_state()
+            return {}
+        
+        if refit or self.model is None:
+            self.scaler = StandardScaler()
+            features_scaled = self.scaler.fit_transform(features)
+            self.model = MiniBatchKMeans(
+                n_clusters=self.n_clusters,
+                batch_size=self.batch_size,
+                random_state=42,
+                n_init=3
+            )
+            self.model.fit(features_scaled)
+        else:
+            features_scaled = self.scaler.transform(features)
+            batch = np.isin(rows, touched, assume_unique=True)
+            if batch.any():
+                self.model.partial_fit(features_scaled[batch])
+        
+        cluster_ids = self.model.predict(features_scaled)
+        
+        if persist:
+            self.save_state()
+        
+        labels = np.array(
+            [self.cluster_labels.get(i, f"cluster_{i}") for i in range(self.n_clusters)],
+            dtype=object
+        )
+        addresses = self.store.addresses
+        return dict(zip([addresses[row] for row in rows], labels[cluster_ids]))
+    
+    def save_state(self, path: Optional[str] = None) -> bool:
+        """
+        Persist the wallet aggregates, scaler and centroids so a restart
+        resumes incremental updates instead of refitting. Before the first
+        fit only the aggregates are saved.
+        
+        The file is written with owner-only permissions, since load_state
+        unpickles it.
+        
+        Returns:
+            True if the state was written
+        """
+        path = path or self.state_path
+        if not path:
+            return False
+        
+        state = {
+            "version": STATE_VERSION,
+            "features": FEATURE_NAMES,
+            "n_clusters": self.n_clusters,
+            "saved_at": datetime.utcnow().isoformat(),
+            "store": self.store,
+            "scaler": self.scaler,
+            "model": self.model,
+        }
+        try:
+            os.makedirs(os.path.dirname(path) or ".", mode=0o700, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                os.fchmod(f.fileno(), 0o600)
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            return True
+        except OSError as e:
+            logger.warning(f"Could not save smart money cluster state to {path}: {e}")
+            return False
+    
+    def load_state(self, path: Optional[str] = None) -> bool:
+        """
+        Restore state written by save_state.
+        
+        State from another feature set or cluster count is ignored, so the
+        next update refits. The file is only unpickled if it is owned by
+        the current user and not group or world writable.
+        
+        Returns:
+            True if state was loaded
+        """
+        self._state_loaded = True
+        path = path or self.state_path
+        if not path or not os.path.exists(path):
+            return False
+        
+        try:
+            with open(path, "rb") as f:
+                if not is_private_file(os.fstat(f.fileno())):
+                    logger.warning(f"Ignoring smart money cluster state at {path}: not owned by this user or writable by others")
+                    return False
+                state = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load smart money cluster state from {path}: {e}")
+            return False
+        
+        if (
+            state.get("version") != STATE_VERSION
+            or tuple(state.get("features", ())) != FEATURE_NAMES
+            or state.get("n_clusters") != self.n_clusters
+        ):
+            logger.info(f"Ignoring incompatible smart money cluster state at {path}")
+            return False
+        
+        self.store = state["store"]
+        self.scaler = state["scaler"]
+        self.model = state["model"]
+        logger.info(f"Loaded smart money cluster state ({len(self.store)} wallets, saved {state['saved_at']})")
+        return True
+    
     def get_cluster_statistics(
         self,
         wallet_data: Dict[str, List[Dict]],
@@ -168,7 +561,7 @@ class SmartMoneyCluster:
         Args:
             wallet_data: Dict mapping wallet_address -> transactions
             wallet_clusters: Dict mapping wallet_address -> cluster_label
-            
+        
         Returns:
             Dict mapping cluster_label -> statistics
         """
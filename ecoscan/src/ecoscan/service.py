@@ -1,9 +1,11 @@
 """Ecoscan Service - Main orchestrator for ecosystem mapping and whale intelligence."""
 
+import time
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 import psycopg
 from psycopg.rows import dict_row
 
@@ -14,6 +16,9 @@ from .config import (
     POSTGRES_USER,
     POSTGRES_PASSWORD,
     ECOSCAN_UPDATE_INTERVAL,
+    ECOSCAN_FETCH_CONCURRENCY,
+    ECOSCAN_SNAPSHOT_REDIS,
+    REDIS_URL,
 )
 from .models import (
     EcosystemMapper,
@@ -22,6 +27,7 @@ from .models import (
     EcoscoreAggregator,
     BridgeMonitor,
 )
+from .snapshot import EcoscanSnapshot, SnapshotRedisMirror, to_json_ready
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -45,49 +51,135 @@ class EcoscanService:
         self.ecoscore_aggregator = EcoscoreAggregator()
         self.bridge_monitor = BridgeMonitor()
         
-        self.db_conn = None
+        self.db_conn = None  # writes: one transaction per stage
+        self.read_conn = None  # autocommit reads, never rolled back by a failing writer
         self.update_interval = ECOSCAN_UPDATE_INTERVAL
+        self.fetch_concurrency = ECOSCAN_FETCH_CONCURRENCY
+        
+        self.db_stats = {"queries": 0, "rows_written": 0}
+        self.last_cycle: Dict = {}
+        
+        self.whale_lookback_hours = 24
+        self.snapshot: Optional[EcoscanSnapshot] = None
+        self.redis_mirror = SnapshotRedisMirror(REDIS_URL) if ECOSCAN_SNAPSHOT_REDIS else None
+        self._snapshot_version = 0
+        self._snapshot_build: Optional[asyncio.Future] = None
+        self._update_task: Optional[asyncio.Task] = None
         
     async def connect_db(self):
-        """Connect to PostgreSQL database."""
+        """
+        Connect to PostgreSQL database.
+        
+        Stage writes (COPY + commit) use db_conn. Reads use a separate
+        autocommit connection, so a failed read never rolls back, or runs
+        inside, a write transaction in progress.
+        """
+        conninfo = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
         try:
-            self.db_conn = await psycopg.AsyncConnection.connect(
-                f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}",
-                row_factory=dict_row
-            )
+            self.db_conn = await psycopg.AsyncConnection.connect(conninfo, row_factory=dict_row)
+            self.read_conn = await psycopg.AsyncConnection.connect(conninfo, row_factory=dict_row, autocommit=True)
             logger.info("Connected to database")
         except Exception as e:
             logger.error(f"Database connection error: {e}")
             raise
     
     async def close_db(self):
-        """Close database connection."""
+        """Close database connections."""
         if self.db_conn:
             await self.db_conn.close()
-            logger.info("Database connection closed")
+        if self.read_conn:
+            await self.read_conn.close()
+        logger.info("Database connection closed")
     
     async def get_assets(self) -> List[Dict]:
         """Get all assets from database."""
-        async with self.db_conn.cursor() as cur:
+        async with self.read_conn.cursor() as cur:
+            self.db_stats["queries"] += 1
             await cur.execute("SELECT * FROM assets ORDER BY symbol")
             return await cur.fetchall()
     
-    async def update_ecosystem_data(self):
-        """Update ecosystem data for all chains."""
+    async def fetch_whale_data(self, assets: List[Dict], lookback_hours: int = 24) -> Dict[str, List[Dict]]:
+        """
+        Fetch whale transactions for every asset concurrently.
+        
+        At most fetch_concurrency fetches run at once. An asset whose fetch
+        fails gets no transactions instead of failing the others.
+        
+        Returns:
+            Dict of symbol -> transactions
+        """
+        semaphore = asyncio.Semaphore(self.fetch_concurrency)
+        
+        async def fetch(symbol: str) -> List[Dict]:
+            async with semaphore:
+                return await self.whale_tracker.fetch_whale_transactions(symbol, lookback_hours=lookback_hours)
+        
+        symbols = [asset["symbol"] for asset in assets]
+        results = await asyncio.gather(*(fetch(symbol) for symbol in symbols), return_exceptions=True)
+        
+        whale_data = {}
+        for symbol, transactions in zip(symbols, results):
+            if isinstance(transactions, BaseException):
+                logger.error(f"Error fetching whale transactions for {symbol}: {transactions}")
+                transactions = []
+            whale_data[symbol] = transactions
+        return whale_data
+    
+    async def _fetch_cycle_inputs(
+        self,
+        assets: List[Dict]
+    ) -> Tuple[Optional[List[Dict]], Optional[Dict[str, List[Dict]]]]:
+        """
+        Fetch ecosystems and whale transactions concurrently.
+        
+        Returns:
+            (ecosystems, whale_data), with None for a fetch that failed
+        """
+        ecosystems, whale_data = await asyncio.gather(
+            self.ecosystem_mapper.get_all_ecosystems(),
+            self.fetch_whale_data(assets, lookback_hours=self.whale_lookback_hours),
+            return_exceptions=True,
+        )
+        if isinstance(ecosystems, BaseException):
+            logger.error(f"Error fetching ecosystems: {ecosystems}")
+            ecosystems = None
+        if isinstance(whale_data, BaseException):
+            logger.error(f"Error fetching whale data: {whale_data}")
+            whale_data = None
+        return ecosystems, whale_data
+    
+    async def _copy_rows(self, cur, table: str, columns: List[str], rows: List[tuple]) -> int:
+        """Write rows to a table with a single COPY."""
+        if not rows:
+            return 0
+        
+        self.db_stats["queries"] += 1
+        async with cur.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+            for row in rows:
+                await copy.write_row(row)
+        
+        self.db_stats["rows_written"] += len(rows)
+        return len(rows)
+    
+    async def update_ecosystem_data(self, ecosystems: Optional[List[Dict]] = None):
+        """
+        Update ecosystem data for all chains.
+        
+        Args:
+            ecosystems: Ecosystems already fetched this cycle (fetched if omitted)
+        """
         try:
             logger.info("Updating ecosystem data...")
             
-            ecosystems = await self.ecosystem_mapper.get_all_ecosystems()
+            if ecosystems is None:
+                ecosystems = await self.ecosystem_mapper.get_all_ecosystems()
             
             async with self.db_conn.cursor() as cur:
-                for ecosystem in ecosystems:
-                    await cur.execute(
-                        """
-                        INSERT INTO ecosystems (
-                            chain, protocols, tvl_usd, wallets_24h, 
-                            volume_24h, bridge_flows, emi_score, updated_at
-                        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                        """,
+                await self._copy_rows(
+                    cur,
+                    "ecosystems",
+                    ["chain", "protocols", "tvl_usd", "wallets_24h", "volume_24h", "bridge_flows", "emi_score", "updated_at"],
+                    [
                         (
                             ecosystem["chain"],
                             ecosystem["protocols"],
@@ -98,175 +190,293 @@ class EcoscanService:
                             ecosystem["emi_score"],
                             ecosystem["updated_at"],
                         )
-                    )
-                
-                await self.db_conn.commit()
+                        for ecosystem in ecosystems
+                    ]
+                )
+            
+            await self.db_conn.commit()
             
             logger.info(f"Updated {len(ecosystems)} ecosystems")
             return ecosystems
             
         except Exception as e:
             logger.error(f"Error updating ecosystem data: {e}")
+            await self._rollback()
             return []
     
-    async def update_whale_flows(self):
-        """Update whale flow data for all assets."""
+    async def update_whale_flows(
+        self,
+        assets: Optional[List[Dict]] = None,
+        whale_data: Optional[Dict[str, List[Dict]]] = None
+    ):
+        """
+        Update whale flow data for all assets.
+        
+        Args:
+            assets: Assets already loaded this cycle (loaded if omitted)
+            whale_data: Transactions already fetched this cycle (fetched if omitted)
+        """
         try:
             logger.info("Updating whale flows...")
             
-            assets = await self.get_assets()
+            if whale_data is None:
+                if assets is None:
+                    assets = await self.get_assets()
+                whale_data = await self.fetch_whale_data(assets)
             
-            all_whale_data = {}
+            all_whale_data = {
+                symbol: transactions
+                for symbol, transactions in whale_data.items()
+                if transactions
+            }
             
-            for asset in assets:
-                symbol = asset["symbol"]
-                
-                transactions = await self.whale_tracker.fetch_whale_transactions(symbol)
-                
-                if transactions:
-                    all_whale_data[symbol] = transactions
-                    
-                    async with self.db_conn.cursor() as cur:
-                        for tx in transactions:
-                            await cur.execute(
-                                """
-                                INSERT INTO whale_flows (
-                                    asset, wallet_tag, direction, value_usd, timestamp
-                                ) VALUES (%s, %s, %s, %s, %s)
-                                """,
-                                (
-                                    tx["asset"],
-                                    tx["wallet_tag"],
-                                    tx["direction"],
-                                    tx["value_usd"],
-                                    tx["timestamp"],
-                                )
-                            )
-                        
-                        await self.db_conn.commit()
+            async with self.db_conn.cursor() as cur:
+                await self._copy_rows(
+                    cur,
+                    "whale_flows",
+                    ["asset", "wallet_tag", "direction", "value_usd", "timestamp"],
+                    [
+                        (tx["asset"], tx["wallet_tag"], tx["direction"], tx["value_usd"], tx["timestamp"])
+                        for transactions in all_whale_data.values()
+                        for tx in transactions
+                    ]
+                )
+            
+            await self.db_conn.commit()
             
             logger.info(f"Updated whale flows for {len(all_whale_data)} assets")
             return all_whale_data
             
         except Exception as e:
             logger.error(f"Error updating whale flows: {e}")
+            await self._rollback()
             return {}
     
-    async def compute_ecoscores(self):
-        """Compute Ecoscores for all assets."""
+    async def compute_ecoscores(
+        self,
+        assets: Optional[List[Dict]] = None,
+        ecosystems: Optional[List[Dict]] = None,
+        whale_data: Optional[Dict[str, List[Dict]]] = None
+    ):
+        """
+        Compute Ecoscores for all assets.
+        
+        Args:
+            assets: Assets already loaded this cycle (loaded if omitted)
+            ecosystems: Ecosystems already fetched this cycle (fetched if omitted)
+            whale_data: Transactions already fetched this cycle (fetched if omitted)
+        """
         try:
             logger.info("Computing Ecoscores...")
             
-            assets = await self.get_assets()
+            if assets is None:
+                assets = await self.get_assets()
             
-            ecosystems = await self.ecosystem_mapper.get_all_ecosystems()
-            chain_emi_map = {eco["chain"]: eco["emi_score"] for eco in ecosystems}
+            if ecosystems is None:
+                ecosystems = await self.ecosystem_mapper.get_all_ecosystems()
             
-            asset_scores = {}
+            if whale_data is None:
+                whale_data = await self.fetch_whale_data(assets)
             
-            for asset in assets:
-                symbol = asset["symbol"]
-                asset_id = asset["asset_id"]
-                chain = asset.get("chain") or ""
-                chain = chain.lower() if chain else ""
-                
-                emi = chain_emi_map.get(chain, 50.0)
-                
-                transactions = await self.whale_tracker.fetch_whale_transactions(symbol)
-                wcf = self.whale_tracker.compute_wcf(transactions)
-                
-                pretrend = await self._get_pretrend_from_signals(asset_id)
-                
-                asset_scores[symbol] = {
-                    "emi": emi,
-                    "wcf": wcf,
-                    "pretrend": pretrend,
-                }
-            
-            opportunities = self.ecoscore_aggregator.rank_opportunities(asset_scores)
+            opportunities = await self._rank_opportunities(assets, ecosystems, whale_data)
             
+            signal_time = datetime.utcnow()
             async with self.db_conn.cursor() as cur:
-                for opp in opportunities:
-                    await cur.execute(
-                        """
-                        INSERT INTO ecoscore_rankings (
-                            asset, emi, wcf, ecoscore, signal_time
-                        ) VALUES (%s, %s, %s, %s, %s)
-                        """,
-                        (
-                            opp["asset"],
-                            opp["emi"],
-                            opp["wcf"],
-                            opp["ecoscore"],
-                            datetime.utcnow(),
-                        )
-                    )
-                
-                await self.db_conn.commit()
+                await self._copy_rows(
+                    cur,
+                    "ecoscore_rankings",
+                    ["asset", "emi", "wcf", "ecoscore", "signal_time"],
+                    [
+                        (opp["asset"], opp["emi"], opp["wcf"], opp["ecoscore"], signal_time)
+                        for opp in opportunities
+                    ]
+                )
+            
+            await self.db_conn.commit()
             
             logger.info(f"Computed Ecoscores for {len(opportunities)} assets")
             return opportunities
             
         except Exception as e:
             logger.error(f"Error computing Ecoscores: {e}")
+            await self._rollback()
             return []
     
-    async def _get_pretrend_from_signals(self, asset_id: int) -> Optional[float]:
-        """Get Pre-Trend probability from latest signal in database."""
+    async def _rank_opportunities(
+        self,
+        assets: List[Dict],
+        ecosystems: List[Dict],
+        whale_data: Dict[str, List[Dict]]
+    ) -> List[Dict]:
+        """Score and rank every asset from already-fetched data (reads only)."""
+        chain_emi_map = {eco["chain"]: eco["emi_score"] for eco in ecosystems}
+        pretrends = await self._get_pretrends_from_signals([asset["asset_id"] for asset in assets])
+        
+        asset_scores = {}
+        
+        for asset in assets:
+            symbol = asset["symbol"]
+            chain = asset.get("chain") or ""
+            chain = chain.lower() if chain else ""
+            
+            asset_scores[symbol] = {
+                "emi": chain_emi_map.get(chain, 50.0),
+                "wcf": self.whale_tracker.compute_wcf(whale_data.get(symbol, [])),
+                "pretrend": pretrends.get(asset["asset_id"], 0.5),
+            }
+        
+        return self.ecoscore_aggregator.rank_opportunities(asset_scores)
+    
+    async def _get_pretrends_from_signals(self, asset_ids: List[int]) -> Dict[int, float]:
+        """
+        Get Pre-Trend probability from the latest signal of each asset.
+        
+        Assets without a signal, or whose latest signal has no probability,
+        are left out (callers default them to 0.5).
+        """
+        if not asset_ids:
+            return {}
+        
         try:
-            async with self.db_conn.cursor() as cur:
+            async with self.read_conn.cursor() as cur:
+                self.db_stats["queries"] += 1
                 await cur.execute(
                     """
-                    SELECT pretrend_prob 
-                    FROM signals 
-                    WHERE asset_id = %s 
-                    ORDER BY ts DESC 
-                    LIMIT 1
+                    SELECT DISTINCT ON (asset_id) asset_id, pretrend_prob
+                    FROM signals
+                    WHERE asset_id = ANY(%s)
+                    ORDER BY asset_id, ts DESC
                     """,
-                    (asset_id,)
+                    (asset_ids,)
                 )
-                result = await cur.fetchone()
-                if result and result["pretrend_prob"] is not None:
-                    return float(result["pretrend_prob"])
-                return 0.5
+                rows = await cur.fetchall()
+            
+            return {
+                row["asset_id"]: float(row["pretrend_prob"])
+                for row in rows
+                if row["pretrend_prob"] is not None
+            }
         except Exception as e:
-            logger.error(f"Error fetching pretrend for asset_id {asset_id}: {e}")
-            return 0.5
+            logger.error(f"Error fetching pretrend for {len(asset_ids)} assets: {e}")
+            return {}
     
     async def _get_pretrend_from_alphabrain(self, symbol: str) -> Optional[float]:
-        """Get Pre-Trend probability from AlphaBrain service (deprecated, use _get_pretrend_from_signals)."""
+        """Get Pre-Trend probability from AlphaBrain service (deprecated, use _get_pretrends_from_signals)."""
         return None
     
-    async def get_summary(self) -> Dict:
-        """Get comprehensive Ecoscan summary."""
+    async def _rollback(self):
+        """Roll back a failed transaction so the connection stays usable."""
         try:
-            ecosystems = await self.ecosystem_mapper.get_all_ecosystems()
-            top_ecosystems = self.ecosystem_mapper.get_top_ecosystems(ecosystems, n=10)
-            
-            assets = await self.get_assets()
-            whale_data = {}
-            for asset in assets[:10]:
-                symbol = asset["symbol"]
-                transactions = await self.whale_tracker.fetch_whale_transactions(symbol)
-                whale_data[symbol] = transactions
-            
-            whale_heatmap = self.whale_tracker.get_whale_heatmap_data(whale_data)
-            
-            bridge_flows = await self.bridge_monitor.get_all_bridge_flows(lookback_hours=24)
-            bridge_summary = self.bridge_monitor.get_bridge_flow_summary(bridge_flows)
-            
-            opportunities = await self.compute_ecoscores()
-            top_opportunities = self.ecoscore_aggregator.get_top_opportunities(opportunities, n=10)
-            
-            wallet_data = self.smartmoney_cluster.generate_mock_wallet_data(n_wallets=50)
-            wallet_clusters = self.smartmoney_cluster.cluster_wallets(wallet_data)
-            cluster_stats = self.smartmoney_cluster.get_cluster_statistics(wallet_data, wallet_clusters)
-            cluster_summary = self.smartmoney_cluster.get_cluster_summary(wallet_clusters, cluster_stats)
+            await self.db_conn.rollback()
+        except Exception as e:
+            logger.error(f"Rollback failed: {e}")
+    
+    async def run_update_cycle(self) -> Dict:
+        """
+        Run one refresh of ecosystems, whale flows and Ecoscores.
+        
+        Assets, ecosystems and whale transactions are fetched once, with
+        the per-asset fetches running concurrently, and shared by every
+        stage; each stage then writes its rows with a single COPY. The
+        results are published as the snapshot the API reads.
+        
+        A failed fetch only skips the stages that need it: ecosystem rows
+        are still written when whale data fails and vice versa, while
+        Ecoscores and the snapshot (which need both) keep their previous
+        values.
+        
+        Returns:
+            Cycle metrics (also kept in last_cycle)
+        """
+        started = time.perf_counter()
+        queries = self.db_stats["queries"]
+        rows_written = self.db_stats["rows_written"]
+        
+        assets = await self.get_assets()
+        ecosystems, whale_data = await self._fetch_cycle_inputs(assets)
+        fetch_seconds = time.perf_counter() - started
+        
+        failed_stages = []
+        if ecosystems is not None:
+            await self.update_ecosystem_data(ecosystems)
+        else:
+            failed_stages.append("ecosystems")
+        if whale_data is not None:
+            await self.update_whale_flows(assets, whale_data)
+        else:
+            failed_stages.append("whale_flows")
+        
+        opportunities = []
+        if not failed_stages:
+            opportunities = await self.compute_ecoscores(assets, ecosystems, whale_data)
             
-            return {
+            # An empty ranking for a non-empty asset list means the stage
+            # failed; keep serving the previous snapshot
+            if opportunities or not assets:
+                await self._publish_snapshot(assets, ecosystems, whale_data, opportunities)
+            else:
+                failed_stages.append("ecoscores")
+        
+        wall_seconds = time.perf_counter() - started
+        rows_written = self.db_stats["rows_written"] - rows_written
+        self.last_cycle = {
+            "completed_at": datetime.utcnow().isoformat(),
+            "assets": len(assets),
+            "ecosystems": len(ecosystems or []),
+            "opportunities": len(opportunities),
+            "failed_stages": failed_stages,
+            "wall_seconds": wall_seconds,
+            "fetch_seconds": fetch_seconds,
+            "queries": self.db_stats["queries"] - queries,
+            "rows_written": rows_written,
+            "rows_per_second": rows_written / wall_seconds if wall_seconds > 0 else 0.0,
+        }
+        
+        logger.info(
+            f"Update cycle: {wall_seconds:.2f}s wall ({fetch_seconds:.2f}s fetching), "
+            f"{self.last_cycle['queries']} queries, {rows_written} rows "
+            f"({self.last_cycle['rows_per_second']:.0f} rows/s)"
+        )
+        if failed_stages:
+            logger.warning(f"Update cycle degraded, skipped: {', '.join(failed_stages)}")
+        return self.last_cycle
+    
+    async def _publish_snapshot(
+        self,
+        assets: List[Dict],
+        ecosystems: List[Dict],
+        whale_data: Dict[str, List[Dict]],
+        opportunities: List[Dict]
+    ) -> EcoscanSnapshot:
+        """Build every API view from one refresh and publish it."""
+        bridge_flows = await self.bridge_monitor.get_all_bridge_flows(lookback_hours=24)
+        bridge_summary = self.bridge_monitor.get_bridge_flow_summary(bridge_flows)
+        
+        top_ecosystems = self.ecosystem_mapper.get_top_ecosystems(ecosystems, n=10)
+        
+        heatmap_symbols = [asset["symbol"] for asset in assets[:10]]
+        whale_heatmap = self.whale_tracker.get_whale_heatmap_data(
+            {symbol: whale_data.get(symbol, []) for symbol in heatmap_symbols}
+        )
+        
+        whale_alerts = []
+        for transactions in whale_data.values():
+            whale_alerts.extend(self.whale_tracker.detect_whale_alerts(transactions))
+        whale_alerts.sort(key=lambda x: x["value_usd"], reverse=True)
+        
+        wallet_data = self.smartmoney_cluster.generate_mock_wallet_data(n_wallets=50)
+        wallet_clusters = self.smartmoney_cluster.cluster_wallets(wallet_data)
+        cluster_stats = self.smartmoney_cluster.get_cluster_statistics(wallet_data, wallet_clusters)
+        cluster_summary = self.smartmoney_cluster.get_cluster_summary(wallet_clusters, cluster_stats)
+        
+        ecoscore_summary = self.ecoscore_aggregator.generate_ecoscore_summary(opportunities)
+        created_at = datetime.utcnow().isoformat()
+        
+        views = {
+            "summary": {
                 "service": "Ecoscan",
                 "version": "0.1.0",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": created_at,
                 "ecosystems": {
                     "top_10": [
                         self.ecosystem_mapper.get_ecosystem_summary(eco)
@@ -284,10 +494,80 @@ class EcoscanService:
                     "top_outflow_chains": bridge_summary.get("top_outflow_chains", [])[:5],
                 },
                 "opportunities": {
-                    "top_10": top_opportunities,
-                    "summary": self.ecoscore_aggregator.generate_ecoscore_summary(opportunities),
+                    "top_10": self.ecoscore_aggregator.get_top_opportunities(opportunities, n=10),
+                    "summary": ecoscore_summary,
                 },
                 "smart_money": cluster_summary,
+            },
+            "ecosystems": [self.ecosystem_mapper.get_ecosystem_summary(eco) for eco in ecosystems],
+            "opportunities": opportunities,
+            "ecoscore_summary": ecoscore_summary,
+            "whale_alerts": whale_alerts,
+            "cluster_summary": cluster_summary,
+        }
+        
+        self._snapshot_version += 1
+        snapshot = EcoscanSnapshot(
+            version=self._snapshot_version,
+            created_at=created_at,
+            lookback_hours=self.whale_lookback_hours,
+            views=MappingProxyType(to_json_ready(views)),
+        )
+        self.snapshot = snapshot
+        
+        if self.redis_mirror is not None:
+            await self.redis_mirror.publish(snapshot)
+        
+        logger.info(f"Published snapshot v{snapshot.version}")
+        return snapshot
+    
+    async def get_snapshot(self) -> EcoscanSnapshot:
+        """
+        Latest published snapshot.
+        
+        Before the first cycle has published, concurrent callers share one
+        read-only build (or the Redis copy, when mirroring is enabled).
+        """
+        if self.snapshot is not None:
+            return self.snapshot
+        
+        if self._snapshot_build is None:
+            self._snapshot_build = asyncio.ensure_future(self._build_first_snapshot())
+            self._snapshot_build.add_done_callback(self._clear_snapshot_build)
+        return await asyncio.shield(self._snapshot_build)
+    
+    def _clear_snapshot_build(self, future: asyncio.Future):
+        self._snapshot_build = None
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Error building snapshot: {future.exception()}")
+    
+    async def _build_first_snapshot(self) -> EcoscanSnapshot:
+        """Snapshot for reads that arrive before the first cycle; writes nothing to the database."""
+        if self.redis_mirror is not None:
+            snapshot = await self.redis_mirror.load()
+            if snapshot is not None:
+                self._snapshot_version = max(self._snapshot_version, snapshot.version)
+                self.snapshot = self.snapshot or snapshot
+                return self.snapshot
+        
+        assets = await self.get_assets()
+        ecosystems, whale_data = await self._fetch_cycle_inputs(assets)
+        # Nothing to fall back to yet: serve what was fetched
+        ecosystems = ecosystems or []
+        whale_data = whale_data or {}
+        opportunities = await self._rank_opportunities(assets, ecosystems, whale_data)
+        
+        return await self._publish_snapshot(assets, ecosystems, whale_data, opportunities)
+    
+    async def get_summary(self) -> Dict:
+        """Get comprehensive Ecoscan summary from the latest snapshot."""
+        try:
+            snapshot = await self.get_snapshot()
+            
+            return {
+                **snapshot.view("summary"),
+                "timestamp": datetime.utcnow().isoformat(),
+                "snapshot": snapshot.freshness(),
             }
             
         except Exception as e:
@@ -299,24 +579,14 @@ class EcoscanService:
             }
     
     async def get_whale_alerts(self, lookback_hours: int = 24) -> List[Dict]:
-        """Get whale transaction alerts."""
+        """
+        Get whale transaction alerts from the latest snapshot.
+        
+        Lookbacks longer than the snapshot's (24h) return all of its alerts.
+        """
         try:
-            assets = await self.get_assets()
-            all_alerts = []
-            
-            for asset in assets:
-                symbol = asset["symbol"]
-                transactions = await self.whale_tracker.fetch_whale_transactions(
-                    symbol,
-                    lookback_hours=lookback_hours
-                )
-                
-                alerts = self.whale_tracker.detect_whale_alerts(transactions)
-                all_alerts.extend(alerts)
-            
-            all_alerts.sort(key=lambda x: x["value_usd"], reverse=True)
-            
-            return all_alerts
+            snapshot = await self.get_snapshot()
+            return snapshot.whale_alerts(lookback_hours)
             
         except Exception as e:
             logger.error(f"Error getting whale alerts: {e}")
@@ -328,11 +598,7 @@ class EcoscanService:
         
         while True:
             try:
-                await self.update_ecosystem_data()
-                
-                await self.update_whale_flows()
-                
-                await self.compute_ecoscores()
+                await self.run_update_cycle()
                 
                 logger.info(f"Update complete. Sleeping for {self.update_interval}s...")
                 await asyncio.sleep(self.update_interval)
@@ -340,6 +606,26 @@ class EcoscanService:
             except Exception as e:
                 logger.error(f"Error in periodic update: {e}")
                 await asyncio.sleep(60)  # Wait 1 minute before retrying
+    
+    def start(self):
+        """Start the periodic update loop in the background."""
+        if self._update_task is None or self._update_task.done():
+            self._update_task = asyncio.ensure_future(self.run_periodic_update())
+    
+    async def stop(self):
+        """Stop the periodic update loop."""
+        if self._update_task is not None:
+            self._update_task.cancel()
+            try:
+                await self._update_task
+            except asyncio.CancelledError:
+                pass
+            self._update_task = None
+        
+        if self.redis_mirror is not None:
+            await self.redis_mirror.close()
+        
+        await self.ecosystem_mapper.close()
 
 
 service = EcoscanService()
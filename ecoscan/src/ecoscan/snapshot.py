@@ -0,0 +1,129 @@
+"""Ecoscan snapshots - read-only views published by the periodic update."""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_REDIS_KEY = "ecoscan:snapshot"
+
+
+@dataclass(frozen=True)
+class EcoscanSnapshot:
+    """
+    One published refresh of ecosystems, whale flows, bridge flows and
+    ranked opportunities.
+    
+    Views are JSON-ready (timestamps as ISO strings) and are not modified
+    after the snapshot is created, so API reads are plain lookups.
+    """
+    version: int
+    created_at: str
+    lookback_hours: int
+    views: Mapping[str, Any] = field(default_factory=dict)
+    
+    def view(self, name: str) -> Any:
+        """One precomputed view"""
+        return self.views.get(name)
+    
+    def age_seconds(self) -> float:
+        return (datetime.utcnow() - datetime.fromisoformat(self.created_at)).total_seconds()
+    
+    def freshness(self) -> Dict[str, Any]:
+        """Version and age, returned alongside snapshot-backed responses"""
+        return {
+            "version": self.version,
+            "updated_at": self.created_at,
+            "age_seconds": round(self.age_seconds(), 1),
+            "lookback_hours": self.lookback_hours,
+        }
+    
+    def whale_alerts(self, lookback_hours: int) -> List[Dict]:
+        """
+        Alerts no older than lookback_hours, largest first.
+        
+        Lookbacks beyond the snapshot's own are served from what the
+        snapshot holds.
+        """
+        alerts = self.views.get("whale_alerts", [])
+        if lookback_hours >= self.lookback_hours:
+            return list(alerts)
+        
+        cutoff = datetime.utcnow() - timedelta(hours=lookback_hours)
+        return [
+            alert for alert in alerts
+            if datetime.fromisoformat(alert["timestamp"]) >= cutoff
+        ]
+    
+    def to_json(self) -> str:
+        return json.dumps({
+            "version": self.version,
+            "created_at": self.created_at,
+            "lookback_hours": self.lookback_hours,
+            "views": dict(self.views),
+        })
+    
+    @classmethod
+    def from_json(cls, data: str) -> "EcoscanSnapshot":
+        payload = json.loads(data)
+        return cls(
+            version=payload["version"],
+            created_at=payload["created_at"],
+            lookback_hours=payload["lookback_hours"],
+            views=MappingProxyType(payload["views"]),
+        )
+
+
+def to_json_ready(value: Any) -> Any:
+    """Round-trip through JSON so views hold no datetimes or numpy scalars"""
+    return json.loads(json.dumps(value, default=_json_default))
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+class SnapshotRedisMirror:
+    """
+    Optional Redis copy of the latest snapshot, so a process that has not
+    refreshed yet (or another service) can read it.
+    """
+    
+    def __init__(self, redis_url: str, key: str = SNAPSHOT_REDIS_KEY, ttl_seconds: Optional[int] = None):
+        self.redis_url = redis_url
+        self.key = key
+        self.ttl_seconds = ttl_seconds
+        self._client = None
+    
+    def _get_client(self):
+        if self._client is None:
+            import redis.asyncio as redis
+            self._client = redis.from_url(self.redis_url)
+        return self._client
+    
+    async def publish(self, snapshot: EcoscanSnapshot) -> None:
+        try:
+            await self._get_client().set(self.key, snapshot.to_json(), ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Could not mirror snapshot to Redis: {e}")
+    
+    async def load(self) -> Optional[EcoscanSnapshot]:
+        try:
+            data = await self._get_client().get(self.key)
+            return EcoscanSnapshot.from_json(data) if data else None
+        except Exception as e:
+            logger.warning(f"Could not load snapshot from Redis: {e}")
+            return None
+    
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1 @@
+"""Tests for ecoscan service."""
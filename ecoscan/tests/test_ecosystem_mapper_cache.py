@@ -0,0 +1,158 @@
+"""Tests for the EcosystemMapper upstream response cache."""
+import json
+import random
+from contextlib import asynccontextmanager
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from ecoscan.models.ecosystem_mapper import DEFILLAMA_CHAIN_NAMES, EcosystemMapper
+
+
+def make_protocols(n=5000):
+    rng = random.Random(46)
+    names = list(DEFILLAMA_CHAIN_NAMES.values())
+    return [
+        {"name": f"Protocol {i}", "category": "Dexes", "tvl": rng.random() * 1e9, "chains": rng.sample(names, rng.randint(1, 4))}
+        for i in range(n)
+    ]
+
+
+@asynccontextmanager
+async def fixture_server(protocols):
+    """Local stand-in for DeFiLlama that counts requests and honours ETags."""
+    body = json.dumps(protocols).encode()
+    etag = '"protocols-v1"'
+    state = {"protocols": 0, "protocols_304": 0, "protocol_bytes": 0, "tvl": 0, "fail": False}
+
+    async def get_protocols(request):
+        state["protocols"] += 1
+        if state["fail"]:
+            return web.Response(status=500)
+        if request.headers.get("If-None-Match") == etag:
+            state["protocols_304"] += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        state["protocol_bytes"] += len(body)
+        return web.Response(body=body, content_type="application/json", headers={"ETag": etag})
+
+    async def get_chain_tvl(request):
+        state["tvl"] += 1
+        return web.json_response([{"date": 1700000000, "tvl": 1.5e9}, {"date": 1700086400, "tvl": 2.0e9}])
+
+    app = web.Application()
+    app.router.add_get("/protocols", get_protocols)
+    app.router.add_get("/v2/historicalChainTvl/{chain}", get_chain_tvl)
+
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield str(server.make_url("")).rstrip("/"), state, len(body)
+    finally:
+        await server.close()
+
+
+def make_mapper(base_url, ttl_seconds=300.0):
+    mapper = EcosystemMapper()
+    mapper.use_mock_data = False
+    mapper.defillama_url = base_url
+    mapper.http_cache.ttl_seconds = ttl_seconds
+    return mapper
+
+
+@pytest.mark.asyncio
+async def test_protocol_list_fetched_once_per_refresh():
+    """All chains share one download and parse of the protocol list."""
+    protocols = make_protocols()
+    async with fixture_server(protocols) as (base_url, state, size):
+        mapper = make_mapper(base_url)
+        try:
+            ecosystems = await mapper.get_all_ecosystems()
+        finally:
+            await mapper.close()
+
+    assert state["protocols"] == 1
+    assert state["tvl"] == len(mapper.supported_chains)
+
+    for eco in ecosystems:
+        name = DEFILLAMA_CHAIN_NAMES[eco["chain"]]
+        expected = [p["name"] for p in protocols if name in p["chains"]][:50]
+        assert eco["protocols"] == expected
+        assert eco["tvl_usd"] == 2.0e9
+
+    stats = mapper.http_cache.stats
+    shared = len(mapper.supported_chains) - 1
+    assert stats["bytes_saved"] >= shared * size
+
+
+@pytest.mark.asyncio
+async def test_refresh_uses_one_http_session(monkeypatch):
+    """Every chain's fetch goes through the cache's shared session."""
+    created = []
+    client_session = aiohttp.ClientSession
+
+    def counting_session(*args, **kwargs):
+        created.append(client_session(*args, **kwargs))
+        return created[-1]
+
+    monkeypatch.setattr(aiohttp, "ClientSession", counting_session)
+    async with fixture_server(make_protocols(200)) as (base_url, state, size):
+        mapper = make_mapper(base_url)
+        try:
+            await mapper.get_all_ecosystems()
+            await mapper.get_all_ecosystems()
+        finally:
+            await mapper.close()
+
+    assert len(created) == 1
+
+
+@pytest.mark.asyncio
+async def test_fresh_responses_served_without_upstream_request():
+    """A refresh within the TTL makes no upstream requests."""
+    async with fixture_server(make_protocols(200)) as (base_url, state, size):
+        mapper = make_mapper(base_url)
+        try:
+            first = await mapper.get_all_ecosystems()
+            second = await mapper.get_all_ecosystems()
+        finally:
+            await mapper.close()
+
+    assert state["protocols"] == 1
+    assert state["tvl"] == len(mapper.supported_chains)
+    assert [eco["protocols"] for eco in first] == [eco["protocols"] for eco in second]
+
+
+@pytest.mark.asyncio
+async def test_stale_responses_revalidated_with_etag():
+    """After the TTL, one conditional request per refresh and no re-download."""
+    async with fixture_server(make_protocols(200)) as (base_url, state, size):
+        mapper = make_mapper(base_url, ttl_seconds=0)
+        try:
+            first = await mapper.get_all_ecosystems()
+            second = await mapper.get_all_ecosystems()
+        finally:
+            await mapper.close()
+
+    assert state["protocols"] == 2
+    assert state["protocols_304"] == 1
+    assert state["protocol_bytes"] == size
+    assert [eco["protocols"] for eco in first] == [eco["protocols"] for eco in second]
+
+
+@pytest.mark.asyncio
+async def test_stale_response_served_when_upstream_fails():
+    """A failed revalidation falls back to the cached protocol index."""
+    async with fixture_server(make_protocols(200)) as (base_url, state, size):
+        mapper = make_mapper(base_url, ttl_seconds=0)
+        try:
+            first = await mapper.get_all_ecosystems()
+            state["fail"] = True
+            second = await mapper.get_all_ecosystems()
+        finally:
+            await mapper.close()
+
+    assert state["protocols"] == 2
+    assert [eco["protocols"] for eco in first] == [eco["protocols"] for eco in second]
+    assert all(eco["protocols"] for eco in second)
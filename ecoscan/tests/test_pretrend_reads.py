@@ -0,0 +1,53 @@
+"""Tests that snapshot reads cannot roll back a write in progress.
+
+Runs against the POSTGRES_* database and is skipped when it is not
+reachable.
+"""
+import os
+
+import psycopg
+import pytest
+from psycopg.rows import dict_row
+
+from ecoscan.service import EcoscanService
+
+SCHEMA = "ecoscan_test"
+CONNINFO = (
+    f"postgresql://{os.getenv('POSTGRES_USER', 'ghost')}:{os.getenv('POSTGRES_PASSWORD', 'ghostpass')}"
+    f"@{os.getenv('POSTGRES_HOST', 'localhost')}:{os.getenv('POSTGRES_PORT', '5432')}/{os.getenv('POSTGRES_DB', 'ghostquant')}"
+)
+
+
+async def connect(**kwargs):
+    return await psycopg.AsyncConnection.connect(
+        CONNINFO, row_factory=dict_row, options=f"-c search_path={SCHEMA}", connect_timeout=3, **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_pretrend_read_keeps_pending_write():
+    try:
+        admin = await connect(autocommit=True)
+    except psycopg.OperationalError as e:
+        pytest.skip(f"Postgres not available: {e}")
+
+    await admin.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    await admin.execute(f"CREATE SCHEMA {SCHEMA}")
+    await admin.execute(f"CREATE TABLE {SCHEMA}.ecosystems (chain TEXT)")
+    service = EcoscanService()
+    try:
+        service.db_conn = await connect()
+        service.read_conn = await connect(autocommit=True)
+
+        async with service.db_conn.cursor() as cur:
+            await service._copy_rows(cur, "ecosystems", ["chain"], [("ethereum",), ("solana",)])
+        # No signals table in the schema: the read fails mid-write
+        assert await service._get_pretrends_from_signals([1, 2]) == {}
+        await service.db_conn.commit()
+
+        rows = await (await admin.execute("SELECT chain FROM ecosystems ORDER BY chain")).fetchall()
+        assert [row["chain"] for row in rows] == ["ethereum", "solana"]
+    finally:
+        await service.close_db()
+        await admin.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        await admin.close()
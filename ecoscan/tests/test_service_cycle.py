@@ -0,0 +1,63 @@
+"""Tests for per-stage degradation in EcoscanService.run_update_cycle."""
+import pytest
+
+from ecoscan.service import EcoscanService
+
+ASSETS = [{"asset_id": 1, "symbol": "ETH"}, {"asset_id": 2, "symbol": "SOL"}]
+ECOSYSTEMS = [{"chain": "ethereum"}]
+
+
+def make_service(monkeypatch, fail_ecosystems=False, fail_symbols=()):
+    service = EcoscanService()
+    calls = []
+
+    async def get_assets():
+        return ASSETS
+
+    async def get_all_ecosystems():
+        if fail_ecosystems:
+            raise RuntimeError("DeFiLlama down")
+        return ECOSYSTEMS
+
+    async def fetch_whale_transactions(symbol, lookback_hours=24):
+        if symbol in fail_symbols:
+            raise RuntimeError("upstream timeout")
+        return [{"symbol": symbol}]
+
+    def recorder(name, result=None):
+        async def record(*args):
+            calls.append((name, args))
+            return result
+        return record
+
+    monkeypatch.setattr(service, "get_assets", get_assets)
+    monkeypatch.setattr(service.ecosystem_mapper, "get_all_ecosystems", get_all_ecosystems)
+    monkeypatch.setattr(service.whale_tracker, "fetch_whale_transactions", fetch_whale_transactions)
+    monkeypatch.setattr(service, "update_ecosystem_data", recorder("ecosystems"))
+    monkeypatch.setattr(service, "update_whale_flows", recorder("whale_flows"))
+    monkeypatch.setattr(service, "compute_ecoscores", recorder("ecoscores", [{"symbol": "ETH"}]))
+    monkeypatch.setattr(service, "_publish_snapshot", recorder("publish"))
+    return service, calls
+
+
+@pytest.mark.asyncio
+async def test_failed_asset_fetch_degrades_to_empty(monkeypatch):
+    service, calls = make_service(monkeypatch, fail_symbols={"SOL"})
+
+    cycle = await service.run_update_cycle()
+
+    assert [name for name, _ in calls] == ["ecosystems", "whale_flows", "ecoscores", "publish"]
+    assert dict(calls)["whale_flows"][1] == {"ETH": [{"symbol": "ETH"}], "SOL": []}
+    assert cycle["failed_stages"] == []
+
+
+@pytest.mark.asyncio
+async def test_failed_ecosystem_fetch_skips_dependent_stages(monkeypatch):
+    service, calls = make_service(monkeypatch, fail_ecosystems=True)
+
+    cycle = await service.run_update_cycle()
+
+    # Whale flows are still written; Ecoscores and the snapshot keep their previous values
+    assert [name for name, _ in calls] == ["whale_flows"]
+    assert cycle["failed_stages"] == ["ecosystems"]
+    assert cycle["ecosystems"] == 0
@@ -0,0 +1,128 @@
+"""Tests for incremental smart money clustering and its persisted state."""
+import os
+import pickle
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from ecoscan.models import smartmoney_cluster
+from ecoscan.models.smartmoney_cluster import (
+    SmartMoneyCluster,
+    WalletFeatureStore,
+    to_epoch_us,
+    transactions_to_columns,
+)
+
+
+def mock_transactions(n_wallets=40):
+    wallet_data = SmartMoneyCluster().generate_mock_wallet_data(n_wallets=n_wallets)
+    return wallet_data, [tx for txs in wallet_data.values() for tx in txs]
+
+
+def make_cluster(path):
+    cluster = SmartMoneyCluster()
+    cluster.state_path = str(path)
+    return cluster
+
+
+def test_store_features_match_extract_wallet_features():
+    cluster = SmartMoneyCluster()
+    wallet_data, transactions = mock_transactions()
+    store = WalletFeatureStore()
+    # Two batches, so the merged aggregates are exercised
+    half = len(transactions) // 2
+    store.add(*transactions_to_columns(transactions[:half]))
+    store.add(*transactions_to_columns(transactions[half:]))
+
+    rows, features = store.features(int(to_epoch_us(datetime.utcnow())), cluster.min_tx_count)
+    expected = np.array([cluster.extract_wallet_features(wallet_data[store.addresses[row]]) for row in rows])
+
+    assert len(rows) == len(wallet_data)
+    np.testing.assert_allclose(features, expected, rtol=1e-9, atol=1e-9)
+
+
+def test_update_partial_fits_touched_wallets_only(tmp_path, monkeypatch):
+    cluster = make_cluster(tmp_path / "state.pkl")
+    wallet_data, transactions = mock_transactions()
+    now = datetime.utcnow()
+    cluster.update_clusters(transactions, now=now)
+
+    fitted = []
+    monkeypatch.setattr(cluster.model, "partial_fit", lambda X: fitted.append(X))
+    touched = list(wallet_data)[:2]
+    batch = [
+        {"wallet_address": wallet, "direction": "inflow", "value_usd": 5e5, "timestamp": now - timedelta(hours=1)}
+        for wallet in touched
+    ]
+    labels = cluster.update_clusters(batch, now=now, persist=False)
+
+    assert len(fitted) == 1
+    rows = cluster.store.rows_for(touched)
+    _, features = cluster.store.features(int(to_epoch_us(now)), cluster.min_tx_count, rows)
+    np.testing.assert_allclose(fitted[0], cluster.scaler.transform(features))
+    assert set(labels) == set(wallet_data)
+
+
+def test_state_round_trip(tmp_path):
+    path = tmp_path / "state.pkl"
+    cluster = make_cluster(path)
+    _, transactions = mock_transactions()
+    now = datetime.utcnow()
+    labels = cluster.update_clusters(transactions, now=now)
+    assert os.stat(path).st_mode & 0o777 == 0o600
+
+    restored = make_cluster(path)
+    assert restored.load_state()
+    assert restored.store.addresses == cluster.store.addresses
+    assert restored.store.index == cluster.store.index
+    np.testing.assert_array_equal(restored.model.cluster_centers_, cluster.model.cluster_centers_)
+    np.testing.assert_array_equal(restored.scaler.mean_, cluster.scaler.mean_)
+    assert restored.update_clusters([], now=now, persist=False) == labels
+
+
+def test_incompatible_state_forces_refit(tmp_path, monkeypatch):
+    path = tmp_path / "state.pkl"
+    _, transactions = mock_transactions()
+    make_cluster(path).update_clusters(transactions)
+
+    wider = make_cluster(path)
+    wider.n_clusters = 4
+    assert not wider.load_state()
+    assert wider.model is None and len(wider.store) == 0
+    wider.update_clusters(transactions, persist=False)
+    assert wider.model.cluster_centers_.shape[0] == 4
+
+    monkeypatch.setattr(smartmoney_cluster, "STATE_VERSION", smartmoney_cluster.STATE_VERSION + 1)
+    assert not make_cluster(path).load_state()
+
+
+def test_state_writable_by_others_is_not_loaded(tmp_path):
+    path = tmp_path / "state.pkl"
+    _, transactions = mock_transactions()
+    make_cluster(path).update_clusters(transactions)
+
+    os.chmod(path, 0o666)
+    assert not make_cluster(path).load_state()
+
+    os.chmod(path, 0o600)
+    assert make_cluster(path).load_state()
+
+
+def test_aggregates_are_saved_before_clustering_starts(tmp_path):
+    path = tmp_path / "state.pkl"
+    wallet_data, transactions = mock_transactions()
+    first_wallet = list(wallet_data)[0]
+
+    cluster = make_cluster(path)
+    assert cluster.update_clusters(wallet_data[first_wallet]) == {}
+    with open(path, "rb") as f:
+        assert pickle.load(f)["model"] is None
+
+    restarted = make_cluster(path)
+    assert restarted.load_state()
+    assert restarted.store.addresses == [first_wallet]
+    rest = [tx for tx in transactions if tx["wallet_address"] != first_wallet]
+    labels = restarted.update_clusters(rest)
+    assert set(labels) == set(wallet_data)
+    row = restarted.store.index[first_wallet]
+    assert restarted.store.count[row] == len(wallet_data[first_wallet])
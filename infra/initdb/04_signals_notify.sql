@@ -0,0 +1,16 @@
+-- Wake the alerts engine as soon as a signal is written.
+-- The payload is informational; the engine reads new rows with a watermark query.
+-- The channel name must match the engine's ALERTS_SIGNALS_CHANNEL (default
+-- signals_new); change both together, or the engine falls back to polling.
+
+CREATE OR REPLACE FUNCTION notify_signal_insert() RETURNS trigger AS $$
+BEGIN
+  PERFORM pg_notify('signals_new', json_build_object('asset_id', NEW.asset_id, 'ts', NEW.ts)::text);
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS signals_notify ON signals;
+CREATE TRIGGER signals_notify
+  AFTER INSERT ON signals
+  FOR EACH ROW EXECUTE FUNCTION notify_signal_insert();
@@ -0,0 +1,13 @@
+-- Ingester OHLCV upserts use ON CONFLICT (symbol, ts, timeframe)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_ohlcv_symbol_ts_timeframe ON ohlcv (symbol, ts, timeframe);
+
+-- Completed backfill chunks, so an interrupted backfill resumes where it stopped
+CREATE TABLE IF NOT EXISTS ohlcv_backfill_checkpoints (
+    symbol TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    chunk_start TIMESTAMPTZ NOT NULL,
+    chunk_end TIMESTAMPTZ NOT NULL,
+    records INT NOT NULL,
+    completed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (symbol, timeframe, chunk_start, chunk_end)
+);
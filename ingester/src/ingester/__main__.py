@@ -6,6 +6,7 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+from .backfill import BackfillScheduler
 from .fetcher import OHLCVFetcher
 from .coingecko_client import CoinGeckoClient
 
@@ -56,6 +57,7 @@ async def backfill_command(args):
         start_date = datetime.fromisoformat(args.start) if args.start else datetime(2022, 1, 1)
         end_date = datetime.fromisoformat(args.end) if args.end else datetime.utcnow()
         
+        targets = []
         for token in tokens:
             symbol = token.get('symbol', '').upper()
             coin_id = token.get('id', token.get('coingecko_id', ''))
@@ -64,18 +66,10 @@ async def backfill_command(args):
                 logger.warning(f"Skipping token with missing symbol or id: {token}")
                 continue
             
-            try:
-                logger.info(f"Backfilling {symbol} ({coin_id})...")
-                await fetcher.backfill_ohlcv(
-                    symbol=symbol,
-                    coin_id=coin_id,
-                    timeframe=args.timeframe,
-                    start_date=start_date,
-                    end_date=end_date
-                )
-            except Exception as e:
-                logger.error(f"Error backfilling {symbol}: {e}")
-                continue
+            targets.append({'symbol': symbol, 'coin_id': coin_id})
+        
+        scheduler = BackfillScheduler(fetcher, concurrency=args.concurrency)
+        await scheduler.run(targets, args.timeframe, start_date, end_date)
         
         logger.info("Backfill complete")
         
@@ -112,7 +106,7 @@ async def list_coins_command(args):
         
         if len(coins) > args.limit:
             print(f"\n... and {len(coins) - args.limit} more")
-    
+        
     finally:
         await client.close()
 
@@ -134,6 +128,7 @@ def main():
     backfill_parser.add_argument('--timeframe', default='1d', help='Timeframe (default: 1d)')
     backfill_parser.add_argument('--start', help='Start date (ISO format, default: 2022-01-01)')
     backfill_parser.add_argument('--end', help='End date (ISO format, default: now)')
+    backfill_parser.add_argument('--concurrency', type=int, help='Chunks fetched concurrently (default: BACKFILL_CONCURRENCY)')
     
     run_parser = subparsers.add_parser('run', help='Run ingester as daemon')
     
@@ -0,0 +1,168 @@
+"""Concurrent, resumable OHLCV backfill."""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple
+
+from .config import config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BackfillChunk:
+    """One (symbol, [start, end)) unit of backfill work."""
+    symbol: str
+    coin_id: str
+    start: datetime
+    end: datetime
+
+
+def plan_chunks(
+    start_date: datetime,
+    end_date: datetime,
+    chunk_days: int
+) -> List[Tuple[datetime, datetime]]:
+    """
+    Split [start_date, end_date) into chunks aligned to UTC midnight.
+    
+    Aligned, non-overlapping chunks mean every daily candle comes from
+    exactly one chunk, and a re-run plans the same chunks so checkpoints
+    match.
+    
+    Args:
+        start_date: Start date (floored to midnight)
+        end_date: End date (exclusive)
+        chunk_days: Days per chunk
+    
+    Returns:
+        List of (chunk_start, chunk_end)
+    """
+    current = datetime.combine(start_date.date(), datetime.min.time())
+    chunks = []
+    
+    while current < end_date:
+        chunk_end = min(current + timedelta(days=chunk_days), end_date)
+        chunks.append((current, chunk_end))
+        current = chunk_end
+    
+    return chunks
+
+
+class BackfillScheduler:
+    """
+    Runs backfill chunks for many symbols concurrently.
+    
+    - Requests are paced by the CoinGecko client's shared rate limiter,
+      so concurrency only fills the rate budget, never exceeds it
+    - Each completed chunk is checkpointed in the same transaction as its
+      rows; a re-run skips checkpointed chunks
+    - Chunks that end after the last complete day are written but not
+      checkpointed, so they are fetched again next time
+    - Symbols are interleaved so every symbol makes progress
+    """
+    
+    def __init__(self, fetcher, concurrency: Optional[int] = None):
+        self.fetcher = fetcher
+        self.concurrency = concurrency or config.backfill_concurrency
+    
+    async def run(
+        self,
+        tokens: List[Dict[str, str]],
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        chunk_days: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Backfill OHLCV for tokens over [start_date, end_date).
+        
+        Args:
+            tokens: List of {'symbol': ..., 'coin_id': ...}
+            timeframe: Timeframe
+            start_date: Start date
+            end_date: End date
+            chunk_days: Days per chunk (default: config.backfill_chunk_days)
+        
+        Returns:
+            Run statistics (chunk counts, records, chunks_per_second)
+        """
+        started = time.perf_counter()
+        chunk_days = chunk_days or config.backfill_chunk_days
+        ranges = plan_chunks(start_date, end_date, chunk_days)
+        symbols = [token['symbol'] for token in tokens]
+        
+        completed = await self.fetcher.db.get_completed_chunks(symbols, timeframe)
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        skipped = 0
+        for chunk_start, chunk_end in ranges:
+            for token in tokens:
+                if (token['symbol'], chunk_start, chunk_end) in completed:
+                    skipped += 1
+                    continue
+                queue.put_nowait(BackfillChunk(token['symbol'], token['coin_id'], chunk_start, chunk_end))
+        
+        pending = queue.qsize()
+        logger.info(
+            f"Backfill plan: {len(tokens)} symbols x {len(ranges)} chunks, "
+            f"{skipped} already completed, {pending} to fetch"
+        )
+        
+        complete_before = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+        stats = {
+            'chunks_total': len(ranges) * len(tokens),
+            'chunks_skipped': skipped,
+            'chunks_done': 0,
+            'chunks_failed': 0,
+            'records': 0,
+        }
+        
+        async def worker():
+            while True:
+                try:
+                    chunk = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                
+                try:
+                    records = await self.fetcher.fetch_ohlcv_range(
+                        chunk.coin_id,
+                        timeframe,
+                        chunk.start,
+                        chunk.end
+                    )
+                    await self.fetcher.db.upsert_ohlcv_chunk(
+                        chunk.symbol,
+                        timeframe,
+                        records,
+                        chunk.start,
+                        chunk.end,
+                        checkpoint=chunk.end <= complete_before
+                    )
+                    stats['chunks_done'] += 1
+                    stats['records'] += len(records)
+                    logger.info(
+                        f"Backfilled {len(records)} records for {chunk.symbol} "
+                        f"({chunk.start.date()} to {chunk.end.date()})"
+                    )
+                except Exception as e:
+                    stats['chunks_failed'] += 1
+                    logger.error(
+                        f"Error backfilling {chunk.symbol} chunk "
+                        f"({chunk.start.date()} to {chunk.end.date()}): {e}"
+                    )
+        
+        await asyncio.gather(*(worker() for _ in range(min(self.concurrency, max(pending, 1)))))
+        
+        stats['wall_seconds'] = time.perf_counter() - started
+        stats['chunks_per_second'] = stats['chunks_done'] / max(stats['wall_seconds'], 1e-9)
+        
+        logger.info(
+            f"Backfill complete: {stats['chunks_done']} chunks, {stats['records']} records, "
+            f"{stats['chunks_failed']} failed, {stats['chunks_skipped']} skipped "
+            f"({stats['chunks_per_second']:.1f} chunks/s)"
+        )
+        return stats
@@ -0,0 +1,92 @@
+"""Candle aggregation for CoinGecko price series."""
+from typing import List, Dict, Any, Sequence
+
+import numpy as np
+
+DAY_MS = 86_400_000
+
+TIMEFRAME_MS = {
+    "1h": 3_600_000,
+    "4h": 4 * 3_600_000,
+    "1d": DAY_MS,
+}
+
+
+def timeframe_ms(timeframe: str) -> int:
+    """Bucket size for a timeframe (daily for anything not listed)."""
+    return TIMEFRAME_MS.get(timeframe, DAY_MS)
+
+
+def aggregate_candles(
+    prices: Sequence[Sequence[float]],
+    volumes: Sequence[Sequence[float]],
+    bucket_ms: int = DAY_MS
+) -> List[Dict[str, Any]]:
+    """
+    Aggregate market_chart prices and volumes into OHLCV candles.
+    
+    Buckets are aligned to UTC. A price's volume is the total_volumes entry
+    with the same timestamp (0 if there is none); candle volume is the sum
+    over the bucket.
+    
+    Args:
+        prices: [[timestamp_ms, price], ...]
+        volumes: [[timestamp_ms, volume], ...]
+        bucket_ms: Candle size in milliseconds
+    
+    Returns:
+        List of OHLCV dicts with keys: ts, open, high, low, close, volume
+    """
+    if len(prices) == 0:
+        return []
+    
+    price_data = np.asarray(prices, dtype=np.float64).reshape(-1, 2)
+    ts_ms = price_data[:, 0].astype(np.int64)
+    price = price_data[:, 1]
+    
+    order = np.argsort(ts_ms, kind="stable")
+    ts_ms = ts_ms[order]
+    price = price[order]
+    
+    volume = np.zeros(len(ts_ms))
+    if len(volumes) > 0:
+        volume_data = np.asarray(volumes, dtype=np.float64).reshape(-1, 2)
+        volume_ts = volume_data[:, 0].astype(np.int64)
+        volume_order = np.argsort(volume_ts, kind="stable")
+        volume_ts = volume_ts[volume_order]
+        volume_values = volume_data[volume_order, 1]
+        
+        # Last entry wins for duplicate timestamps
+        match = np.searchsorted(volume_ts, ts_ms, side="right") - 1
+        found = (match >= 0) & (volume_ts[np.maximum(match, 0)] == ts_ms)
+        volume[found] = volume_values[match[found]]
+    
+    bucket = ts_ms // bucket_ms
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(bucket)] - 1
+    
+    bucket_ts = (bucket[starts] * bucket_ms).astype("datetime64[ms]")
+    opens = price[starts]
+    highs = np.maximum.reduceat(price, starts)
+    lows = np.minimum.reduceat(price, starts)
+    closes = price[ends]
+    bucket_volumes = np.add.reduceat(volume, starts)
+    
+    return [
+        {
+            'ts': ts,
+            'open': o,
+            'high': h,
+            'low': l,
+            'close': c,
+            'volume': v
+        }
+        for ts, o, h, l, c, v in zip(
+            bucket_ts.tolist(),
+            opens.tolist(),
+            highs.tolist(),
+            lows.tolist(),
+            closes.tolist(),
+            bucket_volumes.tolist()
+        )
+    ]
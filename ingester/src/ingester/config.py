@@ -23,7 +23,8 @@ class IngesterConfig(BaseSettings):
     postgres_password: str = os.getenv("POSTGRES_PASSWORD", "ghostpass")
     
     backfill_chunk_days: int = int(os.getenv("BACKFILL_CHUNK_DAYS", "30"))
-    backfill_delay_seconds: float = float(os.getenv("BACKFILL_DELAY_SECONDS", "1.0"))
+    backfill_delay_seconds: float = float(os.getenv("BACKFILL_DELAY_SECONDS", "1.0"))  # unused; backfill is paced by the rate limiter
+    backfill_concurrency: int = int(os.getenv("BACKFILL_CONCURRENCY", "8"))
     
     @property
     def postgres_url(self) -> str:
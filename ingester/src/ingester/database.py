@@ -1,13 +1,45 @@
 """Database operations for ingester."""
 import asyncpg
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime
 
 from .config import config
 
 logger = logging.getLogger(__name__)
 
+# One statement per batch: rows are passed as column arrays and unnested
+UPSERT_OHLCV_QUERY = """
+    INSERT INTO ohlcv (symbol, ts, open, high, low, close, volume, timeframe, source)
+    SELECT $1, t.ts, t.open, t.high, t.low, t.close, t.volume, $2, $3
+    FROM unnest(
+        $4::timestamptz[],
+        $5::double precision[],
+        $6::double precision[],
+        $7::double precision[],
+        $8::double precision[],
+        $9::double precision[]
+    ) AS t(ts, open, high, low, close, volume)
+    ON CONFLICT (symbol, ts, timeframe) DO UPDATE SET
+        open = EXCLUDED.open,
+        high = EXCLUDED.high,
+        low = EXCLUDED.low,
+        close = EXCLUDED.close,
+        volume = EXCLUDED.volume,
+        source = EXCLUDED.source
+"""
+
+
+def _ohlcv_columns(data: List[Dict[str, Any]]) -> Tuple[list, ...]:
+    return (
+        [row['ts'] for row in data],
+        [row['open'] for row in data],
+        [row['high'] for row in data],
+        [row['low'] for row in data],
+        [row['close'] for row in data],
+        [row['volume'] for row in data],
+    )
+
 
 class Database:
     """Database connection and operations."""
@@ -46,7 +78,7 @@ class Database:
             timeframe: Timeframe (e.g., '1d', '1h')
             data: List of OHLCV dicts with keys: ts, open, high, low, close, volume
             source: Data source
-            
+        
         Returns:
             Number of rows inserted/updated
         """
@@ -56,38 +88,94 @@ class Database:
         if not data:
             return 0
         
-        records = [
-            (
-                symbol,
-                row['ts'],
-                row['open'],
-                row['high'],
-                row['low'],
-                row['close'],
-                row['volume'],
-                timeframe,
-                source
-            )
-            for row in data
-        ]
+        async with self.pool.acquire() as conn:
+            await conn.execute(UPSERT_OHLCV_QUERY, symbol, timeframe, source, *_ohlcv_columns(data))
+        
+        logger.info(f"Upserted {len(data)} OHLCV records for {symbol} ({timeframe})")
+        return len(data)
+    
+    async def upsert_ohlcv_chunk(
+        self,
+        symbol: str,
+        timeframe: str,
+        data: List[Dict[str, Any]],
+        chunk_start: datetime,
+        chunk_end: datetime,
+        source: str = "coingecko",
+        checkpoint: bool = True
+    ) -> int:
+        """
+        Upsert one backfill chunk and record it as completed.
+        
+        The upsert and the checkpoint commit together, so an interrupted
+        backfill never skips a chunk whose rows were not written.
+        
+        Args:
+            symbol: Coin symbol
+            timeframe: Timeframe
+            data: List of OHLCV dicts with keys: ts, open, high, low, close, volume
+            chunk_start: Chunk start (inclusive)
+            chunk_end: Chunk end (exclusive)
+            source: Data source
+            checkpoint: Record the chunk as completed
+        
+        Returns:
+            Number of rows inserted/updated
+        """
+        if not self.pool:
+            await self.connect()
+        
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                if data:
+                    await conn.execute(UPSERT_OHLCV_QUERY, symbol, timeframe, source, *_ohlcv_columns(data))
+                
+                if checkpoint:
+                    await conn.execute(
+                        """
+                        INSERT INTO ohlcv_backfill_checkpoints
+                            (symbol, timeframe, chunk_start, chunk_end, records, completed_at)
+                        VALUES ($1, $2, $3, $4, $5, NOW())
+                        ON CONFLICT (symbol, timeframe, chunk_start, chunk_end) DO UPDATE SET
+                            records = EXCLUDED.records,
+                            completed_at = EXCLUDED.completed_at
+                        """,
+                        symbol, timeframe, chunk_start, chunk_end, len(data)
+                    )
+        
+        return len(data)
+    
+    async def get_completed_chunks(
+        self,
+        symbols: List[str],
+        timeframe: str
+    ) -> Set[Tuple[str, datetime, datetime]]:
+        """
+        Get backfill chunks already completed.
+        
+        Args:
+            symbols: Coin symbols
+            timeframe: Timeframe
+        
+        Returns:
+            Set of (symbol, chunk_start, chunk_end)
+        """
+        if not self.pool:
+            await self.connect()
         
         query = """
-            INSERT INTO ohlcv (symbol, ts, open, high, low, close, volume, timeframe, source)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-            ON CONFLICT (symbol, ts, timeframe) DO UPDATE SET
-                open = EXCLUDED.open,
-                high = EXCLUDED.high,
-                low = EXCLUDED.low,
-                close = EXCLUDED.close,
-                volume = EXCLUDED.volume,
-                source = EXCLUDED.source
+            SELECT symbol, chunk_start, chunk_end
+            FROM ohlcv_backfill_checkpoints
+            WHERE symbol = ANY($1::text[]) AND timeframe = $2
         """
         
         async with self.pool.acquire() as conn:
-            await conn.executemany(query, records)
+            rows = await conn.fetch(query, symbols, timeframe)
         
-        logger.info(f"Upserted {len(records)} OHLCV records for {symbol} ({timeframe})")
-        return len(records)
+        return {
+            (row['symbol'], row['chunk_start'].replace(tzinfo=None), row['chunk_end'].replace(tzinfo=None))
+            for row in rows
+        }
     
     async def upsert_supply(
         self,
@@ -102,7 +190,7 @@ class Database:
             symbol: Coin symbol
             data: List of supply dicts with keys: ts, circulating_supply, total_supply, max_supply
             source: Data source
-            
+        
         Returns:
             Number of rows inserted/updated
         """
@@ -151,7 +239,7 @@ class Database:
         Args:
             symbol: Coin symbol
             timeframe: Timeframe
-            
+        
         Returns:
             Latest timestamp or None if no data exists
         """
@@ -179,7 +267,7 @@ class Database:
         Args:
             symbol: Coin symbol
             timeframe: Timeframe
-            
+        
         Returns:
             Number of records
         """
@@ -1,12 +1,12 @@
 """OHLCV and supply data fetcher."""
-import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 
+from .backfill import BackfillScheduler
+from .candles import aggregate_candles, timeframe_ms
 from .coingecko_client import CoinGeckoClient
 from .database import Database
-from .config import config
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +35,7 @@ class OHLCVFetcher:
             timeframe: Timeframe (e.g., "1d", "1h")
             start_date: Start date
             end_date: End date
-            
+        
         Returns:
             Number of records fetched
         """
@@ -63,68 +63,47 @@ class OHLCVFetcher:
             
             await self.db.upsert_ohlcv(symbol, timeframe, records)
             return len(records)
-        
-        else:
-            from_ts = int(start_date.timestamp())
-            to_ts = int(end_date.timestamp())
-            
-            chart_data = await self.client.get_market_chart_range(
-                coin_id,
-                from_ts,
-                to_ts
-            )
-            
-            prices = chart_data.get('prices', [])
-            volumes = chart_data.get('total_volumes', [])
-            
-            volume_dict = {int(ts): vol for ts, vol in volumes}
-            
-            records = []
-            current_day = None
-            day_data = {'open': None, 'high': None, 'low': None, 'close': None, 'volume': 0}
-            
-            for timestamp_ms, price in prices:
-                ts = datetime.fromtimestamp(timestamp_ms / 1000)
-                day = ts.date()
-                
-                if current_day != day:
-                    if current_day is not None and day_data['open'] is not None:
-                        records.append({
-                            'ts': datetime.combine(current_day, datetime.min.time()),
-                            'open': day_data['open'],
-                            'high': day_data['high'],
-                            'low': day_data['low'],
-                            'close': day_data['close'],
-                            'volume': day_data['volume']
-                        })
-                    
-                    current_day = day
-                    day_data = {
-                        'open': price,
-                        'high': price,
-                        'low': price,
-                        'close': price,
-                        'volume': volume_dict.get(int(timestamp_ms), 0)
-                    }
-                else:
-                    day_data['high'] = max(day_data['high'], price)
-                    day_data['low'] = min(day_data['low'], price)
-                    day_data['close'] = price
-                    day_data['volume'] += volume_dict.get(int(timestamp_ms), 0)
-            
-            if current_day is not None and day_data['open'] is not None:
-                records.append({
-                    'ts': datetime.combine(current_day, datetime.min.time()),
-                    'open': day_data['open'],
-                    'high': day_data['high'],
-                    'low': day_data['low'],
-                    'close': day_data['close'],
-                    'volume': day_data['volume']
-                })
             
+        else:
+            records = await self.fetch_ohlcv_range(coin_id, timeframe, start_date, end_date)
             await self.db.upsert_ohlcv(symbol, timeframe, records)
             return len(records)
     
+    async def fetch_ohlcv_range(
+        self,
+        coin_id: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch candles for [start_date, end_date) from the market chart range endpoint.
+        
+        Args:
+            coin_id: CoinGecko coin ID
+            timeframe: Timeframe (candle size; daily if not recognised)
+            start_date: Start (naive UTC, inclusive)
+            end_date: End (naive UTC, exclusive)
+        
+        Returns:
+            List of OHLCV dicts with keys: ts, open, high, low, close, volume
+        """
+        from_ts = int(start_date.replace(tzinfo=timezone.utc).timestamp())
+        to_ts = int(end_date.replace(tzinfo=timezone.utc).timestamp()) - 1
+        
+        chart_data = await self.client.get_market_chart_range(
+            coin_id,
+            from_ts,
+            to_ts
+        )
+        
+        records = aggregate_candles(
+            chart_data.get('prices', []),
+            chart_data.get('total_volumes', []),
+            timeframe_ms(timeframe)
+        )
+        return [record for record in records if start_date <= record['ts'] < end_date]
+    
     async def backfill_ohlcv(
         self,
         symbol: str,
@@ -134,7 +113,7 @@ class OHLCVFetcher:
         end_date: datetime
     ) -> int:
         """
-        Backfill OHLCV data in chunks.
+        Backfill OHLCV data in chunks, resuming from checkpoints.
         
         Args:
             symbol: Coin symbol
@@ -142,43 +121,21 @@ class OHLCVFetcher:
             timeframe: Timeframe
             start_date: Start date
             end_date: End date
-            
+        
         Returns:
             Total number of records fetched
         """
         logger.info(f"Starting backfill for {symbol} ({coin_id}) from {start_date} to {end_date}")
         
-        total_records = 0
-        current_start = start_date
-        chunk_days = config.backfill_chunk_days
-        
-        while current_start < end_date:
-            current_end = min(current_start + timedelta(days=chunk_days), end_date)
-            
-            try:
-                records = await self.fetch_ohlcv(
-                    symbol,
-                    coin_id,
-                    timeframe,
-                    current_start,
-                    current_end
-                )
-                
-                total_records += records
-                logger.info(
-                    f"Backfilled {records} records for {symbol} "
-                    f"({current_start.date()} to {current_end.date()})"
-                )
-                
-                await asyncio.sleep(config.backfill_delay_seconds)
-                
-            except Exception as e:
-                logger.error(f"Error backfilling {symbol} chunk: {e}")
-            
-            current_start = current_end
+        stats = await BackfillScheduler(self).run(
+            [{'symbol': symbol, 'coin_id': coin_id}],
+            timeframe,
+            start_date,
+            end_date
+        )
         
-        logger.info(f"Backfill complete for {symbol}: {total_records} total records")
-        return total_records
+        logger.info(f"Backfill complete for {symbol}: {stats['records']} total records")
+        return stats['records']
     
     async def fetch_supply(
         self,
@@ -191,7 +148,7 @@ class OHLCVFetcher:
         Args:
             symbol: Coin symbol
             coin_id: CoinGecko coin ID
-            
+        
         Returns:
             Number of records stored (1 if successful)
         """
@@ -0,0 +1,218 @@
+"""Tests for the concurrent, resumable OHLCV backfill."""
+import pytest
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from datetime import datetime
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from ingester.backfill import BackfillScheduler, plan_chunks
+from ingester.candles import aggregate_candles
+from ingester.config import config
+from ingester.fetcher import OHLCVFetcher
+from ingester.rate_limiter import RateLimiter
+
+HOUR_MS = 3_600_000
+TOKENS = [
+    {'symbol': 'BTC', 'coin_id': 'bitcoin'},
+    {'symbol': 'ETH', 'coin_id': 'ethereum'},
+    {'symbol': 'SOL', 'coin_id': 'solana'},
+    {'symbol': 'ARB', 'coin_id': 'arbitrum'},
+]
+START = datetime(2023, 1, 1)
+END = datetime(2024, 1, 1)
+UPSTREAM_LATENCY = 0.02
+
+
+class MemoryDatabase:
+    """In-memory stand-in for Database's backfill methods."""
+    
+    def __init__(self):
+        self.rows = {}
+        self.checkpoints = set()
+    
+    async def upsert_ohlcv_chunk(self, symbol, timeframe, data, chunk_start, chunk_end, source="coingecko", checkpoint=True):
+        for row in data:
+            self.rows[(symbol, row['ts'], timeframe)] = row
+        if checkpoint:
+            self.checkpoints.add((symbol, chunk_start, chunk_end))
+        return len(data)
+    
+    async def get_completed_chunks(self, symbols, timeframe):
+        return {chunk for chunk in self.checkpoints if chunk[0] in symbols}
+    
+    async def close(self):
+        pass
+
+
+def hourly_series(coin_id, from_ts, to_ts):
+    """Deterministic hourly prices and volumes for [from_ts, to_ts] (seconds)."""
+    seed = sum(map(ord, coin_id))
+    first = -(-from_ts * 1000 // HOUR_MS) * HOUR_MS
+    prices, volumes = [], []
+    for ts in range(first, to_ts * 1000 + 1, HOUR_MS):
+        hour = ts // HOUR_MS
+        prices.append([ts, 100 + seed % 50 + (hour * 7919 + seed) % 101 / 10])
+        volumes.append([ts, float((hour * 104729 + seed) % 1000)])
+    return prices, volumes
+
+
+@asynccontextmanager
+async def fake_coingecko():
+    """Local stand-in for CoinGecko's market_chart/range endpoint."""
+    state = {"requests": [], "fail": set(), "in_flight": 0, "peak_in_flight": 0}
+    
+    async def market_chart_range(request):
+        coin_id = request.match_info["coin_id"]
+        from_ts = int(request.query["from"])
+        to_ts = int(request.query["to"])
+        state["requests"].append((coin_id, from_ts, to_ts))
+        state["in_flight"] += 1
+        state["peak_in_flight"] = max(state["peak_in_flight"], state["in_flight"])
+        try:
+            await asyncio.sleep(UPSTREAM_LATENCY)
+        finally:
+            state["in_flight"] -= 1
+        if coin_id in state["fail"]:
+            return web.Response(status=500, text="upstream error")
+        prices, volumes = hourly_series(coin_id, from_ts, to_ts)
+        return web.json_response({"prices": prices, "market_caps": [], "total_volumes": volumes})
+    
+    app = web.Application()
+    app.router.add_get("/coins/{coin_id}/market_chart/range", market_chart_range)
+    
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield str(server.make_url("")).rstrip("/"), state
+    finally:
+        await server.close()
+
+
+def make_fetcher(base_url):
+    fetcher = OHLCVFetcher()
+    fetcher.db = MemoryDatabase()
+    fetcher.client.base_url = base_url
+    fetcher.client.rate_limiter = RateLimiter(requests_per_minute=100_000)
+    return fetcher
+
+
+def legacy_daily_candles(prices, volumes):
+    """The previous per-point aggregation loop in fetch_ohlcv (UTC days)."""
+    volume_dict = {int(ts): vol for ts, vol in volumes}
+    records = []
+    current_day = None
+    day_data = None
+    for timestamp_ms, price in prices:
+        day = datetime.utcfromtimestamp(timestamp_ms / 1000).date()
+        if current_day != day:
+            if current_day is not None:
+                records.append({'ts': datetime.combine(current_day, datetime.min.time()), **day_data})
+            current_day = day
+            day_data = {'open': price, 'high': price, 'low': price, 'close': price,
+                        'volume': volume_dict.get(int(timestamp_ms), 0)}
+        else:
+            day_data['high'] = max(day_data['high'], price)
+            day_data['low'] = min(day_data['low'], price)
+            day_data['close'] = price
+            day_data['volume'] += volume_dict.get(int(timestamp_ms), 0)
+    if current_day is not None:
+        records.append({'ts': datetime.combine(current_day, datetime.min.time()), **day_data})
+    return records
+
+
+def test_aggregate_candles_matches_loop():
+    """Vectorized daily candles equal the previous loop's output."""
+    rng = random.Random(49)
+    start_ms = int(START.timestamp()) * 1000 // HOUR_MS * HOUR_MS
+    prices, volumes = [], []
+    ts = start_ms
+    for _ in range(5000):
+        ts += rng.choice([HOUR_MS, HOUR_MS, 2 * HOUR_MS, 300_000])
+        prices.append([ts, rng.uniform(10, 20)])
+        if rng.random() < 0.9:
+            volumes.append([ts, rng.uniform(0, 1e6)])
+    
+    expected = legacy_daily_candles(prices, volumes)
+    actual = aggregate_candles(prices, volumes)
+    
+    assert [row['ts'] for row in actual] == [row['ts'] for row in expected]
+    for got, want in zip(actual, expected):
+        for field in ('open', 'high', 'low', 'close', 'volume'):
+            assert got[field] == pytest.approx(want[field])
+
+
+def test_plan_chunks_aligned_and_contiguous():
+    """Chunks start at midnight and tile the range without overlap."""
+    chunks = plan_chunks(datetime(2023, 1, 1, 15, 30), datetime(2023, 3, 1), 30)
+    
+    assert chunks[0][0] == datetime(2023, 1, 1)
+    assert chunks[-1][1] == datetime(2023, 3, 1)
+    assert all(a[1] == b[0] for a, b in zip(chunks, chunks[1:]))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_backfill_overlaps_requests():
+    """Concurrent workers keep several chunk requests in flight, with identical rows."""
+    results = {}
+    async with fake_coingecko() as (base_url, state):
+        for concurrency in (1, 8):
+            state["peak_in_flight"] = 0
+            fetcher = make_fetcher(base_url)
+            try:
+                stats = await BackfillScheduler(fetcher, concurrency=concurrency).run(TOKENS, "1d", START, END)
+            finally:
+                await fetcher.close()
+            results[concurrency] = (stats, fetcher.db, state["peak_in_flight"])
+    
+    concurrent = results[8][0]
+    n_chunks = len(plan_chunks(START, END, config.backfill_chunk_days)) * len(TOKENS)
+    
+    assert concurrent['chunks_done'] == n_chunks
+    assert concurrent['chunks_failed'] == 0
+    assert concurrent['records'] == 365 * len(TOKENS)
+    assert results[8][1].rows == results[1][1].rows
+    assert len(results[8][1].checkpoints) == n_chunks
+    assert results[1][2] == 1
+    assert results[8][2] > 1
+
+
+@pytest.mark.asyncio
+async def test_backfill_resumes_from_checkpoints(monkeypatch):
+    """A re-run fetches only the chunks that failed and ends with the full data set."""
+    monkeypatch.setattr(config, "retry_max_attempts", 1)
+    n_ranges = len(plan_chunks(START, END, config.backfill_chunk_days))
+    
+    async with fake_coingecko() as (base_url, state):
+        fetcher = make_fetcher(base_url)
+        try:
+            state["fail"] = {"ethereum"}
+            first = await BackfillScheduler(fetcher).run(TOKENS, "1d", START, END)
+            
+            state["fail"] = set()
+            state["requests"].clear()
+            second = await BackfillScheduler(fetcher).run(TOKENS, "1d", START, END)
+            resumed_requests = list(state["requests"])
+            
+            state["requests"].clear()
+            third = await BackfillScheduler(fetcher).run(TOKENS, "1d", START, END)
+            third_requests = list(state["requests"])
+        finally:
+            await fetcher.close()
+        
+        clean = make_fetcher(base_url)
+        try:
+            await BackfillScheduler(clean).run(TOKENS, "1d", START, END)
+        finally:
+            await clean.close()
+    
+    assert first['chunks_failed'] == n_ranges
+    assert second['chunks_skipped'] == n_ranges * (len(TOKENS) - 1)
+    assert second['chunks_done'] == n_ranges
+    assert {coin_id for coin_id, _, _ in resumed_requests} == {"ethereum"}
+    assert len(resumed_requests) == n_ranges
+    assert third['chunks_done'] == 0
+    assert third_requests == []
+    assert fetcher.db.rows == clean.db.rows
+    assert fetcher.db.checkpoints == clean.db.checkpoints